@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import asyncio
 from collections import defaultdict
+from collections.abc import Iterable
 import contextlib
 from functools import partial
 from itertools import chain
@@ -78,17 +79,21 @@ from .helpers import (
     translation,
 )
 from .helpers.dispatcher import async_dispatcher_send
+from .helpers.json import json_bytes
 from .helpers.system_info import async_get_system_info
 from .helpers.typing import ConfigType
 from .setup import (
     BASE_PLATFORMS,
     DATA_SETUP_STARTED,
+    DATA_SETUP_TRACE,
     async_get_setup_timings,
     async_notify_setup_error,
     async_set_domains_to_be_loaded,
     async_setup_component,
+    async_trace_setup_step,
 )
 from .util.async_ import create_eager_task
+from .util.file import write_utf8_file
 from .util.logging import async_activate_log_queue_handler
 from .util.package import async_get_user_site, is_virtual_env
 
@@ -101,6 +106,7 @@ SETUP_ORDER_SORT_KEY = partial(contains, BASE_PLATFORMS)
 
 
 ERROR_LOG_FILENAME = "home-assistant.log"
+STARTUP_TRACE_FILENAME = "home-assistant.startup_trace.json"
 
 # hass.data key for logging information.
 DATA_REGISTRIES_LOADED = "bootstrap_registries_loaded"
@@ -241,8 +247,11 @@ async def async_setup_hass(
     if not (recovery_mode := runtime_config.recovery_mode):
         await hass.async_add_executor_job(conf_util.process_ha_config_upgrade, hass)
 
+        # Loading the configuration is the first step in the startup trace
+        hass.data[DATA_SETUP_TRACE] = []
         try:
-            config_dict = await conf_util.async_hass_config_yaml(hass)
+            with async_trace_setup_step(hass, core.DOMAIN, "load configuration"):
+                config_dict = await conf_util.async_hass_config_yaml(hass)
         except HomeAssistantError as err:
             _LOGGER.error(
                 "Failed to parse configuration.yaml: %s. Activating recovery mode",
@@ -255,6 +264,9 @@ async def async_setup_hass(
             basic_setup_success = (
                 await async_from_config_dict(config_dict, hass) is not None
             )
+        # Setting up the integrations removes the trace when it is done, but
+        # the integrations are not set up if the configuration is invalid
+        hass.data.pop(DATA_SETUP_TRACE, None)
 
     if config_dict is None:
         recovery_mode = True
@@ -698,6 +710,184 @@ async def async_setup_multi_components(
             )
 
 
+async def _async_setup_in_dependency_order(
+    hass: core.HomeAssistant,
+    domains: set[str],
+    config: dict[str, Any],
+    integration_cache: dict[str, loader.Integration],
+) -> None:
+    """Set up multiple domains as soon as the domains they depend on are set up.
+
+    Unlike async_setup_multi_components, a domain is not started before all
+    its dependencies and after dependencies in domains have finished setting
+    up, so it does not wait for them while taking up a slot of the import
+    executor, and slow domains only delay the domains depending on them.
+    """
+    domains_not_yet_setup = domains - hass.config.components
+    waiting_on: dict[str, set[str]] = {}
+    dependents: defaultdict[str, list[str]] = defaultdict(list)
+    for domain in domains_not_yet_setup:
+        prerequisites: set[str] = set()
+        if (integration := integration_cache.get(domain)) is not None:
+            prerequisites.update(
+                dep
+                for dep in chain(
+                    integration.all_dependencies, integration.after_dependencies
+                )
+                if dep in domains_not_yet_setup
+            )
+        waiting_on[domain] = prerequisites
+        for prerequisite in prerequisites:
+            dependents[prerequisite].append(domain)
+
+    scheduled = monotonic()
+    setup_trace: list[tuple[str, str, float, float]] | None = hass.data.get(
+        DATA_SETUP_TRACE
+    )
+    started: dict[str, float] = {}
+    finished: dict[str, float] = {}
+    futures: dict[str, asyncio.Future[bool]] = {}
+    all_done = hass.loop.create_future()
+
+    def _start(domain: str) -> None:
+        """Start setting up a domain."""
+        started[domain] = now = monotonic()
+        if setup_trace is not None and now > scheduled:
+            setup_trace.append((domain, "wait", scheduled, now))
+        futures[domain] = future = hass.async_create_task(
+            async_setup_component(hass, domain, config),
+            f"setup component {domain}",
+            eager_start=True,
+        )
+        future.add_done_callback(partial(_finished, domain))
+
+    def _finished(domain: str, _: asyncio.Future[bool]) -> None:
+        """Start the domains which were waiting for a domain."""
+        finished[domain] = monotonic()
+        ready = []
+        for dependent in dependents.pop(domain, ()):
+            waiting_on[dependent].discard(domain)
+            if not waiting_on[dependent] and dependent not in started:
+                ready.append(dependent)
+        _start_all(ready)
+        _start_if_stalled()
+        if len(finished) == len(waiting_on) and not all_done.done():
+            all_done.set_result(None)
+
+    def _start_all(ready: Iterable[str]) -> None:
+        """Start domains with base platforms first."""
+        for domain in sorted(ready, key=SETUP_ORDER_SORT_KEY, reverse=True):
+            _start(domain)
+
+    def _start_if_stalled() -> None:
+        """Start the waiting domains if no domain is being set up.
+
+        Only possible if after dependencies are circular.
+        """
+        if len(finished) == len(started) < len(waiting_on):
+            _start_all(waiting_on.keys() - started.keys())
+
+    _start_all(domain for domain, deps in waiting_on.items() if not deps)
+    _start_if_stalled()
+
+    try:
+        if waiting_on:
+            await all_done
+    finally:
+        # Do not leave domains behind if the stage timed out
+        _start_all(waiting_on.keys() - started.keys())
+
+    for domain, future in futures.items():
+        try:
+            future.result()
+        except BaseException as err:  # pylint: disable=broad-except
+            _LOGGER.error(
+                "Error setting up integration %s - received exception",
+                domain,
+                exc_info=(type(err), err, err.__traceback__),
+            )
+
+    if _LOGGER.isEnabledFor(logging.DEBUG) and finished:
+        _LOGGER.debug(
+            "Critical path: %s",
+            " -> ".join(
+                f"{domain} ({finished[domain] - started[domain]:.2f}s)"
+                for domain in _critical_path(integration_cache, started, finished)
+            ),
+        )
+
+
+def _critical_path(
+    integration_cache: dict[str, loader.Integration],
+    started: dict[str, float],
+    finished: dict[str, float],
+) -> list[str]:
+    """Return the chain of domains which finished last."""
+    domain = max(finished, key=finished.__getitem__)
+    path = [domain]
+    while (integration := integration_cache.get(domain)) is not None and (
+        prerequisites := [
+            dep
+            for dep in chain(
+                integration.all_dependencies, integration.after_dependencies
+            )
+            if dep in finished and finished[dep] <= started[domain]
+        ]
+    ):
+        domain = max(prerequisites, key=finished.__getitem__)
+        path.append(domain)
+    path.reverse()
+    return path
+
+
+def _write_startup_trace(
+    path: str,
+    setup_trace: list[tuple[str, str, float, float]],
+    other_data: dict[str, Any],
+) -> None:
+    """Write the startup trace in the Chrome trace event format.
+
+    The trace can be opened with chrome://tracing or Perfetto, which show
+    other_data as the metadata of the trace.
+    """
+    if not setup_trace:
+        return
+    first_start = min(start for _, _, start, _ in setup_trace)
+    thread_ids: dict[str, int] = {}
+    trace_events: list[dict[str, Any]] = [
+        {
+            "name": f"{domain} {step}",
+            "cat": step,
+            "ph": "X",
+            "ts": round((start - first_start) * 1_000_000),
+            "dur": round((end - start) * 1_000_000),
+            "pid": 1,
+            "tid": thread_ids.setdefault(domain, len(thread_ids) + 1),
+        }
+        for domain, step, start, end in setup_trace
+    ]
+    trace_events.extend(
+        {
+            "name": "thread_name",
+            "ph": "M",
+            "pid": 1,
+            "tid": thread_id,
+            "args": {"name": domain},
+        }
+        for domain, thread_id in thread_ids.items()
+    )
+    try:
+        write_utf8_file(
+            path,
+            json_bytes({"traceEvents": trace_events, "otherData": other_data}),
+            mode="wb",
+        )
+    except HomeAssistantError as err:
+        _LOGGER.warning("Unable to write the startup trace: %s", err)
+        return
+    _LOGGER.debug("Startup trace written to %s", path)
+
+
 async def _async_resolve_domains_to_setup(
     hass: core.HomeAssistant, config: dict[str, Any]
 ) -> tuple[set[str], dict[str, loader.Integration]]:
@@ -845,6 +1035,9 @@ async def _async_set_up_integrations(
     """Set up all the integrations."""
     setup_started: dict[tuple[str, str | None], float] = {}
     hass.data[DATA_SETUP_STARTED] = setup_started
+    setup_trace: list[tuple[str, str, float, float]] = hass.data.setdefault(
+        DATA_SETUP_TRACE, []
+    )
     watcher = _WatchPendingSetups(hass, setup_started)
     watcher.async_start()
 
@@ -901,7 +1094,9 @@ async def _async_set_up_integrations(
             async with hass.timeout.async_timeout(
                 STAGE_1_TIMEOUT, cool_down=COOLDOWN_TIME
             ):
-                await async_setup_multi_components(hass, stage_1_domains, config)
+                await _async_setup_in_dependency_order(
+                    hass, stage_1_domains, config, integration_cache
+                )
         except TimeoutError:
             _LOGGER.warning(
                 "Setup timed out for stage 1 waiting on %s - moving forward",
@@ -917,7 +1112,9 @@ async def _async_set_up_integrations(
             async with hass.timeout.async_timeout(
                 STAGE_2_TIMEOUT, cool_down=COOLDOWN_TIME
             ):
-                await async_setup_multi_components(hass, stage_2_domains, config)
+                await _async_setup_in_dependency_order(
+                    hass, stage_2_domains, config, integration_cache
+                )
         except TimeoutError:
             _LOGGER.warning(
                 "Setup timed out for stage 2 waiting on %s - moving forward",
@@ -936,6 +1133,9 @@ async def _async_set_up_integrations(
         )
 
     watcher.async_stop()
+    del hass.data[DATA_SETUP_TRACE]
+
+    await loader.async_save_integration_index(hass)
 
     if _LOGGER.isEnabledFor(logging.DEBUG):
         setup_time = async_get_setup_timings(hass)
@@ -943,3 +1143,16 @@ async def _async_set_up_integrations(
             "Integration setup times: %s",
             dict(sorted(setup_time.items(), key=itemgetter(1), reverse=True)),
         )
+        other_data: dict[str, Any] = {}
+        if (yaml_cache := hass.data.get(conf_util.DATA_YAML_CACHE)) is not None:
+            other_data["yaml_cache"] = {
+                "hits": yaml_cache.hits,
+                "misses": yaml_cache.misses,
+                "seconds_saved": round(yaml_cache.seconds_saved, 3),
+            }
+        await hass.async_add_executor_job(
+            _write_startup_trace,
+            hass.config.path(STARTUP_TRACE_FILENAME),
+            setup_trace,
+            other_data,
+        )
@@ -14,6 +14,7 @@ import voluptuous as vol
 
 from homeassistant.components import websocket_api
 from homeassistant.components.blueprint import CONF_USE_BLUEPRINT
+from homeassistant.components.trace import async_remove_run_count
 from homeassistant.const import (
     ATTR_ENTITY_ID,
     ATTR_MODE,
@@ -684,6 +685,7 @@ class AutomationEntity(BaseAutomationEntity, RestoreEntity):
             else:
                 trigger_path = "trigger"
             trace_element = TraceElement(variables, trigger_path)
+            trace_element.freeze_variables()
             trace_append_element(trace_element)
 
             if (
@@ -755,6 +757,7 @@ class AutomationEntity(BaseAutomationEntity, RestoreEntity):
         """Remove listeners when removing automation from Home Assistant."""
         await super().async_will_remove_from_hass()
         await self.async_disable()
+        async_remove_run_count(self.hass, f"{DOMAIN}.{self.unique_id}")
 
     async def _async_enable_automation(self, event: Event) -> None:
         """Start automation on startup."""
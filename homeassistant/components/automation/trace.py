@@ -7,11 +7,12 @@ from contextlib import contextmanager
 from typing import Any
 
 from homeassistant.components.trace import (
-    CONF_STORED_TRACES,
     ActionTrace,
-    async_store_trace,
+    async_finish_trace,
+    async_start_trace,
 )
 from homeassistant.core import Context, HomeAssistant
+from homeassistant.helpers.trace import trace_enabled_get, trace_enabled_set
 from homeassistant.helpers.typing import ConfigType
 
 from .const import DOMAIN
@@ -58,7 +59,8 @@ def trace_automation(
 ) -> Generator[AutomationTrace, None, None]:
     """Trace action execution of automation with automation_id."""
     trace = AutomationTrace(automation_id, config, blueprint_inputs, context)
-    async_store_trace(hass, trace, trace_config[CONF_STORED_TRACES])
+    parent_traced = trace_enabled_get()
+    async_start_trace(hass, trace, trace_config)
 
     try:
         yield trace
@@ -68,4 +70,5 @@ def trace_automation(
         raise ex
     finally:
         if automation_id:
-            trace.finished()
+            async_finish_trace(hass, trace, trace_config)
+        trace_enabled_set(parent_traced)
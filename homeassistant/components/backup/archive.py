@@ -0,0 +1,231 @@
+"""Write the archive of the configuration directory for the Backup integration."""
+
+from __future__ import annotations
+
+from collections import deque
+from collections.abc import Generator
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import contextmanager
+import gzip
+import hashlib
+import os
+from pathlib import Path, PurePath
+import tarfile
+import time
+from types import TracebackType
+from typing import IO, Any, Self, cast
+
+# Size of the chunks of the tar stream which are compressed on their own
+GZIP_CHUNK_SIZE = 2**20 * 4  # 4MB
+GZIP_COMPRESS_LEVEL = 6
+MAX_COMPRESS_WORKERS = 4
+
+# Size, modification time in nanoseconds, sha256 of the content and the
+# slug of the backup which contains the file
+ManifestEntry = list[Any]
+
+
+class ParallelGzipWriter:
+    """Write a gzip stream, compressing chunks of it on multiple threads.
+
+    Each chunk is written as a gzip member of its own. A file with several
+    members is a valid gzip file which decompresses to the concatenated
+    data, so the result can be read by any gzip reader.
+    """
+
+    def __init__(
+        self,
+        fileobj: IO[bytes],
+        workers: int,
+        chunk_size: int = GZIP_CHUNK_SIZE,
+    ) -> None:
+        """Initialize the writer."""
+        self._fileobj = fileobj
+        self._chunk_size = chunk_size
+        self._buffer = bytearray()
+        self._executor = ThreadPoolExecutor(
+            max_workers=workers, thread_name_prefix="BackupCompress"
+        )
+        # Compressed chunks which still have to be written, in order
+        self._pending: deque[Future[bytes]] = deque()
+        self._max_pending = workers * 2
+
+    def write(self, data: bytes) -> int:
+        """Write data to the stream."""
+        self._buffer += data
+        if len(self._buffer) >= self._chunk_size:
+            self._compress_buffer()
+        return len(data)
+
+    def _compress_buffer(self) -> None:
+        """Compress the buffered data on a worker thread."""
+        chunk = bytes(self._buffer)
+        self._buffer.clear()
+        self._pending.append(
+            self._executor.submit(gzip.compress, chunk, GZIP_COMPRESS_LEVEL, mtime=0)
+        )
+        # Limit the memory used by chunks waiting to be written
+        while len(self._pending) >= self._max_pending:
+            self._fileobj.write(self._pending.popleft().result())
+
+    def close(self) -> None:
+        """Compress the rest of the data and write all chunks."""
+        if self._buffer:
+            self._compress_buffer()
+        while self._pending:
+            self._fileobj.write(self._pending.popleft().result())
+        self._executor.shutdown()
+
+    def __enter__(self) -> Self:
+        """Enter the context manager."""
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        """Write the rest of the stream, unless writing it failed."""
+        if exc_type is None:
+            self.close()
+        else:
+            self._executor.shutdown(cancel_futures=True)
+
+
+class _HashingReader:
+    """Hash the data read from a file."""
+
+    def __init__(self, fileobj: IO[bytes]) -> None:
+        """Initialize the reader."""
+        self._fileobj = fileobj
+        self.hash = hashlib.sha256()
+
+    def read(self, size: int = -1) -> bytes:
+        """Read from the file."""
+        data = self._fileobj.read(size)
+        self.hash.update(data)
+        return data
+
+
+@contextmanager
+def _add_stream(
+    tar: tarfile.TarFile, tar_info: tarfile.TarInfo
+) -> Generator[IO[bytes], None, None]:
+    """Add a member of unknown size to an uncompressed tar file.
+
+    The data is written to the returned file object, the header of the
+    member is written again with the size once the data was written.
+    """
+    fileobj = cast(IO[bytes], tar.fileobj)
+    start = fileobj.tell()
+    header_size = len(tar_info.tobuf(tar.format, tar.encoding, tar.errors))
+    fileobj.write(tarfile.NUL * header_size)
+    yield fileobj
+    end = fileobj.tell()
+    tar_info.size = end - start - header_size
+    header = tar_info.tobuf(tar.format, tar.encoding, tar.errors)
+    if len(header) != header_size:
+        raise OSError(f"Header of {tar_info.name} changed its size")
+    padding = -tar_info.size % tarfile.BLOCKSIZE
+    fileobj.write(tarfile.NUL * padding)
+    fileobj.seek(start)
+    fileobj.write(header)
+    fileobj.seek(end + padding)
+    tar.offset = end + padding
+
+
+def _is_excluded(path: PurePath, excludes: list[str]) -> bool:
+    """Return if a path matches one of the exclude patterns."""
+    return any(path.match(exclude) for exclude in excludes)
+
+
+def _add_contents(
+    tar: tarfile.TarFile,
+    origin_path: Path,
+    excludes: list[str],
+    arcname: str,
+    base_files: dict[str, ManifestEntry],
+    files: dict[str, ManifestEntry],
+    slug: str,
+) -> None:
+    """Add a directory to the tar file, skipping unchanged files."""
+    # Add the directory only to also archive empty directories
+    tar.add(origin_path.as_posix(), arcname=arcname, recursive=False)
+
+    for item in origin_path.iterdir():
+        if _is_excluded(item, excludes):
+            continue
+        arcpath = PurePath(arcname, item.name).as_posix()
+        if item.is_symlink() or not (item.is_file() or item.is_dir()):
+            tar.add(item.as_posix(), arcname=arcpath, recursive=False)
+        elif item.is_dir():
+            _add_contents(tar, item, excludes, arcpath, base_files, files, slug)
+        else:
+            _add_file(tar, item, arcpath, base_files, files, slug)
+
+
+def _add_file(
+    tar: tarfile.TarFile,
+    path: Path,
+    arcpath: str,
+    base_files: dict[str, ManifestEntry],
+    files: dict[str, ManifestEntry],
+    slug: str,
+) -> None:
+    """Add a file to the tar file unless it did not change since the base."""
+    stat = path.stat()
+    if (base_entry := base_files.get(arcpath)) is not None and base_entry[:2] == [
+        stat.st_size,
+        stat.st_mtime_ns,
+    ]:
+        files[arcpath] = base_entry
+        return
+    with path.open("rb") as file:
+        stat = os.fstat(file.fileno())
+        tar_info = tar.gettarinfo(arcname=arcpath, fileobj=file)
+        reader = _HashingReader(file)
+        tar.addfile(tar_info, reader)  # type: ignore[arg-type]
+    files[arcpath] = [
+        stat.st_size,
+        stat.st_mtime_ns,
+        reader.hash.hexdigest(),
+        slug,
+    ]
+
+
+def add_config_archive(
+    outer_tar: tarfile.TarFile,
+    name: str,
+    origin_path: Path,
+    excludes: list[str],
+    base_files: dict[str, ManifestEntry],
+    slug: str,
+) -> dict[str, ManifestEntry]:
+    """Add a gzip compressed tar of a directory to the outer tar file.
+
+    Files which have the same size and modification time as in the
+    manifest of the base backup are not added. Returns the manifest of
+    the files in the directory.
+    """
+    tar_info = tarfile.TarInfo(name=name)
+    # A float forces a PAX header, which can hold the size of large members,
+    # and the size needs a PAX record, so the header keeps its size
+    tar_info.mtime = time.time()  # type: ignore[assignment]
+    tar_info.size = 8**11
+    files: dict[str, ManifestEntry] = {}
+    workers = min(MAX_COMPRESS_WORKERS, os.cpu_count() or 1)
+    with (
+        _add_stream(outer_tar, tar_info) as stream,
+        ParallelGzipWriter(stream, workers, GZIP_CHUNK_SIZE) as gzip_stream,
+        tarfile.open(
+            fileobj=gzip_stream,  # type: ignore[arg-type]
+            mode="w|",
+            dereference=False,
+        ) as inner_tar,
+    ):
+        if not _is_excluded(origin_path, excludes):
+            _add_contents(
+                inner_tar, origin_path, excludes, "data", base_files, files, slug
+            )
+    return files
@@ -5,6 +5,13 @@ from logging import getLogger
 DOMAIN = "backup"
 LOGGER = getLogger(__package__)
 
+ATTR_INCREMENTAL = "incremental"
+
+# Index of the backups and manifests of their files, kept next to the backups
+BACKUP_INDEX_FILE = "index.json"
+BACKUP_INDEX_VERSION = 1
+MANIFEST_SUFFIX = ".manifest.json"
+
 EXCLUDE_FROM_BACKUP = [
     "__pycache__/*",
     ".DS_Store",
@@ -12,5 +19,6 @@ EXCLUDE_FROM_BACKUP = [
     "*.log.*",
     "*.log",
     "backups/*.tar",
+    "backups/*.json",
     "OZW_Log.txt",
 ]
@@ -7,23 +7,32 @@ from dataclasses import asdict, dataclass
 import hashlib
 import io
 import json
+import os
 from pathlib import Path
 import tarfile
 from tarfile import TarError
 import time
 from typing import Any, Protocol, cast
 
-from securetar import SecureTarFile, atomic_contents_add
+from securetar import SecureTarFile
 
 from homeassistant.const import __version__ as HAVERSION
 from homeassistant.core import HomeAssistant, callback
 from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers import integration_platform
-from homeassistant.helpers.json import json_bytes
+from homeassistant.helpers.json import json_bytes, save_json
 from homeassistant.util import dt as dt_util
-from homeassistant.util.json import json_loads_object
-
-from .const import DOMAIN, EXCLUDE_FROM_BACKUP, LOGGER
+from homeassistant.util.json import json_loads_object, load_json_object
+
+from .archive import ManifestEntry, add_config_archive
+from .const import (
+    BACKUP_INDEX_FILE,
+    BACKUP_INDEX_VERSION,
+    DOMAIN,
+    EXCLUDE_FROM_BACKUP,
+    LOGGER,
+    MANIFEST_SUFFIX,
+)
 
 BUF_SIZE = 2**20 * 4  # 4MB
 
@@ -132,25 +141,98 @@ class BackupManager:
         self.loaded_platforms = True
 
     def _read_backups(self) -> dict[str, Backup]:
-        """Read backups from disk."""
+        """Read backups from disk.
+
+        The data of the backups is kept in an index next to the backups,
+        only backups which are not in the index or changed are opened.
+        """
+        index = self._load_index()
+        new_index: dict[str, Any] = {}
         backups: dict[str, Backup] = {}
         for backup_path in self.backup_dir.glob("*.tar"):
             try:
-                with tarfile.open(backup_path, "r:", bufsize=BUF_SIZE) as backup_file:
-                    if data_file := backup_file.extractfile("./backup.json"):
-                        data = json_loads_object(data_file.read())
-                        backup = Backup(
-                            slug=cast(str, data["slug"]),
-                            name=cast(str, data["name"]),
-                            date=cast(str, data["date"]),
-                            path=backup_path,
-                            size=round(backup_path.stat().st_size / 1_048_576, 2),
-                        )
-                        backups[backup.slug] = backup
-            except (OSError, TarError, json.JSONDecodeError, KeyError) as err:
+                entry = index.get(backup_path.name)
+                if entry is None or not _index_entry_is_current(
+                    entry, backup_path.stat()
+                ):
+                    entry = _read_backup_index_entry(backup_path)
+                    if entry is None:
+                        continue
+                backup = Backup(
+                    slug=cast(str, entry["slug"]),
+                    name=cast(str, entry["name"]),
+                    date=cast(str, entry["date"]),
+                    path=backup_path,
+                    size=round(entry["size"] / 1_048_576, 2),
+                )
+            except (
+                OSError,
+                TarError,
+                json.JSONDecodeError,
+                KeyError,
+                TypeError,
+            ) as err:
                 LOGGER.warning("Unable to read backup %s: %s", backup_path, err)
+                continue
+            backups[backup.slug] = backup
+            new_index[backup_path.name] = entry
+        if new_index != index:
+            self._save_index(new_index)
         return backups
 
+    def _load_index(self) -> dict[str, Any]:
+        """Load the index of the backups."""
+        try:
+            index = load_json_object(self.backup_dir / BACKUP_INDEX_FILE)
+        except HomeAssistantError as err:
+            LOGGER.warning("Ignoring the index of the backups: %s", err)
+            return {}
+        if index.get("version") != BACKUP_INDEX_VERSION:
+            return {}
+        return cast(dict[str, Any], index["backups"])
+
+    def _save_index(self, index: dict[str, Any]) -> None:
+        """Save the index of the backups."""
+        if not os.path.isdir(self.backup_dir):
+            return
+        try:
+            save_json(
+                str(self.backup_dir / BACKUP_INDEX_FILE),
+                {"version": BACKUP_INDEX_VERSION, "backups": index},
+            )
+        except HomeAssistantError as err:
+            LOGGER.warning("Unable to save the index of the backups: %s", err)
+
+    def _manifest_path(self, slug: str) -> Path:
+        """Return the path of the manifest of a backup."""
+        return self.backup_dir / f"{slug}{MANIFEST_SUFFIX}"
+
+    def _read_base_manifest(
+        self, backups: list[Backup]
+    ) -> tuple[str | None, dict[str, ManifestEntry]]:
+        """Return the slug and the files of the base of an incremental backup.
+
+        The base is the latest backup, if it has a manifest and all the
+        backups which contain its files still exist.
+        """
+        if not backups:
+            return None, {}
+        base = max(backups, key=lambda backup: backup.date)
+        slugs = {backup.slug for backup in backups}
+        try:
+            manifest = load_json_object(self._manifest_path(base.slug))
+        except HomeAssistantError as err:
+            LOGGER.warning("Unable to read manifest of backup %s: %s", base.slug, err)
+            return None, {}
+        if manifest.get("version") != BACKUP_INDEX_VERSION:
+            LOGGER.debug("Backup %s has no manifest", base.slug)
+            return None, {}
+        files = cast(dict[str, ManifestEntry], manifest["files"])
+        if any(entry[3] not in slugs for entry in files.values()):
+            LOGGER.debug("Backups of the files of %s were removed", base.slug)
+            return None, {}
+        return base.slug, files
+
     async def get_backups(self) -> dict[str, Backup]:
         """Return backups."""
         if not self.loaded_backups:
@@ -180,17 +262,49 @@ class BackupManager:
 
         return backup
 
+    def _dependent_backups(self, slug: str, backups: list[Backup]) -> list[str]:
+        """Return the slugs of the backups which contain files of a backup."""
+        dependents = []
+        for backup in backups:
+            if backup.slug == slug:
+                continue
+            try:
+                manifest = load_json_object(self._manifest_path(backup.slug))
+            except HomeAssistantError:
+                continue
+            files = cast(dict[str, ManifestEntry], manifest.get("files", {}))
+            if any(entry[3] == slug for entry in files.values()):
+                dependents.append(backup.slug)
+        return dependents
+
     async def remove_backup(self, slug: str) -> None:
-        """Remove a backup."""
+        """Remove a backup.
+
+        A backup which is the base of incremental backups is not removed,
+        as they cannot be restored without it.
+        """
         if (backup := await self.get_backup(slug)) is None:
             return
 
+        if dependents := await self.hass.async_add_executor_job(
+            self._dependent_backups, slug, list(self.backups.values())
+        ):
+            raise HomeAssistantError(
+                f"Backup {slug} can not be removed, it is the base of the"
+                f" incremental backups {', '.join(sorted(dependents))}"
+            )
+
         await self.hass.async_add_executor_job(backup.path.unlink, True)
+        await self.hass.async_add_executor_job(self._manifest_path(slug).unlink, True)
         LOGGER.debug("Removed backup located at %s", backup.path)
         self.backups.pop(slug)
 
-    async def generate_backup(self) -> Backup:
-        """Generate a backup."""
+    async def generate_backup(self, incremental: bool = False) -> Backup:
+        """Generate a backup.
+
+        An incremental backup only contains the files which changed since
+        the latest backup, which is its base.
+        """
         if self.backing_up:
             raise HomeAssistantError("Backup already in progress")
 
@@ -200,8 +314,15 @@ class BackupManager:
             backup_name = f"Core {HAVERSION}"
             date_str = dt_util.now().isoformat()
             slug = _generate_slug(date_str, backup_name)
+            base_slug: str | None = None
+            base_files: dict[str, ManifestEntry] = {}
+            if incremental:
+                backups = await self.get_backups()
+                base_slug, base_files = await self.hass.async_add_executor_job(
+                    self._read_base_manifest, list(backups.values())
+                )
 
-            backup_data = {
+            backup_data: dict[str, Any] = {
                 "slug": slug,
                 "name": backup_name,
                 "date": date_str,
@@ -210,11 +331,19 @@ class BackupManager:
                 "homeassistant": {"version": HAVERSION},
                 "compressed": True,
             }
+            if base_slug:
+                # Restoring an incremental backup needs the backups of its base
+                backup_name = f"{backup_name} (incremental)"
+                backup_data["name"] = backup_name
+                backup_data["type"] = "incremental"
+                backup_data["base_backup"] = base_slug
             tar_file_path = Path(self.backup_dir, f"{backup_data['slug']}.tar")
             size_in_bytes = await self.hass.async_add_executor_job(
                 self._mkdir_and_generate_backup_contents,
                 tar_file_path,
                 backup_data,
+                base_slug,
+                base_files,
             )
             backup = Backup(
                 slug=slug,
@@ -235,6 +364,8 @@ class BackupManager:
         self,
         tar_file_path: Path,
         backup_data: dict[str, Any],
+        base_slug: str | None,
+        base_files: dict[str, ManifestEntry],
     ) -> int:
         """Generate backup contents and return the size."""
         if not self.backup_dir.exists():
@@ -251,19 +382,56 @@ class BackupManager:
             tar_info.size = len(raw_bytes)
             tar_info.mtime = int(time.time())
             outer_secure_tarfile_tarfile.addfile(tar_info, fileobj=fileobj)
-            with outer_secure_tarfile.create_inner_tar(
-                "./homeassistant.tar.gz", gzip=True
-            ) as core_tar:
-                atomic_contents_add(
-                    tar_file=core_tar,
-                    origin_path=Path(self.hass.config.path()),
-                    excludes=EXCLUDE_FROM_BACKUP,
-                    arcname="data",
-                )
+            files = add_config_archive(
+                outer_secure_tarfile_tarfile,
+                "./homeassistant.tar.gz",
+                Path(self.hass.config.path()),
+                EXCLUDE_FROM_BACKUP,
+                base_files,
+                backup_data["slug"],
+            )
 
+        try:
+            save_json(
+                str(self._manifest_path(backup_data["slug"])),
+                {
+                    "version": BACKUP_INDEX_VERSION,
+                    "base": base_slug,
+                    "files": files,
+                    # Files of the base which no longer exist
+                    "removed": sorted(base_files.keys() - files.keys()),
+                },
+            )
+        except HomeAssistantError as err:
+            LOGGER.warning(
+                "Unable to save manifest of backup %s: %s", backup_data["slug"], err
+            )
         return tar_file_path.stat().st_size
 
 
+def _index_entry_is_current(entry: dict[str, Any], stat: os.stat_result) -> bool:
+    """Return if the index entry of a backup matches the backup file."""
+    return bool(
+        entry.get("size") == stat.st_size and entry.get("mtime_ns") == stat.st_mtime_ns
+    )
+
+
+def _read_backup_index_entry(backup_path: Path) -> dict[str, Any] | None:
+    """Read the index entry of a backup from the backup file."""
+    with tarfile.open(backup_path, "r:", bufsize=BUF_SIZE) as backup_file:
+        if not (data_file := backup_file.extractfile("./backup.json")):
+            return None
+        data = json_loads_object(data_file.read())
+    stat = backup_path.stat()
+    return {
+        "slug": data["slug"],
+        "name": data["name"],
+        "date": data["date"],
+        "size": stat.st_size,
+        "mtime_ns": stat.st_mtime_ns,
+    }
+
+
 def _generate_slug(date: str, name: str) -> str:
     """Generate a backup slug."""
     return hashlib.sha1(f"{date} - {name}".lower().encode()).hexdigest()[:8]
@@ -64,7 +64,12 @@ async def handle_remove(
 
 
 @websocket_api.require_admin
-@websocket_api.websocket_command({vol.Required("type"): "backup/generate"})
+@websocket_api.websocket_command(
+    {
+        vol.Required("type"): "backup/generate",
+        vol.Optional("incremental", default=False): bool,
+    }
+)
 @websocket_api.async_response
 async def handle_create(
     hass: HomeAssistant,
@@ -73,7 +78,7 @@ async def handle_create(
 ) -> None:
     """Generate a backup."""
     manager: BackupManager = hass.data[DOMAIN]
-    backup = await manager.generate_backup()
+    backup = await manager.generate_backup(incremental=msg["incremental"])
     connection.send_result(msg["id"], backup)
 
 
@@ -3,17 +3,26 @@
 from __future__ import annotations
 
 import asyncio
-from collections import defaultdict
+from collections import Counter, defaultdict
 from collections.abc import Awaitable, Callable, Iterable
 from dataclasses import dataclass
 import functools
+import itertools
 import logging
 from pathlib import Path
 import re
 from typing import IO, Any
 
 from hassil.expression import Expression, ListReference, Sequence
-from hassil.intents import Intents, SlotList, TextSlotList, WildcardSlotList
+from hassil.intents import (
+    Intent,
+    IntentData,
+    Intents,
+    SlotList,
+    TextSlotList,
+    TextSlotValue,
+    WildcardSlotList,
+)
 from hassil.recognize import (
     MISSING_ENTITY,
     RecognizeResult,
@@ -143,9 +152,21 @@ class DefaultAgent(AbstractConversationAgent):
         self._config_intents: dict[str, Any] = {}
         self._slot_lists: dict[str, SlotList] | None = None
 
+        # entity_id -> values of the exposed entity in the name slot list,
+        # None if the values of all entities need to be gathered again
+        self._entity_names: dict[str, list[TextSlotValue]] | None = None
+        # Values of the area slot list, None if they need to be gathered again
+        self._area_names: list[TextSlotValue] | None = None
+
         # Sentences that will trigger a callback (skipping intent recognition)
-        self._trigger_sentences: list[TriggerData] = []
+        # trigger id -> trigger data
+        self._trigger_sentences: dict[int, TriggerData] = {}
+        self._trigger_ids = itertools.count()
+        # Parsed sentences of all triggers, updated when a trigger is
+        # registered or unregistered
         self._trigger_intents: Intents | None = None
+        # Wildcard slot list name -> number of triggers referencing it
+        self._trigger_wildcards: Counter[str] = Counter()
 
     @property
     def supported_languages(self) -> list[str]:
@@ -700,99 +721,140 @@ class DefaultAgent(AbstractConversationAgent):
         self, event: core.Event[ar.EventAreaRegistryUpdatedData]
     ) -> None:
         """Clear area area cache when the area registry has changed."""
+        self._area_names = None
         self._slot_lists = None
 
     @core.callback
     def _async_handle_entity_registry_changed(
         self, event: core.Event[er.EventEntityRegistryUpdatedData]
     ) -> None:
-        """Clear names list cache when an entity registry entry has changed."""
+        """Update the names of an entity when its registry entry has changed."""
         if event.data["action"] != "update" or not any(
             field in event.data["changes"] for field in _ENTITY_REGISTRY_UPDATE_FIELDS
         ):
             return
-        self._slot_lists = None
+        entity_id = event.data["entity_id"]
+        self._async_update_entity_names(entity_id, self.hass.states.get(entity_id))
 
     @core.callback
     def _async_handle_state_changed(
         self, event: core.Event[EventStateChangedData]
     ) -> None:
-        """Clear names list cache when a state is added or removed from the state machine."""
-        if event.data["old_state"] and event.data["new_state"]:
-            return
-        self._slot_lists = None
+        """Update the names of an entity when its state is added, removed or renamed."""
+        new_state = event.data["new_state"]
+        if (old_state := event.data["old_state"]) and new_state:
+            if old_state.attributes is new_state.attributes or (
+                old_state.name == new_state.name
+                and all(
+                    old_state.attributes.get(attr) == new_state.attributes.get(attr)
+                    for attr in DEFAULT_EXPOSED_ATTRIBUTES
+                )
+            ):
+                return
+        self._async_update_entity_names(event.data["entity_id"], new_state)
 
     @core.callback
     def _async_exposed_entities_updated(self) -> None:
         """Handle updated preferences."""
+        self._entity_names = None
+        self._slot_lists = None
+
+    @core.callback
+    def _async_update_entity_names(
+        self, entity_id: str, state: core.State | None
+    ) -> None:
+        """Update the values of an entity in the name slot list."""
+        if (entity_names := self._entity_names) is None:
+            # The names of all entities are gathered on next use
+            return
+        names = self._get_entity_names(state) if state is not None else None
+        if entity_names.get(entity_id) == names:
+            return
+        if names is None:
+            del entity_names[entity_id]
+        else:
+            entity_names[entity_id] = names
         self._slot_lists = None
 
+    def _get_entity_names(self, state: core.State) -> list[TextSlotValue] | None:
+        """Return the values of an entity in the name slot list.
+
+        Returns None if the entity is not exposed.
+        """
+        if not async_should_expose(self.hass, DOMAIN, state.entity_id):
+            return None
+
+        # Checked against "requires_context" and "excludes_context" in hassil
+        context = {"domain": state.domain}
+        if state.attributes:
+            # Include some attributes
+            for attr in DEFAULT_EXPOSED_ATTRIBUTES:
+                if attr not in state.attributes:
+                    continue
+                context[attr] = state.attributes[attr]
+
+        names: list[tuple[str, str, dict[str, Any]]] = []
+        entity = er.async_get(self.hass).async_get(state.entity_id)
+        if entity and entity.aliases:
+            for alias in entity.aliases:
+                if not alias.strip():
+                    continue
+
+                names.append((alias, alias, context))
+
+        # Default name
+        names.append((state.name, state.name, context))
+
+        return [TextSlotValue.from_tuple(name, allow_template=False) for name in names]
+
     def _make_slot_lists(self) -> dict[str, SlotList]:
         """Create slot lists with areas and entity names/aliases."""
         if self._slot_lists is not None:
             return self._slot_lists
 
-        entity_registry = er.async_get(self.hass)
-        states = [
-            state
-            for state in self.hass.states.async_all()
-            if async_should_expose(self.hass, DOMAIN, state.entity_id)
-        ]
-
         # Gather exposed entity names.
         #
         # NOTE: We do not pass entity ids in here because multiple entities may
         # have the same name. The intent matcher doesn't gather all matching
         # values for a list, just the first. So we will need to match by name no
         # matter what.
-        entity_names = []
-        for state in states:
-            # Checked against "requires_context" and "excludes_context" in hassil
-            context = {"domain": state.domain}
-            if state.attributes:
-                # Include some attributes
-                for attr in DEFAULT_EXPOSED_ATTRIBUTES:
-                    if attr not in state.attributes:
-                        continue
-                    context[attr] = state.attributes[attr]
-
-            entity = entity_registry.async_get(state.entity_id)
-
-            if not entity:
-                # Default name
-                entity_names.append((state.name, state.name, context))
-                continue
-
-            if entity.aliases:
-                for alias in entity.aliases:
-                    if not alias.strip():
-                        continue
-
-                    entity_names.append((alias, alias, context))
-
-            # Default name
-            entity_names.append((state.name, state.name, context))
+        #
+        # The names are gathered once and then kept up to date when entities
+        # are added, removed or renamed.
+        if self._entity_names is None:
+            self._entity_names = {
+                state.entity_id: names
+                for state in self.hass.states.async_all()
+                if (names := self._get_entity_names(state)) is not None
+            }
 
         # Expose all areas.
         #
         # We pass in area id here with the expectation that no two areas will
         # share the same name or alias.
-        areas = ar.async_get(self.hass)
-        area_names = []
-        for area in areas.async_list_areas():
-            area_names.append((area.name, area.id))
-            if area.aliases:
-                for alias in area.aliases:
-                    if not alias.strip():
-                        continue
-
-                    area_names.append((alias, area.id))
+        if self._area_names is None:
+            areas = ar.async_get(self.hass)
+            area_names = []
+            for area in areas.async_list_areas():
+                area_names.append((area.name, area.id))
+                if area.aliases:
+                    for alias in area.aliases:
+                        if not alias.strip():
+                            continue
+
+                        area_names.append((alias, area.id))
+            self._area_names = [
+                TextSlotValue.from_tuple(name, allow_template=False)
+                for name in area_names
+            ]
 
-        _LOGGER.debug("Exposed entities: %s", entity_names)
+        _LOGGER.debug("Exposed entities: %s", self._entity_names)
 
         self._slot_lists = {
-            "area": TextSlotList.from_tuples(area_names, allow_template=False),
-            "name": TextSlotList.from_tuples(entity_names, allow_template=False),
+            "area": TextSlotList(values=list(self._area_names)),
+            "name": TextSlotList(
+                values=list(itertools.chain.from_iterable(self._entity_names.values()))
+            ),
         }
 
         return self._slot_lists
@@ -840,48 +902,62 @@ class DefaultAgent(AbstractConversationAgent):
         callback: TRIGGER_CALLBACK_TYPE,
     ) -> core.CALLBACK_TYPE:
         """Register a list of sentences that will trigger a callback when recognized."""
+        trigger_id = next(self._trigger_ids)
         trigger_data = TriggerData(sentences=sentences, callback=callback)
-        self._trigger_sentences.append(trigger_data)
+        self._trigger_sentences[trigger_id] = trigger_data
 
-        # Force rebuild on next use
-        self._trigger_intents = None
+        if self._trigger_intents is not None:
+            self._add_trigger_intent(trigger_id, trigger_data)
 
-        unregister = functools.partial(self._unregister_trigger, trigger_data)
+        unregister = functools.partial(self._unregister_trigger, trigger_id)
         return unregister
 
-    def _rebuild_trigger_intents(self) -> None:
-        """Rebuild the HassIL intents object from the current trigger sentences."""
-        intents_dict = {
-            "language": self.hass.config.language,
-            "intents": {
-                # Use trigger data index as a virtual intent name for HassIL.
-                # This works because the intents are rebuilt on every
-                # register/unregister.
-                str(trigger_id): {"data": [{"sentences": trigger_data.sentences}]}
-                for trigger_id, trigger_data in enumerate(self._trigger_sentences)
-            },
-        }
+    def _add_trigger_intent(self, trigger_id: int, trigger_data: TriggerData) -> None:
+        """Add the sentences of a trigger to the HassIL intents object."""
+        assert self._trigger_intents is not None
 
-        self._trigger_intents = Intents.from_dict(intents_dict)
+        # Use trigger id as a virtual intent name for HassIL.
+        trigger_intent = Intent(
+            name=str(trigger_id),
+            data=[IntentData(sentence_texts=trigger_data.sentences)],
+        )
+        self._trigger_intents.intents[trigger_intent.name] = trigger_intent
 
-        # Assume slot list references are wildcards
-        wildcard_names: set[str] = set()
-        for trigger_intent in self._trigger_intents.intents.values():
-            for intent_data in trigger_intent.data:
-                for sentence in intent_data.sentences:
-                    _collect_list_references(sentence, wildcard_names)
+        for wildcard_name in _trigger_wildcard_names(trigger_intent):
+            self._trigger_wildcards[wildcard_name] += 1
+            self._trigger_intents.slot_lists.setdefault(
+                wildcard_name, WildcardSlotList()
+            )
 
-        for wildcard_name in wildcard_names:
-            self._trigger_intents.slot_lists[wildcard_name] = WildcardSlotList()
+    def _rebuild_trigger_intents(self) -> None:
+        """Rebuild the HassIL intents object from the current trigger sentences."""
+        self._trigger_intents = Intents(language=self.hass.config.language, intents={})
+        self._trigger_wildcards.clear()
+        for trigger_id, trigger_data in self._trigger_sentences.items():
+            self._add_trigger_intent(trigger_id, trigger_data)
 
-        _LOGGER.debug("Rebuilt trigger intents: %s", intents_dict)
+        _LOGGER.debug(
+            "Rebuilt trigger intents: %s",
+            {
+                trigger_id: trigger_data.sentences
+                for trigger_id, trigger_data in self._trigger_sentences.items()
+            },
+        )
 
-    def _unregister_trigger(self, trigger_data: TriggerData) -> None:
+    def _unregister_trigger(self, trigger_id: int) -> None:
         """Unregister a set of trigger sentences."""
-        self._trigger_sentences.remove(trigger_data)
+        del self._trigger_sentences[trigger_id]
+
+        if self._trigger_intents is None:
+            return
 
-        # Force rebuild on next use
-        self._trigger_intents = None
+        trigger_intent = self._trigger_intents.intents.pop(str(trigger_id))
+        for wildcard_name in _trigger_wildcard_names(trigger_intent):
+            self._trigger_wildcards[wildcard_name] -= 1
+            if not self._trigger_wildcards[wildcard_name]:
+                # No trigger references the wildcard anymore
+                del self._trigger_wildcards[wildcard_name]
+                del self._trigger_intents.slot_lists[wildcard_name]
 
     async def _match_triggers(self, sentence: str) -> SentenceTriggerResult | None:
         """Try to match sentence against registered trigger sentences.
@@ -893,7 +969,10 @@ class DefaultAgent(AbstractConversationAgent):
             # No triggers registered
             return None
 
-        if self._trigger_intents is None:
+        if (
+            self._trigger_intents is None
+            or self._trigger_intents.language != self.hass.config.language
+        ):
             # Need to rebuild intents before matching
             self._rebuild_trigger_intents()
 
@@ -1021,6 +1100,18 @@ def _get_duplicate_names_matched_response(
     return ErrorKey.DUPLICATE_ENTITIES, {"entity": duplicate_names_error.name}
 
 
+def _trigger_wildcard_names(trigger_intent: Intent) -> set[str]:
+    """Return the names of the slot lists referenced by a trigger.
+
+    The slot lists of triggers are assumed to be wildcards.
+    """
+    wildcard_names: set[str] = set()
+    for intent_data in trigger_intent.data:
+        for sentence in intent_data.sentences:
+            _collect_list_references(sentence, wildcard_names)
+    return wildcard_names
+
+
 def _collect_list_references(expression: Expression, list_names: set[str]) -> None:
     """Collect list reference names recursively."""
     if isinstance(expression, Sequence):
@@ -37,6 +37,7 @@ SERVICE_LRU_STATS = "lru_stats"
 SERVICE_LOG_THREAD_FRAMES = "log_thread_frames"
 SERVICE_LOG_EVENT_LOOP_SCHEDULED = "log_event_loop_scheduled"
 SERVICE_SET_ASYNCIO_DEBUG = "set_asyncio_debug"
+SERVICE_LOG_EVENT_BUS_STATS = "log_event_bus_stats"
 
 _LRU_CACHE_WRAPPER_OBJECT = _lru_cache_wrapper.__name__
 _SQLALCHEMY_LRU_OBJECT = "LRUCache"
@@ -59,6 +60,7 @@ SERVICES = (
     SERVICE_LOG_THREAD_FRAMES,
     SERVICE_LOG_EVENT_LOOP_SCHEDULED,
     SERVICE_SET_ASYNCIO_DEBUG,
+    SERVICE_LOG_EVENT_BUS_STATS,
 )
 
 DEFAULT_SCAN_INTERVAL = timedelta(seconds=30)
@@ -70,6 +72,7 @@ CONF_SECONDS = "seconds"
 CONF_MAX_OBJECTS = "max_objects"
 
 LOG_INTERVAL_SUB = "log_interval_subscription"
+EVENT_BUS_STATS_RUNNING = "event_bus_stats_running"
 
 
 _LOGGER = logging.getLogger(__name__)
@@ -257,6 +260,33 @@ async def async_setup_entry(  # noqa: C901
             arepr.maxstring = original_maxstring
             arepr.maxother = original_maxother
 
+    async def _async_log_event_bus_stats(call: ServiceCall) -> None:
+        """Log statistics about firing events for a period of time."""
+        if domain_data.get(EVENT_BUS_STATS_RUNNING):
+            raise HomeAssistantError("Event bus statistics are already being collected")
+        domain_data[EVENT_BUS_STATS_RUNNING] = True
+        seconds = float(call.data[CONF_SECONDS])
+        hass.bus.async_start_collecting_stats()
+        try:
+            await asyncio.sleep(seconds)
+        finally:
+            stats = hass.bus.async_stop_collecting_stats()
+            domain_data.pop(EVENT_BUS_STATS_RUNNING, None)
+        for event_type, event_type_stats in sorted(
+            stats.items(), key=lambda item: item[1].dispatch_time, reverse=True
+        ):
+            _LOGGER.critical(
+                (
+                    "Event bus stats for %s over %s seconds: fired %s times, "
+                    "called %s event filters, dispatching took %.6f seconds"
+                ),
+                event_type,
+                seconds,
+                event_type_stats.fired,
+                event_type_stats.filter_calls,
+                event_type_stats.dispatch_time,
+            )
+
     async def _async_asyncio_debug(call: ServiceCall) -> None:
         """Enable or disable asyncio debug."""
         enabled = call.data[CONF_ENABLED]
@@ -364,6 +394,16 @@ async def async_setup_entry(  # noqa: C901
         _async_dump_scheduled,
     )
 
+    async_register_admin_service(
+        hass,
+        DOMAIN,
+        SERVICE_LOG_EVENT_BUS_STATS,
+        _async_log_event_bus_stats,
+        schema=vol.Schema(
+            {vol.Optional(CONF_SECONDS, default=60.0): vol.Coerce(float)}
+        ),
+    )
+
     async_register_admin_service(
         hass,
         DOMAIN,
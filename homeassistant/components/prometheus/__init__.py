@@ -8,7 +8,7 @@ import logging
 import string
 from typing import Any, TypeVar, cast
 
-from aiohttp import web
+from aiohttp import hdrs, web
 import prometheus_client
 from prometheus_client.metrics import MetricWrapperBase
 import voluptuous as vol
@@ -26,7 +26,7 @@ from homeassistant.components.cover import (
     ATTR_CURRENT_POSITION,
     ATTR_CURRENT_TILT_POSITION,
 )
-from homeassistant.components.http import HomeAssistantView
+from homeassistant.components.http import KEY_HASS, HomeAssistantView
 from homeassistant.components.humidifier import ATTR_AVAILABLE_MODES, ATTR_HUMIDITY
 from homeassistant.components.light import ATTR_BRIGHTNESS
 from homeassistant.components.sensor import SensorDeviceClass
@@ -62,6 +62,8 @@ from homeassistant.helpers.typing import ConfigType
 from homeassistant.util.dt import as_timestamp
 from homeassistant.util.unit_conversion import TemperatureConverter
 
+from .exposition import CONTENT_TYPE_OPENMETRICS, MetricsExposition
+
 _MetricBaseT = TypeVar("_MetricBaseT", bound=MetricWrapperBase)
 _LOGGER = logging.getLogger(__name__)
 
@@ -109,8 +111,6 @@ CONFIG_SCHEMA = vol.Schema(
 
 def setup(hass: HomeAssistant, config: ConfigType) -> bool:
     """Activate Prometheus component."""
-    hass.http.register_view(PrometheusView(config[DOMAIN][CONF_REQUIRES_AUTH]))
-
     conf: dict[str, Any] = config[DOMAIN]
     entity_filter: entityfilter.EntityFilter = conf[CONF_FILTER]
     namespace: str = conf[CONF_PROM_NAMESPACE]
@@ -131,6 +131,9 @@ def setup(hass: HomeAssistant, config: ConfigType) -> bool:
         override_metric,
         default_metric,
     )
+    hass.http.register_view(
+        PrometheusView(conf[CONF_REQUIRES_AUTH], metrics.exposition)
+    )
 
     hass.bus.listen(EVENT_STATE_CHANGED, metrics.handle_state_changed_event)
     hass.bus.listen(
@@ -178,6 +181,7 @@ class PrometheusMetrics:
         else:
             self.metrics_prefix = ""
         self._metrics: dict[str, MetricWrapperBase] = {}
+        self.exposition = MetricsExposition()
         self._climate_units = climate_units
 
     def handle_state_changed_event(self, event: Event[EventStateChangedData]) -> None:
@@ -258,7 +262,7 @@ class PrometheusMetrics:
         self, entity_id: str, friendly_name: str | None = None
     ) -> None:
         """Remove labelsets matching the given entity id from all metrics."""
-        for metric in self._metrics.values():
+        for name, metric in self._metrics.items():
             for sample in cast(list[prometheus_client.Metric], metric.collect())[
                 0
             ].samples:
@@ -272,6 +276,7 @@ class PrometheusMetrics:
                     )
                     with suppress(KeyError):
                         metric.remove(*sample.labels.values())
+                    self.exposition.touch(name)
 
     def _handle_attributes(self, state: State) -> None:
         for key, value in state.attributes.items():
@@ -299,17 +304,21 @@ class PrometheusMetrics:
             labels.extend(extra_labels)
 
         try:
+            # The metric is fetched to be updated
+            self.exposition.touch(metric)
             return cast(_MetricBaseT, self._metrics[metric])
         except KeyError:
             full_metric_name = self._sanitize_metric_name(
                 f"{self.metrics_prefix}{metric}"
             )
+            # The metrics are rendered by the exposition, not the registry
             self._metrics[metric] = factory(
                 full_metric_name,
                 documentation,
                 labels,
-                registry=prometheus_client.REGISTRY,
+                registry=None,
             )
+            self.exposition.add(metric, self._metrics[metric])
             return cast(_MetricBaseT, self._metrics[metric])
 
     @staticmethod
@@ -723,15 +732,29 @@ class PrometheusView(HomeAssistantView):
     url = API_ENDPOINT
     name = "api:prometheus"
 
-    def __init__(self, requires_auth: bool) -> None:
+    def __init__(self, requires_auth: bool, exposition: MetricsExposition) -> None:
         """Initialize Prometheus view."""
         self.requires_auth = requires_auth
+        self._exposition = exposition
 
     async def get(self, request: web.Request) -> web.Response:
         """Handle request for Prometheus metrics."""
         _LOGGER.debug("Received Prometheus metrics request")
 
+        use_openmetrics = any(
+            accepted.split(";")[0].strip() == "application/openmetrics-text"
+            for accepted in request.headers.get(hdrs.ACCEPT, "").split(",")
+        )
+        compress = "gzip" in request.headers.get(hdrs.ACCEPT_ENCODING, "")
+        body = await self._exposition.async_render(
+            request.app[KEY_HASS], use_openmetrics, compress
+        )
+        headers: dict[str, str] = {hdrs.VARY: hdrs.ACCEPT_ENCODING}
+        if compress:
+            headers[hdrs.CONTENT_ENCODING] = "gzip"
+        if use_openmetrics:
+            headers[hdrs.CONTENT_TYPE] = CONTENT_TYPE_OPENMETRICS
+            return web.Response(body=body, headers=headers)
         return web.Response(
-            body=prometheus_client.generate_latest(prometheus_client.REGISTRY),
-            content_type=CONTENT_TYPE_TEXT_PLAIN,
+            body=body, content_type=CONTENT_TYPE_TEXT_PLAIN, headers=headers
         )
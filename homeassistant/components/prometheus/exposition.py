@@ -0,0 +1,138 @@
+"""Render the metrics of Home Assistant for Prometheus scrapes."""
+
+from __future__ import annotations
+
+import asyncio
+from dataclasses import dataclass
+import struct
+from typing import cast
+import zlib
+
+import prometheus_client
+from prometheus_client.metrics import MetricWrapperBase
+from prometheus_client.openmetrics import exposition as openmetrics
+
+from homeassistant.core import HomeAssistant
+
+CONTENT_TYPE_OPENMETRICS = openmetrics.CONTENT_TYPE_LATEST
+
+_OPENMETRICS_EOF = b"# EOF\n"
+
+GZIP_COMPRESS_LEVEL = 6
+# Gzip header without a file name or modification time
+_GZIP_HEADER = b"\x1f\x8b\x08\x00\x00\x00\x00\x00\x00\xff"
+# An empty, final deflate block
+_DEFLATE_END = b"\x03\x00"
+
+
+def _render(collector: object, use_openmetrics: bool) -> bytes:
+    """Render the metrics of a collector in the text or OpenMetrics format."""
+    registry = cast(prometheus_client.CollectorRegistry, collector)
+    if not use_openmetrics:
+        return prometheus_client.generate_latest(registry)
+    # The end of the exposition is added once after all collectors
+    text = cast(bytes, openmetrics.generate_latest(registry))  # type: ignore[no-untyped-call]
+    return text.removesuffix(_OPENMETRICS_EOF)
+
+
+def _deflate(data: bytes) -> bytes:
+    """Compress data to deflate blocks which can be joined with other blocks.
+
+    A new compressor does not refer to earlier data, and the sync flush
+    ends the blocks at a byte boundary without marking them as final.
+    """
+    compressor = zlib.compressobj(GZIP_COMPRESS_LEVEL, zlib.DEFLATED, -zlib.MAX_WBITS)
+    return compressor.compress(data) + compressor.flush(zlib.Z_SYNC_FLUSH)
+
+
+@dataclass(slots=True)
+class _RenderedFamily:
+    """The text of a metric family and its deflate blocks."""
+
+    text: bytes
+    deflated: bytes | None = None
+
+
+class MetricsExposition:
+    """Exposition of the metric families of Home Assistant.
+
+    The rendered text of each family is cached, and only families which
+    were touched since the last scrape are rendered again. Rendering is
+    done in the executor.
+
+    Gzip compressed responses are a single gzip stream, joined from the
+    cached deflate blocks of each family, so unchanged families are not
+    compressed again either. The collectors of the global registry, like
+    the process metrics, are rendered on every scrape.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the exposition."""
+        self._families: dict[str, MetricWrapperBase] = {}
+        # Families which were touched since they were rendered
+        self._dirty: set[str] = set()
+        # (family, OpenMetrics) -> rendered family
+        self._rendered: dict[tuple[str, bool], _RenderedFamily] = {}
+        self._lock = asyncio.Lock()
+
+    def add(self, name: str, metric: MetricWrapperBase) -> None:
+        """Add a metric family."""
+        self._families[name] = metric
+        self._dirty.add(name)
+
+    def touch(self, name: str) -> None:
+        """Mark a metric family as changed."""
+        self._dirty.add(name)
+
+    async def async_render(
+        self, hass: HomeAssistant, use_openmetrics: bool, compress: bool
+    ) -> bytes:
+        """Render the metrics."""
+        async with self._lock:
+            dirty = self._dirty
+            self._dirty = set()
+            return await hass.async_add_executor_job(
+                self._render_families,
+                list(self._families.items()),
+                dirty,
+                use_openmetrics,
+                compress,
+            )
+
+    def _render_families(
+        self,
+        families: list[tuple[str, MetricWrapperBase]],
+        dirty: set[str],
+        use_openmetrics: bool,
+        compress: bool,
+    ) -> bytes:
+        """Render the metrics, using the cache for unchanged families."""
+        rendered = self._rendered
+        for name in dirty:
+            rendered.pop((name, False), None)
+            rendered.pop((name, True), None)
+
+        parts = [_RenderedFamily(_render(prometheus_client.REGISTRY, use_openmetrics))]
+        for name, metric in families:
+            if (family := rendered.get((name, use_openmetrics))) is None:
+                family = _RenderedFamily(_render(metric, use_openmetrics))
+                rendered[(name, use_openmetrics)] = family
+            parts.append(family)
+        if use_openmetrics:
+            parts.append(_RenderedFamily(_OPENMETRICS_EOF))
+
+        if not compress:
+            return b"".join(part.text for part in parts)
+
+        crc = 0
+        size = 0
+        blocks = [_GZIP_HEADER]
+        for part in parts:
+            if part.deflated is None:
+                part.deflated = _deflate(part.text)
+            blocks.append(part.deflated)
+            crc = zlib.crc32(part.text, crc)
+            size += len(part.text)
+        blocks.append(_DEFLATE_END)
+        blocks.append(struct.pack("<II", crc, size & 0xFFFFFFFF))
+        return b"".join(blocks)
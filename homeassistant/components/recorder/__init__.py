@@ -162,6 +162,7 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
         entity_filter=entity_filter,
         exclude_event_types=exclude_event_types,
     )
+    await instance.async_load_backlog_journal()
     instance.async_initialize()
     instance.async_register()
     instance.start()
@@ -0,0 +1,245 @@
+"""Spill queued events to disk when the recorder falls behind."""
+
+from __future__ import annotations
+
+from contextlib import suppress
+import logging
+import os
+import threading
+from typing import IO, Any, cast
+
+from homeassistant.const import EVENT_STATE_CHANGED
+from homeassistant.core import Context, Event, EventOrigin, HomeAssistant, State
+from homeassistant.exceptions import HomeAssistantError
+from homeassistant.helpers.json import json_bytes
+from homeassistant.util.file import write_utf8_file
+from homeassistant.util.json import JSON_DECODE_EXCEPTIONS, json_loads
+
+from .const import BACKLOG_FLUSH_SIZE
+
+_LOGGER = logging.getLogger(__name__)
+
+
+def _event_to_json_line(event: Event) -> bytes:
+    """Serialize an event to a journal line.
+
+    The recorder only uses the new state of state_changed events,
+    so the old state is not written to save disk space.
+    """
+    data: Any = event.data
+    if event.event_type == EVENT_STATE_CHANGED:
+        data = {"entity_id": data["entity_id"], "new_state": data["new_state"]}
+    context = event.context
+    return (
+        json_bytes(
+            {
+                "e": event.event_type,
+                "d": data,
+                "o": event.origin.value,
+                "t": event.time_fired_timestamp,
+                "c": [context.id, context.user_id, context.parent_id],
+            }
+        )
+        + b"\n"
+    )
+
+
+def _event_from_json_line(line: bytes) -> Event:
+    """Deserialize an event from a journal line."""
+    row = cast(dict[str, Any], json_loads(line))
+    data = row["d"]
+    if row["e"] == EVENT_STATE_CHANGED:
+        data["old_state"] = None
+        data["new_state"] = State.from_dict(data["new_state"])
+    context_id, user_id, parent_id = row["c"]
+    return Event(
+        row["e"],
+        data,
+        EventOrigin(row["o"]),
+        row["t"],
+        Context(user_id=user_id, parent_id=parent_id, id=context_id),
+    )
+
+
+class EventBacklogJournal:
+    """Append-only journal of events waiting to be recorded.
+
+    Once the recorder queue reaches the spill threshold, events are
+    appended to the journal instead of the queue until the recorder has
+    replayed all of them, which keeps them in order. Events are collected
+    in memory by the event loop and written to disk in the executor in
+    chunks of BACKLOG_FLUSH_SIZE. The recorder thread reads them back in
+    order and also takes the events which were not written yet.
+
+    Events which were not replayed before shutdown are written to disk
+    together with the offset of the first unread event, they are
+    replayed after the next start.
+
+    The events are counted when they are added and when they are taken,
+    so the recorder can run a task after the events which were spilled
+    before it.
+    """
+
+    def __init__(self, hass: HomeAssistant, path: str) -> None:
+        """Initialize the journal."""
+        self._hass = hass
+        self._path = path
+        self._offset_path = f"{path}.offset"
+        self._lock = threading.Lock()
+        self._pending: list[Event] = []
+        self._flush_scheduled = False
+        self._reader: IO[bytes] | None = None
+        self._read_offset = 0
+        self._unread_lines = 0
+        # Read without the lock by the event loop, only changed with it
+        self.active = False
+        self.added = 0
+        self.taken = 0
+        self.spilled = 0
+        self.replayed = 0
+        self.replay_seconds = 0.0
+
+    def __len__(self) -> int:
+        """Return the number of events waiting to be replayed."""
+        return self._unread_lines + len(self._pending)
+
+    @property
+    def replay_rate(self) -> float | None:
+        """Return the number of replayed events per second."""
+        if not self.replay_seconds:
+            return None
+        return self.replayed / self.replay_seconds
+
+    def async_append(self, event: Event) -> None:
+        """Add an event to the end of the journal.
+
+        This method must be run in the event loop.
+        """
+        with self._lock:
+            self.active = True
+            self._pending.append(event)
+            self.added += 1
+            self.spilled += 1
+            if self._flush_scheduled or len(self._pending) < BACKLOG_FLUSH_SIZE:
+                return
+            self._flush_scheduled = True
+        self._hass.async_add_executor_job(self.flush)
+
+    def flush(self) -> None:
+        """Write the pending events to disk."""
+        with self._lock:
+            self._flush_scheduled = False
+            self._write_pending()
+
+    def _write_pending(self) -> None:
+        """Write the pending events to disk, the lock must be held."""
+        if not self._pending:
+            return
+        lines: list[bytes] = []
+        for event in self._pending:
+            try:
+                lines.append(_event_to_json_line(event))
+            except (TypeError, ValueError):
+                # The recorder would not be able to record it either
+                _LOGGER.warning("Event is not JSON serializable: %s", event)
+        # Events which can't be written are taken right away
+        self.taken += len(self._pending) - len(lines)
+        self._pending.clear()
+        with open(self._path, "ab") as journal:
+            journal.write(b"".join(lines))
+        self._unread_lines += len(lines)
+
+    def load(self) -> None:
+        """Resume a journal which was not replayed before the last shutdown."""
+        with self._lock:
+            if not os.path.exists(self._path):
+                return
+            with (
+                suppress(FileNotFoundError, ValueError),
+                open(self._offset_path, encoding="utf-8") as offset_file,
+            ):
+                self._read_offset = int(offset_file.read())
+            with open(self._path, "rb") as journal:
+                journal.seek(self._read_offset)
+                unread_lines = sum(1 for _ in journal)
+            self._unread_lines = unread_lines
+            self.added += unread_lines
+            if unread_lines:
+                self.active = True
+                _LOGGER.info(
+                    "Resuming %s events spilled to disk before shutdown",
+                    unread_lines,
+                )
+
+    def read_batch(self, max_events: int) -> list[Event]:
+        """Return up to max_events of the oldest events.
+
+        Stops being active once all events have been read.
+        """
+        lines: list[bytes] = []
+        with self._lock:
+            if self._unread_lines:
+                if self._reader is None:
+                    # pylint: disable-next=consider-using-with
+                    self._reader = open(self._path, "rb")
+                    self._reader.seek(self._read_offset)
+                while len(lines) < max_events:
+                    if not (line := self._reader.readline()):
+                        # The journal is shorter than expected if it was
+                        # truncated, there is nothing more to read
+                        self._unread_lines = len(lines)
+                        break
+                    lines.append(line)
+                self._read_offset = self._reader.tell()
+                self._unread_lines -= len(lines)
+            if not self._unread_lines:
+                events = self._pending[: max_events - len(lines)]
+                del self._pending[: len(events)]
+            else:
+                events = []
+            self.taken += len(lines) + len(events)
+            if not self._unread_lines and not self._pending:
+                self.active = False
+                # Lines which were lost if the journal was truncated
+                self.taken = self.added
+                self._remove_files()
+
+        decoded_events: list[Event] = []
+        for line in lines:
+            try:
+                decoded_events.append(_event_from_json_line(line))
+            except (*JSON_DECODE_EXCEPTIONS, KeyError, TypeError, ValueError):
+                _LOGGER.warning("Skipping invalid event in the backlog journal")
+        decoded_events.extend(events)
+        return decoded_events
+
+    def record_replay(self, events: int, seconds: float) -> None:
+        """Record the time it took to replay events."""
+        self.replayed += events
+        self.replay_seconds += seconds
+
+    def _remove_files(self) -> None:
+        """Remove the journal once it has been replayed, the lock must be held."""
+        if self._reader is not None:
+            self._reader.close()
+            self._reader = None
+        self._read_offset = 0
+        self._unread_lines = 0
+        for path in (self._path, self._offset_path):
+            with suppress(FileNotFoundError):
+                os.unlink(path)
+
+    def close(self) -> None:
+        """Write all pending events to disk and remember the read offset."""
+        with self._lock:
+            self._write_pending()
+            if self._reader is not None:
+                self._reader.close()
+                self._reader = None
+            if not self._unread_lines:
+                self._remove_files()
+                return
+            try:
+                write_utf8_file(self._offset_path, str(self._read_offset))
+            except HomeAssistantError as err:
+                _LOGGER.error("Could not save the backlog journal offset: %s", err)
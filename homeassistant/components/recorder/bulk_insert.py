@@ -0,0 +1,294 @@
+"""Write event session rows with multi-row inserts."""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Sequence
+from typing import TYPE_CHECKING, Any, cast
+
+from sqlalchemy import Table, insert
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm.session import Session
+
+from .db_schema import Base, EventData, Events, StateAttributes, States
+from .util import chunked_or_all
+
+if TYPE_CHECKING:
+    from .core import Recorder
+
+
+def _insert_keys(table: Table, primary_key: str) -> tuple[str, ...]:
+    """Return the column keys to insert for a table."""
+    return tuple(column.key for column in table.columns if column.key != primary_key)
+
+
+_STATE_ATTRIBUTES_TABLE = cast(Table, StateAttributes.__table__)
+_EVENT_DATA_TABLE = cast(Table, EventData.__table__)
+_EVENTS_TABLE = cast(Table, Events.__table__)
+_STATES_TABLE = cast(Table, States.__table__)
+
+_STATE_ATTRIBUTES_KEYS = _insert_keys(_STATE_ATTRIBUTES_TABLE, "attributes_id")
+_EVENT_DATA_KEYS = _insert_keys(_EVENT_DATA_TABLE, "data_id")
+_EVENTS_KEYS = _insert_keys(_EVENTS_TABLE, "event_id")
+_STATES_KEYS = _insert_keys(_STATES_TABLE, "state_id")
+
+
+def supports_bulk_insert(engine: Engine) -> bool:
+    """Return if the database can return ids from a multi-row insert in order."""
+    return bool(engine.dialect.insert_executemany_returning_sort_by_parameter_order)
+
+
+class BulkInsertWriter:
+    """Accumulate rows between commits and write them with multi-row inserts.
+
+    The recorder still builds the ORM objects so the table managers
+    can track pending rows the same way they do for the unit of work,
+    but the objects are never added to the session. Instead they are
+    written with one executemany per table when the event session is
+    committed, and the newly created ids are copied back onto the
+    objects so post_commit_pending can pick them up.
+
+    If the commit fails and is retried in the same transaction, the
+    statements which already ran are not executed again, otherwise the
+    rows they inserted would be written twice.
+
+    This class is not thread-safe and must only be used from the
+    recorder thread.
+    """
+
+    def __init__(self, recorder: Recorder) -> None:
+        """Initialize the bulk insert writer."""
+        self.recorder = recorder
+        self._state_attributes: list[StateAttributes] = []
+        self._event_data: list[EventData] = []
+        self._events: list[Events] = []
+        self._states: list[States] = []
+        self._pending_by_type: dict[type, list[Any]] = {
+            StateAttributes: self._state_attributes,
+            EventData: self._event_data,
+            Events: self._events,
+            States: self._states,
+        }
+        # The rows selected for insert and the ids returned by the statements
+        # which ran in the current transaction
+        self._selected: dict[str, list[Any]] = {}
+        self._executed: list[list[int]] = []
+        self._statement = 0
+
+    def add(self, obj: object) -> bool:
+        """Add a row to be written at the next commit.
+
+        Returns False if the object must be added to the session instead.
+        """
+        if (pending := self._pending_by_type.get(type(obj))) is None:
+            return False
+        pending.append(obj)
+        return True
+
+    def write(self, session: Session) -> None:
+        """Write all pending rows in the current transaction.
+
+        EventTypes and StatesMeta rows are rare and still go through
+        the session so they are flushed first to make their ids
+        available to the events and states that reference them.
+        """
+        session.flush()
+        self._statement = 0
+        recorder = self.recorder
+        if state_attributes := self._rows_to_insert(
+            self._state_attributes,
+            lambda: recorder.state_attributes_manager.get_many(
+                (
+                    (cast(str, row.shared_attrs), cast(int, row.hash))
+                    for row in self._state_attributes
+                ),
+                session,
+            ),
+            "shared_attrs",
+            "attributes_id",
+        ):
+            self._insert_returning_ids(
+                session,
+                _STATE_ATTRIBUTES_TABLE,
+                _STATE_ATTRIBUTES_KEYS,
+                "attributes_id",
+                state_attributes,
+                [
+                    {"hash": row.hash, "shared_attrs": row.shared_attrs}
+                    for row in state_attributes
+                ],
+            )
+        if event_data := self._rows_to_insert(
+            self._event_data,
+            lambda: recorder.event_data_manager.get_many(
+                (
+                    (cast(str, row.shared_data), cast(int, row.hash))
+                    for row in self._event_data
+                ),
+                session,
+            ),
+            "shared_data",
+            "data_id",
+        ):
+            self._insert_returning_ids(
+                session,
+                _EVENT_DATA_TABLE,
+                _EVENT_DATA_KEYS,
+                "data_id",
+                event_data,
+                [
+                    {"hash": row.hash, "shared_data": row.shared_data}
+                    for row in event_data
+                ],
+            )
+        if self._events:
+            self._insert(
+                session,
+                _EVENTS_TABLE,
+                _EVENTS_KEYS,
+                [self._event_params(row) for row in self._events],
+            )
+        if self._states:
+            self._write_states(session)
+
+    def clear(self) -> None:
+        """Clear all pending rows after a commit or rollback."""
+        for pending in self._pending_by_type.values():
+            pending.clear()
+        self._selected.clear()
+        self._executed.clear()
+
+    def _write_states(self, session: Session) -> None:
+        """Write pending states in generations.
+
+        A state can link to an older state of the same entity that is
+        pending in the same commit. Those have to be written first so
+        the old_state_id is known, which means each generation is one
+        multi-row insert.
+        """
+        generations: list[list[States]] = []
+        generation_by_state: dict[int, int] = {}
+        for dbstate in self._states:
+            generation = 0
+            if (old_state := dbstate.__dict__.get("old_state")) is not None and (
+                old_generation := generation_by_state.get(id(old_state))
+            ) is not None:
+                generation = old_generation + 1
+            generation_by_state[id(dbstate)] = generation
+            if generation == len(generations):
+                generations.append([])
+            generations[generation].append(dbstate)
+
+        for generation_states in generations:
+            self._insert_returning_ids(
+                session,
+                _STATES_TABLE,
+                _STATES_KEYS,
+                "state_id",
+                generation_states,
+                [self._state_params(dbstate) for dbstate in generation_states],
+            )
+
+    def _rows_to_insert(
+        self,
+        rows: list[Any],
+        get_existing_ids: Callable[[], dict[str, int | None]],
+        shared_key: str,
+        primary_key: str,
+    ) -> list[Any]:
+        """Return the rows that are not in the database yet.
+
+        Rows that are already in the database get their existing id. The
+        rows are only selected once per transaction, since a retry would
+        find the rows inserted by the failed attempt.
+        """
+        if not rows:
+            return rows
+        if (to_insert := self._selected.get(primary_key)) is not None:
+            return to_insert
+        existing_ids = get_existing_ids()
+        to_insert = self._selected[primary_key] = []
+        for row in rows:
+            if (id_ := existing_ids.get(row.__dict__[shared_key])) is not None:
+                setattr(row, primary_key, id_)
+            else:
+                to_insert.append(row)
+        return to_insert
+
+    @staticmethod
+    def _event_params(dbevent: Events) -> dict[str, Any]:
+        """Return the insert parameters for an Events row."""
+        row = dbevent.__dict__
+        params = {key: row.get(key) for key in _EVENTS_KEYS}
+        if (event_type := row.get("event_type_rel")) is not None:
+            params["event_type_id"] = event_type.event_type_id
+        if (event_data := row.get("event_data_rel")) is not None:
+            params["data_id"] = event_data.data_id
+        return params
+
+    @staticmethod
+    def _state_params(dbstate: States) -> dict[str, Any]:
+        """Return the insert parameters for a States row."""
+        row = dbstate.__dict__
+        params = {key: row.get(key) for key in _STATES_KEYS}
+        if (old_state := row.get("old_state")) is not None:
+            params["old_state_id"] = old_state.__dict__.get("state_id")
+        if (state_attributes := row.get("state_attributes")) is not None:
+            params["attributes_id"] = state_attributes.attributes_id
+        if (states_meta := row.get("states_meta_rel")) is not None:
+            params["metadata_id"] = states_meta.metadata_id
+        return params
+
+    def _chunk_size(self, keys: tuple[str, ...]) -> int:
+        """Return the number of rows that fit in one statement."""
+        return max(1, self.recorder.max_bind_vars // len(keys))
+
+    def _insert(
+        self,
+        session: Session,
+        table: Table,
+        keys: tuple[str, ...],
+        params: list[dict[str, Any]],
+    ) -> None:
+        """Insert rows without fetching the new ids."""
+        stmt = insert(table)
+        for params_chunk in chunked_or_all(params, self._chunk_size(keys)):
+            self._execute(session, stmt, params_chunk, False)
+
+    def _insert_returning_ids(
+        self,
+        session: Session,
+        table: Table,
+        keys: tuple[str, ...],
+        primary_key: str,
+        rows: Sequence[Base],
+        params: list[dict[str, Any]],
+    ) -> None:
+        """Insert rows and copy the new ids back to the objects."""
+        stmt = insert(table).returning(
+            table.c[primary_key], sort_by_parameter_order=True
+        )
+        ids: list[int] = []
+        for params_chunk in chunked_or_all(params, self._chunk_size(keys)):
+            ids.extend(self._execute(session, stmt, params_chunk, True))
+        for row, id_ in zip(rows, ids, strict=True):
+            setattr(row, primary_key, id_)
+
+    def _execute(
+        self,
+        session: Session,
+        stmt: Any,
+        params: Sequence[dict[str, Any]],
+        returning: bool,
+    ) -> list[int]:
+        """Execute a statement unless it already ran in the current transaction.
+
+        Returns the new ids of a statement returning them.
+        """
+        statement = self._statement
+        self._statement += 1
+        if statement < len(self._executed):
+            return self._executed[statement]
+        result = session.execute(stmt, params)
+        ids: list[int] = list(result.scalars()) if returning else []
+        self._executed.append(ids)
+        return ids
@@ -25,6 +25,17 @@ MAX_QUEUE_BACKLOG_MIN_VALUE = 65000
 ESTIMATED_QUEUE_ITEM_SIZE = 10240
 QUEUE_PERCENTAGE_ALLOWED_AVAILABLE_MEMORY = 0.65
 
+# Events are spilled to the backlog journal on disk
+# once the queue reaches this size
+BACKLOG_SPILL_THRESHOLD = 30000
+# The number of events collected before writing them to the journal
+BACKLOG_FLUSH_SIZE = 1000
+# The number of spilled events replayed before checking the queue for tasks
+BACKLOG_REPLAY_BATCH_SIZE = 100
+BACKLOG_JOURNAL_FILE = ".recorder_backlog"
+# The recorder stops recording once this many events were spilled to disk
+BACKLOG_JOURNAL_MAX_EVENTS = 1000000
+
 # The maximum number of rows (events) we purge in one delete statement
 
 # sqlite3 has a limit of 999 until version 3.32.0
@@ -42,7 +42,13 @@ import homeassistant.util.dt as dt_util
 from homeassistant.util.enum import try_parse_enum
 
 from . import migration, statistics
+from .backlog import EventBacklogJournal
+from .bulk_insert import BulkInsertWriter, supports_bulk_insert
 from .const import (
+    BACKLOG_JOURNAL_FILE,
+    BACKLOG_JOURNAL_MAX_EVENTS,
+    BACKLOG_REPLAY_BATCH_SIZE,
+    BACKLOG_SPILL_THRESHOLD,
     DB_WORKER_PREFIX,
     DOMAIN,
     ESTIMATED_QUEUE_ITEM_SIZE,
@@ -83,6 +89,7 @@ from .migration import (
 )
 from .models import DatabaseEngine, StatisticData, StatisticMetaData, UnsupportedDialect
 from .pool import POOL_SIZE, MutexPool, RecorderPool
+from .purge import PurgeScheduler
 from .queries import get_migration_changes
 from .table_managers.event_data import EventDataManager
 from .table_managers.event_types import EventTypeManager
@@ -94,6 +101,7 @@ from .table_managers.statistics_meta import StatisticsMetaManager
 from .tasks import (
     AdjustLRUSizeTask,
     AdjustStatisticsTask,
+    AfterBacklogTask,
     ChangeStatisticsUnitTask,
     ClearStatisticsTask,
     CommitTask,
@@ -186,6 +194,11 @@ class Recorder(threading.Thread):
         self._hass_started: asyncio.Future[object] = hass.loop.create_future()
         self.commit_interval = commit_interval
         self._queue: queue.SimpleQueue[RecorderTask | Event] = queue.SimpleQueue()
+        # Events which did not fit in the queue, see backlog.py
+        self.backlog_journal = EventBacklogJournal(
+            hass, hass.config.path(BACKLOG_JOURNAL_FILE)
+        )
+        self.purge_scheduler = PurgeScheduler()
         self.db_url = uri
         self.db_max_retries = db_max_retries
         self.db_retry_wait = db_retry_wait
@@ -221,6 +234,9 @@ class Recorder(threading.Thread):
         self.statistics_meta_manager = StatisticsMetaManager(self)
 
         self.event_session: Session | None = None
+        # Set once connected if the database can return the ids
+        # of multi-row inserts, see bulk_insert.py
+        self.bulk_insert_writer: BulkInsertWriter | None = None
         self._get_session: Callable[[], Session] | None = None
         self._completed_first_database_setup: bool | None = None
         self.async_migration_event = asyncio.Event()
@@ -248,8 +264,11 @@ class Recorder(threading.Thread):
 
     @property
     def backlog(self) -> int:
-        """Return the number of items in the recorder backlog."""
-        return self._queue.qsize()
+        """Return the number of items in the recorder backlog.
+
+        Includes the events which were spilled to disk.
+        """
+        return self._queue.qsize() + len(self.backlog_journal)
 
     @property
     def dialect_name(self) -> SupportedDialect | None:
@@ -275,7 +294,17 @@ class Recorder(threading.Thread):
         return self._get_session()
 
     def queue_task(self, task: RecorderTask | Event) -> None:
-        """Add a task to the recorder queue."""
+        """Add a task to the recorder queue.
+
+        While events are spilled to disk, tasks are run after the events
+        which were spilled before them.
+        """
+        if (
+            (backlog_journal := self.backlog_journal).active
+            and isinstance(task, RecorderTask)
+            and task.wait_for_backlog
+        ):
+            task = AfterBacklogTask(task, backlog_journal.added)
         self._queue.put(task)
 
     def set_enable(self, enable: bool) -> None:
@@ -296,12 +325,34 @@ class Recorder(threading.Thread):
         if self.engine and hasattr(self.engine.pool, "shutdown"):
             self.engine.pool.shutdown()
 
+    async def async_load_backlog_journal(self) -> None:
+        """Resume the events which were spilled to disk before the last shutdown.
+
+        Must be done before events are queued, so the new events are
+        recorded after the events of the last run.
+        """
+        try:
+            await self.hass.async_add_executor_job(self.backlog_journal.load)
+        except OSError as err:
+            _LOGGER.error("Could not load the backlog journal: %s", err)
+
     @callback
     def async_initialize(self) -> None:
         """Initialize the recorder."""
         entity_filter = self.entity_filter
         exclude_event_types = self.exclude_event_types
-        queue_put = self._queue.put_nowait
+        queue_size = self._queue.qsize
+        backlog_journal = self.backlog_journal
+
+        @callback
+        def queue_put(event: Event) -> None:
+            """Queue an event or spill it to disk if the recorder is behind."""
+            # Once spilling starts, all events are spilled until the
+            # recorder has caught up to keep them in order
+            if backlog_journal.active or queue_size() >= BACKLOG_SPILL_THRESHOLD:
+                backlog_journal.async_append(event)
+            else:
+                self._queue.put_nowait(event)
 
         @callback
         def _event_listener(event: Event) -> None:
@@ -378,6 +429,18 @@ class Recorder(threading.Thread):
         """
         size = self.backlog
         _LOGGER.debug("Recorder queue size is: %s", size)
+        if (spilled := len(self.backlog_journal)) >= BACKLOG_JOURNAL_MAX_EVENTS:
+            _LOGGER.error(
+                (
+                    "The recorder backlog spilled to disk reached the maximum size "
+                    "of %s events; usually, the system is CPU bound, I/O bound, or "
+                    "the database is corrupt due to a disk problem; The recorder "
+                    "will stop recording events to avoid running out of disk space"
+                ),
+                spilled,
+            )
+            self._async_stop_queue_watcher_and_event_listener()
+            return
         if not self._reached_max_backlog_percentage(100):
             return
         _LOGGER.error(
@@ -400,7 +463,8 @@ class Recorder(threading.Thread):
     def _reached_max_backlog_percentage(self, percentage: int) -> bool:
         """Check if the system has reached the max queue backlog and return the maximum if it has."""
         percentage_modifier = percentage / 100
-        current_backlog = self.backlog
+        # Only the events in the queue are kept in memory
+        current_backlog = self._queue.qsize()
         # First check the minimum value since its cheap
         if current_backlog < (MAX_QUEUE_BACKLOG_MIN_VALUE * percentage_modifier):
             return False
@@ -706,7 +770,8 @@ class Recorder(threading.Thread):
     def _add_to_session(self, session: Session, obj: object) -> None:
         """Add an object to the session."""
         self._event_session_has_pending_writes = True
-        session.add(obj)
+        if (writer := self.bulk_insert_writer) is None or not writer.add(obj):
+            session.add(obj)
 
     def _run(self) -> None:
         """Start processing events to save."""
@@ -857,11 +922,38 @@ class Recorder(threading.Thread):
         del startup_task_or_events
 
         self.stop_requested = False
+        backlog_journal = self.backlog_journal
         while not self.stop_requested:
+            # Tasks and events which were queued before the backlog
+            # was spilled to disk are processed first
+            if backlog_journal.active and queue_.empty():
+                self._replay_backlog_journal()
+                continue
             self._guarded_process_one_task_or_event_or_recover(queue_.get())
 
+    def _replay_backlog_journal(
+        self, max_events: int = BACKLOG_REPLAY_BATCH_SIZE
+    ) -> None:
+        """Process a batch of the events which were spilled to disk."""
+        start = time.monotonic()
+        if not (events := self.backlog_journal.read_batch(max_events)):
+            return
+        self._pre_process_startup_events(events)
+        for event in events:
+            self._guarded_process_one_task_or_event_or_recover(event)
+        self.backlog_journal.record_replay(len(events), time.monotonic() - start)
+
+    def _replay_backlog_journal_until(self, position: int) -> None:
+        """Process the events which were spilled to disk before a position."""
+        backlog_journal = self.backlog_journal
+        while (
+            backlog_journal.active
+            and (remaining := position - backlog_journal.taken) > 0
+        ):
+            self._replay_backlog_journal(min(remaining, BACKLOG_REPLAY_BATCH_SIZE))
+
     def _pre_process_startup_events(
-        self, startup_task_or_events: list[RecorderTask | Event]
+        self, startup_task_or_events: Iterable[RecorderTask | Event]
     ) -> None:
         """Pre process startup events."""
         # Prime all the state_attributes and event_data caches
@@ -1066,6 +1158,9 @@ class Recorder(threading.Thread):
         # Matching attributes id found in the cache
         elif (data_id := event_data_manager.get_from_cache(shared_data)) or (
             (hash_ := EventData.hash_shared_data_bytes(shared_data_bytes))
+            # The bulk insert writer resolves existing data_ids
+            # for all pending EventData at once when committing
+            and self.bulk_insert_writer is None
             and (data_id := event_data_manager.get(shared_data, hash_, session))
         ):
             dbevent.data_id = data_id
@@ -1135,6 +1230,9 @@ class Recorder(threading.Thread):
             attributes_id := state_attributes_manager.get_from_cache(shared_attrs)
         ) or (
             (hash_ := StateAttributes.hash_shared_attrs_bytes(shared_attrs_bytes))
+            # The bulk insert writer resolves existing attributes_ids
+            # for all pending StateAttributes at once when committing
+            and self.bulk_insert_writer is None
             and (
                 attributes_id := state_attributes_manager.get(
                     shared_attrs, hash_, session
@@ -1188,6 +1286,8 @@ class Recorder(threading.Thread):
         session = self.event_session
         self._commits_without_expire += 1
 
+        if writer := self.bulk_insert_writer:
+            writer.write(session)
         session.commit()
         self._event_session_has_pending_writes = False
         # We just committed the state attributes to the database
@@ -1199,6 +1299,8 @@ class Recorder(threading.Thread):
         self.event_data_manager.post_commit_pending()
         self.event_type_manager.post_commit_pending()
         self.states_meta_manager.post_commit_pending()
+        if writer:
+            writer.clear()
 
         # Expire is an expensive operation (frequently more expensive
         # than the flush and commit itself) so we only
@@ -1226,6 +1328,8 @@ class Recorder(threading.Thread):
         self.event_type_manager.reset()
         self.states_meta_manager.reset()
         self.statistics_meta_manager.reset()
+        if self.bulk_insert_writer:
+            self.bulk_insert_writer.clear()
 
         if not self.event_session:
             return
@@ -1284,7 +1388,11 @@ class Recorder(threading.Thread):
 
     async def async_block_till_done(self) -> None:
         """Async version of block_till_done."""
-        if self._queue.empty() and not self._event_session_has_pending_writes:
+        if (
+            self._queue.empty()
+            and not self.backlog_journal.active
+            and not self._event_session_has_pending_writes
+        ):
             return
         event = asyncio.Event()
         self.queue_task(SynchronizeTask(event))
@@ -1412,6 +1520,8 @@ class Recorder(threading.Thread):
         sqlalchemy_event.listen(self.engine, "connect", self._setup_recorder_connection)
 
         Base.metadata.create_all(self.engine)
+        if supports_bulk_insert(self.engine):
+            self.bulk_insert_writer = BulkInsertWriter(self)
         self._get_session = scoped_session(sessionmaker(bind=self.engine, future=True))
         _LOGGER.debug("Connected to recorder database")
 
@@ -1421,6 +1531,7 @@ class Recorder(threading.Thread):
             self.engine.dispose()
             self.engine = None
         self._get_session = None
+        self.bulk_insert_writer = None
 
     def _setup_run(self) -> None:
         """Log the start of the current run and schedule any needed jobs."""
@@ -1469,3 +1580,7 @@ class Recorder(threading.Thread):
         finally:
             self._stop_executor()
             self._close_connection()
+            try:
+                self.backlog_journal.close()
+            except OSError as err:
+                _LOGGER.error("Could not save the backlog journal: %s", err)
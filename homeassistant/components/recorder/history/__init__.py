@@ -2,10 +2,11 @@
 
 from __future__ import annotations
 
-from collections.abc import MutableMapping
+from collections.abc import MutableMapping, Sequence
 from datetime import datetime
 from typing import Any
 
+from sqlalchemy.engine.row import Row
 from sqlalchemy.orm.session import Session
 
 from homeassistant.core import HomeAssistant, State
@@ -16,6 +17,7 @@ from .const import NEED_ATTRIBUTE_DOMAINS, SIGNIFICANT_DOMAINS
 from .modern import (
     get_full_significant_states_with_session as _modern_get_full_significant_states_with_session,
     get_last_state_changes as _modern_get_last_state_changes,
+    get_significant_state_rows_with_session as _modern_get_significant_state_rows_with_session,
     get_significant_states as _modern_get_significant_states,
     get_significant_states_with_session as _modern_get_significant_states_with_session,
     state_changes_during_period as _modern_state_changes_during_period,
@@ -27,6 +29,7 @@ __all__ = [
     "SIGNIFICANT_DOMAINS",
     "get_full_significant_states_with_session",
     "get_last_state_changes",
+    "get_significant_state_rows_with_session",
     "get_significant_states",
     "get_significant_states_with_session",
     "state_changes_during_period",
@@ -81,6 +84,25 @@ def get_last_state_changes(
     return _target(hass, number_of_states, entity_id)
 
 
+def get_significant_state_rows_with_session(
+    hass: HomeAssistant,
+    session: Session,
+    start_time: datetime,
+    end_time: datetime,
+    entity_ids: list[str],
+) -> tuple[dict[int, str], Sequence[Row]] | None:
+    """Return the raw significant state rows during a time period.
+
+    Returns None if the database has not been migrated to the schema with
+    states metadata yet, callers should use get_significant_states instead.
+    """
+    if not recorder.get_instance(hass).states_meta_manager.active:
+        return None
+    return _modern_get_significant_state_rows_with_session(
+        hass, session, start_time, end_time, entity_ids
+    )
+
+
 def get_significant_states(
     hass: HomeAssistant,
     start_time: datetime,
@@ -92,17 +114,31 @@ def get_significant_states(
     minimal_response: bool = False,
     no_attributes: bool = False,
     compressed_state_format: bool = False,
+    max_points: int | None = None,
 ) -> MutableMapping[str, list[State | dict[str, Any]]]:
-    """Return a dict of significant states during a time period."""
+    """Return a dict of significant states during a time period.
+
+    max_points is ignored until the database has been migrated to the
+    schema with states metadata.
+    """
     if not recorder.get_instance(hass).states_meta_manager.active:
         from .legacy import (  # pylint: disable=import-outside-toplevel
             get_significant_states as _legacy_get_significant_states,
         )
 
-        _target = _legacy_get_significant_states
-    else:
-        _target = _modern_get_significant_states
-    return _target(
+        return _legacy_get_significant_states(
+            hass,
+            start_time,
+            end_time,
+            entity_ids,
+            filters,
+            include_start_time_state,
+            significant_changes_only,
+            minimal_response,
+            no_attributes,
+            compressed_state_format,
+        )
+    return _modern_get_significant_states(
         hass,
         start_time,
         end_time,
@@ -113,6 +149,7 @@ def get_significant_states(
         minimal_response,
         no_attributes,
         compressed_state_format,
+        max_points,
     )
 
 
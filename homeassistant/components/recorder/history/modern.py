@@ -2,9 +2,11 @@
 
 from __future__ import annotations
 
-from collections.abc import Callable, Iterable, Iterator, MutableMapping
+from collections.abc import Callable, Iterable, Iterator, MutableMapping, Sequence
 from datetime import datetime
+from functools import partial
 from itertools import groupby
+import math
 from operator import itemgetter
 from typing import Any, cast
 
@@ -21,6 +23,7 @@ from sqlalchemy import (
 )
 from sqlalchemy.engine.row import Row
 from sqlalchemy.orm.session import Session
+from sqlalchemy.sql.lambdas import StatementLambdaElement
 
 from homeassistant.const import COMPRESSED_STATE_LAST_UPDATED, COMPRESSED_STATE_STATE
 from homeassistant.core import HomeAssistant, State, split_entity_id
@@ -103,6 +106,7 @@ def get_significant_states(
     minimal_response: bool = False,
     no_attributes: bool = False,
     compressed_state_format: bool = False,
+    max_points: int | None = None,
 ) -> MutableMapping[str, list[State | dict[str, Any]]]:
     """Wrap get_significant_states_with_session with an sql session."""
     with session_scope(hass=hass, read_only=True) as session:
@@ -118,6 +122,7 @@ def get_significant_states(
             minimal_response,
             no_attributes,
             compressed_state_format,
+            max_points,
         )
 
 
@@ -196,6 +201,7 @@ def get_significant_states_with_session(
     minimal_response: bool = False,
     no_attributes: bool = False,
     compressed_state_format: bool = False,
+    max_points: int | None = None,
 ) -> MutableMapping[str, list[State | dict[str, Any]]]:
     """Return states changes during UTC period start_time - end_time.
 
@@ -207,21 +213,124 @@ def get_significant_states_with_session(
     Significant states are all states where there is a state change,
     as well as all states from certain domains (for instance
     thermostat so that we get current temperature in our graphs).
+
+    If max_points is given, the numeric states of each entity are
+    downsampled to at most max_points states, see _downsample_rows.
     """
     if filters is not None:
         raise NotImplementedError("Filters are no longer supported")
     if not entity_ids:
         raise ValueError("entity_ids must be provided")
     entity_id_to_metadata_id: dict[str, int | None] | None = None
-    metadata_ids_in_significant_domains: list[int] = []
     instance = recorder.get_instance(hass)
     if not (
         entity_id_to_metadata_id := instance.states_meta_manager.get_many(
             entity_ids, session, False
         )
-    ) or not (possible_metadata_ids := extract_metadata_ids(entity_id_to_metadata_id)):
+    ) or not (metadata_ids := extract_metadata_ids(entity_id_to_metadata_id)):
         return {}
-    metadata_ids = possible_metadata_ids
+    run_start_ts: float | None = None
+    if include_start_time_state and not (
+        run_start_ts := _get_run_start_ts_for_utc_point_in_time(hass, start_time)
+    ):
+        include_start_time_state = False
+    stmt = _significant_states_lambda_stmt(
+        start_time,
+        end_time,
+        entity_id_to_metadata_id,
+        metadata_ids,
+        significant_changes_only,
+        no_attributes,
+        include_start_time_state,
+        run_start_ts,
+    )
+    downsample: Callable[[Iterable[Row]], Iterable[Row]] | None = None
+    if max_points:
+        downsample = partial(
+            _downsample_rows,
+            start_time_ts=start_time.timestamp(),
+            end_time_ts=(end_time or dt_util.utcnow()).timestamp(),
+            max_points=max_points,
+        )
+    return _sorted_states_to_dict(
+        execute_stmt_lambda_element(
+            session,
+            stmt,
+            # Stream the rows of long periods instead of fetching
+            # all of them since most of them are dropped anyway
+            start_time if downsample else None,
+            end_time,
+            orm_rows=False,
+        ),
+        dt_util.utc_to_timestamp(start_time) if include_start_time_state else None,
+        entity_ids,
+        entity_id_to_metadata_id,
+        minimal_response,
+        compressed_state_format,
+        no_attributes=no_attributes,
+        downsample=downsample,
+    )
+
+
+def get_significant_state_rows_with_session(
+    hass: HomeAssistant,
+    session: Session,
+    start_time: datetime,
+    end_time: datetime,
+    entity_ids: list[str],
+) -> tuple[dict[int, str], Sequence[Row]]:
+    """Return the significant state rows during UTC period start_time - end_time.
+
+    This is a variant of get_significant_states_with_session for callers
+    which process large amounts of states and do not need State objects.
+
+    Returns a map of metadata_id to entity_id and the rows, which are
+    (metadata_id, state, last_updated_ts, attributes) sorted by metadata_id
+    and last_updated_ts. The state at start_time has a last_updated_ts of 0.
+    """
+    instance = recorder.get_instance(hass)
+    if not (
+        entity_id_to_metadata_id := instance.states_meta_manager.get_many(
+            entity_ids, session, False
+        )
+    ) or not (metadata_ids := extract_metadata_ids(entity_id_to_metadata_id)):
+        return {}, []
+    run_start_ts = _get_run_start_ts_for_utc_point_in_time(hass, start_time)
+    stmt = _significant_states_lambda_stmt(
+        start_time,
+        end_time,
+        entity_id_to_metadata_id,
+        metadata_ids,
+        True,
+        False,
+        run_start_ts is not None,
+        run_start_ts,
+    )
+    return (
+        {
+            metadata_id: entity_id
+            for entity_id, metadata_id in entity_id_to_metadata_id.items()
+            if metadata_id is not None
+        },
+        cast(
+            Sequence[Row],
+            execute_stmt_lambda_element(session, stmt, orm_rows=False),
+        ),
+    )
+
+
+def _significant_states_lambda_stmt(
+    start_time: datetime,
+    end_time: datetime | None,
+    entity_id_to_metadata_id: dict[str, int | None],
+    metadata_ids: list[int],
+    significant_changes_only: bool,
+    no_attributes: bool,
+    include_start_time_state: bool,
+    run_start_ts: float | None,
+) -> StatementLambdaElement:
+    """Return the lambda statement for significant state changes."""
+    metadata_ids_in_significant_domains: list[int] = []
     if significant_changes_only:
         metadata_ids_in_significant_domains = [
             metadata_id
@@ -229,15 +338,10 @@ def get_significant_states_with_session(
             if metadata_id is not None
             and split_entity_id(entity_id)[0] in SIGNIFICANT_DOMAINS
         ]
-    run_start_ts: float | None = None
-    if include_start_time_state and not (
-        run_start_ts := _get_run_start_ts_for_utc_point_in_time(hass, start_time)
-    ):
-        include_start_time_state = False
     start_time_ts = dt_util.utc_to_timestamp(start_time)
     end_time_ts = datetime_to_timestamp_or_none(end_time)
     single_metadata_id = metadata_ids[0] if len(metadata_ids) == 1 else None
-    stmt = lambda_stmt(
+    return lambda_stmt(
         lambda: _significant_states_stmt(
             start_time_ts,
             end_time_ts,
@@ -258,15 +362,6 @@ def get_significant_states_with_session(
             include_start_time_state,
         ],
     )
-    return _sorted_states_to_dict(
-        execute_stmt_lambda_element(session, stmt, None, end_time, orm_rows=False),
-        start_time_ts if include_start_time_state else None,
-        entity_ids,
-        entity_id_to_metadata_id,
-        minimal_response,
-        compressed_state_format,
-        no_attributes=no_attributes,
-    )
 
 
 def get_full_significant_states_with_session(
@@ -634,6 +729,72 @@ def _get_single_entity_start_time_stmt(
     )
 
 
+def _downsample_rows(
+    rows: Iterable[Row],
+    start_time_ts: float,
+    end_time_ts: float,
+    max_points: int,
+) -> Iterator[Row]:
+    """Downsample the numeric state rows of an entity.
+
+    The period is split into max_points / 4 buckets of equal length and
+    only the first, last, minimum and maximum state of each bucket are
+    kept, which preserves the shape of the graph. Rows are consumed and
+    yielded bucket by bucket so they can be streamed from the database.
+
+    Rows with a state which is not a number are always kept, they end
+    the current bucket to keep the rows in order.
+    """
+    state_idx = _FIELD_MAP["state"]
+    last_updated_ts_idx = _FIELD_MAP["last_updated_ts"]
+    bucket_length = (end_time_ts - start_time_ts) / max(max_points // 4, 1)
+    if bucket_length <= 0:
+        yield from rows
+        return
+
+    current_bucket: int | None = None
+    # Position, value and row of the first, last, minimum and maximum
+    # state of the current bucket
+    selected: list[tuple[int, float, Row]] = []
+
+    def _selected_rows() -> list[Row]:
+        """Return the selected rows of the current bucket in order."""
+        rows_by_position = {position: row for position, _, row in selected}
+        selected.clear()
+        return [rows_by_position[position] for position in sorted(rows_by_position)]
+
+    for position, row in enumerate(rows):
+        try:
+            value = float(row[state_idx])
+        except (TypeError, ValueError):
+            value = math.nan
+        if not math.isfinite(value):
+            if selected:
+                yield from _selected_rows()
+            yield row
+            continue
+        # The state at the start time has a last_updated_ts of 0
+        bucket = int(
+            (max(row[last_updated_ts_idx] or 0, start_time_ts) - start_time_ts)
+            // bucket_length
+        )
+        current = (position, value, row)
+        if not selected or bucket != current_bucket:
+            if selected:
+                yield from _selected_rows()
+            current_bucket = bucket
+            selected.extend((current, current, current, current))
+            continue
+        selected[1] = current
+        if value < selected[2][1]:
+            selected[2] = current
+        elif value > selected[3][1]:
+            selected[3] = current
+
+    if selected:
+        yield from _selected_rows()
+
+
 def _sorted_states_to_dict(
     states: Iterable[Row],
     start_time_ts: float | None,
@@ -643,6 +804,7 @@ def _sorted_states_to_dict(
     compressed_state_format: bool = False,
     descending: bool = False,
     no_attributes: bool = False,
+    downsample: Callable[[Iterable[Row]], Iterable[Row]] | None = None,
 ) -> MutableMapping[str, list[State | dict[str, Any]]]:
     """Convert SQL results into JSON friendly data structure.
 
@@ -696,6 +858,8 @@ def _sorted_states_to_dict(
         entity_id = metadata_id_to_entity_id[metadata_id]
         attr_cache: dict[str, dict[str, Any]] = {}
         ent_results = result[entity_id]
+        if downsample:
+            group = iter(downsample(group))
         if (
             not minimal_response
             or split_entity_id(entity_id)[0] in NEED_ATTRIBUTE_DOMAINS
@@ -7,7 +7,7 @@ from datetime import datetime
 from itertools import zip_longest
 import logging
 import time
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
 from sqlalchemy.orm.session import Session
 
@@ -35,6 +35,8 @@ from .queries import (
     find_legacy_detached_states_and_attributes_to_purge,
     find_legacy_event_state_and_attributes_and_data_ids_to_purge,
     find_legacy_row,
+    find_oldest_event_ts,
+    find_oldest_state_ts,
     find_short_term_statistics_to_purge,
     find_states_to_purge,
     find_statistics_runs_to_purge,
@@ -51,6 +53,138 @@ _LOGGER = logging.getLogger(__name__)
 DEFAULT_STATES_BATCHES_PER_PURGE = 20  # We expect ~95% de-dupe rate
 DEFAULT_EVENTS_BATCHES_PER_PURGE = 15  # We expect ~92% de-dupe rate
 
+# Time a purge run may spend purging states and events before the recorder
+# records the events which were queued in the meantime
+PURGE_RUN_TIME_BUDGET = 2.0
+# Runs only purge a single batch of states and events while this many
+# events are waiting to be recorded
+PURGE_BACKLOG_THRESHOLD = 1000
+# Weight of the last batch in the average time of a batch
+BATCH_SECONDS_SMOOTHING = 0.3
+
+
+class PurgeScheduler:
+    """Size the runs of a purge from the measured time of its batches.
+
+    A purge is split into runs, a run which did not finish queues the next
+    one behind the events which were queued while it was purging, so they
+    are recorded in between. Each run purges as many batches of states and
+    events as fit in PURGE_RUN_TIME_BUDGET according to the average time
+    of the previous batches, and stops early once the budget is used up.
+
+    The progress of the purge is kept for the recorder/purge_progress
+    websocket command.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the scheduler."""
+        # Average time to select and delete one batch of rows
+        self.batch_seconds: float | None = None
+        self.purge_before: datetime | None = None
+        self.running = False
+        self.runs = 0
+        self.states_purged = 0
+        self.events_purged = 0
+        self.estimated_remaining: int | None = None
+        self._deadline: float | None = None
+        self._cycle_oldest_ts: tuple[float | None, float | None] = (None, None)
+
+    def start_run(
+        self, session: Session, purge_before: datetime, adaptive: bool
+    ) -> None:
+        """Start a run of the purge, only adaptive runs have a deadline."""
+        if not self.running or purge_before != self.purge_before:
+            self.purge_before = purge_before
+            self.running = True
+            self.runs = 0
+            self.states_purged = 0
+            self.events_purged = 0
+            self.estimated_remaining = None
+            self._cycle_oldest_ts = _oldest_ts(session)
+        self.runs += 1
+        self._deadline = time.monotonic() + PURGE_RUN_TIME_BUDGET if adaptive else None
+
+    def batches(self, max_batches: int, backlog: int) -> int:
+        """Return the number of batches of a table to purge in this run."""
+        if backlog >= PURGE_BACKLOG_THRESHOLD:
+            return 1
+        if not self.batch_seconds:
+            return max_batches
+        # The budget is shared by the states and the events
+        batches = int(PURGE_RUN_TIME_BUDGET / 2 / self.batch_seconds)
+        return max(1, min(batches, max_batches))
+
+    def batch_done(self, seconds: float) -> None:
+        """Record the time it took to select and delete a batch."""
+        if self.batch_seconds is None:
+            self.batch_seconds = seconds
+        else:
+            self.batch_seconds += BATCH_SECONDS_SMOOTHING * (
+                seconds - self.batch_seconds
+            )
+
+    def out_of_time(self) -> bool:
+        """Return if the run used up its time budget."""
+        return self._deadline is not None and time.monotonic() > self._deadline
+
+    def reset(self) -> None:
+        """Forget the progress of a run which failed, keeping the batch time."""
+        self.purge_before = None
+        self.running = False
+        self.runs = 0
+        self.states_purged = 0
+        self.events_purged = 0
+        self.estimated_remaining = None
+        self._deadline = None
+        self._cycle_oldest_ts = (None, None)
+
+    def finish_run(self, session: Session, finished: bool) -> None:
+        """Finish a run and estimate the number of rows left to purge."""
+        self._deadline = None
+        if finished:
+            self.running = False
+            self.estimated_remaining = 0
+            return
+        assert self.purge_before is not None
+        purge_before_ts = self.purge_before.timestamp()
+        self.estimated_remaining = None
+        remaining = 0
+        # The rows are purged from the oldest, the rows left are estimated
+        # from the rows purged per second of recorded history
+        for purged, start_ts, oldest_ts in zip(
+            (self.states_purged, self.events_purged),
+            self._cycle_oldest_ts,
+            _oldest_ts(session),
+            strict=True,
+        ):
+            if oldest_ts is None or oldest_ts >= purge_before_ts:
+                continue
+            if start_ts is None or oldest_ts <= start_ts:
+                return
+            rows_per_second = purged / (oldest_ts - start_ts)
+            remaining += int(rows_per_second * (purge_before_ts - oldest_ts))
+        self.estimated_remaining = remaining
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the progress of the purge."""
+        return {
+            "running": self.running,
+            "purge_before": self.purge_before,
+            "runs": self.runs,
+            "states_purged": self.states_purged,
+            "events_purged": self.events_purged,
+            "estimated_remaining": self.estimated_remaining,
+            "batch_seconds": self.batch_seconds,
+        }
+
+
+def _oldest_ts(session: Session) -> tuple[float | None, float | None]:
+    """Return the timestamps of the oldest state and event."""
+    return (
+        session.execute(find_oldest_state_ts()).scalar(),
+        session.execute(find_oldest_event_ts()).scalar(),
+    )
+
 
 @retryable_database_job("purge")
 def purge_old_data(
@@ -58,69 +192,97 @@ def purge_old_data(
     purge_before: datetime,
     repack: bool,
     apply_filter: bool = False,
-    events_batch_size: int = DEFAULT_EVENTS_BATCHES_PER_PURGE,
-    states_batch_size: int = DEFAULT_STATES_BATCHES_PER_PURGE,
+    events_batch_size: int | None = None,
+    states_batch_size: int | None = None,
 ) -> bool:
     """Purge events and states older than purge_before.
 
     Cleans up an timeframe of an hour, based on the oldest record.
+
+    Unless batch sizes are passed, the number of batches purged by this
+    run is chosen by the purge scheduler of the recorder.
     """
     _LOGGER.debug(
         "Purging states and events before target %s",
         purge_before.isoformat(sep=" ", timespec="seconds"),
     )
-    with session_scope(session=instance.get_session()) as session:
-        # Purge a max of max_bind_vars, based on the oldest states or events record
-        has_more_to_purge = False
-        if instance.use_legacy_events_index and _purging_legacy_format(session):
-            _LOGGER.debug(
-                "Purge running in legacy format as there are states with event_id"
-                " remaining"
+    scheduler = instance.purge_scheduler
+    try:
+        with session_scope(session=instance.get_session()) as session:
+            scheduler.start_run(
+                session,
+                purge_before,
+                events_batch_size is None and states_batch_size is None,
             )
-            has_more_to_purge |= _purge_legacy_format(instance, session, purge_before)
-        else:
-            _LOGGER.debug(
-                "Purge running in new format as there are NO states with event_id"
-                " remaining"
+            backlog = instance.backlog
+            if events_batch_size is None:
+                events_batch_size = scheduler.batches(
+                    DEFAULT_EVENTS_BATCHES_PER_PURGE, backlog
+                )
+            if states_batch_size is None:
+                states_batch_size = scheduler.batches(
+                    DEFAULT_STATES_BATCHES_PER_PURGE, backlog
+                )
+            # Purge a max of max_bind_vars, based on the oldest states or events record
+            has_more_to_purge = False
+            if instance.use_legacy_events_index and _purging_legacy_format(session):
+                _LOGGER.debug(
+                    "Purge running in legacy format as there are states with event_id"
+                    " remaining"
+                )
+                has_more_to_purge |= _purge_legacy_format(
+                    instance, session, purge_before
+                )
+            else:
+                _LOGGER.debug(
+                    "Purge running in new format as there are NO states with event_id"
+                    " remaining"
+                )
+                # Once we are done purging legacy rows, we use the new method
+                has_more_to_purge |= _purge_states_and_attributes_ids(
+                    instance, session, states_batch_size, purge_before
+                )
+                has_more_to_purge |= _purge_events_and_data_ids(
+                    instance, session, events_batch_size, purge_before
+                )
+
+            statistics_runs = _select_statistics_runs_to_purge(
+                session, purge_before, instance.max_bind_vars
             )
-            # Once we are done purging legacy rows, we use the new method
-            has_more_to_purge |= _purge_states_and_attributes_ids(
-                instance, session, states_batch_size, purge_before
+            short_term_statistics = _select_short_term_statistics_to_purge(
+                session, purge_before, instance.max_bind_vars
             )
-            has_more_to_purge |= _purge_events_and_data_ids(
-                instance, session, events_batch_size, purge_before
-            )
-
-        statistics_runs = _select_statistics_runs_to_purge(
-            session, purge_before, instance.max_bind_vars
-        )
-        short_term_statistics = _select_short_term_statistics_to_purge(
-            session, purge_before, instance.max_bind_vars
-        )
-        if statistics_runs:
-            _purge_statistics_runs(session, statistics_runs)
-
-        if short_term_statistics:
-            _purge_short_term_statistics(session, short_term_statistics)
-
-        if has_more_to_purge or statistics_runs or short_term_statistics:
-            # Return false, as we might not be done yet.
-            _LOGGER.debug("Purging hasn't fully completed yet")
-            return False
-
-        if apply_filter and _purge_filtered_data(instance, session) is False:
-            _LOGGER.debug("Cleanup filtered data hasn't fully completed yet")
-            return False
-
-        # This purge cycle is finished, clean up old event types and
-        # recorder runs
-        if instance.event_type_manager.active:
-            _purge_old_event_types(instance, session)
-
-        if instance.states_meta_manager.active:
-            _purge_old_entity_ids(instance, session)
-
-        _purge_old_recorder_runs(instance, session, purge_before)
+            if statistics_runs:
+                _purge_statistics_runs(session, statistics_runs)
+
+            if short_term_statistics:
+                _purge_short_term_statistics(session, short_term_statistics)
+
+            if has_more_to_purge or statistics_runs or short_term_statistics:
+                # Return false, as we might not be done yet.
+                _LOGGER.debug("Purging hasn't fully completed yet")
+                scheduler.finish_run(session, False)
+                return False
+
+            if apply_filter and _purge_filtered_data(instance, session) is False:
+                _LOGGER.debug("Cleanup filtered data hasn't fully completed yet")
+                scheduler.finish_run(session, False)
+                return False
+
+            # This purge cycle is finished, clean up old event types and
+            # recorder runs
+            if instance.event_type_manager.active:
+                _purge_old_event_types(instance, session)
+
+            if instance.states_meta_manager.active:
+                _purge_old_entity_ids(instance, session)
+
+            _purge_old_recorder_runs(instance, session, purge_before)
+            scheduler.finish_run(session, True)
+    except Exception:
+        # A failed run must not be reported as still running
+        scheduler.reset()
+        raise
     if repack:
         repack_database(instance)
     return True
@@ -147,6 +309,8 @@ def _purge_legacy_format(
     _purge_unused_attributes_ids(instance, session, attributes_ids)
     _purge_event_ids(session, event_ids)
     _purge_unused_data_ids(instance, session, data_ids)
+    instance.purge_scheduler.states_purged += len(state_ids)
+    instance.purge_scheduler.events_purged += len(event_ids)
 
     # The database may still have some rows that have an event_id but are not
     # linked to any event. These rows are not linked to any event because the
@@ -161,6 +325,7 @@ def _purge_legacy_format(
     )
     _purge_state_ids(instance, session, detached_state_ids)
     _purge_unused_attributes_ids(instance, session, detached_attributes_ids)
+    instance.purge_scheduler.states_purged += len(detached_state_ids)
     return bool(
         event_ids
         or state_ids
@@ -190,7 +355,9 @@ def _purge_states_and_attributes_ids(
     # max_bind_vars
     attributes_ids_batch: set[int] = set()
     max_bind_vars = instance.max_bind_vars
+    scheduler = instance.purge_scheduler
     for _ in range(states_batch_size):
+        start = time.monotonic()
         state_ids, attributes_ids = _select_state_attributes_ids_to_purge(
             session, purge_before, max_bind_vars
         )
@@ -199,6 +366,10 @@ def _purge_states_and_attributes_ids(
             break
         _purge_state_ids(instance, session, state_ids)
         attributes_ids_batch = attributes_ids_batch | attributes_ids
+        scheduler.states_purged += len(state_ids)
+        scheduler.batch_done(time.monotonic() - start)
+        if scheduler.out_of_time():
+            break
 
     _purge_unused_attributes_ids(instance, session, attributes_ids_batch)
     _LOGGER.debug(
@@ -225,7 +396,9 @@ def _purge_events_and_data_ids(
     # max_bind_vars
     data_ids_batch: set[int] = set()
     max_bind_vars = instance.max_bind_vars
+    scheduler = instance.purge_scheduler
     for _ in range(events_batch_size):
+        start = time.monotonic()
         event_ids, data_ids = _select_event_data_ids_to_purge(
             session, purge_before, max_bind_vars
         )
@@ -234,6 +407,10 @@ def _purge_events_and_data_ids(
             break
         _purge_event_ids(session, event_ids)
         data_ids_batch = data_ids_batch | data_ids
+        scheduler.events_purged += len(event_ids)
+        scheduler.batch_done(time.monotonic() - start)
+        if scheduler.out_of_time():
+            break
 
     _purge_unused_data_ids(instance, session, data_ids_batch)
     _LOGGER.debug(
@@ -636,6 +636,16 @@ def find_states_to_purge(
     )
 
 
+def find_oldest_state_ts() -> StatementLambdaElement:
+    """Find the last_updated_ts of the oldest state."""
+    return lambda_stmt(lambda: select(func.min(States.last_updated_ts)))
+
+
+def find_oldest_event_ts() -> StatementLambdaElement:
+    """Find the time_fired_ts of the oldest event."""
+    return lambda_stmt(lambda: select(func.min(Events.time_fired_ts)))
+
+
 def find_short_term_statistics_to_purge(
     purge_before: datetime, max_bind_vars: int
 ) -> StatementLambdaElement:
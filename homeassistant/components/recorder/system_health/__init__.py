@@ -44,6 +44,18 @@ def _get_db_stats(instance: Recorder, database_name: str) -> dict[str, Any]:
     return db_stats
 
 
+@callback
+def _async_get_backlog_info(instance: Recorder) -> dict[str, Any]:
+    """Get info about events spilled to disk when the recorder fell behind."""
+    backlog_info: dict[str, Any] = {}
+    backlog_journal = instance.backlog_journal
+    if backlog_journal.spilled or backlog_journal.active:
+        backlog_info["spilled_events"] = len(backlog_journal)
+        if (replay_rate := backlog_journal.replay_rate) is not None:
+            backlog_info["spilled_events_replay_rate"] = f"{replay_rate:.0f} events/s"
+    return backlog_info
+
+
 @callback
 def _async_get_db_engine_info(instance: Recorder) -> dict[str, Any]:
     """Get database engine info."""
@@ -72,4 +84,4 @@ async def system_health_info(hass: HomeAssistant) -> dict[str, Any]:
             "oldest_recorder_run": recorder_runs_manager.first.start,
             "current_recorder_run": recorder_runs_manager.current.start,
         }
-    return db_runs | db_stats | db_engine_info
+    return db_runs | db_stats | db_engine_info | _async_get_backlog_info(instance)
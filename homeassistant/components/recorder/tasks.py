@@ -31,12 +31,34 @@ class RecorderTask:
     """ABC for recorder tasks."""
 
     commit_before = True
+    # Run after the events which were spilled to disk before the task was queued
+    wait_for_backlog = True
 
     @abc.abstractmethod
     def run(self, instance: Recorder) -> None:
         """Handle the task."""
 
 
+@dataclass(slots=True)
+class AfterBacklogTask(RecorderTask):
+    """Run a task after the events spilled to disk before it are recorded.
+
+    position is the number of events which had been added to the backlog
+    journal when the task was queued.
+    """
+
+    task: RecorderTask
+    position: int
+    commit_before = False
+
+    def run(self, instance: Recorder) -> None:
+        """Handle the task."""
+        # pylint: disable-next=[protected-access]
+        instance._replay_backlog_journal_until(self.position)
+        # pylint: disable-next=[protected-access]
+        instance._guarded_process_one_task_or_event_or_recover(self.task)
+
+
 @dataclass(slots=True)
 class ChangeStatisticsUnitTask(RecorderTask):
     """Object to store statistics_id and unit to convert unit of statistics."""
@@ -251,6 +273,9 @@ class DatabaseLockTask(RecorderTask):
     database_locked: asyncio.Event
     database_unlock: threading.Event
     queue_overflow: bool
+    # The database is locked right away, events queued while it is
+    # locked are spilled to disk anyway
+    wait_for_backlog = False
 
     def run(self, instance: Recorder) -> None:
         """Handle the task."""
@@ -262,6 +287,8 @@ class StopTask(RecorderTask):
     """An object to insert into the recorder queue to stop the event handler."""
 
     commit_before = False
+    # The events which were not replayed are kept in the journal
+    wait_for_backlog = False
 
     def run(self, instance: Recorder) -> None:
         """Handle the task."""
@@ -273,6 +300,7 @@ class KeepAliveTask(RecorderTask):
     """A keep alive to be sent."""
 
     commit_before = False
+    wait_for_backlog = False
 
     def run(self, instance: Recorder) -> None:
         """Handle the task."""
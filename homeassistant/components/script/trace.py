@@ -7,11 +7,12 @@ from contextlib import contextmanager
 from typing import Any
 
 from homeassistant.components.trace import (
-    CONF_STORED_TRACES,
     ActionTrace,
-    async_store_trace,
+    async_finish_trace,
+    async_start_trace,
 )
 from homeassistant.core import Context, HomeAssistant
+from homeassistant.helpers.trace import trace_enabled_get, trace_enabled_set
 
 from .const import DOMAIN
 
@@ -33,7 +34,8 @@ def trace_script(
 ) -> Iterator[ScriptTrace]:
     """Trace execution of a script."""
     trace = ScriptTrace(item_id, config, blueprint_inputs, context)
-    async_store_trace(hass, trace, trace_config[CONF_STORED_TRACES])
+    parent_traced = trace_enabled_get()
+    async_start_trace(hass, trace, trace_config)
 
     try:
         yield trace
@@ -43,4 +45,5 @@ def trace_script(
         raise ex
     finally:
         if item_id:
-            trace.finished()
+            async_finish_trace(hass, trace, trace_config)
+        trace_enabled_set(parent_traced)
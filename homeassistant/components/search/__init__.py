@@ -22,6 +22,8 @@ from homeassistant.helpers.entity import (
 )
 from homeassistant.helpers.typing import ConfigType
 
+from .graph import ReferenceGraph
+
 DOMAIN = "search"
 _LOGGER = logging.getLogger(__name__)
 
@@ -30,6 +32,9 @@ CONFIG_SCHEMA = cv.empty_config_schema(DOMAIN)
 
 async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
     """Set up the Search component."""
+    reference_graph = ReferenceGraph(hass)
+    reference_graph.async_listen()
+    hass.data[DOMAIN] = reference_graph
     websocket_api.async_register_command(hass, websocket_search_related)
     return True
 
@@ -67,6 +72,7 @@ def websocket_search_related(
         dr.async_get(hass),
         er.async_get(hass),
         get_entity_sources(hass),
+        hass.data[DOMAIN],
     )
     connection.send_result(
         msg["id"], searcher.async_search(msg["item_type"], msg["item_id"])
@@ -102,12 +108,14 @@ class Searcher:
         device_reg: dr.DeviceRegistry,
         entity_reg: er.EntityRegistry,
         entity_sources: dict[str, EntityInfo],
+        reference_graph: ReferenceGraph | None = None,
     ) -> None:
         """Search results."""
         self.hass = hass
         self._device_reg = device_reg
         self._entity_reg = entity_reg
         self._sources = entity_sources
+        self._graph = reference_graph or ReferenceGraph(hass)
         self.results: defaultdict[str, set[str]] = defaultdict(set)
         self._to_resolve: deque[tuple[str, str]] = deque()
 
@@ -160,10 +168,8 @@ class Searcher:
         for entity_entry in er.async_entries_for_area(self._entity_reg, area_id):
             self._add_or_resolve("entity", entity_entry.entity_id)
 
-        for entity_id in script.scripts_with_area(self.hass, area_id):
-            self._add_or_resolve("entity", entity_id)
-
-        for entity_id in automation.automations_with_area(self.hass, area_id):
+        # Automations and scripts referencing the area
+        for entity_id in self._graph.async_referenced_by("area", area_id):
             self._add_or_resolve("entity", entity_id)
 
     @callback
@@ -194,8 +200,8 @@ class Searcher:
 
         Will only be called if blueprint is an entry point.
         """
-        for entity_id in automation.automations_with_blueprint(
-            self.hass, blueprint_path
+        for entity_id in self._graph.async_referenced_by(
+            "automation_blueprint", blueprint_path
         ):
             self._add_or_resolve("automation", entity_id)
 
@@ -233,30 +239,16 @@ class Searcher:
         for entity_entry in er.async_entries_for_device(self._entity_reg, device_id):
             self._add_or_resolve("entity", entity_entry.entity_id)
 
-        for entity_id in script.scripts_with_device(self.hass, device_id):
-            self._add_or_resolve("entity", entity_id)
-
-        for entity_id in automation.automations_with_device(self.hass, device_id):
+        # Automations and scripts referencing the device
+        for entity_id in self._graph.async_referenced_by("device", device_id):
             self._add_or_resolve("entity", entity_id)
 
     @callback
     def _resolve_entity(self, entity_id: str) -> None:
         """Resolve an entity."""
-        # Extra: Find automations and scripts that reference this entity.
-
-        for entity in scene.scenes_with_entity(self.hass, entity_id):
-            self._add_or_resolve("entity", entity)
-
-        for entity in group.groups_with_entity(self.hass, entity_id):
-            self._add_or_resolve("entity", entity)
-
-        for entity in automation.automations_with_entity(self.hass, entity_id):
-            self._add_or_resolve("entity", entity)
-
-        for entity in script.scripts_with_entity(self.hass, entity_id):
-            self._add_or_resolve("entity", entity)
-
-        for entity in person.persons_with_entity(self.hass, entity_id):
+        # Extra: Find automations, scripts, scenes, groups and persons
+        # that reference this entity.
+        for entity in self._graph.async_referenced_by("entity", entity_id):
             self._add_or_resolve("entity", entity)
 
         # Find devices
@@ -328,5 +320,7 @@ class Searcher:
 
         Will only be called if blueprint is an entry point.
         """
-        for entity_id in script.scripts_with_blueprint(self.hass, blueprint_path):
+        for entity_id in self._graph.async_referenced_by(
+            "script_blueprint", blueprint_path
+        ):
             self._add_or_resolve("script", entity_id)
@@ -0,0 +1,173 @@
+"""Graph of the references between the items the Search integration finds."""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+import logging
+
+from homeassistant.components import automation, group, person, script
+from homeassistant.components.homeassistant import scene
+from homeassistant.components.scene import DOMAIN as SCENE_DOMAIN
+from homeassistant.const import EVENT_STATE_CHANGED
+from homeassistant.core import (
+    CALLBACK_TYPE,
+    Event,
+    HomeAssistant,
+    callback,
+    split_entity_id,
+)
+from homeassistant.helpers.event import EventStateChangedData
+
+_LOGGER = logging.getLogger(__name__)
+
+# An item the graph knows about, (item type, item id)
+Reference = tuple[str, str]
+
+
+@callback
+def _automation_references(hass: HomeAssistant, entity_id: str) -> set[Reference]:
+    """Return the items an automation references."""
+    references = {
+        ("entity", item) for item in automation.entities_in_automation(hass, entity_id)
+    }
+    references.update(
+        ("device", item) for item in automation.devices_in_automation(hass, entity_id)
+    )
+    references.update(
+        ("area", item) for item in automation.areas_in_automation(hass, entity_id)
+    )
+    if blueprint := automation.blueprint_in_automation(hass, entity_id):
+        references.add(("automation_blueprint", blueprint))
+    return references
+
+
+@callback
+def _script_references(hass: HomeAssistant, entity_id: str) -> set[Reference]:
+    """Return the items a script references."""
+    references = {
+        ("entity", item) for item in script.entities_in_script(hass, entity_id)
+    }
+    references.update(
+        ("device", item) for item in script.devices_in_script(hass, entity_id)
+    )
+    references.update(
+        ("area", item) for item in script.areas_in_script(hass, entity_id)
+    )
+    if blueprint := script.blueprint_in_script(hass, entity_id):
+        references.add(("script_blueprint", blueprint))
+    return references
+
+
+@callback
+def _scene_references(hass: HomeAssistant, entity_id: str) -> set[Reference]:
+    """Return the items a scene references."""
+    return {("entity", item) for item in scene.entities_in_scene(hass, entity_id)}
+
+
+@callback
+def _group_references(hass: HomeAssistant, entity_id: str) -> set[Reference]:
+    """Return the items a group references."""
+    return {("entity", item) for item in group.get_entity_ids(hass, entity_id)}
+
+
+@callback
+def _person_references(hass: HomeAssistant, entity_id: str) -> set[Reference]:
+    """Return the items a person references."""
+    return {("entity", item) for item in person.entities_in_person(hass, entity_id)}
+
+
+# The domains of the entities which reference other items
+REFERENCING_DOMAINS: dict[str, Callable[[HomeAssistant, str], set[Reference]]] = {
+    automation.DOMAIN: _automation_references,
+    group.DOMAIN: _group_references,
+    person.DOMAIN: _person_references,
+    SCENE_DOMAIN: _scene_references,
+    script.DOMAIN: _script_references,
+}
+
+
+class ReferenceGraph:
+    """Graph of the items automations, scripts, scenes, groups and persons reference.
+
+    Keeps the references of each of these entities and the reverse
+    references, so finding the entities which reference an item does not
+    have to look at all of them.
+
+    The graph is built on first use. Once it listens to state changes,
+    entities which were added, removed or changed are marked and only their
+    references are updated on the next lookup. Reloading automations and
+    scripts replaces the entities which changed, which is a state change
+    of those entities.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the graph."""
+        self.hass = hass
+        # Entity id -> items the entity references
+        self._references: dict[str, set[Reference]] = {}
+        # Item -> entity ids of the entities referencing the item
+        self._referenced_by: dict[Reference, set[str]] = {}
+        self._built = False
+        # Entities whose references have to be updated
+        self._dirty: set[str] = set()
+
+    @callback
+    def async_listen(self) -> CALLBACK_TYPE:
+        """Update the graph when entities with references change."""
+        return self.hass.bus.async_listen(
+            EVENT_STATE_CHANGED,
+            self._async_state_changed,
+            event_filter=_is_referencing_entity,
+            run_immediately=True,
+        )
+
+    @callback
+    def _async_state_changed(self, event: Event[EventStateChangedData]) -> None:
+        """Mark an entity with references as changed."""
+        if self._built:
+            self._dirty.add(event.data["entity_id"])
+
+    @callback
+    def async_referenced_by(self, item_type: str, item_id: str) -> set[str]:
+        """Return the entity ids of the entities which reference an item."""
+        self._async_update()
+        return self._referenced_by.get((item_type, item_id), set())
+
+    @callback
+    def _async_update(self) -> None:
+        """Build the graph or update the references of changed entities."""
+        if not self._built:
+            for domain in REFERENCING_DOMAINS:
+                for entity_id in self.hass.states.async_entity_ids(domain):
+                    self._async_update_entity(entity_id)
+            self._built = True
+            _LOGGER.debug("Built reference graph of %s entities", len(self._references))
+            return
+        while self._dirty:
+            self._async_update_entity(self._dirty.pop())
+
+    @callback
+    def _async_update_entity(self, entity_id: str) -> None:
+        """Update the references of an entity."""
+        domain = split_entity_id(entity_id)[0]
+        old_references = self._references.pop(entity_id, set())
+        if self.hass.states.get(entity_id) is None:
+            references: set[Reference] = set()
+        else:
+            references = REFERENCING_DOMAINS[domain](self.hass, entity_id)
+            self._references[entity_id] = references
+
+        referenced_by = self._referenced_by
+        for reference in old_references - references:
+            entity_ids = referenced_by[reference]
+            entity_ids.discard(entity_id)
+            if not entity_ids:
+                del referenced_by[reference]
+        for reference in references - old_references:
+            referenced_by.setdefault(reference, set()).add(entity_id)
+
+
+@callback
+def _is_referencing_entity(event_data: EventStateChangedData) -> bool:
+    """Return if a state change is of an entity which references items."""
+    return split_entity_id(event_data["entity_id"])[0] in REFERENCING_DOMAINS
@@ -5,6 +5,7 @@ from __future__ import annotations
 from collections import defaultdict
 from collections.abc import Callable, Iterable, MutableMapping
 import datetime
+from importlib.util import find_spec
 import itertools
 import logging
 import math
@@ -35,6 +36,7 @@ from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers.entity import entity_sources
 from homeassistant.loader import async_suggest_report_issue
 from homeassistant.util import dt as dt_util
+from homeassistant.util.async_ import run_callback_threadsafe
 from homeassistant.util.enum import try_parse_enum
 
 from .const import (
@@ -45,6 +47,13 @@ from .const import (
     UnitOfVolumeFlowRate,
 )
 
+# NumPy is not a requirement of the sensor integration, because bootstrap imports
+# this module before any requirements are installed. Without NumPy the statistics
+# of measurement sensors are compiled from State objects, which is slower.
+VECTORIZED_STATISTICS = find_spec("numpy") is not None
+if VECTORIZED_STATISTICS:
+    from . import recorder_vectorized
+
 _LOGGER = logging.getLogger(__name__)
 
 DEFAULT_STATISTICS = {
@@ -70,6 +79,8 @@ WARN_NEGATIVE = "sensor_warn_total_increasing_negative"
 # Keep track of entities for which a warning about unsupported unit has been logged
 WARN_UNSUPPORTED_UNIT = "sensor_warn_unsupported_unit"
 WARN_UNSTABLE_UNIT = "sensor_warn_unstable_unit"
+# Keep track of if it has been logged that NumPy is not available
+LOGGED_NOT_VECTORIZED = "sensor_logged_not_vectorized"
 # Link to dev statistics where issues around LTS can be fixed
 LINK_DEV_STATISTICS = "https://my.home-assistant.io/redirect/developer_statistics"
 
@@ -82,7 +93,9 @@ def _get_sensor_states(hass: HomeAssistant) -> list[State]:
     # than checking the state class
     return [
         state
-        for state in hass.states.all(DOMAIN)
+        for state in run_callback_threadsafe(
+            hass.loop, hass.states.async_all_snapshot, DOMAIN
+        ).result()
         if (state_class := state.attributes.get(ATTR_STATE_CLASS))
         and (
             type(state_class) is SensorStateClass
@@ -417,6 +430,47 @@ def compile_statistics(  # noqa: C901
         for i in sensor_states
         if "sum" not in wanted_statistics[i.entity_id]
     ]
+    measurements: dict[str, recorder_vectorized.MeasurementStatistics] = {}
+    vectorized_entity_ids: set[str] = set()
+    if (
+        entities_significant_history
+        and not VECTORIZED_STATISTICS
+        and LOGGED_NOT_VECTORIZED not in hass.data
+    ):
+        hass.data[LOGGED_NOT_VECTORIZED] = True
+        _LOGGER.info(
+            "NumPy is not installed, statistics of measurement sensors are compiled"
+            " from states which is slower"
+        )
+    if (
+        entities_significant_history
+        and VECTORIZED_STATISTICS
+        and (
+            state_rows := history.get_significant_state_rows_with_session(
+                hass,
+                session,
+                start - datetime.timedelta.resolution,
+                end,
+                entities_significant_history,
+            )
+        )
+        and state_rows[0]
+    ):
+        # Mean, min and max can be calculated without creating State objects
+        # unless the unit changes within the period.
+        (
+            measurements,
+            unstable_unit,
+            entities_with_states,
+        ) = recorder_vectorized.compile_measurement_statistics(
+            state_rows[1], state_rows[0], start, end
+        )
+        vectorized_entity_ids = entities_with_states.difference(unstable_unit)
+        entities_significant_history = [
+            entity_id
+            for entity_id in entities_significant_history
+            if entity_id not in vectorized_entity_ids
+        ]
     if entities_significant_history:
         _history_list = history.get_full_significant_states_with_session(
             hass,
@@ -430,6 +484,8 @@ def compile_statistics(  # noqa: C901
     entities_with_float_states: dict[str, list[tuple[float, State]]] = {}
     for _state in sensor_states:
         entity_id = _state.entity_id
+        if entity_id in vectorized_entity_ids:
+            continue
         # If there are no recent state changes, the sensor's state may already be pruned
         # from the recorder. Get the state from the state machine instead.
         if not (entity_history := history_list.get(entity_id, [_state])):
@@ -443,12 +499,40 @@ def compile_statistics(  # noqa: C901
     # that are not in the metadata table and we are not working
     # with them anyway.
     old_metadatas = statistics.get_metadata_with_session(
-        get_instance(hass), session, statistic_ids=set(entities_with_float_states)
+        get_instance(hass),
+        session,
+        statistic_ids=set(entities_with_float_states).union(measurements),
     )
+    if needs_conversion := [
+        entity_id
+        for entity_id, (unit, *_) in measurements.items()
+        if entity_id in old_metadatas
+        and (statistics_unit := old_metadatas[entity_id][1]["unit_of_measurement"])
+        != unit
+        and statistics_unit in statistics.STATISTIC_UNIT_TO_UNIT_CONVERTER
+    ]:
+        # The states have to be converted to the unit of the compiled statistics
+        conversion_history = history.get_full_significant_states_with_session(
+            hass,
+            session,
+            start - datetime.timedelta.resolution,
+            end,
+            entity_ids=needs_conversion,
+        )
+        for entity_id in needs_conversion:
+            del measurements[entity_id]
+            if float_states := _entity_history_to_float_and_state(
+                conversion_history.get(entity_id, [])
+            ):
+                entities_with_float_states[entity_id] = float_states
     to_process: list[tuple[str, str | None, str, list[tuple[float, State]]]] = []
     to_query: set[str] = set()
     for _state in sensor_states:
         entity_id = _state.entity_id
+        state_class: str = _state.attributes[ATTR_STATE_CLASS]
+        if (measurement := measurements.get(entity_id)) is not None:
+            to_process.append((entity_id, measurement[0], state_class, []))
+            continue
         if not (maybe_float_states := entities_with_float_states.get(entity_id)):
             continue
         statistics_unit, valid_float_states = _normalize_states(
@@ -459,7 +543,6 @@ def compile_statistics(  # noqa: C901
         )
         if not valid_float_states:
             continue
-        state_class: str = _state.attributes[ATTR_STATE_CLASS]
         to_process.append((entity_id, statistics_unit, state_class, valid_float_states))
         if "sum" in wanted_statistics[entity_id]:
             to_query.add(entity_id)
@@ -510,13 +593,16 @@ def compile_statistics(  # noqa: C901
 
         # Make calculations
         stat: StatisticData = {"start": start}
-        if "max" in wanted_statistics[entity_id]:
-            stat["max"] = max(*itertools.islice(zip(*valid_float_states), 1))
-        if "min" in wanted_statistics[entity_id]:
-            stat["min"] = min(*itertools.islice(zip(*valid_float_states), 1))
+        if (measurement := measurements.get(entity_id)) is not None:
+            _, stat["mean"], stat["min"], stat["max"] = measurement
+        else:
+            if "max" in wanted_statistics[entity_id]:
+                stat["max"] = max(*itertools.islice(zip(*valid_float_states), 1))
+            if "min" in wanted_statistics[entity_id]:
+                stat["min"] = min(*itertools.islice(zip(*valid_float_states), 1))
 
-        if "mean" in wanted_statistics[entity_id]:
-            stat["mean"] = _time_weighted_average(valid_float_states, start, end)
+            if "mean" in wanted_statistics[entity_id]:
+                stat["mean"] = _time_weighted_average(valid_float_states, start, end)
 
         if "sum" in wanted_statistics[entity_id]:
             last_reset = old_last_reset = None
@@ -0,0 +1,128 @@
+"""Compile statistics for measurement sensors with NumPy."""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+from contextlib import suppress
+import datetime
+from typing import Any, cast
+
+import numpy as np
+from sqlalchemy.engine.row import Row
+
+from homeassistant.const import ATTR_UNIT_OF_MEASUREMENT
+from homeassistant.util.json import json_loads_object
+
+# Mean, min and max of an entity together with the unit of its states
+MeasurementStatistics = tuple[str | None, float, float, float]
+
+
+def _float_or_nan(state: Any) -> float:
+    """Return the state as float or NaN if it is not a number."""
+    try:
+        return float(state)
+    except (ValueError, TypeError):
+        return np.nan
+
+
+def compile_measurement_statistics(
+    rows: Sequence[Row],
+    metadata_id_to_entity_id: dict[int, str],
+    start: datetime.datetime,
+    end: datetime.datetime,
+) -> tuple[dict[str, MeasurementStatistics], list[str], set[str]]:
+    """Compile time weighted mean, min and max from significant state rows.
+
+    The rows must be sorted by metadata_id and last_updated_ts as returned
+    by history.get_significant_state_rows_with_session.
+
+    The result is the same as calculating the statistics from the states
+    with _time_weighted_average, but the states are never turned into State
+    objects. Entities where the unit changes within the period are returned
+    separately since they need unit conversion or warnings, they have to
+    be compiled from their states instead.
+
+    Also returns the entity_ids which have states in the rows, including the
+    ones without any valid states.
+    """
+    count = len(rows)
+    unit_codes: dict[str | None, int] = {}
+    source_to_unit_code: dict[str | None, int] = {}
+
+    def _unit_code(source: str | None) -> int:
+        """Return a number identifying the unit in the attributes."""
+        if (code := source_to_unit_code.get(source)) is not None:
+            return code
+        unit: str | None = None
+        if source:
+            with suppress(ValueError):
+                unit = cast(
+                    str | None,
+                    json_loads_object(source).get(ATTR_UNIT_OF_MEASUREMENT),
+                )
+        code = unit_codes.setdefault(unit, len(unit_codes))
+        source_to_unit_code[source] = code
+        return code
+
+    metadata_ids = np.fromiter((row[0] for row in rows), np.int64, count)
+    values = np.fromiter((_float_or_nan(row[1]) for row in rows), np.float64, count)
+    # The state at the start time has a last_updated_ts of 0, it counts
+    # from the start of the period just like states updated before it.
+    timestamps = np.fromiter((row[2] or 0.0 for row in rows), np.float64, count)
+    units = np.fromiter((_unit_code(row[3]) for row in rows), np.int64, count)
+    entity_ids = {
+        metadata_id_to_entity_id[metadata_id]
+        for metadata_id in np.unique(metadata_ids).tolist()
+    }
+
+    valid = np.isfinite(values)
+    if not valid.all():
+        metadata_ids = metadata_ids[valid]
+        values = values[valid]
+        timestamps = timestamps[valid]
+        units = units[valid]
+    if not len(values):
+        return {}, [], entity_ids
+
+    np.maximum(timestamps, start.timestamp(), out=timestamps)
+    group_starts = np.flatnonzero(np.diff(metadata_ids, prepend=-1))
+    group_ends = np.append(group_starts[1:], len(values))
+
+    # Each state counts until the next state of the entity or the end
+    durations = np.empty_like(timestamps)
+    durations[:-1] = timestamps[1:]
+    durations[group_ends - 1] = end.timestamp()
+    durations -= timestamps
+    accumulated = np.add.reduceat(values * durations, group_starts)
+    period_seconds = np.add.reduceat(durations, group_starts)
+    # A period of zero means the only state changed at the end of the period,
+    # there is no meaningful average so return 0.0 like _time_weighted_average
+    means = np.divide(
+        accumulated,
+        period_seconds,
+        out=np.zeros_like(accumulated),
+        where=period_seconds != 0,
+    )
+    minimums = np.minimum.reduceat(values, group_starts)
+    maximums = np.maximum.reduceat(values, group_starts)
+    stable_unit = np.minimum.reduceat(units, group_starts) == np.maximum.reduceat(
+        units, group_starts
+    )
+
+    code_to_unit = {code: unit for unit, code in unit_codes.items()}
+    measurements: dict[str, MeasurementStatistics] = {}
+    unstable_unit: list[str] = []
+    for metadata_id, unit_code, is_stable, mean, minimum, maximum in zip(
+        metadata_ids[group_starts].tolist(),
+        units[group_starts].tolist(),
+        stable_unit.tolist(),
+        means.tolist(),
+        minimums.tolist(),
+        maximums.tolist(),
+    ):
+        entity_id = metadata_id_to_entity_id[metadata_id]
+        if not is_stable:
+            unstable_unit.append(entity_id)
+            continue
+        measurements[entity_id] = (code_to_unit[unit_code], mean, minimum, maximum)
+    return measurements, unstable_unit, entity_ids
@@ -0,0 +1,227 @@
+"""Sliding window of samples with incrementally maintained aggregates."""
+
+from __future__ import annotations
+
+from bisect import bisect_left, insort
+from collections import deque
+from datetime import datetime
+import math
+
+
+class SampleWindow:
+    """Hold the samples of a statistics sensor and their running aggregates.
+
+    Every aggregate is updated when a sample is added to the end of the
+    window or removed from the start of it, so reading a characteristic
+    does not need to walk over all samples. Sums are rebuilt from the
+    samples once as many samples have been removed as the window holds,
+    which bounds the floating point drift of adding and removing values
+    while keeping the amortized cost per sample constant.
+    """
+
+    def __init__(
+        self,
+        max_size: int | None,
+        keep_sorted: bool = False,
+        track_circular: bool = False,
+    ) -> None:
+        """Initialize the window.
+
+        The sorted values for median and percentile and the circular
+        sums for mean_circular are only kept when requested since they
+        are more expensive to maintain than the other aggregates.
+        """
+        self.max_size = max_size
+        self.states: deque[float | bool] = deque()
+        self.ages: deque[datetime] = deque()
+        self._keep_sorted = keep_sorted
+        self._track_circular = track_circular
+        self.sorted_values: list[float] = []
+        # Monotonic deques of (value, sequence, age) used for min and max.
+        # Equal values are kept so the oldest occurrence is at the front.
+        self._max_candidates: deque[tuple[float, int, datetime]] = deque()
+        self._min_candidates: deque[tuple[float, int, datetime]] = deque()
+        self._next_sequence = 0
+        self._first_sequence = 0
+        self._removed_since_rebuild = 0
+        self._reset_sums()
+
+    def _reset_sums(self) -> None:
+        """Reset the running sums."""
+        self.sum: float = 0.0
+        self.count_true = 0
+        # Welford's running mean and sum of squared differences
+        self.mean: float = 0.0
+        self._m2: float = 0.0
+        self.sum_differences: float = 0.0
+        self.sum_differences_nonnegative: float = 0.0
+        self.area_linear: float = 0.0
+        self.area_step: float = 0.0
+        self.sin_sum: float = 0.0
+        self.cos_sum: float = 0.0
+
+    def __len__(self) -> int:
+        """Return the number of samples in the window."""
+        return len(self.states)
+
+    @property
+    def variance(self) -> float:
+        """Return the sample variance, needs at least two samples."""
+        return max(self._m2, 0.0) / (len(self.states) - 1)
+
+    @property
+    def value_max(self) -> float:
+        """Return the largest sample."""
+        return self._max_candidates[0][0]
+
+    @property
+    def value_min(self) -> float:
+        """Return the smallest sample."""
+        return self._min_candidates[0][0]
+
+    @property
+    def datetime_value_max(self) -> datetime:
+        """Return the age of the oldest occurrence of the largest sample."""
+        return self._max_candidates[0][2]
+
+    @property
+    def datetime_value_min(self) -> datetime:
+        """Return the age of the oldest occurrence of the smallest sample."""
+        return self._min_candidates[0][2]
+
+    def median(self) -> float:
+        """Return the median of the samples."""
+        values = self.sorted_values
+        middle = len(values) // 2
+        if len(values) % 2:
+            return values[middle]
+        return (values[middle - 1] + values[middle]) / 2
+
+    def percentile(self, percentile: int) -> float:
+        """Return a percentile the same way as statistics.quantiles(n=100).
+
+        Uses the exclusive method and needs at least two samples.
+        """
+        values = self.sorted_values
+        count = len(values)
+        scaled = percentile * (count + 1)
+        index = min(max(scaled // 100, 1), count - 1)
+        delta = scaled - index * 100
+        return (values[index - 1] * (100 - delta) + values[index] * delta) / 100
+
+    def append(self, value: float | bool, age: datetime) -> None:
+        """Add a sample to the end of the window."""
+        states = self.states
+        if self.max_size is not None and len(states) >= self.max_size:
+            self.popleft()
+
+        if states:
+            previous = states[-1]
+            seconds = (age - self.ages[-1]).total_seconds()
+            difference = value - previous
+            self.sum_differences += abs(difference)
+            self.sum_differences_nonnegative += (
+                difference if value >= previous else value
+            )
+            self.area_linear += 0.5 * (value + previous) * seconds
+            self.area_step += previous * seconds
+
+        states.append(value)
+        self.ages.append(age)
+        self.sum += value
+        if value is True:
+            self.count_true += 1
+        delta = value - self.mean
+        self.mean += delta / len(states)
+        self._m2 += delta * (value - self.mean)
+        if self._track_circular:
+            self.sin_sum += math.sin(math.radians(value))
+            self.cos_sum += math.cos(math.radians(value))
+        if self._keep_sorted:
+            insort(self.sorted_values, value)
+
+        sequence = self._next_sequence
+        self._next_sequence += 1
+        max_candidates = self._max_candidates
+        while max_candidates and max_candidates[-1][0] < value:
+            max_candidates.pop()
+        max_candidates.append((value, sequence, age))
+        min_candidates = self._min_candidates
+        while min_candidates and min_candidates[-1][0] > value:
+            min_candidates.pop()
+        min_candidates.append((value, sequence, age))
+
+    def popleft(self) -> None:
+        """Remove the oldest sample from the window."""
+        states = self.states
+        ages = self.ages
+        value = states[0]
+        if len(states) >= 2:
+            following = states[1]
+            seconds = (ages[1] - ages[0]).total_seconds()
+            difference = following - value
+            self.sum_differences -= abs(difference)
+            self.sum_differences_nonnegative -= (
+                difference if following >= value else following
+            )
+            self.area_linear -= 0.5 * (following + value) * seconds
+            self.area_step -= value * seconds
+
+        states.popleft()
+        ages.popleft()
+        sequence = self._first_sequence
+        self._first_sequence += 1
+        if self._max_candidates[0][1] == sequence:
+            self._max_candidates.popleft()
+        if self._min_candidates[0][1] == sequence:
+            self._min_candidates.popleft()
+        if self._keep_sorted:
+            del self.sorted_values[bisect_left(self.sorted_values, value)]
+
+        if not states:
+            self._reset_sums()
+            self._removed_since_rebuild = 0
+            return
+
+        self.sum -= value
+        if value is True:
+            self.count_true -= 1
+        count = len(states)
+        previous_mean = self.mean
+        self.mean = (previous_mean * (count + 1) - value) / count
+        self._m2 -= (value - previous_mean) * (value - self.mean)
+        if self._track_circular:
+            self.sin_sum -= math.sin(math.radians(value))
+            self.cos_sum -= math.cos(math.radians(value))
+
+        self._removed_since_rebuild += 1
+        if self._removed_since_rebuild >= count:
+            self._rebuild_sums()
+
+    def _rebuild_sums(self) -> None:
+        """Recalculate the running sums from the samples."""
+        self._removed_since_rebuild = 0
+        states = self.states
+        count = len(states)
+        self.sum = math.fsum(states)
+        self.mean = self.sum / count
+        self._m2 = math.fsum((value - self.mean) ** 2 for value in states)
+        values = list(states)
+        pairs = list(zip(values, values[1:]))
+        self.sum_differences = math.fsum(abs(j - i) for i, j in pairs)
+        self.sum_differences_nonnegative = math.fsum(
+            j - i if j >= i else j for i, j in pairs
+        )
+        seconds = [
+            (newer - older).total_seconds()
+            for older, newer in zip(self.ages, list(self.ages)[1:])
+        ]
+        self.area_linear = math.fsum(
+            0.5 * (i + j) * duration for (i, j), duration in zip(pairs, seconds)
+        )
+        self.area_step = math.fsum(
+            i * duration for (i, _), duration in zip(pairs, seconds)
+        )
+        if self._track_circular:
+            self.sin_sum = math.fsum(math.sin(math.radians(value)) for value in states)
+            self.cos_sum = math.fsum(math.cos(math.radians(value)) for value in states)
@@ -14,16 +14,26 @@ from homeassistant.exceptions import HomeAssistantError
 import homeassistant.helpers.config_validation as cv
 from homeassistant.helpers.json import ExtendedJSONEncoder
 from homeassistant.helpers.storage import Store
+from homeassistant.helpers.trace import trace_enabled_set
 from homeassistant.helpers.typing import ConfigType
 from homeassistant.util.limited_size_dict import LimitedSizeDict
 
 from . import websocket_api
 from .const import (
+    CONF_SAMPLE_EVERY,
     CONF_STORED_TRACES,
+    CONF_TRACE_MODE,
     DATA_TRACE,
+    DATA_TRACE_RUN_COUNTS,
     DATA_TRACE_STORE,
     DATA_TRACES_RESTORED,
+    DEFAULT_SAMPLE_EVERY,
     DEFAULT_STORED_TRACES,
+    TRACE_MODE_ERRORS,
+    TRACE_MODE_FULL,
+    TRACE_MODE_OFF,
+    TRACE_MODE_SAMPLED,
+    TRACE_MODES,
 )
 from .models import ActionTrace, BaseTrace, RestoredTrace
 
@@ -35,7 +45,9 @@ STORAGE_KEY = "trace.saved_traces"
 STORAGE_VERSION = 1
 
 TRACE_CONFIG_SCHEMA = {
-    vol.Optional(CONF_STORED_TRACES, default=DEFAULT_STORED_TRACES): cv.positive_int
+    vol.Optional(CONF_STORED_TRACES, default=DEFAULT_STORED_TRACES): cv.positive_int,
+    vol.Optional(CONF_TRACE_MODE, default=TRACE_MODE_FULL): vol.In(TRACE_MODES),
+    vol.Optional(CONF_SAMPLE_EVERY, default=DEFAULT_SAMPLE_EVERY): cv.positive_int,
 }
 
 CONFIG_SCHEMA = cv.empty_config_schema(DOMAIN)
@@ -150,6 +162,51 @@ def async_store_trace(
         traces[key][trace.run_id] = trace
 
 
+@callback
+def async_start_trace(
+    hass: HomeAssistant, trace: ActionTrace, trace_config: ConfigType
+) -> None:
+    """Start the trace of a script or automation run.
+
+    Depending on the trace mode, trace elements of the run are not recorded,
+    or the trace is only stored when the run is finished.
+    """
+    mode = trace_config.get(CONF_TRACE_MODE, TRACE_MODE_FULL)
+    if mode == TRACE_MODE_SAMPLED:
+        run_counts: dict[str, int] = hass.data.setdefault(DATA_TRACE_RUN_COUNTS, {})
+        run_count = run_counts.get(trace.key, 0)
+        run_counts[trace.key] = run_count + 1
+        traced = (
+            run_count % trace_config.get(CONF_SAMPLE_EVERY, DEFAULT_SAMPLE_EVERY) == 0
+        )
+    else:
+        traced = mode != TRACE_MODE_OFF
+
+    trace_enabled_set(traced)
+    if traced and mode != TRACE_MODE_ERRORS:
+        async_store_trace(hass, trace, trace_config[CONF_STORED_TRACES])
+
+
+@callback
+def async_remove_run_count(hass: HomeAssistant, key: str) -> None:
+    """Forget the number of runs of a script or automation which was removed."""
+    if (run_counts := hass.data.get(DATA_TRACE_RUN_COUNTS)) is not None:
+        run_counts.pop(key, None)
+
+
+@callback
+def async_finish_trace(
+    hass: HomeAssistant, trace: ActionTrace, trace_config: ConfigType
+) -> None:
+    """Finish the trace of a script or automation run."""
+    trace.finished()
+    if (
+        trace_config.get(CONF_TRACE_MODE, TRACE_MODE_FULL) == TRACE_MODE_ERRORS
+        and trace.failed
+    ):
+        async_store_trace(hass, trace, trace_config[CONF_STORED_TRACES])
+
+
 def _async_store_restored_trace(hass: HomeAssistant, trace: RestoredTrace) -> None:
     """Store a restored trace and move it to the end of the LimitedSizeDict."""
     key = trace.key
@@ -1,7 +1,21 @@
 """Shared constants for script and automation tracing and debugging."""
 
+CONF_SAMPLE_EVERY = "sample_every"
 CONF_STORED_TRACES = "stored_traces"
+CONF_TRACE_MODE = "mode"
 DATA_TRACE = "trace"
+DATA_TRACE_RUN_COUNTS = "trace_run_counts"
 DATA_TRACE_STORE = "trace_store"
 DATA_TRACES_RESTORED = "trace_traces_restored"
+DEFAULT_SAMPLE_EVERY = 10  # Trace one in this many runs in sampled mode
 DEFAULT_STORED_TRACES = 5  # Stored traces per script or automation
+
+# Every run is traced
+TRACE_MODE_FULL = "full"
+# One in every sample_every runs is traced
+TRACE_MODE_SAMPLED = "sampled"
+# Runs are traced, but only runs which failed are stored
+TRACE_MODE_ERRORS = "errors"
+# No runs are traced
+TRACE_MODE_OFF = "off"
+TRACE_MODES = [TRACE_MODE_FULL, TRACE_MODE_SAMPLED, TRACE_MODE_ERRORS, TRACE_MODE_OFF]
@@ -80,6 +80,14 @@ class ActionTrace(BaseTrace):
         """Set error."""
         self._error = ex
 
+    @property
+    def failed(self) -> bool:
+        """Return if the run failed or was stopped with an error."""
+        return self._error is not None or self._script_execution in (
+            "aborted",
+            "error",
+        )
+
     def finished(self) -> None:
         """Set finish time."""
         self._timestamp_finish = dt_util.utcnow()
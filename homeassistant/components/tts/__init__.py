@@ -47,6 +47,7 @@ from homeassistant.helpers.entity_component import EntityComponent
 from homeassistant.helpers.event import async_call_later
 from homeassistant.helpers.network import get_url
 from homeassistant.helpers.restore_state import RestoreEntity
+from homeassistant.helpers.storage import Store
 from homeassistant.helpers.typing import UNDEFINED, ConfigType
 from homeassistant.util import dt as dt_util, language as language_util
 
@@ -55,6 +56,9 @@ from .const import (
     ATTR_LANGUAGE,
     ATTR_MESSAGE,
     ATTR_OPTIONS,
+    CACHE_INDEX_SAVE_DELAY,
+    CACHE_INDEX_STORAGE_KEY,
+    CACHE_INDEX_STORAGE_VERSION,
     CONF_CACHE,
     CONF_CACHE_DIR,
     CONF_TIME_MEMORY,
@@ -63,6 +67,8 @@ from .const import (
     DEFAULT_CACHE_DIR,
     DEFAULT_TIME_MEMORY,
     DOMAIN,
+    FILE_CACHE_MAX_SIZE,
+    MEM_CACHE_MAX_SIZE,
     TtsAudioType,
 )
 from .helper import get_engine_instance
@@ -488,7 +494,14 @@ def _hash_options(options: dict) -> str:
 
 
 class SpeechManager:
-    """Representation of a speech store."""
+    """Representation of a speech store.
+
+    Voices are cached in memory and in files. Both caches are bounded by
+    a byte budget, the least recently used voices are removed first. The
+    files in the cache are kept in an index, so the cache directory is
+    only listed if there is no index or the directory changed since the
+    index was saved.
+    """
 
     def __init__(
         self,
@@ -504,8 +517,18 @@ class SpeechManager:
         self.use_cache = use_cache
         self.cache_dir = cache_dir
         self.time_memory = time_memory
+        # Cache key -> filename, ordered from least to most recently used
         self.file_cache: dict[str, str] = {}
+        self.file_cache_sizes: dict[str, int] = {}
+        # Modification time of the cache directory after the last change
+        # of the file cache
+        self._cache_dir_mtime: int | None = None
+        # Cache key -> voice, ordered from least to most recently used
         self.mem_cache: dict[str, TTSCache] = {}
+        self.mem_cache_size = 0
+        self._index_store: Store[dict[str, Any]] = Store(
+            hass, CACHE_INDEX_STORAGE_VERSION, CACHE_INDEX_STORAGE_KEY
+        )
 
     async def async_init_cache(self) -> None:
         """Init config folder and load file cache."""
@@ -516,30 +539,69 @@ class SpeechManager:
         except OSError as err:
             raise HomeAssistantError(f"Can't init cache dir {err}") from err
 
+        try:
+            self._cache_dir_mtime = await self.hass.async_add_executor_job(
+                _get_cache_dir_mtime, self.cache_dir
+            )
+        except OSError as err:
+            raise HomeAssistantError(f"Can't read cache dir {err}") from err
+
+        index = await self._index_store.async_load()
+        # Files which were written after the index was saved, or which were
+        # added by others, changed the modification time of the directory
+        if (
+            index is not None
+            and index["cache_dir"] == self.cache_dir
+            and index.get("mtime") == self._cache_dir_mtime
+        ):
+            for cache_key, filename, size in index["files"]:
+                self.file_cache[cache_key] = filename
+                self.file_cache_sizes[cache_key] = size
+            return
+
         try:
             cache_files = await self.hass.async_add_executor_job(
                 _get_cache_files, self.cache_dir
             )
+            file_sizes = await self.hass.async_add_executor_job(
+                _get_file_sizes, self.cache_dir, cache_files
+            )
         except OSError as err:
             raise HomeAssistantError(f"Can't read cache dir {err}") from err
 
         if cache_files:
             self.file_cache.update(cache_files)
+            self.file_cache_sizes.update(file_sizes)
+        self._async_schedule_save_index()
+
+    @callback
+    def _async_schedule_save_index(self) -> None:
+        """Schedule saving the index of the file cache."""
+        self._index_store.async_delay_save(self._index_data, CACHE_INDEX_SAVE_DELAY)
+
+    @callback
+    def _index_data(self) -> dict[str, Any]:
+        """Return the index of the file cache to store."""
+        return {
+            "cache_dir": self.cache_dir,
+            "mtime": self._cache_dir_mtime,
+            "files": [
+                [cache_key, filename, self.file_cache_sizes.get(cache_key, 0)]
+                for cache_key, filename in self.file_cache.items()
+            ],
+        }
 
     async def async_clear_cache(self) -> None:
         """Read file cache and delete files."""
         self.mem_cache = {}
+        self.mem_cache_size = 0
 
-        def remove_files() -> None:
-            """Remove files from filesystem."""
-            for filename in self.file_cache.values():
-                try:
-                    os.remove(os.path.join(self.cache_dir, filename))
-                except OSError as err:
-                    _LOGGER.warning("Can't remove cache file '%s': %s", filename, err)
-
-        await self.hass.async_add_executor_job(remove_files)
+        self._cache_dir_mtime = await self.hass.async_add_executor_job(
+            _remove_cache_files, self.cache_dir, list(self.file_cache.values())
+        )
         self.file_cache = {}
+        self.file_cache_sizes = {}
+        self._async_schedule_save_index()
 
     @callback
     def async_register_legacy_engine(
@@ -618,10 +680,11 @@ class SpeechManager:
         # Is speech already in memory
         if cache_key in self.mem_cache:
             filename = self.mem_cache[cache_key]["filename"]
-        # Is file store in file cache
+            self._async_use_mem_cache(cache_key)
+        # Is file store in file cache, the view streams it from the file
         elif use_cache and cache_key in self.file_cache:
             filename = self.file_cache[cache_key]
-            self.hass.async_create_task(self._async_file_to_mem(cache_key))
+            self._async_use_file_cache(cache_key)
         # Load speech from engine into memory
         else:
             filename = await self._async_get_tts_audio(
@@ -647,13 +710,14 @@ class SpeechManager:
         use_cache = cache if cache is not None else self.use_cache
 
         # If we have the file, load it into memory if necessary
-        if cache_key not in self.mem_cache:
-            if use_cache and cache_key in self.file_cache:
-                await self._async_file_to_mem(cache_key)
-            else:
-                await self._async_get_tts_audio(
-                    engine_instance, cache_key, message, use_cache, language, options
-                )
+        if cache_key in self.mem_cache:
+            self._async_use_mem_cache(cache_key)
+        elif use_cache and cache_key in self.file_cache:
+            await self._async_file_to_mem(cache_key)
+        else:
+            await self._async_get_tts_audio(
+                engine_instance, cache_key, message, use_cache, language, options
+            )
 
         extension = os.path.splitext(self.mem_cache[cache_key]["filename"])[1][1:]
         cached = self.mem_cache[cache_key]
@@ -764,11 +828,12 @@ class SpeechManager:
         def handle_error(_future: asyncio.Future) -> None:
             """Handle error."""
             if audio_task.exception():
-                self.mem_cache.pop(cache_key, None)
+                self._async_remove_from_mem_cache(cache_key)
 
         audio_task.add_done_callback(handle_error)
 
         filename = f"{cache_key}.{final_extension}".lower()
+        self._async_remove_from_mem_cache(cache_key)
         self.mem_cache[cache_key] = {
             "filename": filename,
             "voice": b"",
@@ -785,16 +850,36 @@ class SpeechManager:
         """
         voice_file = os.path.join(self.cache_dir, filename)
 
-        def save_speech() -> None:
+        def save_speech() -> int:
             """Store speech to filesystem."""
             with open(voice_file, "wb") as speech:
                 speech.write(data)
+            return _get_cache_dir_mtime(self.cache_dir)
 
         try:
-            await self.hass.async_add_executor_job(save_speech)
-            self.file_cache[cache_key] = filename
+            self._cache_dir_mtime = await self.hass.async_add_executor_job(save_speech)
         except OSError as err:
             _LOGGER.error("Can't write %s: %s", filename, err)
+            return
+
+        self.file_cache.pop(cache_key, None)
+        self.file_cache[cache_key] = filename
+        self.file_cache_sizes[cache_key] = len(data)
+        self._async_schedule_save_index()
+
+        # Remove the least recently used files if the cache is too large
+        total_size = sum(self.file_cache_sizes.values())
+        evicted: list[str] = []
+        for evict_key in list(self.file_cache):
+            if total_size <= FILE_CACHE_MAX_SIZE or evict_key == cache_key:
+                break
+            total_size -= self.file_cache_sizes.pop(evict_key, 0)
+            evicted.append(self.file_cache.pop(evict_key))
+        if evicted:
+            _LOGGER.debug("Removing %s voices from the file cache", len(evicted))
+            self._cache_dir_mtime = await self.hass.async_add_executor_job(
+                _remove_cache_files, self.cache_dir, evicted
+            )
 
     async def _async_file_to_mem(self, cache_key: str) -> None:
         """Load voice from file cache into memory.
@@ -814,26 +899,61 @@ class SpeechManager:
         try:
             data = await self.hass.async_add_executor_job(load_speech)
         except OSError as err:
-            del self.file_cache[cache_key]
+            self._async_remove_from_file_cache(cache_key)
             raise HomeAssistantError(f"Can't read {voice_file}") from err
 
+        self._async_use_file_cache(cache_key)
         self._async_store_to_memcache(cache_key, filename, data)
 
+    @callback
+    def _async_use_file_cache(self, cache_key: str) -> None:
+        """Mark a file in the file cache as most recently used."""
+        self.file_cache[cache_key] = self.file_cache.pop(cache_key)
+        self._async_schedule_save_index()
+
+    @callback
+    def _async_remove_from_file_cache(self, cache_key: str) -> None:
+        """Remove a file which can't be read from the file cache."""
+        self.file_cache.pop(cache_key, None)
+        self.file_cache_sizes.pop(cache_key, None)
+        self._async_schedule_save_index()
+
+    @callback
+    def _async_use_mem_cache(self, cache_key: str) -> None:
+        """Mark a voice in the memory cache as most recently used."""
+        self.mem_cache[cache_key] = self.mem_cache.pop(cache_key)
+
+    @callback
+    def _async_remove_from_mem_cache(self, cache_key: str) -> None:
+        """Remove a voice from the memory cache."""
+        if (cached := self.mem_cache.pop(cache_key, None)) is not None:
+            self.mem_cache_size -= len(cached["voice"])
+
     @callback
     def _async_store_to_memcache(
         self, cache_key: str, filename: str, data: bytes
     ) -> None:
         """Store data to memcache and set timer to remove it."""
+        self._async_remove_from_mem_cache(cache_key)
         self.mem_cache[cache_key] = {
             "filename": filename,
             "voice": data,
             "pending": None,
         }
+        self.mem_cache_size += len(data)
+
+        # Remove the least recently used voices if the cache is too large,
+        # voices which are still being generated are kept
+        for evict_key, cached in list(self.mem_cache.items()):
+            if self.mem_cache_size <= MEM_CACHE_MAX_SIZE or evict_key == cache_key:
+                break
+            if cached["pending"] is None:
+                self._async_remove_from_mem_cache(evict_key)
 
         @callback
         def async_remove_from_mem(_: datetime) -> None:
             """Cleanup memcache."""
-            self.mem_cache.pop(cache_key, None)
+            self._async_remove_from_mem_cache(cache_key)
 
         async_call_later(
             self.hass,
@@ -850,19 +970,14 @@ class SpeechManager:
 
         This method is a coroutine.
         """
-        if not (record := _RE_VOICE_FILE.match(filename.lower())) and not (
-            record := _RE_LEGACY_VOICE_FILE.match(filename.lower())
-        ):
-            raise HomeAssistantError("Wrong tts file format!")
-
-        cache_key = KEY_PATTERN.format(
-            record.group(1), record.group(2), record.group(3), record.group(4)
-        )
+        cache_key = _cache_key_from_filename(filename)
 
         if cache_key not in self.mem_cache:
             if cache_key not in self.file_cache:
                 raise HomeAssistantError(f"{cache_key} not in cache!")
             await self._async_file_to_mem(cache_key)
+        else:
+            self._async_use_mem_cache(cache_key)
 
         cached = self.mem_cache[cache_key]
         if pending := cached.get("pending"):
@@ -872,6 +987,38 @@ class SpeechManager:
         content, _ = mimetypes.guess_type(filename)
         return content, cached["voice"]
 
+    async def async_open_tts(self, filename: str) -> tuple[str | None, bytes | str]:
+        """Return the data of a voice which is only in memory or the path of its file.
+
+        Voices in the file cache are not loaded into memory, so they can be
+        streamed from the file.
+
+        This method is a coroutine.
+        """
+        cache_key = _cache_key_from_filename(filename)
+        content, _ = mimetypes.guess_type(filename)
+
+        if (cached := self.mem_cache.get(cache_key)) is not None and (
+            pending := cached["pending"]
+        ):
+            await pending
+
+        if cache_key in self.file_cache:
+            voice_file = os.path.join(self.cache_dir, self.file_cache[cache_key])
+            try:
+                await self.hass.async_add_executor_job(os.stat, voice_file)
+            except OSError:
+                _LOGGER.debug("Voice file %s was removed", voice_file)
+                self._async_remove_from_file_cache(cache_key)
+            else:
+                self._async_use_file_cache(cache_key)
+                return content, voice_file
+
+        if cache_key not in self.mem_cache:
+            raise HomeAssistantError(f"{cache_key} not in cache!")
+        self._async_use_mem_cache(cache_key)
+        return content, self.mem_cache[cache_key]["voice"]
+
     @staticmethod
     def write_tags(
         filename: str,
@@ -935,6 +1082,47 @@ def _init_tts_cache_dir(hass: HomeAssistant, cache_dir: str) -> str:
     return cache_dir
 
 
+def _cache_key_from_filename(filename: str) -> str:
+    """Return the cache key of a voice file."""
+    if not (record := _RE_VOICE_FILE.match(filename.lower())) and not (
+        record := _RE_LEGACY_VOICE_FILE.match(filename.lower())
+    ):
+        raise HomeAssistantError("Wrong tts file format!")
+
+    return KEY_PATTERN.format(
+        record.group(1), record.group(2), record.group(3), record.group(4)
+    )
+
+
+def _get_file_sizes(cache_dir: str, cache_files: dict[str, str]) -> dict[str, int]:
+    """Return the sizes of the files in the cache."""
+    return {
+        cache_key: os.path.getsize(os.path.join(cache_dir, filename))
+        for cache_key, filename in cache_files.items()
+    }
+
+
+def _get_cache_dir_mtime(cache_dir: str) -> int:
+    """Return the modification time of the cache directory."""
+    return os.stat(cache_dir).st_mtime_ns
+
+
+def _remove_cache_files(cache_dir: str, filenames: list[str]) -> int | None:
+    """Remove files from the cache directory.
+
+    Returns the modification time of the directory after removing them.
+    """
+    for filename in filenames:
+        try:
+            os.remove(os.path.join(cache_dir, filename))
+        except OSError as err:
+            _LOGGER.warning("Can't remove cache file '%s': %s", filename, err)
+    try:
+        return _get_cache_dir_mtime(cache_dir)
+    except OSError:
+        return None
+
+
 def _get_cache_files(cache_dir: str) -> dict[str, str]:
     """Return a dict of given engine files."""
     cache = {}
@@ -1008,15 +1196,20 @@ class TextToSpeechView(HomeAssistantView):
         """Initialize a tts view."""
         self.tts = tts
 
-    async def get(self, request: web.Request, filename: str) -> web.Response:
+    async def get(
+        self, request: web.Request, filename: str
+    ) -> web.Response | web.FileResponse:
         """Start a get request."""
         try:
-            content, data = await self.tts.async_read_tts(filename)
+            content, voice = await self.tts.async_open_tts(filename)
         except HomeAssistantError as err:
             _LOGGER.error("Error on load tts: %s", err)
             return web.Response(status=HTTPStatus.NOT_FOUND)
 
-        return web.Response(body=data, content_type=content)
+        if isinstance(voice, str):
+            # Stream the file, which also handles range requests
+            return web.FileResponse(voice)
+        return web.Response(body=voice, content_type=content)
 
 
 @websocket_api.websocket_command(
@@ -14,6 +14,15 @@ DEFAULT_CACHE = True
 DEFAULT_CACHE_DIR = "tts"
 DEFAULT_TIME_MEMORY = 300
 
+# Byte budgets of the memory and the file cache, the least recently used
+# voices are removed when they are exceeded
+MEM_CACHE_MAX_SIZE = 2**20 * 32  # 32MB
+FILE_CACHE_MAX_SIZE = 2**20 * 512  # 512MB
+
+CACHE_INDEX_STORAGE_KEY = "tts_cache"
+CACHE_INDEX_STORAGE_VERSION = 1
+CACHE_INDEX_SAVE_DELAY = 60
+
 DOMAIN = "tts"
 
 DATA_TTS_MANAGER = "tts_manager"
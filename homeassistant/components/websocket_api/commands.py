@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from collections.abc import Callable
+from collections.abc import Callable, Sequence
 from functools import lru_cache, partial
 import json
 import logging
@@ -47,6 +47,7 @@ from homeassistant.helpers.json import (
     find_paths_unserializable_data,
     json_bytes,
 )
+from homeassistant.helpers.polling import async_get_poll_scheduler
 from homeassistant.helpers.service import async_get_all_descriptions
 from homeassistant.loader import (
     Integration,
@@ -82,9 +83,11 @@ def async_register_commands(
     async_reg(hass, handle_get_states)
     async_reg(hass, handle_manifest_get)
     async_reg(hass, handle_integration_setup_info)
+    async_reg(hass, handle_poll_latencies)
     async_reg(hass, handle_manifest_list)
     async_reg(hass, handle_ping)
     async_reg(hass, handle_render_template)
+    async_reg(hass, handle_render_template_cache_stats)
     async_reg(hass, handle_subscribe_bootstrap_integrations)
     async_reg(hass, handle_subscribe_events)
     async_reg(hass, handle_subscribe_trigger)
@@ -306,14 +309,14 @@ async def handle_call_service(
 @callback
 def _async_get_allowed_states(
     hass: HomeAssistant, connection: ActiveConnection
-) -> list[State]:
+) -> Sequence[State]:
     user = connection.user
     if user.is_admin or user.permissions.access_all_entities(POLICY_READ):
-        return hass.states.async_all()
+        return hass.states.async_all_snapshot()
     entity_perm = connection.user.permissions.check_entity
     return [
         state
-        for state in hass.states.async_all()
+        for state in hass.states.async_all_snapshot()
         if entity_perm(state.entity_id, POLICY_READ)
     ]
 
@@ -364,15 +367,11 @@ def _send_handle_get_states_response(
 @callback
 def _forward_entity_changes(
     send_message: Callable[[str | bytes | dict[str, Any] | Callable[[], str]], None],
-    entity_ids: set[str],
     user: User,
     msg_id: int,
     event: Event[EventStateChangedData],
 ) -> None:
     """Forward entity state changed events to websocket."""
-    entity_id = event.data["entity_id"]
-    if entity_ids and entity_id not in entity_ids:
-        return
     # We have to lookup the permissions again because the user might have
     # changed since the subscription was created.
     permissions = user.permissions
@@ -406,11 +405,11 @@ def handle_subscribe_entities(
         partial(
             _forward_entity_changes,
             connection.send_message,
-            entity_ids,
             connection.user,
             msg["id"],
         ),
         run_immediately=True,
+        entity_ids=entity_ids or None,
     )
     connection.send_result(msg["id"])
 
@@ -548,6 +547,22 @@ def handle_integration_setup_info(
     )
 
 
+@callback
+@decorators.websocket_command({vol.Required("type"): "entity/poll_latencies"})
+@decorators.require_admin
+def handle_poll_latencies(
+    hass: HomeAssistant, connection: ActiveConnection, msg: dict[str, Any]
+) -> None:
+    """Handle entity/poll_latencies command."""
+    connection.send_result(
+        msg["id"],
+        {
+            platform: latency.as_dict()
+            for platform, latency in async_get_poll_scheduler(hass).latencies.items()
+        },
+    )
+
+
 @callback
 @decorators.websocket_command({vol.Required("type"): "ping"})
 def handle_ping(
@@ -661,6 +676,18 @@ async def handle_render_template(
     hass.loop.call_soon_threadsafe(info.async_refresh)
 
 
+@callback
+@decorators.websocket_command({vol.Required("type"): "render_template/cache_stats"})
+@decorators.require_admin
+def handle_render_template_cache_stats(
+    hass: HomeAssistant, connection: ActiveConnection, msg: dict[str, Any]
+) -> None:
+    """Handle render_template/cache_stats command."""
+    connection.send_result(
+        msg["id"], template.async_get_render_cache(hass).async_get_stats()
+    )
+
+
 def _serialize_entity_sources(
     entity_infos: dict[str, entity.EntityInfo],
 ) -> dict[str, Any]:
@@ -119,27 +119,20 @@ def cached_event_message(iden: int, event: Event) -> bytes:
     all getting many of the same events (mostly state changed)
     we can avoid serializing the same data for each connection.
     """
-    return b"".join(
-        (
-            _partial_cached_event_message(event)[:-1],
-            b',"id":',
-            str(iden).encode(),
-            b"}",
-        )
-    )
+    return _partial_cached_event_message(event) + _message_id_suffix(iden)
 
 
 @lru_cache(maxsize=128)
 def _partial_cached_event_message(event: Event) -> bytes:
     """Cache and serialize the event to json.
 
-    The message is constructed without the id which appended
-    in cached_event_message.
+    The message is constructed without the id and the closing
+    brace which are appended in cached_event_message.
     """
     return (
         _message_to_json_bytes_or_none({"type": "event", "event": event.json_fragment})
         or INVALID_JSON_PARTIAL_MESSAGE
-    )
+    )[:-1]
 
 
 def cached_state_diff_message(iden: int, event: Event[EventStateChangedData]) -> bytes:
@@ -151,29 +144,32 @@ def cached_state_diff_message(iden: int, event: Event[EventStateChangedData]) ->
     all getting many of the same events (mostly state changed)
     we can avoid serializing the same data for each connection.
     """
-    return b"".join(
-        (
-            _partial_cached_state_diff_message(event)[:-1],
-            b',"id":',
-            str(iden).encode(),
-            b"}",
-        )
-    )
+    return _partial_cached_state_diff_message(event) + _message_id_suffix(iden)
 
 
 @lru_cache(maxsize=128)
 def _partial_cached_state_diff_message(event: Event[EventStateChangedData]) -> bytes:
     """Cache and serialize the event to json.
 
-    The message is constructed without the id which
-    will be appended in cached_state_diff_message
+    The message is constructed without the id and the closing
+    brace which will be appended in cached_state_diff_message
     """
     return (
         _message_to_json_bytes_or_none(
             {"type": "event", "event": _state_diff_event(event)}
         )
         or INVALID_JSON_PARTIAL_MESSAGE
-    )
+    )[:-1]
+
+
+@lru_cache(maxsize=1024)
+def _message_id_suffix(iden: int) -> bytes:
+    """Return the end of a cached message with the message id.
+
+    Subscriptions keep their id, so this is only encoded
+    once per subscription instead of once per message.
+    """
+    return b',"id":%d}' % iden
 
 
 def _state_diff_event(event: Event[EventStateChangedData]) -> dict:
@@ -11,6 +11,7 @@ from ipaddress import IPv4Address, IPv6Address
 import logging
 import re
 import sys
+from time import monotonic
 from typing import TYPE_CHECKING, Any, Final, cast
 
 import voluptuous as vol
@@ -29,10 +30,11 @@ from homeassistant.const import (
     EVENT_HOMEASSISTANT_STOP,
     __version__,
 )
-from homeassistant.core import Event, HomeAssistant, callback
+from homeassistant.core import CALLBACK_TYPE, Event, HomeAssistant, callback
 from homeassistant.data_entry_flow import BaseServiceInfo
 from homeassistant.helpers import discovery_flow, instance_id
 import homeassistant.helpers.config_validation as cv
+from homeassistant.helpers.dispatcher import async_dispatcher_connect
 from homeassistant.helpers.network import NoURLAvailableError, get_url
 from homeassistant.helpers.typing import ConfigType
 from homeassistant.loader import (
@@ -76,6 +78,10 @@ MAX_PROPERTY_VALUE_LEN = 230
 # Dns label max length
 MAX_NAME_LEN = 63
 
+# Unchanged announcements are matched again after this many seconds, so
+# flows which were aborted because of a transient error are retried
+FINGERPRINT_TTL = 300
+
 ATTR_DOMAIN: Final = "domain"
 ATTR_NAME: Final = "name"
 ATTR_PROPERTIES: Final = "properties"
@@ -328,13 +334,55 @@ async def _async_register_hass_zc_service(
     await aio_zc.async_register_service(info, allow_name_change=True)
 
 
-def _match_against_props(matcher: dict[str, str], props: dict[str, str | None]) -> bool:
-    """Check a matcher to ensure all values in props."""
-    for key, value in matcher.items():
-        prop_val = props.get(key)
-        if prop_val is None or not _memorized_fnmatch(prop_val.lower(), value):
+@dataclass(slots=True, frozen=True)
+class _CompiledZeroconfMatcher:
+    """A zeroconf matcher with its patterns compiled."""
+
+    domain: str
+    name: re.Pattern | None
+    # property key -> pattern the lower case value must match
+    properties: tuple[tuple[str, re.Pattern], ...]
+
+    def matches(self, lowered_name: str, props: dict[str, str | None]) -> bool:
+        """Return if the service name and properties match."""
+        if self.name is not None and not self.name.match(lowered_name):
             return False
-    return True
+        for key, pattern in self.properties:
+            if (prop_val := props.get(key)) is None or not pattern.match(
+                prop_val.lower()
+            ):
+                return False
+        return True
+
+
+def _compile_zeroconf_matchers(
+    zeroconf_types: dict[str, list[ZeroconfMatcher]],
+) -> dict[str, tuple[_CompiledZeroconfMatcher, ...]]:
+    """Compile the matchers of each service type."""
+    return {
+        service_type: tuple(
+            _CompiledZeroconfMatcher(
+                matcher[ATTR_DOMAIN],
+                _compile_fnmatch(matcher[ATTR_NAME]) if ATTR_NAME in matcher else None,
+                tuple(
+                    (key, _compile_fnmatch(value))
+                    for key, value in matcher.get(ATTR_PROPERTIES, {}).items()
+                ),
+            )
+            for matcher in matchers
+        )
+        for service_type, matchers in zeroconf_types.items()
+    }
+
+
+def _service_info_fingerprint(info: ZeroconfServiceInfo) -> tuple[Any, ...]:
+    """Return the data of a service which is matched and passed to flows."""
+    return (
+        tuple(info.ip_addresses),
+        info.port,
+        info.hostname,
+        tuple(info.properties.items()),
+    )
 
 
 def is_homekit_paired(props: dict[str, Any]) -> bool:
@@ -366,6 +414,15 @@ class ZeroconfDiscovery:
         self.homekit_model_lookups = homekit_model_lookups
         self.homekit_model_matchers = homekit_model_matchers
         self.async_service_browser: AsyncServiceBrowser | None = None
+        self._matchers = _compile_zeroconf_matchers(zeroconf_types)
+        # (service type, name) -> fingerprint and time of the last processed
+        # update
+        self._fingerprints: dict[tuple[str, str], tuple[tuple[Any, ...], float]] = {}
+        self._unsub_config_entry_changed: CALLBACK_TYPE | None = None
+        # Number of updates matched against the matchers, and number of
+        # updates skipped since they did not change since the last update
+        self.processed_updates = 0
+        self.skipped_updates = 0
 
     async def async_setup(self) -> None:
         """Start discovery."""
@@ -378,6 +435,11 @@ class ZeroconfDiscovery:
             for hk_type in (ZEROCONF_TYPE, *HOMEKIT_TYPES)
             if hk_type not in self.zeroconf_types
         )
+        self._unsub_config_entry_changed = async_dispatcher_connect(
+            self.hass,
+            config_entries.SIGNAL_CONFIG_ENTRY_CHANGED,
+            self._async_config_entry_changed,
+        )
         _LOGGER.debug("Starting Zeroconf browser for: %s", types)
         self.async_service_browser = AsyncServiceBrowser(
             self.zeroconf, types, handlers=[self.async_service_update]
@@ -385,9 +447,22 @@ class ZeroconfDiscovery:
 
     async def async_stop(self) -> None:
         """Cancel the service browser and stop processing the queue."""
+        if self._unsub_config_entry_changed:
+            self._unsub_config_entry_changed()
+            self._unsub_config_entry_changed = None
         if self.async_service_browser:
             await self.async_service_browser.async_cancel()
 
+    @callback
+    def _async_config_entry_changed(
+        self,
+        change: config_entries.ConfigEntryChange,
+        entry: config_entries.ConfigEntry,
+    ) -> None:
+        """Discover unchanged services again when a config entry is removed."""
+        if change is config_entries.ConfigEntryChange.REMOVED:
+            self._fingerprints.clear()
+
     def _async_dismiss_discoveries(self, name: str) -> None:
         """Dismiss all discoveries for the given name."""
         for flow in self.hass.config_entries.flow.async_progress_by_init_data_type(
@@ -413,6 +488,7 @@ class ZeroconfDiscovery:
         )
 
         if state_change == ServiceStateChange.Removed:
+            self._fingerprints.pop((service_type, name), None)
             self._async_dismiss_discoveries(name)
             return
 
@@ -455,7 +531,30 @@ class ZeroconfDiscovery:
             # Prevent the browser thread from collapsing
             _LOGGER.debug("Failed to get addresses for device %s", name)
             return
+        # Devices announce themselves again periodically, and the flows
+        # were already started for an unchanged announcement
+        fingerprint = _service_info_fingerprint(info)
+        now = monotonic()
+        if (
+            (last := self._fingerprints.get((service_type, name))) is not None
+            and last[0] == fingerprint
+            and now - last[1] < FINGERPRINT_TTL
+        ):
+            self.skipped_updates += 1
+            return
+        self.processed_updates += 1
+
         _LOGGER.debug("Discovered new device %s %s", name, info)
+        self._async_create_discovery_flows(info, service_type)
+        # Only skip the next unchanged announcement once the flows were
+        # created, so a failed discovery is tried again
+        self._fingerprints[(service_type, name)] = (fingerprint, now)
+
+    @callback
+    def _async_create_discovery_flows(
+        self, info: ZeroconfServiceInfo, service_type: str
+    ) -> None:
+        """Create the discovery flows of the integrations matching a service."""
         props: dict[str, str | None] = info.properties
         domain = None
 
@@ -489,23 +588,17 @@ class ZeroconfDiscovery:
                 # discover it, we can stop here.
                 return
 
-        if not (matchers := self.zeroconf_types.get(service_type)):
+        if not (matchers := self._matchers.get(service_type)):
             return
 
         # Not all homekit types are currently used for discovery
         # so not all service type exist in zeroconf_types
+        lowered_name = info.name.lower()
         for matcher in matchers:
-            if len(matcher) > 1:
-                if ATTR_NAME in matcher and not _memorized_fnmatch(
-                    info.name.lower(), matcher[ATTR_NAME]
-                ):
-                    continue
-                if ATTR_PROPERTIES in matcher and not _match_against_props(
-                    matcher[ATTR_PROPERTIES], props
-                ):
-                    continue
-
-            matcher_domain = matcher[ATTR_DOMAIN]
+            if not matcher.matches(lowered_name, props):
+                continue
+
+            matcher_domain = matcher.domain
             context = {
                 "source": config_entries.SOURCE_ZEROCONF,
             }
@@ -622,18 +715,3 @@ def _truncate_location_name_to_valid(location_name: str) -> str:
 def _compile_fnmatch(pattern: str) -> re.Pattern:
     """Compile a fnmatch pattern."""
     return re.compile(translate(pattern))
-
-
-@lru_cache(maxsize=1024, typed=True)
-def _memorized_fnmatch(name: str, pattern: str) -> bool:
-    """Memorized version of fnmatch that has a larger lru_cache.
-
-    The default version of fnmatch only has a lru_cache of 256 entries.
-    With many devices we quickly reach that limit and end up compiling
-    the same pattern over and over again.
-
-    Zeroconf has its own memorized fnmatch with its own lru_cache
-    since the data is going to be relatively the same
-    since the devices will not change frequently
-    """
-    return bool(_compile_fnmatch(pattern).match(name))
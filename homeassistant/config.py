@@ -63,6 +63,7 @@ from .exceptions import ConfigValidationError, HomeAssistantError
 from .generated.currencies import HISTORIC_CURRENCIES
 from .helpers import config_validation as cv, issue_registry as ir
 from .helpers.entity_values import EntityValues
+from .helpers.storage import STORAGE_DIR
 from .helpers.typing import ConfigType
 from .loader import ComponentProtocol, Integration, IntegrationNotFound
 from .requirements import RequirementsNotFound, async_get_integration_with_requirements
@@ -70,6 +71,7 @@ from .util.async_ import create_eager_task
 from .util.package import is_docker_env
 from .util.unit_system import get_unit_system, validate_unit_system
 from .util.yaml import SECRET_YAML, Secrets, YamlTypeError, load_yaml_dict
+from .util.yaml.cache import YamlCache
 from .util.yaml.objects import NodeStrClass
 
 _LOGGER = logging.getLogger(__name__)
@@ -80,6 +82,8 @@ YAML_CONFIG_FILE = "configuration.yaml"
 VERSION_FILE = ".HA_VERSION"
 CONFIG_DIR_NAME = ".homeassistant"
 DATA_CUSTOMIZE = "hass_customize"
+DATA_YAML_CACHE = "config_yaml_cache"
+YAML_CACHE_FILE = "core.yaml_cache"
 
 AUTOMATION_CONFIG_PATH = "automations.yaml"
 SCRIPT_CONFIG_PATH = "scripts.yaml"
@@ -470,14 +474,19 @@ async def async_hass_config_yaml(hass: HomeAssistant) -> dict:
     configuration by itself. Include package merge.
     """
     secrets = Secrets(Path(hass.config.config_dir))
+    if (yaml_cache := hass.data.get(DATA_YAML_CACHE)) is None:
+        yaml_cache = hass.data[DATA_YAML_CACHE] = YamlCache(
+            hass.config.path(STORAGE_DIR, YAML_CACHE_FILE)
+        )
 
     # Not using async_add_executor_job because this is an internal method.
     try:
         config = await hass.loop.run_in_executor(
             None,
-            load_yaml_config_file,
+            _load_yaml_config_file_with_cache,
             hass.config.path(YAML_CONFIG_FILE),
             secrets,
+            yaml_cache,
         )
     except HomeAssistantError as exc:
         if not (base_exc := exc.__cause__) or not isinstance(base_exc, MarkedYAMLError):
@@ -518,6 +527,26 @@ async def async_hass_config_yaml(hass: HomeAssistant) -> dict:
     return config
 
 
+def _load_yaml_config_file_with_cache(
+    config_path: str, secrets: Secrets, yaml_cache: YamlCache
+) -> dict[Any, Any]:
+    """Parse a YAML configuration file, only parsing changed files.
+
+    This method needs to run in an executor.
+    """
+    hits, misses = yaml_cache.hits, yaml_cache.misses
+    seconds_saved = yaml_cache.seconds_saved
+    with yaml_cache.active():
+        config = load_yaml_config_file(config_path, secrets)
+    _LOGGER.debug(
+        "Loaded %s files from the YAML cache and parsed %s files, saving %.3fs",
+        yaml_cache.hits - hits,
+        yaml_cache.misses - misses,
+        yaml_cache.seconds_saved - seconds_saved,
+    )
+    return config
+
+
 def load_yaml_config_file(
     config_path: str, secrets: Secrets | None = None
 ) -> dict[Any, Any]:
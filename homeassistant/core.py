@@ -1336,17 +1336,41 @@ class _OneTimeListener:
 # Empty list, used by EventBus._async_fire
 EMPTY_LIST: list[Any] = []
 
+# Events which can be listened to for specific entity_ids
+ENTITY_ID_SCOPED_EVENTS = {EVENT_STATE_CHANGED, EVENT_STATE_REPORTED}
+
+
+@dataclass(slots=True)
+class EventBusStats:
+    """Statistics for firing events of one event type."""
+
+    fired: int = 0
+    filter_calls: int = 0
+    dispatch_time: float = 0.0  # seconds
+
 
 class EventBus:
     """Allow the firing of and listening for events."""
 
-    __slots__ = ("_debug", "_hass", "_listeners", "_match_all_listeners")
+    __slots__ = (
+        "_debug",
+        "_entity_id_listeners",
+        "_hass",
+        "_listeners",
+        "_match_all_listeners",
+        "_stats",
+    )
 
     def __init__(self, hass: HomeAssistant) -> None:
         """Initialize a new event bus."""
         self._listeners: dict[str, list[_FilterableJobType[Any]]] = {}
         self._match_all_listeners: list[_FilterableJobType[Any]] = []
         self._listeners[MATCH_ALL] = self._match_all_listeners
+        # Listeners for specific entity_ids keyed by (event_type, entity_id)
+        self._entity_id_listeners: dict[
+            tuple[str, str], list[_FilterableJobType[Any]]
+        ] = {}
+        self._stats: defaultdict[str, EventBusStats] | None = None
         self._hass = hass
         self._async_logging_changed()
         self.async_listen(
@@ -1364,13 +1388,36 @@ class EventBus:
 
         This method must be run in the event loop.
         """
-        return {key: len(listeners) for key, listeners in self._listeners.items()}
+        listeners = {key: len(listeners) for key, listeners in self._listeners.items()}
+        for (event_type, _), entity_id_listeners in self._entity_id_listeners.items():
+            listeners[event_type] = listeners.get(event_type, 0) + len(
+                entity_id_listeners
+            )
+        return listeners
 
     @property
     def listeners(self) -> dict[str, int]:
         """Return dictionary with events and the number of listeners."""
         return run_callback_threadsafe(self._hass.loop, self.async_listeners).result()
 
+    @callback
+    def async_start_collecting_stats(self) -> None:
+        """Start collecting statistics about firing events.
+
+        This method must be run in the event loop.
+        """
+        self._stats = defaultdict(EventBusStats)
+
+    @callback
+    def async_stop_collecting_stats(self) -> dict[str, EventBusStats]:
+        """Stop collecting statistics and return them by event type.
+
+        This method must be run in the event loop.
+        """
+        stats = dict(self._stats or {})
+        self._stats = None
+        return stats
+
     def fire(
         self,
         event_type: str,
@@ -1431,13 +1478,56 @@ class EventBus:
         else:
             aliased_listeners = EMPTY_LIST
         listeners = listeners + match_all_listeners + aliased_listeners
-        if not listeners:
+        if (
+            self._entity_id_listeners
+            and event_data is not None
+            and event_type in ENTITY_ID_SCOPED_EVENTS
+        ):
+            entity_id = event_data["entity_id"]
+            listeners += self._entity_id_listeners.get(
+                (event_type, entity_id), EMPTY_LIST
+            )
+            if event_type == EVENT_STATE_CHANGED:
+                listeners += self._entity_id_listeners.get(
+                    (EVENT_STATE_REPORTED, entity_id), EMPTY_LIST
+                )
+
+        if (stats := self._stats) is not None:
+            start = time.perf_counter()
+            filter_calls = self._async_fire_listeners(
+                listeners, event_type, event_data, origin, context, time_fired
+            )
+            event_type_stats = stats[event_type]
+            event_type_stats.fired += 1
+            event_type_stats.filter_calls += filter_calls
+            event_type_stats.dispatch_time += time.perf_counter() - start
             return
 
+        if listeners:
+            self._async_fire_listeners(
+                listeners, event_type, event_data, origin, context, time_fired
+            )
+
+    @callback
+    def _async_fire_listeners(
+        self,
+        listeners: list[_FilterableJobType[Any]],
+        event_type: str,
+        event_data: Mapping[str, Any] | None,
+        origin: EventOrigin,
+        context: Context | None,
+        time_fired: float | None,
+    ) -> int:
+        """Run or schedule the listeners for an event.
+
+        Returns the number of event filters which have been called.
+        """
         event: Event | None = None
+        filter_calls = 0
 
         for job, event_filter, run_immediately in listeners:
             if event_filter is not None:
+                filter_calls += 1
                 try:
                     if event_data is None or not event_filter(event_data):
                         continue
@@ -1462,6 +1552,8 @@ class EventBus:
             else:
                 self._hass.async_add_hass_job(job, event)
 
+        return filter_calls
+
     def listen(
         self,
         event_type: str,
@@ -1489,6 +1581,7 @@ class EventBus:
         listener: Callable[[Event[_DataT]], Coroutine[Any, Any, None] | None],
         event_filter: Callable[[_DataT], bool] | None = None,
         run_immediately: bool = False,
+        entity_ids: Iterable[str] | None = None,
     ) -> CALLBACK_TYPE:
         """Listen for all events or events of a specific type.
 
@@ -1503,17 +1596,31 @@ class EventBus:
           - callbacks will be run right away instead of using call_soon.
           - coroutine functions will be scheduled eagerly.
 
+        If entity_ids is passed, the listener is only called for events of
+        these entities. This is only supported for state_changed and
+        state_reported events and is much cheaper than an event_filter
+        since the listener is looked up by entity_id when firing.
+
         This method must be run in the event loop.
         """
         if event_filter is not None and not is_callback_check_partial(event_filter):
             raise HomeAssistantError(f"Event filter {event_filter} is not a callback")
-        return self._async_listen_filterable_job(
-            event_type,
-            (
-                HassJob(listener, f"listen {event_type}"),
-                event_filter,
-                run_immediately,
-            ),
+        filterable_job: _FilterableJobType[Any] = (
+            HassJob(listener, f"listen {event_type}"),
+            event_filter,
+            run_immediately,
+        )
+        if entity_ids is None:
+            return self._async_listen_filterable_job(event_type, filterable_job)
+        if event_type not in ENTITY_ID_SCOPED_EVENTS:
+            raise HomeAssistantError(
+                f"Listening for specific entity_ids is not supported for {event_type}"
+            )
+        keys = [(event_type, entity_id) for entity_id in set(entity_ids)]
+        for key in keys:
+            self._entity_id_listeners.setdefault(key, []).append(filterable_job)
+        return functools.partial(
+            self._async_remove_entity_id_listener, keys, filterable_job
         )
 
     @callback
@@ -1600,6 +1707,24 @@ class EventBus:
                 "Unable to remove unknown job listener %s", filterable_job
             )
 
+    @callback
+    def _async_remove_entity_id_listener(
+        self, keys: list[tuple[str, str]], filterable_job: _FilterableJobType
+    ) -> None:
+        """Remove a listener for specific entity_ids.
+
+        This method must be run in the event loop.
+        """
+        for key in keys:
+            try:
+                self._entity_id_listeners[key].remove(filterable_job)
+                if not self._entity_id_listeners[key]:
+                    del self._entity_id_listeners[key]
+            except (KeyError, ValueError):
+                _LOGGER.exception(
+                    "Unable to remove unknown job listener %s", filterable_job
+                )
+
 
 class CompressedState(TypedDict):
     """Compressed dict of a state."""
@@ -1859,12 +1984,20 @@ class States(UserDict[str, State]):
 
     Maintains an additional index:
     - domain -> dict[str, State]
+
+    Also caches immutable snapshots of all states and of the states of
+    each domain. A snapshot is shared by all readers until a state of
+    the snapshot is added, replaced or removed.
     """
 
     def __init__(self) -> None:
         """Initialize the container."""
         super().__init__()
         self._domain_index: defaultdict[str, dict[str, State]] = defaultdict(dict)
+        self._snapshot: tuple[State, ...] | None = None
+        self._domain_snapshots: dict[str, tuple[State, ...]] = {}
+        # Incremented on every change so readers can detect changes
+        self.version = 0
 
     def values(self) -> ValuesView[State]:
         """Return the underlying values to avoid __iter__ overhead."""
@@ -1874,12 +2007,37 @@ class States(UserDict[str, State]):
         """Add an item."""
         self.data[key] = entry
         self._domain_index[entry.domain][entry.entity_id] = entry
+        self._async_invalidate_snapshots(entry.domain)
 
     def __delitem__(self, key: str) -> None:
         """Remove an item."""
         entry = self[key]
         del self._domain_index[entry.domain][entry.entity_id]
         super().__delitem__(key)
+        self._async_invalidate_snapshots(entry.domain)
+
+    def _async_invalidate_snapshots(self, domain: str) -> None:
+        """Drop the snapshots containing a changed state."""
+        self.version += 1
+        self._snapshot = None
+        self._domain_snapshots.pop(domain, None)
+
+    def snapshot(self) -> tuple[State, ...]:
+        """Return an immutable snapshot of all states."""
+        if (snapshot := self._snapshot) is None:
+            snapshot = self._snapshot = tuple(self.data.values())
+        return snapshot
+
+    def domain_snapshot(self, key: str) -> tuple[State, ...]:
+        """Return an immutable snapshot of all states of a domain."""
+        if (snapshot := self._domain_snapshots.get(key)) is None:
+            # Avoid polluting _domain_index with non-existing domains
+            if key not in self._domain_index:
+                return ()
+            snapshot = self._domain_snapshots[key] = tuple(
+                self._domain_index[key].values()
+            )
+        return snapshot
 
     def domain_entity_ids(self, key: str) -> KeysView[str] | tuple[()]:
         """Get all entity_ids for a domain."""
@@ -1980,6 +2138,31 @@ class StateMachine:
             states.extend(self._states.domain_states(domain))
         return states
 
+    @callback
+    def async_all_snapshot(self, domain_filter: str | None = None) -> tuple[State, ...]:
+        """Return an immutable snapshot of all states matching the filter.
+
+        Unlike async_all, the snapshot is only created once per change of
+        the states it contains and is shared by all callers. The caller
+        must not hold on to it when it needs to see later changes, use
+        async_version to find out if the states changed since.
+
+        This method must be run in the event loop.
+        """
+        if domain_filter is None:
+            return self._states.snapshot()
+        return self._states.domain_snapshot(domain_filter.lower())
+
+    @callback
+    def async_version(self) -> int:
+        """Return a number which changes whenever a state is set or removed.
+
+        Updates of only last_reported don't change the version.
+
+        This method must be run in the event loop.
+        """
+        return self._states.version
+
     def get(self, entity_id: str) -> State | None:
         """Retrieve state of entity_id or None if not found.
 
@@ -121,6 +121,7 @@ ConditionCheckerType = Callable[[HomeAssistant, TemplateVarsType], bool | None]
 def condition_trace_append(variables: TemplateVarsType, path: str) -> TraceElement:
     """Append a TraceElement to trace[path]."""
     trace_element = TraceElement(variables, path)
+    trace_element.freeze_variables()
     trace_append_element(trace_element)
     return trace_element
 
@@ -70,6 +70,7 @@ from .event import (
     async_track_device_registry_updated_event,
     async_track_entity_registry_updated_event,
 )
+from .polling import current_poll
 from .typing import UNDEFINED, StateType, UndefinedType
 
 if TYPE_CHECKING:
@@ -1263,14 +1264,29 @@ class Entity(
                 hass.loop.time() + SLOW_UPDATE_WARNING, self._async_slow_update_warning
             )
 
+        # Set when the entity is polled by the poll scheduler
+        if (poll := current_poll.get()) is not None and poll.entity is not self:
+            poll = None
+        start: float | None = None
         try:
             if hasattr(self, "async_update"):
+                start = hass.loop.time()
                 await self.async_update()
             elif hasattr(self, "update"):
-                await hass.async_add_executor_job(self.update)
+                if poll is None:
+                    await hass.async_add_executor_job(self.update)
+                else:
+                    # Only take a slot of the polls in the executor once the
+                    # entity may update, so a platform waiting for its
+                    # parallel updates does not hold slots of other platforms
+                    async with poll.executor_polls:
+                        start = hass.loop.time()
+                        await hass.async_add_executor_job(self.update)
             else:
                 return
         finally:
+            if poll is not None and start is not None:
+                poll.duration = hass.loop.time() - start
             self._update_staged = False
             if warning:
                 update_warn.cancel()
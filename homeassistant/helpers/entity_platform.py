@@ -5,7 +5,7 @@ from __future__ import annotations
 import asyncio
 from collections.abc import Awaitable, Callable, Coroutine, Iterable
 from contextvars import ContextVar
-from datetime import datetime, timedelta
+from datetime import timedelta
 from functools import partial
 from logging import Logger, getLogger
 from typing import TYPE_CHECKING, Any, Protocol
@@ -43,8 +43,9 @@ from . import (
     translation,
 )
 from .entity_registry import EntityRegistry, RegistryEntryDisabler, RegistryEntryHider
-from .event import async_call_later, async_track_time_interval
+from .event import async_call_later
 from .issue_registry import IssueSeverity, async_create_issue
+from .polling import PlatformPoller, async_get_poll_scheduler
 from .typing import UNDEFINED, ConfigType, DiscoveryInfoType
 
 if TYPE_CHECKING:
@@ -137,14 +138,12 @@ class EntityPlatform:
         self._tasks: list[asyncio.Task[None]] = []
         # Stop tracking tasks after setup is completed
         self._setup_complete = False
-        # Method to cancel the state change listener
-        self._async_unsub_polling: CALLBACK_TYPE | None = None
+        # Poller of the entities, if the platform has polling entities
+        self._poller: PlatformPoller | None = None
         # Method to cancel the retry of setup
         self._async_cancel_retry_setup: CALLBACK_TYPE | None = None
-        self._process_updates: asyncio.Lock | None = None
 
         self.parallel_updates: asyncio.Semaphore | None = None
-        self._update_in_sequence: bool = False
 
         # Platform is None for the EntityComponent "catch-all" EntityPlatform
         # which powers entity_component.add_entities
@@ -210,7 +209,6 @@ class EntityPlatform:
 
         if parallel_updates is not None:
             self.parallel_updates = asyncio.Semaphore(parallel_updates)
-            self._update_in_sequence = parallel_updates == 1
 
         return self.parallel_updates
 
@@ -628,36 +626,18 @@ class EntityPlatform:
 
         await add_func(coros, entities, timeout)
 
-        if (
-            (self.config_entry and self.config_entry.pref_disable_polling)
-            or self._async_unsub_polling is not None
-            or not any(entity.should_poll for entity in entities)
-        ):
+        if self.config_entry and self.config_entry.pref_disable_polling:
             return
 
-        self._async_unsub_polling = async_track_time_interval(
-            self.hass,
-            self._async_handle_interval_callback,
-            self.scan_interval,
-            name=f"EntityPlatform poll {self.domain}.{self.platform_name}",
-        )
+        if self._poller is not None:
+            self._poller.async_add_entities(entities)
+            return
 
-    @callback
-    def _async_handle_interval_callback(self, now: datetime) -> None:
-        """Update all the entity states in a single platform."""
-        if self.config_entry:
-            self.config_entry.async_create_background_task(
-                self.hass,
-                self._update_entity_states(now),
-                name=f"EntityPlatform poll {self.domain}.{self.platform_name}",
-                eager_start=True,
-            )
-        else:
-            self.hass.async_create_background_task(
-                self._update_entity_states(now),
-                name=f"EntityPlatform poll {self.domain}.{self.platform_name}",
-                eager_start=True,
-            )
+        if not any(entity.should_poll for entity in entities):
+            return
+
+        self._poller = async_get_poll_scheduler(self.hass).async_track_platform(self)
+        self._poller.async_add_entities(self.entities.values())
 
     def _entity_id_already_exists(self, entity_id: str) -> tuple[bool, bool]:
         """Check if an entity_id already exists.
@@ -875,6 +855,8 @@ class EntityPlatform:
             self.entities.pop(entity_id)
             self.domain_entities.pop(entity_id)
             self.domain_platform_entities.pop(entity_id)
+            if self._poller is not None:
+                self._poller.async_remove_entity(entity_id)
 
         entity.async_on_remove(remove_entity_cb)
 
@@ -908,9 +890,9 @@ class EntityPlatform:
     @callback
     def async_unsub_polling(self) -> None:
         """Stop polling."""
-        if self._async_unsub_polling is not None:
-            self._async_unsub_polling()
-            self._async_unsub_polling = None
+        if self._poller is not None:
+            self._poller.async_cancel()
+            self._poller = None
 
     @callback
     def async_prepare(self) -> None:
@@ -932,11 +914,10 @@ class EntityPlatform:
         await self.entities[entity_id].async_remove()
 
         # Clean up polling job if no longer needed
-        if self._async_unsub_polling is not None and not any(
+        if self._poller is not None and not any(
             entity.should_poll for entity in self.entities.values()
         ):
-            self._async_unsub_polling()
-            self._async_unsub_polling = None
+            self.async_unsub_polling()
 
     async def async_extract_from_service(
         self, service_call: ServiceCall, expand_group: bool = True
@@ -987,44 +968,6 @@ class EntityPlatform:
             supports_response,
         )
 
-    async def _update_entity_states(self, now: datetime) -> None:
-        """Update the states of all the polling entities.
-
-        To protect from flooding the executor, we will update async entities
-        in parallel and other entities sequential.
-
-        This method must be run in the event loop.
-        """
-        if self._process_updates is None:
-            self._process_updates = asyncio.Lock()
-        if self._process_updates.locked():
-            self.logger.warning(
-                "Updating %s %s took longer than the scheduled update interval %s",
-                self.platform_name,
-                self.domain,
-                self.scan_interval,
-            )
-            return
-
-        async with self._process_updates:
-            if self._update_in_sequence or len(self.entities) <= 1:
-                # If we know we will update sequentially, we want to avoid scheduling
-                # the coroutines as tasks that will wait on the semaphore lock.
-                for entity in list(self.entities.values()):
-                    # If the entity is removed from hass during the previous
-                    # entity being updated, we need to skip updating the
-                    # entity.
-                    if entity.should_poll and entity.hass:
-                        await entity.async_update_ha_state(True)
-                return
-
-            if tasks := [
-                create_eager_task(entity.async_update_ha_state(True))
-                for entity in self.entities.values()
-                if entity.should_poll
-            ]:
-                await asyncio.gather(*tasks)
-
 
 current_platform: ContextVar[EntityPlatform | None] = ContextVar(
     "current_platform", default=None
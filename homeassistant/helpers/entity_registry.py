@@ -10,8 +10,7 @@ timer.
 
 from __future__ import annotations
 
-from collections import UserDict
-from collections.abc import Callable, Iterable, KeysView, Mapping, ValuesView
+from collections.abc import Callable, Iterable, KeysView, Mapping
 from datetime import datetime, timedelta
 from enum import StrEnum
 import logging
@@ -53,7 +52,7 @@ from homeassistant.util.read_only_dict import ReadOnlyDict
 from . import device_registry as dr, storage
 from .device_registry import EVENT_DEVICE_REGISTRY_UPDATED
 from .json import JSON_DUMP, find_paths_unserializable_data, json_bytes, json_fragment
-from .registry import BaseRegistry
+from .registry import BaseRegistry, BaseRegistryItems
 from .typing import UNDEFINED, UndefinedType
 
 if TYPE_CHECKING:
@@ -511,14 +510,27 @@ class EntityRegistryStore(storage.Store[dict[str, list[dict[str, Any]]]]):
         return data
 
 
-class EntityRegistryItems(UserDict[str, RegistryEntry]):
+def _entry_labels(entry: RegistryEntry) -> set[str]:
+    """Return the labels an entry is indexed by."""
+    return entry.labels
+
+
+def _entry_categories(entry: RegistryEntry) -> Iterable[tuple[str, str]]:
+    """Return the (scope, category_id) pairs an entry is indexed by."""
+    return entry.categories.items()
+
+
+class EntityRegistryItems(BaseRegistryItems[RegistryEntry]):
     """Container for entity registry items, maps entity_id -> entry.
 
-    Maintains four additional indexes:
+    Maintains these additional indexes:
     - id -> entry
     - (domain, platform, unique_id) -> entity_id
     - config_entry_id -> list[key]
     - device_id -> list[key]
+    - area_id -> list[key]
+    - label_id -> list[key]
+    - (scope, category_id) -> list[key]
     """
 
     def __init__(self) -> None:
@@ -529,17 +541,11 @@ class EntityRegistryItems(UserDict[str, RegistryEntry]):
         self._config_entry_id_index: dict[str, dict[str, Literal[True]]] = {}
         self._device_id_index: dict[str, dict[str, Literal[True]]] = {}
         self._area_id_index: dict[str, dict[str, Literal[True]]] = {}
+        self.add_index("labels", _entry_labels)
+        self.add_index("categories", _entry_categories)
 
-    def values(self) -> ValuesView[RegistryEntry]:
-        """Return the underlying values to avoid __iter__ overhead."""
-        return self.data.values()
-
-    def __setitem__(self, key: str, entry: RegistryEntry) -> None:
-        """Add an item."""
-        data = self.data
-        if key in data:
-            self._unindex_entry(key)
-        data[key] = entry
+    def _index_entry(self, key: str, entry: RegistryEntry) -> None:
+        """Index an entry."""
         self._entry_ids[entry.id] = entry
         self._index[(entry.domain, entry.platform, entry.unique_id)] = entry.entity_id
         # python has no ordered set, so we use a dict with True values
@@ -577,11 +583,6 @@ class EntityRegistryItems(UserDict[str, RegistryEntry]):
         if area_id := entry.area_id:
             self._unindex_entry_value(key, area_id, self._area_id_index)
 
-    def __delitem__(self, key: str) -> None:
-        """Remove an item."""
-        self._unindex_entry(key)
-        super().__delitem__(key)
-
     def get_device_ids(self) -> KeysView[str]:
         """Return device ids."""
         return self._device_id_index.keys()
@@ -619,6 +620,16 @@ class EntityRegistryItems(UserDict[str, RegistryEntry]):
         data = self.data
         return [data[key] for key in self._area_id_index.get(area_id, ())]
 
+    def get_entries_for_label(self, label_id: str) -> list[RegistryEntry]:
+        """Get entries for label."""
+        return self.get_entries_for_index("labels", label_id)
+
+    def get_entries_for_category(
+        self, scope: str, category_id: str
+    ) -> list[RegistryEntry]:
+        """Get entries for a category in a scope."""
+        return self.get_entries_for_index("categories", (scope, category_id))
+
 
 class EntityRegistry(BaseRegistry):
     """Class to hold a registry of entities."""
@@ -636,6 +647,7 @@ class EntityRegistry(BaseRegistry):
             STORAGE_KEY,
             atomic_writes=True,
             minor_version=STORAGE_VERSION_MINOR,
+            journal=True,
         )
         self.hass.bus.async_listen(
             EVENT_DEVICE_REGISTRY_UPDATED,
@@ -1367,7 +1379,7 @@ def async_entries_for_label(
     registry: EntityRegistry, label_id: str
 ) -> list[RegistryEntry]:
     """Return entries that match a label."""
-    return [entry for entry in registry.entities.values() if label_id in entry.labels]
+    return registry.entities.get_entries_for_label(label_id)
 
 
 @callback
@@ -1375,14 +1387,7 @@ def async_entries_for_category(
     registry: EntityRegistry, scope: str, category_id: str
 ) -> list[RegistryEntry]:
     """Return entries that match a category in a scope."""
-    return [
-        entry
-        for entry in registry.entities.values()
-        if (
-            (existing_category_id := entry.categories.get(scope))
-            and category_id == existing_category_id
-        )
-    ]
+    return registry.entities.get_entries_for_category(scope, category_id)
 
 
 @callback
@@ -973,7 +973,7 @@ class TrackTemplateResultInfo:
             template = super_template.template
             variables = super_template.variables
             self._info[template] = info = template.async_render_to_info(
-                variables, strict=strict, log_fn=log_fn
+                variables, strict=strict, log_fn=log_fn, use_cache=True
             )
 
             # If the super template did not render to True, don't update other templates
@@ -994,7 +994,7 @@ class TrackTemplateResultInfo:
             template = track_template_.template
             variables = track_template_.variables
             self._info[template] = info = template.async_render_to_info(
-                variables, strict=strict, log_fn=log_fn
+                variables, strict=strict, log_fn=log_fn, use_cache=True
             )
 
             if info.exception:
@@ -1119,7 +1119,7 @@ class TrackTemplateResultInfo:
 
         self._rate_limit.async_triggered(template, now)
         self._info[template] = info = template.async_render_to_info(
-            track_template_.variables
+            track_template_.variables, use_cache=True
         )
 
         try:
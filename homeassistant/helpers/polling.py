@@ -0,0 +1,248 @@
+"""Schedule the polls of the entities which are polled."""
+
+from __future__ import annotations
+
+import asyncio
+from bisect import bisect_left
+from collections.abc import Iterable
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any
+import zlib
+
+from homeassistant.core import HomeAssistant, callback
+
+if TYPE_CHECKING:
+    from .entity import Entity
+    from .entity_platform import EntityPlatform
+
+DATA_POLL_SCHEDULER = "poll_scheduler"
+
+# Maximum number of polls of entities updating in the executor which are
+# running at the same time, leaving workers of the executor for other jobs
+MAX_EXECUTOR_POLLS = 16
+
+# Upper bounds of the buckets of the poll latency histograms in seconds
+POLL_LATENCY_BUCKETS = (0.01, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+
+
+@dataclass(slots=True)
+class PollLatencyHistogram:
+    """Histogram of the time the polls of the entities of a platform took."""
+
+    # Number of polls per bucket, the last bucket has no upper bound
+    counts: list[int] = field(
+        default_factory=lambda: [0] * (len(POLL_LATENCY_BUCKETS) + 1)
+    )
+    count: int = 0
+    total: float = 0.0
+    # Number of polls which took longer than the scan interval
+    overruns: int = 0
+
+    def record(self, seconds: float) -> None:
+        """Record the time a poll took."""
+        self.counts[bisect_left(POLL_LATENCY_BUCKETS, seconds)] += 1
+        self.count += 1
+        self.total += seconds
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the histogram as a dictionary."""
+        return {
+            "buckets": [*POLL_LATENCY_BUCKETS, None],
+            "counts": list(self.counts),
+            "count": self.count,
+            "total": self.total,
+            "overruns": self.overruns,
+        }
+
+
+@dataclass(slots=True)
+class EntityPoll:
+    """A poll of an entity by the poll scheduler."""
+
+    entity: Entity
+    # Bounds the polls which run in the executor at the same time
+    executor_polls: asyncio.Semaphore
+    # Time the update of the entity took, None if the entity was not updated
+    duration: float | None = None
+
+
+# The poll of the entity which is updated in the current task
+current_poll: ContextVar[EntityPoll | None] = ContextVar("current_poll", default=None)
+
+
+def _entity_phase(entity_id: str, interval: float) -> float:
+    """Return the offset of the polls of an entity within the scan interval.
+
+    The offset is derived from the entity id, so the entity is polled at
+    the same point of the interval after a restart.
+    """
+    return zlib.crc32(entity_id.encode()) / 2**32 * interval
+
+
+def _next_poll_time(now: float, interval: float, phase: float) -> float:
+    """Return the next time after now at the phase of the scan interval.
+
+    The time is at most one scan interval away.
+    """
+    return now + interval - (now - phase) % interval
+
+
+class PlatformPoller:
+    """Poll the entities of an entity platform.
+
+    Each entity is polled at its own offset within the scan interval, so the
+    polls of the entities are spread over the interval instead of all
+    running at the same time. The next poll is scheduled when a poll is
+    done, so an entity whose update takes longer than the scan interval is
+    polled at the next offset after its update, instead of its polls
+    piling up.
+    """
+
+    def __init__(
+        self,
+        scheduler: PollScheduler,
+        platform: EntityPlatform,
+        latency: PollLatencyHistogram,
+    ) -> None:
+        """Initialize the poller."""
+        self._scheduler = scheduler
+        self._platform = platform
+        self._latency = latency
+        self._interval = platform.scan_interval.total_seconds()
+        self._handles: dict[str, asyncio.TimerHandle] = {}
+        # Entities whose last poll took longer than the scan interval
+        self._overrunning: set[str] = set()
+        self._cancelled = False
+
+    @callback
+    def async_add_entities(self, entities: Iterable[Entity]) -> None:
+        """Start polling entities of the platform."""
+        now = self._platform.hass.loop.time()
+        for entity in entities:
+            self._async_schedule(entity, now)
+
+    @callback
+    def async_remove_entity(self, entity_id: str) -> None:
+        """Stop polling an entity."""
+        if (handle := self._handles.pop(entity_id, None)) is not None:
+            handle.cancel()
+        self._overrunning.discard(entity_id)
+
+    @callback
+    def async_cancel(self) -> None:
+        """Stop polling all entities."""
+        self._cancelled = True
+        for handle in self._handles.values():
+            handle.cancel()
+        self._handles.clear()
+        self._overrunning.clear()
+
+    @callback
+    def _async_schedule(self, entity: Entity, now: float) -> None:
+        """Schedule the next poll of an entity."""
+        entity_id = entity.entity_id
+        if self._platform.entities.get(entity_id) is not entity:
+            # The entity was not added or was removed
+            return
+        if (handle := self._handles.get(entity_id)) is not None:
+            handle.cancel()
+        when = _next_poll_time(
+            now, self._interval, _entity_phase(entity_id, self._interval)
+        )
+        self._handles[entity_id] = self._platform.hass.loop.call_at(
+            when, self._async_handle_poll, entity
+        )
+
+    @callback
+    def _async_handle_poll(self, entity: Entity) -> None:
+        """Poll an entity at its scheduled time."""
+        platform = self._platform
+        hass = platform.hass
+        entity_id = entity.entity_id
+        del self._handles[entity_id]
+        if platform.entities.get(entity_id) is not entity:
+            return
+        if not entity.should_poll:
+            self._async_schedule(entity, hass.loop.time())
+            return
+
+        name = f"EntityPlatform poll {entity_id}"
+        if platform.config_entry:
+            platform.config_entry.async_create_background_task(
+                hass, self._async_poll(entity), name=name, eager_start=True
+            )
+        else:
+            hass.async_create_background_task(
+                self._async_poll(entity), name=name, eager_start=True
+            )
+
+    async def _async_poll(self, entity: Entity) -> None:
+        """Poll an entity and schedule its next poll.
+
+        The entity takes the semaphore bounding the polls in the executor
+        and records the time of its update while it is updated, see
+        Entity.async_device_update.
+        """
+        poll = EntityPoll(entity, self._scheduler.executor_polls)
+        token = current_poll.set(poll)
+        try:
+            await entity.async_update_ha_state(True)
+        finally:
+            current_poll.reset(token)
+            if poll.duration is not None:
+                self._async_poll_done(entity, poll.duration)
+            if not self._cancelled:
+                self._async_schedule(entity, self._platform.hass.loop.time())
+
+    @callback
+    def _async_poll_done(self, entity: Entity, duration: float) -> None:
+        """Record the time the update of a poll took."""
+        self._latency.record(duration)
+        entity_id = entity.entity_id
+        if duration <= self._interval:
+            self._overrunning.discard(entity_id)
+            return
+        self._latency.overruns += 1
+        if entity_id not in self._overrunning:
+            self._overrunning.add(entity_id)
+            self._platform.logger.warning(
+                (
+                    "Updating %s took longer than the scheduled update interval %s,"
+                    " it is polled at the next interval after its update"
+                ),
+                entity_id,
+                self._platform.scan_interval,
+            )
+
+
+class PollScheduler:
+    """Schedule the polls of the entities of all entity platforms.
+
+    Bounds the number of polls which run in the executor at the same time
+    and keeps a histogram of the time the updates of the polls of each
+    platform took.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the scheduler."""
+        self.hass = hass
+        self.executor_polls = asyncio.Semaphore(MAX_EXECUTOR_POLLS)
+        # domain.platform -> histogram of the poll latency
+        self.latencies: dict[str, PollLatencyHistogram] = {}
+
+    @callback
+    def async_track_platform(self, platform: EntityPlatform) -> PlatformPoller:
+        """Return a poller for the entities of a platform."""
+        latency = self.latencies.setdefault(
+            f"{platform.domain}.{platform.platform_name}", PollLatencyHistogram()
+        )
+        return PlatformPoller(self, platform, latency)
+
+
+@callback
+def async_get_poll_scheduler(hass: HomeAssistant) -> PollScheduler:
+    """Return the poll scheduler."""
+    if (scheduler := hass.data.get(DATA_POLL_SCHEDULER)) is None:
+        scheduler = hass.data[DATA_POLL_SCHEDULER] = PollScheduler(hass)
+    return scheduler
@@ -3,7 +3,9 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
-from typing import TYPE_CHECKING, Any
+from collections import UserDict
+from collections.abc import Callable, Hashable, Iterable, ValuesView
+from typing import TYPE_CHECKING, Any, Generic, Literal, TypeVar
 
 from homeassistant.core import CoreState, HomeAssistant, callback
 
@@ -13,6 +15,104 @@ if TYPE_CHECKING:
 SAVE_DELAY = 10
 SAVE_DELAY_LONG = 180
 
+_DataT = TypeVar("_DataT")
+
+
+class RegistryIndex(Generic[_DataT]):
+    """Index of registry item keys by values derived from the items.
+
+    values_func returns the values an item is indexed by, for example
+    its labels. Items are immutable, so the values of an item do not
+    change while it is indexed.
+    """
+
+    __slots__ = ("_values_func", "_index")
+
+    def __init__(self, values_func: Callable[[_DataT], Iterable[Hashable]]) -> None:
+        """Initialize the index."""
+        self._values_func = values_func
+        # python has no ordered set, so we use a dict with True values
+        # https://discuss.python.org/t/add-orderedset-to-stdlib/12730
+        self._index: dict[Hashable, dict[str, Literal[True]]] = {}
+
+    def add(self, key: str, entry: _DataT) -> None:
+        """Add an item to the index."""
+        for value in self._values_func(entry):
+            self._index.setdefault(value, {})[key] = True
+
+    def remove(self, key: str, entry: _DataT) -> None:
+        """Remove an item from the index."""
+        index = self._index
+        for value in self._values_func(entry):
+            keys = index[value]
+            del keys[key]
+            if not keys:
+                del index[value]
+
+    def get(self, value: Hashable) -> Iterable[str]:
+        """Return the keys of the items indexed by a value."""
+        return self._index.get(value, ())
+
+
+class BaseRegistryItems(UserDict[str, _DataT]):
+    """Container for registry items with pluggable secondary indexes.
+
+    Indexes added with add_index are kept up to date when items are
+    added, replaced or removed. Subclasses can maintain additional
+    indexes by implementing _index_entry and _unindex_entry.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the container."""
+        super().__init__()
+        self._indexes: dict[str, RegistryIndex[_DataT]] = {}
+
+    def values(self) -> ValuesView[_DataT]:
+        """Return the underlying values to avoid __iter__ overhead."""
+        return self.data.values()
+
+    def add_index(
+        self, name: str, values_func: Callable[[_DataT], Iterable[Hashable]]
+    ) -> None:
+        """Add an index of the items by the values values_func returns."""
+        index: RegistryIndex[_DataT] = RegistryIndex(values_func)
+        for key, entry in self.data.items():
+            index.add(key, entry)
+        self._indexes[name] = index
+
+    def get_entries_for_index(self, name: str, value: Hashable) -> list[_DataT]:
+        """Return the items indexed by a value in the index called name."""
+        data = self.data
+        return [data[key] for key in self._indexes[name].get(value)]
+
+    def __setitem__(self, key: str, entry: _DataT) -> None:
+        """Add an item."""
+        data = self.data
+        if key in data:
+            self._unindex(key)
+        data[key] = entry
+        for index in self._indexes.values():
+            index.add(key, entry)
+        self._index_entry(key, entry)
+
+    def __delitem__(self, key: str) -> None:
+        """Remove an item."""
+        self._unindex(key)
+        super().__delitem__(key)
+
+    def _unindex(self, key: str) -> None:
+        """Remove an item from all indexes."""
+        entry = self.data[key]
+        for index in self._indexes.values():
+            index.remove(key, entry)
+        self._unindex_entry(key)
+
+    def _index_entry(self, key: str, entry: _DataT) -> None:
+        """Add an entry to the indexes maintained by a subclass."""
+
+    def _unindex_entry(self, key: str) -> None:
+        """Remove an entry from the indexes maintained by a subclass."""
+
 
 class BaseRegistry(ABC):
     """Class to implement a registry."""
@@ -33,6 +33,10 @@ STATE_DUMP_INTERVAL = timedelta(minutes=15)
 # How long should a saved state be preserved if the entity no longer exists
 STATE_EXPIRATION = timedelta(days=7)
 
+# How often the last seen time of an unchanged state is updated. Unchanged
+# states are not written again by the dumps in between.
+STATE_LAST_SEEN_INTERVAL = timedelta(days=1)
+
 
 class ExtraStoredData(ABC):
     """Object to hold extra stored data."""
@@ -135,10 +139,15 @@ class RestoreStateData:
         """Initialize the restore state data class."""
         self.hass: HomeAssistant = hass
         self.store = Store[list[dict[str, Any]]](
-            hass, STORAGE_VERSION, STORAGE_KEY, encoder=JSONEncoder
+            hass, STORAGE_VERSION, STORAGE_KEY, encoder=JSONEncoder, journal=True
         )
         self.last_states: dict[str, StoredState] = {}
         self.entities: dict[str, RestoreEntity] = {}
+        # Loaded states which have not been used yet, they are only decoded
+        # when they are restored and written again as they were loaded
+        self._stored_records: dict[str, dict[str, Any]] = {}
+        # The states of the current entities written by the last dump
+        self._dumped_states: dict[str, StoredState] = {}
 
     async def async_setup(self) -> None:
         """Set up up the instance of this data helper."""
@@ -159,16 +168,28 @@ class RestoreStateData:
             _LOGGER.error("Error loading last states", exc_info=exc)
             stored_states = None
 
+        self.last_states = {}
         if stored_states is None:
             _LOGGER.debug("Not creating cache - no saved states found")
-            self.last_states = {}
+            self._stored_records = {}
         else:
-            self.last_states = {
-                item["state"]["entity_id"]: StoredState.from_dict(item)
+            self._stored_records = {
+                item["state"]["entity_id"]: item
                 for item in stored_states
                 if valid_entity_id(item["state"]["entity_id"])
             }
-            _LOGGER.debug("Created cache with %s", list(self.last_states))
+            _LOGGER.debug("Created cache with %s", list(self._stored_records))
+
+    @callback
+    def async_get_stored_state(self, entity_id: str) -> StoredState | None:
+        """Return the stored state of an entity from the previous run."""
+        if (stored_state := self.last_states.get(entity_id)) is not None:
+            return stored_state
+        if (record := self._stored_records.pop(entity_id, None)) is None:
+            return None
+        stored_state = StoredState.from_dict(record)
+        self.last_states[entity_id] = stored_state
+        return stored_state
 
     @callback
     def async_get_stored_states(self) -> list[StoredState]:
@@ -178,6 +199,19 @@ class RestoreStateData:
         stored states from the previous run, which have not been created as
         entities on this run, and have not expired.
         """
+        return [
+            item if isinstance(item, StoredState) else StoredState.from_dict(item)
+            for item in self._async_get_stored_items()
+        ]
+
+    @callback
+    def _async_get_stored_items(self) -> list[StoredState | dict[str, Any]]:
+        """Get the states which should be stored.
+
+        Loaded states which have not been used are returned as they were
+        loaded. The last seen time of the states which did not change since
+        the last dump is kept, so they are serialized as before.
+        """
         now = dt_util.utcnow()
         all_states = self.hass.states.async_all()
         # Entities currently backed by an entity object
@@ -188,15 +222,26 @@ class RestoreStateData:
         }
 
         # Start with the currently registered states
-        stored_states = [
-            StoredState(
-                current_states_by_entity_id[entity_id],
-                entity.extra_restore_state_data,
-                now,
+        stored_states: list[StoredState | dict[str, Any]] = []
+        dumped_states = self._dumped_states
+        self._dumped_states = {}
+        last_seen_time = now - STATE_LAST_SEEN_INTERVAL
+        for entity_id, entity in self.entities.items():
+            if (state := current_states_by_entity_id.get(entity_id)) is None:
+                continue
+            last_seen = now
+            if (
+                (dumped_state := dumped_states.get(entity_id)) is not None
+                and dumped_state.state is state
+                and dumped_state.last_seen > last_seen_time
+            ):
+                last_seen = dumped_state.last_seen
+            stored_state = StoredState(
+                state, entity.extra_restore_state_data, last_seen
             )
-            for entity_id, entity in self.entities.items()
-            if entity_id in current_states_by_entity_id
-        ]
+            self._dumped_states[entity_id] = stored_state
+            stored_states.append(stored_state)
+
         expiration_time = now - STATE_EXPIRATION
 
         for entity_id, stored_state in self.last_states.items():
@@ -212,6 +257,21 @@ class RestoreStateData:
 
             stored_states.append(stored_state)
 
+        for entity_id, record in self._stored_records.items():
+            if (
+                entity_id in current_states_by_entity_id
+                or entity_id in self.last_states
+            ):
+                continue
+
+            record_last_seen: datetime | str | None = record["last_seen"]
+            if isinstance(record_last_seen, str):
+                record_last_seen = dt_util.parse_datetime(record_last_seen)
+            if record_last_seen is None or record_last_seen < expiration_time:
+                continue
+
+            stored_states.append(record)
+
         return stored_states
 
     async def async_dump_states(self) -> None:
@@ -220,8 +280,8 @@ class RestoreStateData:
         try:
             await self.store.async_save(
                 [
-                    stored_state.as_dict()
-                    for stored_state in self.async_get_stored_states()
+                    item.as_dict() if isinstance(item, StoredState) else item
+                    for item in self._async_get_stored_items()
                 ]
             )
         except HomeAssistantError as exc:
@@ -275,11 +335,13 @@ class RestoreStateData:
         if state is not None:
             state = State.from_dict(json_loads(state.as_dict_json))  # type: ignore[arg-type]
         if state is not None:
+            self._stored_records.pop(entity_id, None)
             self.last_states[entity_id] = StoredState(
                 state, extra_data, dt_util.utcnow()
             )
 
         self.entities.pop(entity_id)
+        self._dumped_states.pop(entity_id, None)
 
 
 class RestoreEntity(Entity):
@@ -306,7 +368,7 @@ class RestoreEntity(Entity):
                 "Cannot get last state. Entity not added to hass"
             )
             return None
-        return async_get(self.hass).last_states.get(self.entity_id)
+        return async_get(self.hass).async_get_stored_state(self.entity_id)
 
     async def async_get_last_state(self) -> State | None:
         """Get the entity state from the previous run."""
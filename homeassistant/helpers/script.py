@@ -246,6 +246,7 @@ async def trace_action(
         trace_element.set_error(ex)
         raise ex
     finally:
+        trace_element.freeze_variables()
         trace_stack_pop(trace_stack_cv)
 
 
@@ -531,17 +531,17 @@ def async_extract_referenced_entity_ids(  # noqa: C901
             if area_entry.labels.intersection(selector.label_ids):
                 selected.referenced_areas.add(area_entry.id)
 
-        for device_entry in dev_reg.devices.values():
-            if device_entry.labels.intersection(selector.label_ids):
-                selected.referenced_devices.add(device_entry.id)
-
-        for entity_entry in ent_reg.entities.values():
-            if (
-                entity_entry.entity_category is None
+        for label_id in selector.label_ids:
+            selected.referenced_devices.update(
+                device_entry.id
+                for device_entry in dev_reg.devices.get_devices_for_label(label_id)
+            )
+            selected.indirectly_referenced.update(
+                entity_entry.entity_id
+                for entity_entry in ent_reg.entities.get_entries_for_label(label_id)
+                if entity_entry.entity_category is None
                 and entity_entry.hidden_by is None
-                and entity_entry.labels.intersection(selector.label_ids)
-            ):
-                selected.indirectly_referenced.add(entity_entry.entity_id)
+            )
 
     # Find areas for targeted floors
     if selector.floor_ids:
@@ -6,11 +6,12 @@ import asyncio
 from collections.abc import Callable, Mapping, Sequence
 from contextlib import suppress
 from copy import deepcopy
+import hashlib
 import inspect
 from json import JSONDecodeError, JSONEncoder
 import logging
 import os
-from typing import TYPE_CHECKING, Any, Generic, TypeVar
+from typing import TYPE_CHECKING, Any, Generic, TypeVar, cast
 
 from homeassistant.const import EVENT_HOMEASSISTANT_FINAL_WRITE
 from homeassistant.core import (
@@ -44,10 +45,274 @@ _LOGGER = logging.getLogger(__name__)
 
 STORAGE_SEMAPHORE = "storage_semaphore"
 
+JOURNAL_SUFFIX = ".journal"
+# Write a full snapshot instead of appending to the journal once the
+# journal is this large compared to the last snapshot
+JOURNAL_COMPACT_RATIO = 0.5
+
 
 _T = TypeVar("_T", bound=Mapping[str, Any] | Sequence[Any])
 
 
+class _StoreJournal:
+    """Append-only log of the changes since the last full snapshot of a store.
+
+    Each line of the journal holds the changes of one write. For lists at
+    the top level of the stored data only the items which changed are
+    written, which is a single item when one entry of a registry changes.
+    Other values are written in full when they change. Stores which save
+    a list are journaled as if the list was the only value.
+
+    Each line holds the hash of the snapshot it was written for, so lines
+    which were written for another snapshot are ignored. The snapshot
+    itself stays a plain store file, which is complete whenever the journal
+    was compacted into it, like when Home Assistant is stopped.
+    """
+
+    def __init__(self, path: str, private: bool, fsync: bool) -> None:
+        """Initialize the journal."""
+        self.path = f"{path}{JOURNAL_SUFFIX}"
+        self._private = private
+        self._fsync = fsync
+        self.snapshot_id: str | None = None
+        self._versions: tuple[int, int] | None = None
+        self._is_list = False
+        self._snapshot_size = 0
+        self._journal_size = 0
+        # Serialized values of the data as it is stored on disk, lists
+        # are kept as lists of items returned by _journal_item
+        self._values: dict[str, list[Any] | bytes] = {}
+
+    @property
+    def has_changes(self) -> bool:
+        """Return if the journal holds changes which are not in the snapshot."""
+        return self._journal_size > 0
+
+    def replay(self, data: dict[str, Any], snapshot_path: str) -> None:
+        """Apply the journal of a snapshot to the loaded snapshot."""
+        snapshot_id: str | None
+        snapshot_id, snapshot_size = _snapshot_id(snapshot_path)
+        if (stored := _journal_values(data.get("data"))) is not None:
+            try:
+                with open(self.path, "rb") as journal:
+                    for line in journal:
+                        self._journal_size += len(line)
+                        record: dict[str, Any] = json_util.json_loads_object(line)
+                        if record["j"] == snapshot_id:
+                            _apply_journal_record(stored, record["d"])
+            except FileNotFoundError:
+                pass
+            except (AttributeError, LookupError, OSError, TypeError, ValueError):
+                # The last line is incomplete if writing it was interrupted,
+                # lines appended after it would never be replayed so the
+                # next write has to be a snapshot
+                _LOGGER.warning(
+                    "Ignoring the rest of the storage journal %s", self.path
+                )
+                snapshot_id = None
+        self._remember(snapshot_id, snapshot_size, data)
+
+    def _remember(
+        self, snapshot_id: str | None, snapshot_size: int, data: dict[str, Any]
+    ) -> None:
+        """Remember the data which is stored on disk."""
+        self.snapshot_id = snapshot_id
+        self._snapshot_size = snapshot_size
+        self._values = {}
+        if (stored := _journal_values(data.get("data"))) is None:
+            self.snapshot_id = None
+            return
+        self._versions = (data["version"], data.get("minor_version", 1))
+        self._is_list = isinstance(data["data"], list)
+        for key, value in stored.items():
+            self._values[key] = (
+                [_journal_item(item) for item in value]
+                if isinstance(value, list)
+                else json_helper.json_bytes(value)
+            )
+
+    def snapshot_written(self, data: dict[str, Any], snapshot_path: str) -> None:
+        """Start a new journal after a snapshot has been written."""
+        with suppress(FileNotFoundError):
+            os.unlink(self.path)
+        self._journal_size = 0
+        self._remember(*_snapshot_id(snapshot_path), data)
+
+    def clear(self) -> None:
+        """Forget the snapshot and the journal after they were removed."""
+        self.snapshot_id = None
+        self._journal_size = 0
+        self._values = {}
+
+    def compacted_data(self, key: str) -> dict[str, Any] | None:
+        """Return the data of the snapshot with the journal applied."""
+        if self._versions is None or not self._values:
+            return None
+        stored = {
+            name: [json_helper.json_fragment(_item_bytes(item)) for item in value]
+            if isinstance(value, list)
+            else json_helper.json_fragment(value)
+            for name, value in self._values.items()
+        }
+        return {
+            "version": self._versions[0],
+            "minor_version": self._versions[1],
+            "key": key,
+            "data": stored[""] if self._is_list else stored,
+        }
+
+    def append(self, data: dict[str, Any]) -> bool:
+        """Append the changes of the data to the journal.
+
+        Returns False if a full snapshot has to be written instead.
+        """
+        stored = _journal_values(data["data"])
+        if (
+            self.snapshot_id is None
+            or (data["version"], data["minor_version"]) != self._versions
+            or self._journal_size > self._snapshot_size * JOURNAL_COMPACT_RATIO
+            or stored is None
+            or stored.keys() != self._values.keys()
+        ):
+            return False
+
+        values: dict[str, list[Any] | bytes] = {}
+        changes: dict[str, Any] = {}
+        for key, value in stored.items():
+            old_value = self._values[key]
+            if isinstance(value, list) and isinstance(old_value, list):
+                items = [_journal_item(item) for item in value]
+                values[key] = items
+                if splices := _list_splices(items, old_value):
+                    changes[key] = splices
+            elif (encoded := json_helper.json_bytes(value)) != old_value:
+                values[key] = encoded
+                changes[key] = {"v": json_helper.json_fragment(encoded)}
+            else:
+                values[key] = encoded
+
+        if not changes:
+            self._values = values
+            return True
+        line = json_helper.json_bytes({"j": self.snapshot_id, "d": changes}) + b"\n"
+        try:
+            fd = os.open(
+                self.path,
+                os.O_WRONLY | os.O_APPEND | os.O_CREAT,
+                0o600 if self._private else 0o644,
+            )
+            with open(fd, "ab") as journal:
+                journal.write(line)
+                if self._fsync:
+                    journal.flush()
+                    os.fsync(journal.fileno())
+        except OSError as err:
+            # The line may have been written partially
+            _LOGGER.warning("Error writing storage journal %s: %s", self.path, err)
+            self.snapshot_id = None
+            return False
+        self._values = values
+        self._journal_size += len(line)
+        return True
+
+
+def _snapshot_id(path: str) -> tuple[str, int]:
+    """Return the hash and the size of a snapshot."""
+    with open(path, "rb") as snapshot:
+        content = snapshot.read()
+    return hashlib.sha1(content).hexdigest(), len(content)
+
+
+def _journal_item(item: Any) -> Any:
+    """Return an item of a list which can be compared with later writes.
+
+    JSON fragments, like the ones of registry entries, are immutable and
+    kept as they are, so unchanged entries are found by identity. Other
+    items are serialized since they could be changed in place.
+    """
+    if type(item) is json_helper.json_fragment:
+        return item
+    return json_helper.json_bytes(item)
+
+
+def _item_bytes(item: Any) -> bytes:
+    """Return the serialized item returned by _journal_item."""
+    if isinstance(item, bytes):
+        return item
+    return json_helper.json_bytes(item)
+
+
+def _same_item(item: Any, old_item: Any) -> bool:
+    """Return if two items returned by _journal_item are the same."""
+    return item is old_item or _item_bytes(item) == _item_bytes(old_item)
+
+
+def _journal_values(stored: Any) -> dict[str, Any] | None:
+    """Return the values of the stored data which are compared by the journal."""
+    if isinstance(stored, dict):
+        return stored
+    if isinstance(stored, list):
+        return {"": stored}
+    return None
+
+
+def _list_splices(items: list[Any], old_items: list[Any]) -> list[list[Any]]:
+    """Return the splices which turn the old items into the new items.
+
+    Each splice holds the start and end of the replaced old items and the
+    serialized new items. Items between the common head and tail are
+    compared one by one if no items were added or removed, so several
+    changed entries do not rewrite the entries between them.
+    """
+    shortest = min(len(items), len(old_items))
+    head = 0
+    while head < shortest and _same_item(items[head], old_items[head]):
+        head += 1
+    if head == len(items) == len(old_items):
+        return []
+    tail = 0
+    while tail < shortest - head and _same_item(items[-1 - tail], old_items[-1 - tail]):
+        tail += 1
+    end = len(items) - tail
+    old_end = len(old_items) - tail
+    ranges: list[tuple[int, int, int]] = []
+    if end != old_end:
+        ranges.append((head, old_end, end))
+    else:
+        start: int | None = None
+        for idx in range(head, end):
+            if not _same_item(items[idx], old_items[idx]):
+                if start is None:
+                    start = idx
+            elif start is not None:
+                ranges.append((start, idx, idx))
+                start = None
+        if start is not None:
+            ranges.append((start, end, end))
+    return [
+        [
+            start,
+            old_stop,
+            [
+                json_helper.json_fragment(_item_bytes(item))
+                for item in items[start:stop]
+            ],
+        ]
+        for start, old_stop, stop in ranges
+    ]
+
+
+def _apply_journal_record(stored: dict[str, Any], changes: dict[str, Any]) -> None:
+    """Apply the changes of one journal line to the stored data."""
+    for key, change in changes.items():
+        if isinstance(change, list):
+            # Later splices start after the end of earlier ones
+            for start, end, items in reversed(change):
+                stored[key][start:end] = items
+        else:
+            stored[key] = change["v"]
+
+
 @bind_hass
 async def async_migrator(
     hass: HomeAssistant,
@@ -103,8 +368,15 @@ class Store(Generic[_T]):
         encoder: type[JSONEncoder] | None = None,
         minor_version: int = 1,
         read_only: bool = False,
+        journal: bool = False,
     ) -> None:
-        """Initialize storage class."""
+        """Initialize storage class.
+
+        With journal, writes only append the changes to a journal next to
+        the file and the file is rewritten once the journal grew too large.
+        Data is saved to the journal only if it is a dict, lists at its
+        top level are compared item by item.
+        """
         self.version = version
         self.minor_version = minor_version
         self.key = key
@@ -119,12 +391,22 @@ class Store(Generic[_T]):
         self._atomic_writes = atomic_writes
         self._read_only = read_only
         self._next_write_time = 0.0
+        self._journal = journal
 
     @cached_property
     def path(self):
         """Return the config path."""
         return self.hass.config.path(STORAGE_DIR, self.key)
 
+    @cached_property
+    def _store_journal(self) -> _StoreJournal | None:
+        """Return the journal of the store."""
+        if not self._journal or (
+            self._encoder and self._encoder is not json_helper.JSONEncoder
+        ):
+            return None
+        return _StoreJournal(self.path, self._private, self._atomic_writes)
+
     async def async_load(self) -> _T | None:
         """Load data.
 
@@ -172,9 +454,7 @@ class Store(Generic[_T]):
             data = deepcopy(data)
         else:
             try:
-                data = await self.hass.async_add_executor_job(
-                    json_util.load_json, self.path
-                )
+                data = await self.hass.async_add_executor_job(self._load_data)
             except HomeAssistantError as err:
                 if isinstance(err.__cause__, JSONDecodeError):
                     # If we have a JSONDecodeError, it means the file is corrupt.
@@ -361,6 +641,13 @@ class Store(Generic[_T]):
     async def _async_callback_final_write(self, _event: Event) -> None:
         """Handle a write because Home Assistant is in final write state."""
         self._unsub_final_write_listener = None
+        if (
+            self._data is None
+            and (journal := self._store_journal) is not None
+            and journal.has_changes
+        ):
+            # Compact the journal, so the file is complete after stopping
+            self._data = journal.compacted_data(self.key)
         await self._async_handle_write_data()
 
     async def _async_handle_write_data(self, *_args):
@@ -384,6 +671,16 @@ class Store(Generic[_T]):
             except (json_util.SerializationError, WriteError) as err:
                 _LOGGER.error("Error writing config for %s: %s", self.key, err)
 
+            if (journal := self._store_journal) is not None and journal.has_changes:
+                self._async_ensure_final_write_listener()
+
+    def _load_data(self) -> Any:
+        """Load the data and apply the journal."""
+        data = json_util.load_json(self.path)
+        if (journal := self._store_journal) is not None and data:
+            journal.replay(cast(dict[str, Any], data), self.path)
+        return data
+
     async def _async_write_data(self, path: str, data: dict) -> None:
         await self.hass.async_add_executor_job(self._write_data, self.path, data)
 
@@ -394,6 +691,15 @@ class Store(Generic[_T]):
         if "data_func" in data:
             data["data"] = data.pop("data_func")()
 
+        if (
+            (journal := self._store_journal) is not None
+            # The final write compacts the journal into a snapshot
+            and self.hass.state is not CoreState.final_write
+            and journal.append(data)
+        ):
+            _LOGGER.debug("Appended changes of %s to %s", self.key, journal.path)
+            return
+
         _LOGGER.debug("Writing data for %s to %s", self.key, path)
         json_helper.save_json(
             path,
@@ -402,6 +708,8 @@ class Store(Generic[_T]):
             encoder=self._encoder,
             atomic_writes=self._atomic_writes,
         )
+        if journal is not None:
+            journal.snapshot_written(data, path)
 
     async def _async_migrate_func(self, old_major_version, old_minor_version, old_data):
         """Migrate to the new version."""
@@ -414,3 +722,7 @@ class Store(Generic[_T]):
 
         with suppress(FileNotFoundError):
             await self.hass.async_add_executor_job(os.unlink, self.path)
+        if (journal := self._store_journal) is not None:
+            journal.clear()
+            with suppress(FileNotFoundError):
+                await self.hass.async_add_executor_job(os.unlink, journal.path)
@@ -38,6 +38,7 @@ import weakref
 from awesomeversion import AwesomeVersion
 import jinja2
 from jinja2 import pass_context, pass_environment, pass_eval_context
+import jinja2.meta
 from jinja2.runtime import AsyncLoopContext, LoopContext
 from jinja2.sandbox import ImmutableSandboxedEnvironment
 from jinja2.utils import Namespace
@@ -51,6 +52,7 @@ from homeassistant.const import (
     ATTR_LONGITUDE,
     ATTR_PERSONS,
     ATTR_UNIT_OF_MEASUREMENT,
+    EVENT_CORE_CONFIG_UPDATE,
     EVENT_HOMEASSISTANT_START,
     EVENT_HOMEASSISTANT_STOP,
     STATE_UNAVAILABLE,
@@ -101,6 +103,10 @@ _ENVIRONMENT = "template.environment"
 _ENVIRONMENT_LIMITED = "template.environment_limited"
 _ENVIRONMENT_STRICT = "template.environment_strict"
 _HASS_LOADER = "template.hass_loader"
+_RENDER_CACHE = "template.render_cache"
+# Types of variable values which are only equal to values of the same type
+# which render the same
+_RENDER_CACHE_KEY_TYPES = frozenset({str, int, bool, type(None)})
 
 _RE_JINJA_DELIMITERS = re.compile(r"\{%|\{\{|\{#")
 # Match "simple" ints and floats. -1.0, 1, +5, 5.0
@@ -134,6 +140,8 @@ _P = ParamSpec("_P")
 ALL_STATES_RATE_LIMIT = 60  # seconds
 DOMAIN_STATES_RATE_LIMIT = 1  # seconds
 
+RENDER_CACHE_SIZE = 1024
+
 _render_info: ContextVar[RenderInfo | None] = ContextVar("_render_info", default=None)
 
 
@@ -358,6 +366,8 @@ class RenderInfo:
         "entities",
         "rate_limit",
         "has_time",
+        "has_random",
+        "uncacheable",
     )
 
     def __init__(self, template: Template) -> None:
@@ -376,6 +386,9 @@ class RenderInfo:
         self.entities: collections.abc.Set[str] = set()
         self.rate_limit: float | None = None
         self.has_time = False
+        self.has_random = False
+        # Set by functions reading data which does not invalidate the cache
+        self.uncacheable = False
 
     def __repr__(self) -> str:
         """Representation of RenderInfo."""
@@ -388,6 +401,8 @@ class RenderInfo:
             f" entities={self.entities}"
             f" rate_limit={self.rate_limit}"
             f" has_time={self.has_time}"
+            f" has_random={self.has_random}"
+            f" uncacheable={self.uncacheable}"
             f" exception={self.exception}"
             f" is_static={self.is_static}"
             ">"
@@ -432,6 +447,28 @@ class RenderInfo:
         self.domains = frozenset(self.domains)
         self.domains_lifecycle = frozenset(self.domains_lifecycle)
 
+    def _is_cacheable(self) -> bool:
+        """Return if the result only depends on the collected entities."""
+        return not (
+            self.exception
+            or self.has_time
+            or self.has_random
+            or self.uncacheable
+            or self.all_states
+            or self.all_states_lifecycle
+            or self.domains
+            or self.domains_lifecycle
+        )
+
+    def _copy_for(self, template: Template) -> RenderInfo:
+        """Return a frozen copy of a cacheable render for another template."""
+        render_info = RenderInfo(template)
+        render_info._result = self._result
+        render_info.entities = self.entities
+        render_info.rate_limit = self.rate_limit
+        render_info._freeze()
+        return render_info
+
     def _freeze(self) -> None:
         self._freeze_sets()
 
@@ -461,6 +498,119 @@ class RenderInfo:
             self.filter = _false
 
 
+class TemplateRenderCache:
+    """Share the results of identical template renders.
+
+    Renders are keyed by the template string, the variables the template
+    references and the strict flag. A result stays valid as long as none
+    of the entities collected during the render has been updated or
+    reported since, so trackers of the same template render it only once
+    per state change. Renders depending on time, random values or domains
+    are not cached since they can change without any collected entity
+    changing. The registries are not tracked by RenderInfo, so all entries
+    are dropped when one of them is updated.
+    """
+
+    __slots__ = ("_entries", "_hass", "hits", "misses")
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the cache."""
+        self._hass = hass
+        self._entries: LRU[
+            tuple[Any, ...],
+            tuple[RenderInfo, tuple[tuple[str, State | None, datetime | None], ...]],
+        ] = LRU(RENDER_CACHE_SIZE)
+        self.hits = 0
+        self.misses = 0
+
+    @callback
+    def async_get(self, key: tuple[Any, ...], template: Template) -> RenderInfo | None:
+        """Return a cached render for the template if it is still valid."""
+        if (entry := self._entries.get(key)) is None:
+            self.misses += 1
+            return None
+        render_info, snapshot = entry
+        states_get = self._hass.states.get
+        for entity_id, state, last_reported in snapshot:
+            current = states_get(entity_id)
+            if current is not state or (
+                current is not None and current.last_reported is not last_reported
+            ):
+                del self._entries[key]
+                self.misses += 1
+                return None
+        self.hits += 1
+        return render_info._copy_for(template)  # pylint: disable=protected-access
+
+    @callback
+    def async_set(self, key: tuple[Any, ...], render_info: RenderInfo) -> None:
+        """Store a render together with the states it depends on."""
+        if not render_info._is_cacheable():  # pylint: disable=protected-access
+            return
+        states_get = self._hass.states.get
+        snapshot = tuple(
+            (
+                entity_id,
+                state := states_get(entity_id),
+                None if state is None else state.last_reported,
+            )
+            for entity_id in render_info.entities
+        )
+        self._entries[key] = (render_info, snapshot)
+
+    @callback
+    def async_clear(self, _: Any = None) -> None:
+        """Drop all cached renders."""
+        self._entries.clear()
+
+    @callback
+    def async_get_stats(self) -> dict[str, int]:
+        """Return hit and miss counts of the cache."""
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "size": len(self._entries),
+            "max_size": self._entries.get_size(),
+        }
+
+
+@singleton(_RENDER_CACHE)
+@callback
+def async_get_render_cache(hass: HomeAssistant) -> TemplateRenderCache:
+    """Return the render cache shared by all templates."""
+    render_cache = TemplateRenderCache(hass)
+    for event_type in (
+        EVENT_CORE_CONFIG_UPDATE,
+        area_registry.EVENT_AREA_REGISTRY_UPDATED,
+        device_registry.EVENT_DEVICE_REGISTRY_UPDATED,
+        entity_registry.EVENT_ENTITY_REGISTRY_UPDATED,
+        fr.EVENT_FLOOR_REGISTRY_UPDATED,
+    ):
+        hass.bus.async_listen(
+            event_type, render_cache.async_clear, run_immediately=True
+        )
+    return render_cache
+
+
+def _render_cache_key_value(value: Any) -> Any:
+    """Return the part of the render cache key for the value of a variable.
+
+    Values of different types can be equal, like True, 1 and 1.0, so the
+    type is part of the key as well. Only values which are only equal to
+    values rendering the same are accepted, raises TypeError otherwise.
+    """
+    value_type = type(value)
+    if value_type is float:
+        # -0.0 is equal to 0.0 and nan is not equal to itself
+        return repr(value)
+    if value_type in _RENDER_CACHE_KEY_TYPES or (
+        value_type.__eq__ is object.__eq__  # type: ignore[comparison-overlap]
+        and value_type.__hash__ is object.__hash__  # type: ignore[comparison-overlap]
+    ):
+        return value
+    raise TypeError(f"{value_type} can't be part of the render cache key")
+
+
 class Template:
     """Class to hold a template and manage caching and rendering."""
 
@@ -477,6 +627,7 @@ class Template:
         "_log_fn",
         "_hash_cache",
         "_renders",
+        "_referenced_variables",
     )
 
     def __init__(self, template: str, hass: HomeAssistant | None = None) -> None:
@@ -495,6 +646,8 @@ class Template:
         self._log_fn: Callable[[int, str], None] | None = None
         self._hash_cache: int = hash(self.template)
         self._renders: int = 0
+        # Whether renders can be cached and the variables the template reads
+        self._referenced_variables: tuple[bool, frozenset[str]] | None = None
 
     @property
     def _env(self) -> TemplateEnvironment:
@@ -692,9 +845,14 @@ class Template:
         variables: TemplateVarsType = None,
         strict: bool = False,
         log_fn: Callable[[int, str], None] | None = None,
+        use_cache: bool = False,
         **kwargs: Any,
     ) -> RenderInfo:
-        """Render the template and collect an entity filter."""
+        """Render the template and collect an entity filter.
+
+        If use_cache is True, the result may be shared with renders of the
+        same template with the same variables, see TemplateRenderCache.
+        """
         self._renders += 1
         assert self.hass and _render_info.get() is None
 
@@ -706,6 +864,14 @@ class Template:
             render_info._freeze_static()
             return render_info
 
+        cache_key: tuple[Any, ...] | None = None
+        if use_cache and log_fn is None and not kwargs:
+            cache_key = self._render_cache_key(variables, strict)
+        if cache_key is not None:
+            render_cache = async_get_render_cache(self.hass)
+            if cached_render_info := render_cache.async_get(cache_key, self):
+                return cached_render_info
+
         token = _render_info.set(render_info)
         try:
             render_info._result = self.async_render(
@@ -717,8 +883,51 @@ class Template:
             _render_info.reset(token)
 
         render_info._freeze()
+        if cache_key is not None:
+            render_cache.async_set(cache_key, render_info)
         return render_info
 
+    def _render_cache_key(
+        self, variables: TemplateVarsType, strict: bool
+    ) -> tuple[Any, ...] | None:
+        """Return the render cache key or None if the render can't be cached.
+
+        Only the variables the template references are part of the key,
+        so renders with different unused variables share the result.
+        """
+        if self._referenced_variables is None:
+            try:
+                ast = self._env.parse(self.template)
+                referenced = frozenset(jinja2.meta.find_undeclared_variables(ast))
+            except jinja2.TemplateError:
+                self._referenced_variables = (False, frozenset())
+            else:
+                # Included templates and macros imported with context
+                # can read any variable
+                self._referenced_variables = (
+                    ast.find(jinja2.nodes.Include) is None
+                    and ast.find(jinja2.nodes.Import) is None
+                    and ast.find(jinja2.nodes.FromImport) is None
+                    and ast.find(jinja2.nodes.Extends) is None,
+                    referenced,
+                )
+        cacheable, referenced = self._referenced_variables
+        if not cacheable:
+            return None
+        used_variables: frozenset[tuple[str, type, Any]] | None = None
+        try:
+            if variables:
+                used_variables = frozenset(
+                    (name, type(value), _render_cache_key_value(value))
+                    for name, value in variables.items()
+                    if name in referenced
+                )
+            key = (self.template, strict, used_variables)
+            hash(key)
+        except TypeError:
+            return None
+        return key
+
     def render_with_possible_json_value(self, value, error_value=_SENTINEL):
         """Render template with value exposed.
 
@@ -1156,21 +1365,9 @@ def _state_generator(
     hass: HomeAssistant, domain: str | None
 ) -> Generator[TemplateState, None, None]:
     """State generator for a domain or all states."""
-    states = hass.states
-    # If domain is None, we want to iterate over all states, but making
-    # a copy of the dict is expensive. So we iterate over the protected
-    # _states dict instead. This is safe because we're not modifying it
-    # and everything is happening in the same thread (MainThread).
-    #
-    # We do not want to expose this method in the public API though to
-    # ensure it does not get misused.
-    #
-    container: Iterable[State]
-    if domain is None:
-        container = states._states.values()  # pylint: disable=protected-access
-    else:
-        container = states.async_all(domain)
-    for state in container:
+    # The snapshot is shared with other readers and only created again
+    # after a state changed, so there is no need to copy the states.
+    for state in hass.states.async_all_snapshot(domain):
         yield _template_state_no_collect(hass, state)
 
 
@@ -1299,6 +1496,7 @@ def integration_entities(hass: HomeAssistant, entry_name: str) -> Iterable[str]:
     integration.
     """
 
+    _mark_uncacheable()
     # Don't allow searching for config entries without title
     if not entry_name:
         return []
@@ -1381,6 +1579,7 @@ def is_device_attr(
 
 def issues(hass: HomeAssistant) -> dict[tuple[str, str], dict[str, Any]]:
     """Return all open issues."""
+    _mark_uncacheable()
     current_issues = issue_registry.async_get(hass).issues
     # Use JSON for safe representation
     return {k: v.to_json() for (k, v) in current_issues.items()}
@@ -1388,6 +1587,7 @@ def issues(hass: HomeAssistant) -> dict[tuple[str, str], dict[str, Any]]:
 
 def issue(hass: HomeAssistant, domain: str, issue_id: str) -> dict[str, Any] | None:
     """Get issue by domain and issue_id."""
+    _mark_uncacheable()
     result = issue_registry.async_get(hass).async_get_issue(domain, issue_id)
     if result:
         return result.to_json()
@@ -2332,6 +2532,12 @@ def to_json(
     ).decode("utf-8")
 
 
+def _mark_uncacheable() -> None:
+    """Prevent caching the render, if the result depends on uncached data."""
+    if (render_info := _render_info.get()) is not None:
+        render_info.uncacheable = True
+
+
 @pass_context
 def random_every_time(context, values):
     """Choose a random value.
@@ -2339,6 +2545,8 @@ def random_every_time(context, values):
     Unlike Jinja's random filter,
     this is context-dependent to avoid caching the chosen value.
     """
+    if (render_info := _render_info.get()) is not None:
+        render_info.has_random = True
     return random.choice(values)
 
 
@@ -43,8 +43,12 @@ class TraceElement:
         self.reuse_by_child = False
         self._timestamp = dt_util.utcnow()
 
-        self._last_variables = variables_cv.get() or {}
-        self.update_variables(variables)
+        # Variables are not captured if the run is not traced
+        self._last_variables: dict[str, Any] | None = None
+        self._variables: dict[str, Any] | None = None
+        if trace_enabled_cv.get():
+            self._last_variables = variables_cv.get() or {}
+            self.update_variables(variables)
 
     def __repr__(self) -> str:
         """Container for trace data."""
@@ -69,17 +73,34 @@ class TraceElement:
         self._result = {**old_result, **kwargs}
 
     def update_variables(self, variables: TemplateVarsType) -> None:
-        """Update variables."""
+        """Update variables.
+
+        Only the variables which changed since the previous element are
+        kept. The variables are only copied if they changed, otherwise the
+        copy of the previous element is passed on to the next element.
+        """
+        if (last_variables := self._last_variables) is None:
+            return
         if variables is None:
             variables = {}
-        last_variables = self._last_variables
+        if variables == last_variables:
+            variables_cv.set(last_variables)
+            self._variables = None
+            return
         variables_cv.set(dict(variables))
-        changed_variables = {
+        self._variables = {
             key: value
             for key, value in variables.items()
             if key not in last_variables or last_variables[key] != value
         }
-        self._variables = changed_variables
+
+    def freeze_variables(self) -> None:
+        """Stop updating the variables.
+
+        Drops the variables of the previous element, so stored traces only
+        keep the changed variables.
+        """
+        self._last_variables = None
 
     def as_dict(self) -> dict[str, Any]:
         """Return dictionary version of this TraceElement."""
@@ -115,6 +136,8 @@ trace_path_stack_cv: ContextVar[list[str] | None] = ContextVar(
 )
 # Copy of last variables
 variables_cv: ContextVar[Any | None] = ContextVar("variables_cv", default=None)
+# If trace elements of the current run are recorded
+trace_enabled_cv: ContextVar[bool] = ContextVar("trace_enabled_cv", default=True)
 # (domain.item_id, Run ID)
 trace_id_cv: ContextVar[tuple[str, str] | None] = ContextVar(
     "trace_id_cv", default=None
@@ -135,6 +158,16 @@ def trace_id_get() -> tuple[str, str] | None:
     return trace_id_cv.get()
 
 
+def trace_enabled_set(enabled: bool) -> None:
+    """Set if trace elements of the current run are recorded."""
+    trace_enabled_cv.set(enabled)
+
+
+def trace_enabled_get() -> bool:
+    """Return if trace elements of the current run are recorded."""
+    return trace_enabled_cv.get()
+
+
 def trace_stack_push(trace_stack_var: ContextVar[list[_T] | None], node: _T) -> None:
     """Push an element to the top of a trace stack."""
     trace_stack: list[_T] | None
@@ -184,6 +217,8 @@ def trace_append_element(
     maxlen: int | None = None,
 ) -> None:
     """Append a TraceElement to trace[path]."""
+    if not trace_enabled_cv.get():
+        return
     if (trace := trace_cv.get()) is None:
         trace = {}
         trace_cv.set(trace)
@@ -15,7 +15,9 @@ import importlib
 import logging
 import os
 import pathlib
+import stat
 import sys
+import threading
 import time
 from types import ModuleType
 from typing import TYPE_CHECKING, Any, Literal, Protocol, TypedDict, TypeVar, cast
@@ -28,8 +30,9 @@ from awesomeversion import (
 import voluptuous as vol
 
 from . import generated
-from .const import Platform
+from .const import Platform, __version__
 from .core import HomeAssistant, callback
+from .exceptions import HomeAssistantError
 from .generated.application_credentials import APPLICATION_CREDENTIALS
 from .generated.bluetooth import BLUETOOTH
 from .generated.config_flows import FLOWS
@@ -38,6 +41,7 @@ from .generated.mqtt import MQTT
 from .generated.ssdp import SSDP
 from .generated.usb import USB
 from .generated.zeroconf import HOMEKIT, ZEROCONF
+from .util.file import write_utf8_file
 from .util.json import JSON_DECODE_EXCEPTIONS, json_loads
 
 if TYPE_CHECKING:
@@ -101,6 +105,9 @@ DATA_INTEGRATIONS = "integrations"
 DATA_MISSING_PLATFORMS = "missing_platforms"
 DATA_CUSTOM_COMPONENTS = "custom_components"
 DATA_PRELOAD_PLATFORMS = "preload_platforms"
+DATA_INTEGRATION_INDEX = "integration_index"
+INTEGRATION_INDEX_FILE = "core.integration_index"
+INTEGRATION_INDEX_VERSION = 1
 PACKAGE_CUSTOM_COMPONENTS = "custom_components"
 PACKAGE_BUILTIN = "homeassistant.components"
 CUSTOM_WARNING = (
@@ -254,6 +261,176 @@ def manifest_from_legacy_module(domain: str, module: ModuleType) -> Manifest:
     }
 
 
+class IntegrationIndex:
+    """Index of integration manifests and directory listings.
+
+    Reading the manifest.json files and listing the integration
+    directories is slow on SD cards and network storage. The index keeps
+    what was read together with the modification times of the files and
+    directories it was read from, and is stored in a single file which is
+    loaded with one read. An entry is only used if the modification times
+    still match, otherwise the manifest is read from disk again.
+    """
+
+    def __init__(self, path: str | None = None) -> None:
+        """Initialize the index."""
+        self.path = path
+        self.hits = 0
+        self.misses = 0
+        self.dirty = False
+        self._lock = threading.Lock()
+        # Manifest path -> [manifest mtime and size, directory mtime,
+        # manifest, top level files or None for virtual integrations]
+        self._manifests: dict[str, list[Any]] = {}
+        # Directory path -> [directory mtime, names of sub directories]
+        self._directories: dict[str, list[Any]] = {}
+
+    def read_manifest(
+        self, manifest_path: pathlib.Path
+    ) -> tuple[Manifest, set[str] | None] | None:
+        """Return the manifest and the top level files of an integration.
+
+        Returns None if the manifest does not exist.
+        """
+        key = str(manifest_path)
+        try:
+            manifest_stat = manifest_path.stat()
+        except OSError:
+            manifest_stat = None
+        if manifest_stat is None or not stat.S_ISREG(manifest_stat.st_mode):
+            if key in self._manifests:
+                with self._lock:
+                    self._manifests.pop(key, None)
+                    self.dirty = True
+            return None
+
+        file_stamp = [manifest_stat.st_mtime_ns, manifest_stat.st_size]
+        file_path = manifest_path.parent
+        if (entry := self._manifests.get(key)) is not None:
+            stamp, dir_mtime, manifest, files = entry
+            if stamp == file_stamp and (
+                files is None or dir_mtime == os.stat(file_path).st_mtime_ns
+            ):
+                self.hits += 1
+                return cast(Manifest, dict(manifest)), (
+                    None if files is None else set(files)
+                )
+
+        self.misses += 1
+        manifest = cast(Manifest, json_loads(manifest_path.read_text()))
+        # Avoid the listdir for virtual integrations
+        # as they cannot have any platforms
+        top_level_files: set[str] | None = None
+        dir_mtime = None
+        if manifest.get("integration_type") != "virtual":
+            # Take the modification time before listing the directory, so
+            # changes while it is listed are noticed the next time
+            dir_mtime = os.stat(file_path).st_mtime_ns
+            top_level_files = set(os.listdir(file_path))
+        with self._lock:
+            self._manifests[key] = [
+                file_stamp,
+                dir_mtime,
+                dict(manifest),
+                None if top_level_files is None else sorted(top_level_files),
+            ]
+            self.dirty = True
+        return manifest, top_level_files
+
+    def sub_directories(self, path: str) -> list[str]:
+        """Return the names of the sub directories of a directory."""
+        mtime = os.stat(path).st_mtime_ns
+        if (entry := self._directories.get(path)) is not None and entry[0] == mtime:
+            return list(entry[1])
+        names = [entry.name for entry in os.scandir(path) if entry.is_dir()]
+        with self._lock:
+            self._directories[path] = [mtime, names]
+            self.dirty = True
+        return list(names)
+
+    def load(self) -> None:
+        """Load the index from disk."""
+        if self.path is None:
+            return
+        try:
+            with open(self.path, "rb") as index_file:
+                data = cast(dict[str, Any], json_loads(index_file.read()))
+            if (
+                data["version"] != INTEGRATION_INDEX_VERSION
+                or data["ha_version"] != __version__
+            ):
+                return
+            manifests = data["manifests"]
+            directories = data["directories"]
+        except FileNotFoundError:
+            return
+        except (OSError, *JSON_DECODE_EXCEPTIONS, KeyError, TypeError) as err:
+            _LOGGER.warning("Ignoring invalid integration index %s: %s", self.path, err)
+            return
+        with self._lock:
+            self._manifests = manifests
+            self._directories = directories
+
+    def save(self) -> None:
+        """Save the index to disk if it changed."""
+        # pylint: disable-next=import-outside-toplevel
+        from .helpers.json import json_bytes
+
+        if self.path is None or not self.dirty:
+            return
+        with self._lock:
+            data = json_bytes(
+                {
+                    "version": INTEGRATION_INDEX_VERSION,
+                    "ha_version": __version__,
+                    "manifests": self._manifests,
+                    "directories": self._directories,
+                }
+            )
+            self.dirty = False
+        try:
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            write_utf8_file(self.path, data, mode="wb")
+        except (OSError, HomeAssistantError) as err:
+            _LOGGER.warning(
+                "Unable to save the integration index %s: %s", self.path, err
+            )
+
+
+async def async_get_integration_index(hass: HomeAssistant) -> IntegrationIndex:
+    """Return the integration index, loading it on first use."""
+    index_or_future: IntegrationIndex | asyncio.Future[
+        IntegrationIndex
+    ] | None = hass.data.get(DATA_INTEGRATION_INDEX)
+
+    if index_or_future is None:
+        future = hass.data[DATA_INTEGRATION_INDEX] = hass.loop.create_future()
+        index = IntegrationIndex(hass.config.path(".storage", INTEGRATION_INDEX_FILE))
+        await hass.async_add_executor_job(index.load)
+        hass.data[DATA_INTEGRATION_INDEX] = index
+        future.set_result(index)
+        return index
+
+    if isinstance(index_or_future, asyncio.Future):
+        return await index_or_future
+
+    return index_or_future
+
+
+async def async_save_integration_index(hass: HomeAssistant) -> None:
+    """Save the integration index if it changed."""
+    index: IntegrationIndex | asyncio.Future[IntegrationIndex] | None = hass.data.get(
+        DATA_INTEGRATION_INDEX
+    )
+    if isinstance(index, IntegrationIndex) and index.dirty:
+        _LOGGER.debug(
+            "Integration index: %s manifests read from the index, %s from disk",
+            index.hits,
+            index.misses,
+        )
+        await hass.async_add_executor_job(index.save)
+
+
 async def _async_get_custom_components(
     hass: HomeAssistant,
 ) -> dict[str, Integration]:
@@ -266,24 +443,18 @@ async def _async_get_custom_components(
     except ImportError:
         return {}
 
-    def get_sub_directories(paths: list[str]) -> list[pathlib.Path]:
-        """Return all sub directories in a set of paths."""
-        return [
-            entry
-            for path in paths
-            for entry in pathlib.Path(path).iterdir()
-            if entry.is_dir()
-        ]
+    index = await async_get_integration_index(hass)
+
+    def get_sub_directories(paths: list[str]) -> list[str]:
+        """Return the names of all sub directories in a set of paths."""
+        return [name for path in paths for name in index.sub_directories(path)]
 
     dirs = await hass.async_add_executor_job(
         get_sub_directories, custom_components.__path__
     )
 
     integrations = await hass.async_add_executor_job(
-        _resolve_integrations_from_root,
-        hass,
-        custom_components,
-        [comp.name for comp in dirs],
+        _resolve_integrations_from_root, hass, custom_components, dirs, index
     )
     return {
         integration.domain: integration
@@ -630,33 +801,39 @@ class Integration:
 
     @classmethod
     def resolve_from_root(
-        cls, hass: HomeAssistant, root_module: ModuleType, domain: str
+        cls,
+        hass: HomeAssistant,
+        root_module: ModuleType,
+        domain: str,
+        index: IntegrationIndex | None = None,
     ) -> Integration | None:
-        """Resolve an integration from a root module."""
+        """Resolve an integration from a root module.
+
+        The manifest is taken from the index if it did not change.
+        """
+        if index is None:
+            index = IntegrationIndex()
         for base in root_module.__path__:
             manifest_path = pathlib.Path(base) / domain / "manifest.json"
 
-            if not manifest_path.is_file():
-                continue
-
             try:
-                manifest = cast(Manifest, json_loads(manifest_path.read_text()))
+                manifest_and_files = index.read_manifest(manifest_path)
             except JSON_DECODE_EXCEPTIONS as err:
                 _LOGGER.error(
                     "Error parsing manifest.json file at %s: %s", manifest_path, err
                 )
                 continue
 
-            file_path = manifest_path.parent
-            # Avoid the listdir for virtual integrations
-            # as they cannot have any platforms
-            is_virtual = manifest.get("integration_type") == "virtual"
+            if manifest_and_files is None:
+                continue
+
+            manifest, top_level_files = manifest_and_files
             integration = cls(
                 hass,
                 f"{root_module.__name__}.{domain}",
-                file_path,
+                manifest_path.parent,
                 manifest,
-                None if is_virtual else set(os.listdir(file_path)),
+                top_level_files,
             )
 
             if not integration.import_executor:
@@ -1284,13 +1461,18 @@ def _version_blocked(
 
 
 def _resolve_integrations_from_root(
-    hass: HomeAssistant, root_module: ModuleType, domains: Iterable[str]
+    hass: HomeAssistant,
+    root_module: ModuleType,
+    domains: Iterable[str],
+    index: IntegrationIndex | None = None,
 ) -> dict[str, Integration]:
     """Resolve multiple integrations from root."""
     integrations: dict[str, Integration] = {}
     for domain in domains:
         try:
-            integration = Integration.resolve_from_root(hass, root_module, domain)
+            integration = Integration.resolve_from_root(
+                hass, root_module, domain, index
+            )
         except Exception:  # pylint: disable=broad-except
             _LOGGER.exception("Error loading integration: %s", domain)
         else:
@@ -1377,8 +1559,9 @@ async def async_get_integrations(
     if needed:
         from . import components  # pylint: disable=import-outside-toplevel
 
+        index = await async_get_integration_index(hass)
         integrations = await hass.async_add_executor_job(
-            _resolve_integrations_from_root, hass, components, needed
+            _resolve_integrations_from_root, hass, components, needed, index
         )
         for domain, future in needed.items():
             int_or_exc = integrations.get(domain)
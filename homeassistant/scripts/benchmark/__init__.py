@@ -6,20 +6,28 @@ import argparse
 import asyncio
 import collections
 from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import suppress
+from datetime import timedelta
+from functools import partial
 import json
 import logging
+import os
+import tempfile
+from time import process_time
 from timeit import default_timer as timer
 from typing import TypeVar
 
 from homeassistant import core
 from homeassistant.const import EVENT_STATE_CHANGED
+from homeassistant.helpers import recorder as recorder_helper
 from homeassistant.helpers.entityfilter import convert_include_exclude_filter
 from homeassistant.helpers.event import (
     async_track_state_change,
     async_track_state_change_event,
 )
 from homeassistant.helpers.json import JSON_DUMP, JSONEncoder
+from homeassistant.util import dt as dt_util
 
 # mypy: allow-untyped-calls, allow-untyped-defs, no-check-untyped-defs
 # mypy: no-warn-return-any
@@ -302,6 +310,71 @@ async def valid_entity_id(hass):
     return timer() - start
 
 
+@benchmark
+async def states_reconnect_storm(hass):
+    """Fetch all of 5,000 states for 1,000 reconnecting clients.
+
+    A state changes between every 10 reconnects. Compares sharing the
+    state machine snapshot with copying all states for every client.
+    """
+    entity_count = 5000
+    reconnects = 1000
+    for idx in range(entity_count):
+        hass.states.async_set(f"sensor.sensor_{idx}", "0")
+
+    def _reconnect_storm(get_states):
+        start = timer()
+        for idx in range(reconnects):
+            if idx % 10 == 0:
+                hass.states.async_set(f"sensor.sensor_{idx}", str(idx))
+            for _ in get_states():
+                pass
+        return timer() - start
+
+    copy_runtime = _reconnect_storm(hass.states.async_all)
+    runtime = _reconnect_storm(hass.states.async_all_snapshot)
+    print(f"Copying all states: {copy_runtime:.3f} seconds")
+    return runtime
+
+
+@benchmark
+async def subscribe_entities_fan_out(hass):
+    """Forward 10,000 state changes to 30 subscribe_entities clients.
+
+    Prints the CPU time spent per state change.
+    """
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant.auth.models import User
+
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant.components.websocket_api.commands import _forward_entity_changes
+
+    state_changes = 10**4
+    subscribers = 30
+    user = User(name="Tablet", perm_lookup=None, is_owner=True)
+    sent_messages = []
+    for msg_id in range(subscribers):
+        hass.bus.async_listen(
+            EVENT_STATE_CHANGED,
+            partial(_forward_entity_changes, sent_messages.append, user, msg_id),
+            run_immediately=True,
+        )
+    attributes = {"friendly_name": "Living room", "unit_of_measurement": "W"}
+    hass.states.async_set("sensor.power", "0", attributes)
+
+    start = timer()
+    cpu_start = process_time()
+    for idx in range(state_changes):
+        hass.states.async_set("sensor.power", str(idx + 1), attributes)
+    cpu_time = process_time() - cpu_start
+    runtime = timer() - start
+    assert len(sent_messages) == (state_changes + 1) * subscribers
+    print(
+        f"CPU time per state change: {cpu_time / state_changes * 10**6:.1f} microseconds"
+    )
+    return runtime
+
+
 @benchmark
 async def json_serialize_states(hass):
     """Serialize million states with websocket default encoder."""
@@ -315,6 +388,648 @@ async def json_serialize_states(hass):
     return timer() - start
 
 
+@benchmark
+async def recorder_write_events(hass):
+    """Replay 100k events through the recorder write path into SQLite.
+
+    Compares the unit of work with the bulk insert writer.
+    """
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant.components.recorder import Recorder
+
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant.components.recorder.const import DB_WORKER_PREFIX
+
+    events_to_replay = 10**5
+    events_per_commit = 750
+    entity_count = 4000
+    events = []
+    old_states = {}
+    for idx in range(events_to_replay):
+        if idx % 10 == 0:
+            events.append(core.Event("benchmark_event", {"value": idx % 50}))
+            continue
+        entity_id = f"sensor.power_{idx % entity_count}"
+        new_state = core.State(
+            entity_id,
+            str(idx),
+            {"unit_of_measurement": "W", "friendly_name": entity_id, "mode": idx % 5},
+        )
+        events.append(
+            core.Event(
+                EVENT_STATE_CHANGED,
+                {
+                    "entity_id": entity_id,
+                    "old_state": old_states.get(entity_id),
+                    "new_state": new_state,
+                },
+            )
+        )
+        old_states[entity_id] = new_state
+
+    def _replay(instance: Recorder, bulk_insert: bool) -> float:
+        instance._setup_recorder()  # pylint: disable=protected-access
+        instance._setup_run()  # pylint: disable=protected-access
+        instance.event_type_manager.active = True
+        instance.states_meta_manager.active = True
+        if not bulk_insert:
+            instance.bulk_insert_writer = None
+        start = timer()
+        for idx, event in enumerate(events, 1):
+            instance._process_one_event(event)  # pylint: disable=protected-access
+            if idx % events_per_commit == 0:
+                # pylint: disable-next=protected-access
+                instance._commit_event_session_or_retry()
+        instance._commit_event_session_or_retry()  # pylint: disable=protected-access
+        runtime = timer() - start
+        instance._close_event_session()  # pylint: disable=protected-access
+        instance._close_connection()  # pylint: disable=protected-access
+        return runtime
+
+    recorder_helper.async_initialize_recorder(hass)
+    runtime = 0.0
+    for bulk_insert in (False, True):
+        with tempfile.TemporaryDirectory() as tmpdir, ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix=DB_WORKER_PREFIX
+        ) as executor:
+            instance = Recorder(
+                hass,
+                auto_purge=False,
+                auto_repack=False,
+                keep_days=10,
+                commit_interval=5,
+                uri=f"sqlite:///{tmpdir}/benchmark.db",
+                db_max_retries=1,
+                db_retry_wait=0,
+                entity_filter=lambda entity_id: True,
+                exclude_event_types=set(),
+            )
+            # The recorder pool only hands out connections to db workers
+            runtime = await hass.loop.run_in_executor(
+                executor, _replay, instance, bulk_insert
+            )
+        print(
+            f"{'bulk insert' if bulk_insert else 'unit of work'}:",
+            f"{events_to_replay / runtime:.0f} events/s",
+        )
+
+    return runtime
+
+
+@benchmark
+async def mqtt_wildcard_subscriptions(hass):
+    """Match a million messages against 10k wildcard subscriptions."""
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant.components.mqtt.client import Subscription, SubscriptionTrie
+
+    subscription_count = 10**4
+    messages_to_match = 10**6
+    trie = SubscriptionTrie()
+    job = core.HassJob(lambda msg: None)
+    for idx in range(subscription_count // 2):
+        trie.add(Subscription(f"zigbee2mqtt/device_{idx}/+", job))
+        trie.add(Subscription(f"tasmota/+/device_{idx}/#", job))
+    topics = [
+        topic
+        for idx in range(subscription_count)
+        for topic in (
+            f"zigbee2mqtt/device_{idx}/set",
+            f"tasmota/stat/device_{idx}/POWER",
+        )
+    ]
+    topic_count = len(topics)
+    matched = 0
+
+    start = timer()
+
+    for idx in range(messages_to_match):
+        matched += len(trie.match(topics[idx % topic_count]))
+
+    assert matched == messages_to_match // 2
+    return timer() - start
+
+
+@benchmark
+async def statistics_sensor_updates(hass):
+    """Feed 100k samples through statistics sensors with a 5000 sample buffer.
+
+    Compares the incremental characteristics with recalculating them
+    over all samples on every update.
+    """
+    # pylint: disable-next=import-outside-toplevel
+    import statistics
+
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant.components.statistics.sensor import StatisticsSensor
+
+    samples_to_add = 10**5
+    buffer_size = 5000
+    characteristics = {
+        "mean": statistics.mean,
+        "median": statistics.median,
+        "standard_deviation": statistics.stdev,
+        "percentile": lambda values: statistics.quantiles(
+            values, n=100, method="exclusive"
+        )[49],
+        "value_max": max,
+    }
+    start_time = dt_util.utcnow()
+    states = [
+        core.State(
+            "sensor.power",
+            str((idx * 7919) % 3001 / 10),
+            last_updated=start_time + timedelta(seconds=idx),
+        )
+        for idx in range(samples_to_add)
+    ]
+    runtime = 0.0
+    for characteristic, recompute in characteristics.items():
+        sensor = StatisticsSensor(
+            "sensor.power",
+            characteristic,
+            None,
+            characteristic,
+            buffer_size,
+            None,
+            False,
+            2,
+            50,
+        )
+        start = timer()
+        for state in states:
+            sensor._add_state_to_queue(state)  # pylint: disable=protected-access
+            sensor._update_value()  # pylint: disable=protected-access
+        incremental_runtime = timer() - start
+        runtime += incremental_runtime
+
+        # Only a fraction of the samples for the recalculation, it is too slow
+        recompute_samples = samples_to_add // 100
+        start = timer()
+        for state in states[:recompute_samples]:
+            sensor._add_state_to_queue(state)  # pylint: disable=protected-access
+            recompute(list(sensor.states))
+        recompute_runtime = (timer() - start) * 100
+        print(
+            f"{characteristic}: {samples_to_add / incremental_runtime:.0f} samples/s incremental,",
+            f"{samples_to_add / recompute_runtime:.0f} samples/s recalculated",
+        )
+    return runtime
+
+
+@benchmark
+async def sensor_compile_statistics(hass):
+    """Compile 5-minute statistics for 2,500 measurement sensors.
+
+    The states are generated in an in-memory SQLite database. Compares
+    compiling from State objects with compiling from the state rows.
+    """
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant.components.recorder import Recorder
+
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant.components.recorder.const import DATA_INSTANCE, DB_WORKER_PREFIX
+
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant.components.recorder.util import session_scope
+
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant.components.sensor import recorder as sensor_recorder
+
+    sensor_count = 2500
+    states_per_sensor = 20
+    attributes = {"state_class": "measurement", "unit_of_measurement": "W"}
+    for idx in range(sensor_count):
+        hass.states.async_set(f"sensor.power_{idx}", "0", attributes)
+
+    def _compile(instance: Recorder) -> float:
+        instance._setup_recorder()  # pylint: disable=protected-access
+        instance._setup_run()  # pylint: disable=protected-access
+        instance.event_type_manager.active = True
+        instance.states_meta_manager.active = True
+        start = dt_util.utcnow() + timedelta(minutes=1)
+        end = start + timedelta(minutes=5)
+        old_states: dict[str, core.State] = {}
+        # The first state of each sensor is before the start of the period
+        for sample in range(states_per_sensor):
+            last_updated = start + timedelta(seconds=sample * 15 - 10)
+            for idx in range(sensor_count):
+                entity_id = f"sensor.power_{idx}"
+                new_state = core.State(
+                    entity_id,
+                    str((idx * 31 + sample * 7) % 997 / 10),
+                    attributes,
+                    last_updated=last_updated,
+                )
+                # pylint: disable-next=protected-access
+                instance._process_one_event(
+                    core.Event(
+                        EVENT_STATE_CHANGED,
+                        {
+                            "entity_id": entity_id,
+                            "old_state": old_states.get(entity_id),
+                            "new_state": new_state,
+                        },
+                    )
+                )
+                old_states[entity_id] = new_state
+        instance._commit_event_session_or_retry()  # pylint: disable=protected-access
+
+        vectorized = sensor_recorder.VECTORIZED_STATISTICS
+        runtime = 0.0
+        for vectorized_statistics in (False, vectorized):
+            sensor_recorder.VECTORIZED_STATISTICS = vectorized_statistics
+            with session_scope(
+                session=instance.get_session(), read_only=True
+            ) as session:
+                start_time = timer()
+                compiled = sensor_recorder.compile_statistics(hass, session, start, end)
+                runtime = timer() - start_time
+            assert len(compiled.platform_stats) == sensor_count
+            print(
+                "state rows:" if vectorized_statistics else "states:",
+                f"{runtime:.3f}s",
+            )
+        sensor_recorder.VECTORIZED_STATISTICS = vectorized
+        instance._close_event_session()  # pylint: disable=protected-access
+        instance._close_connection()  # pylint: disable=protected-access
+        return runtime
+
+    recorder_helper.async_initialize_recorder(hass)
+    instance = Recorder(
+        hass,
+        auto_purge=False,
+        auto_repack=False,
+        keep_days=10,
+        commit_interval=5,
+        uri="sqlite://",
+        db_max_retries=1,
+        db_retry_wait=0,
+        entity_filter=lambda entity_id: True,
+        exclude_event_types=set(),
+    )
+    hass.data[DATA_INSTANCE] = instance
+    with ThreadPoolExecutor(
+        max_workers=1, thread_name_prefix=DB_WORKER_PREFIX
+    ) as executor:
+        return await hass.loop.run_in_executor(executor, _compile, instance)
+
+
+@benchmark
+async def service_target_by_label(hass):
+    """Resolve a label target 1,000 times in a registry of 6,000 entities."""
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant.helpers import (
+        area_registry as ar,
+        device_registry as dr,
+        entity_registry as er,
+        floor_registry as fr,
+        label_registry as lr,
+    )
+
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant.helpers.service import async_extract_referenced_entity_ids
+
+    entity_count = 6000
+    label_count = 60
+    resolutions = 1000
+    with tempfile.TemporaryDirectory() as tmpdir:
+        hass.config.config_dir = tmpdir
+        for registry in (dr, er, ar, fr, lr):
+            await registry.async_load(hass)
+        entity_registry = er.async_get(hass)
+        for idx in range(entity_count):
+            entry = entity_registry.async_get_or_create(
+                "light", "benchmark", str(idx), suggested_object_id=f"light_{idx}"
+            )
+            entity_registry.async_update_entity(
+                entry.entity_id, labels={f"label_{idx % label_count}"}
+            )
+
+        call = core.ServiceCall("light", "turn_on", {"label_id": ["label_7"]})
+        start = timer()
+        for _ in range(resolutions):
+            selected = async_extract_referenced_entity_ids(hass, call)
+        runtime = timer() - start
+        assert len(selected.indirectly_referenced) == entity_count // label_count
+        await hass.async_stop()
+        return runtime
+
+
+@benchmark
+async def entity_registry_edit_writes(hass):
+    """Measure the bytes written per edit of a registry of 10,000 entities.
+
+    Compares rewriting the registry file with appending to its journal.
+    """
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant.helpers import (
+        device_registry as dr,
+        entity_registry as er,
+        storage,
+    )
+
+    entity_count = 10000
+    edits = 200
+    with tempfile.TemporaryDirectory() as tmpdir:
+        hass.config.config_dir = tmpdir
+        await dr.async_load(hass)
+        await er.async_load(hass)
+        entity_registry = er.async_get(hass)
+        store = entity_registry._store  # pylint: disable=protected-access
+        journal_path = f"{store.path}{storage.JOURNAL_SUFFIX}"
+        entity_ids = [
+            entity_registry.async_get_or_create(
+                "sensor",
+                "benchmark",
+                str(idx),
+                suggested_object_id=f"sensor_{idx}",
+                original_name=f"Sensor {idx}",
+            ).entity_id
+            for idx in range(entity_count)
+        ]
+
+        def _file_sizes() -> tuple[int, int, int]:
+            stat = os.stat(store.path)
+            journal_size = (
+                os.path.getsize(journal_path) if os.path.exists(journal_path) else 0
+            )
+            return stat.st_ino, stat.st_size, journal_size
+
+        runtime = 0.0
+        for journal in (False, True):
+            store._journal = journal  # pylint: disable=protected-access
+            with suppress(AttributeError):
+                # Create the journal of the store again
+                del store._store_journal  # pylint: disable=protected-access
+            entity_registry.async_schedule_save()
+            # pylint: disable-next=protected-access
+            await store._async_handle_write_data()
+            bytes_written = 0
+            start = timer()
+            for edit in range(edits):
+                old_inode, _, old_journal_size = _file_sizes()
+                entity_registry.async_update_entity(
+                    entity_ids[edit * 37 % entity_count],
+                    name=f"Edit {edit} with journal {journal}",
+                )
+                # pylint: disable-next=protected-access
+                await store._async_handle_write_data()
+                inode, size, journal_size = _file_sizes()
+                if inode != old_inode:
+                    bytes_written += size
+                bytes_written += max(journal_size - old_journal_size, 0)
+            runtime = timer() - start
+            print(
+                "journal:" if journal else "snapshot:",
+                f"{bytes_written / edits:.0f} bytes per edit,",
+                f"{runtime / edits * 1000:.2f}ms per edit",
+            )
+        await hass.async_stop()
+        return runtime
+
+
+@benchmark
+async def search_related_automations(hass):
+    """Search the items related to an entity 200 times with 1,500 automations."""
+    # pylint: disable=import-outside-toplevel
+    from homeassistant import bootstrap, config_entries, loader
+    from homeassistant.components import search
+    from homeassistant.components.search.graph import ReferenceGraph
+    from homeassistant.helpers import device_registry as dr, entity_registry as er
+    from homeassistant.helpers.entity import entity_sources
+    from homeassistant.setup import async_setup_component
+
+    # pylint: enable=import-outside-toplevel
+
+    automation_count = 1500
+    searches = 200
+    with tempfile.TemporaryDirectory() as tmpdir:
+        hass.config.config_dir = tmpdir
+        loader.async_setup(hass)
+        hass.config_entries = config_entries.ConfigEntries(hass, {})
+        await bootstrap.async_load_base_functionality(hass)
+        automations = [
+            {
+                "id": str(idx),
+                "alias": f"Automation {idx}",
+                "trigger": {
+                    "platform": "state",
+                    "entity_id": f"binary_sensor.motion_{idx % 300}",
+                },
+                "action": {
+                    "service": "light.turn_on",
+                    "target": {"entity_id": f"light.light_{idx % 100}"},
+                },
+            }
+            for idx in range(automation_count)
+        ]
+        assert await async_setup_component(
+            hass, "automation", {"automation": automations}
+        )
+        await hass.async_block_till_done()
+        graph = ReferenceGraph(hass)
+        graph.async_listen()
+
+        def _search(item_id):
+            searcher = search.Searcher(
+                hass,
+                dr.async_get(hass),
+                er.async_get(hass),
+                entity_sources(hass),
+                graph,
+            )
+            return searcher.async_search("entity", item_id)
+
+        start = timer()
+        _search("light.light_0")
+        print(f"first search, building the graph: {(timer() - start) * 1000:.2f}ms")
+        start = timer()
+        for idx in range(searches):
+            result = _search(f"light.light_{idx % 100}")
+        runtime = timer() - start
+        assert len(result["automation"]) == automation_count // 100
+        print(f"{runtime / searches * 1000:.3f}ms per search")
+        await hass.async_stop()
+        return runtime
+
+
+@benchmark
+async def prometheus_scrape(hass):
+    """Scrape 10,000 Prometheus series 100 times, with 100 changed states each."""
+    # pylint: disable=import-outside-toplevel
+    from homeassistant.components.prometheus import PrometheusMetrics
+    from homeassistant.const import UnitOfTemperature
+    from homeassistant.helpers.entity_values import EntityValues
+    from homeassistant.helpers.entityfilter import FILTER_SCHEMA
+
+    # pylint: enable=import-outside-toplevel
+
+    sensor_count = 2500
+    scrapes = 100
+    changes = 100
+    metrics = PrometheusMetrics(
+        FILTER_SCHEMA({}),
+        "homeassistant",
+        UnitOfTemperature.CELSIUS,
+        EntityValues({}, {}, {}),
+        None,
+        None,
+    )
+    units = ("°C", "%", "W", "kWh", "lx")
+    states = [
+        core.State(
+            f"sensor.sensor_{idx}",
+            str(idx),
+            {"unit_of_measurement": units[idx % len(units)]},
+        )
+        for idx in range(sensor_count)
+    ]
+    # A unit metric, state changes, availability and last update per sensor
+    for state in states:
+        metrics.handle_state(state)
+
+    for compress in (False, True):
+        await metrics.exposition.async_render(hass, False, compress)
+        rendered = 0.0
+        full = 0.0
+        for scrape in range(scrapes):
+            for idx in range(changes):
+                state = states[(scrape * changes + idx) % sensor_count]
+                metrics.handle_state(
+                    core.State(state.entity_id, str(scrape), state.attributes)
+                )
+            start = timer()
+            await metrics.exposition.async_render(hass, False, compress)
+            rendered += timer() - start
+            # Render everything, as before the exposition cached families
+            metrics.exposition._dirty.update(  # pylint: disable=protected-access
+                metrics._metrics  # pylint: disable=protected-access
+            )
+            start = timer()
+            await metrics.exposition.async_render(hass, False, compress)
+            full += timer() - start
+        print(
+            "gzip:" if compress else "text:",
+            f"{rendered / scrapes * 1000:.2f}ms per scrape,",
+            f"{full / scrapes * 1000:.2f}ms rendering all families",
+        )
+    return rendered
+
+
+@benchmark
+async def script_run_tracing(hass):
+    """Run a script 5,000 times with and without recording its trace."""
+    # pylint: disable=import-outside-toplevel
+    from homeassistant.helpers import config_validation as cv
+    from homeassistant.helpers.script import Script
+    from homeassistant.helpers.trace import trace_clear, trace_enabled_set
+
+    # pylint: enable=import-outside-toplevel
+
+    runs = 5000
+    rounds = 10
+    sequence = cv.SCRIPT_SCHEMA(
+        [
+            {"variables": {"count": "{{ count + 1 }}"}},
+            {"condition": "template", "value_template": "{{ count > 0 }}"},
+            {"event": "benchmark_event", "event_data": {"count": "{{ count }}"}},
+            {"variables": {"last": "{{ count }}"}},
+            {"event": "benchmark_event", "event_data": {"last": "{{ last }}"}},
+        ]
+    )
+    script = Script(hass, sequence, "Benchmark", "script")
+    run_variables = {"count": 0, "payload": {f"key_{idx}": idx for idx in range(500)}}
+
+    async def run(traced):
+        trace_enabled_set(traced)
+        start = timer()
+        for _ in range(runs // rounds):
+            trace_clear()
+            await script.async_run(run_variables, core.Context())
+        return timer() - start
+
+    await run(True)
+    # Alternate between the modes, so both see the same state of the heap
+    traced = untraced = 0.0
+    for _ in range(rounds):
+        traced += await hass.async_create_task(run(True))
+        untraced += await hass.async_create_task(run(False))
+    print(f"traced: {traced / runs * 1000000:.1f}µs per run")
+    print(f"untraced: {untraced / runs * 1000000:.1f}µs per run")
+    return untraced
+
+
+@benchmark
+async def conversation_recognize(hass):
+    """Update the slot lists 100 times and recognize with 5,000 exposed entities."""
+    # pylint: disable=import-outside-toplevel
+    from homeassistant import bootstrap, config_entries, loader
+    from homeassistant.components import conversation
+    from homeassistant.components.conversation.default_agent import DefaultAgent
+    from homeassistant.setup import async_setup_component
+
+    # pylint: enable=import-outside-toplevel
+
+    entity_count = 5000
+    changes = 100
+    recognitions = 5
+    with tempfile.TemporaryDirectory() as tmpdir:
+        hass.config.config_dir = tmpdir
+        loader.async_setup(hass)
+        hass.config_entries = config_entries.ConfigEntries(hass, {})
+        await bootstrap.async_load_base_functionality(hass)
+        for idx in range(entity_count):
+            hass.states.async_set(
+                f"light.light_{idx}", "off", {"friendly_name": f"Light {idx}"}
+            )
+        assert await async_setup_component(hass, "homeassistant", {})
+        # Recognizing does not need the intent handlers
+        hass.config.components.add("intent")
+        agent = DefaultAgent(hass)
+        await agent.async_initialize(None)
+        for idx in range(100):
+            agent.register_trigger([f"start scene number {idx}"], None)
+
+        async def recognize():
+            return await agent.async_recognize(
+                conversation.ConversationInput(
+                    text="turn on light 42",
+                    context=core.Context(),
+                    conversation_id=None,
+                    device_id=None,
+                    language="en",
+                )
+            )
+
+        # Load the intents
+        await recognize()
+
+        # Slot lists after an entity was added and trigger intents after a
+        # trigger was registered, as for the first sentence after a change
+        slot_lists = 0.0
+        triggers = 0.0
+        for idx in range(changes):
+            hass.states.async_set(f"light.new_{idx}", "off")
+            start = timer()
+            agent._make_slot_lists()  # pylint: disable=protected-access
+            slot_lists += timer() - start
+            agent.register_trigger([f"stop scene number {idx}"], None)
+            start = timer()
+            await agent._match_triggers("turn on light 42")  # pylint: disable=protected-access
+            triggers += timer() - start
+
+        start = timer()
+        for _ in range(recognitions):
+            assert (await recognize()).entities["name"].value == "Light 42"
+        recognized = timer() - start
+
+        print(f"{slot_lists / changes * 1000:.2f}ms per slot list update")
+        print(f"{triggers / changes * 1000:.2f}ms per trigger match after a change")
+        print(f"{recognized / recognitions * 1000:.1f}ms per recognition")
+        await hass.async_stop()
+        return slot_lists
+
+
 def _create_state_changed_event_from_old_new(
     entity_id, event_time_fired, old_state, new_state
 ):
@@ -69,6 +69,11 @@ DATA_SETUP_STARTED = "setup_started"
 # indicating how time was spent setting up a component and each group (config entry).
 DATA_SETUP_TIME = "setup_time"
 
+# DATA_SETUP_TRACE is a list[tuple[str, str, float, float]] with the domain, step,
+# start and end of the steps of setting up components. It is only present while
+# bootstrap records the startup trace.
+DATA_SETUP_TRACE = "setup_trace"
+
 DATA_DEPS_REQS = "deps_reqs_processed"
 
 DATA_PERSISTENT_ERRORS = "bootstrap_persistent_errors"
@@ -301,7 +306,8 @@ async def _async_setup_component(  # noqa: C901
     # Some integrations fail on import because they call functions incorrectly.
     # So we do it before validating config to catch these errors.
     try:
-        component = await integration.async_get_component()
+        with async_trace_setup_step(hass, domain, "import"):
+            component = await integration.async_get_component()
     except ImportError as err:
         log_error(f"Unable to import component: {err}", err)
         return False
@@ -365,7 +371,10 @@ async def _async_setup_component(  # noqa: C901
             translation.async_load_integrations(hass, integration_set)
         )
 
-    with async_start_setup(hass, integration=domain, phase=SetupPhases.SETUP):
+    with (
+        async_start_setup(hass, integration=domain, phase=SetupPhases.SETUP),
+        async_trace_setup_step(hass, domain, "setup"),
+    ):
         if hasattr(component, "PLATFORM_SCHEMA"):
             # Entity components have their own warning
             warn_task = None
@@ -541,13 +550,16 @@ async def async_process_deps_reqs(
     elif integration.domain in processed:
         return
 
-    if failed_deps := await _async_process_dependencies(hass, config, integration):
+    with async_trace_setup_step(hass, integration.domain, "dependencies"):
+        failed_deps = await _async_process_dependencies(hass, config, integration)
+    if failed_deps:
         raise DependencyError(failed_deps)
 
     async with hass.timeout.async_freeze(integration.domain):
-        await requirements.async_get_integration_with_requirements(
-            hass, integration.domain
-        )
+        with async_trace_setup_step(hass, integration.domain, "requirements"):
+            await requirements.async_get_integration_with_requirements(
+                hass, integration.domain
+            )
 
     processed.add(integration.domain)
 
@@ -702,6 +714,21 @@ def _setup_times(
     return hass.data[DATA_SETUP_TIME]  # type: ignore[no-any-return]
 
 
+@contextlib.contextmanager
+def async_trace_setup_step(
+    hass: core.HomeAssistant, domain: str, step: str
+) -> Generator[None, None, None]:
+    """Record a step of setting up a component in the startup trace."""
+    if (setup_trace := hass.data.get(DATA_SETUP_TRACE)) is None:
+        yield
+        return
+    start = time.monotonic()
+    try:
+        yield
+    finally:
+        setup_trace.append((domain, step, start, time.monotonic()))
+
+
 @contextlib.contextmanager
 def async_start_setup(
     hass: core.HomeAssistant,
@@ -0,0 +1,341 @@
+"""Persistent cache of parsed YAML files."""
+
+from __future__ import annotations
+
+import base64
+from collections.abc import Generator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from datetime import date, datetime
+import logging
+import math
+import os
+import threading
+import time
+from typing import Any
+
+import orjson
+
+from homeassistant.exceptions import HomeAssistantError
+from homeassistant.util.file import write_utf8_file
+from homeassistant.util.json import JSON_DECODE_EXCEPTIONS, json_loads_object
+
+from . import loader
+from .loader import JSON_TYPE, Secrets, YamlDependencies
+from .objects import Input, NodeDictClass, NodeListClass, NodeStrClass
+
+_LOGGER = logging.getLogger(__name__)
+
+CACHE_VERSION = 2
+
+# Range of the integers orjson can serialize
+_MIN_INT = -(2**63)
+_MAX_INT = 2**64 - 1
+
+
+def _encode_reference(
+    value: NodeDictClass | NodeListClass | NodeStrClass, encoded: dict[str, Any]
+) -> dict[str, Any]:
+    """Add the file reference used in error messages to an encoded value."""
+    if (config_file := getattr(value, "__config_file__", None)) is not None:
+        encoded["file"] = config_file
+        encoded["line"] = getattr(value, "__line__", None)
+    return encoded
+
+
+def _encode(value: Any) -> Any:
+    """Encode a parsed YAML tree as JSON.
+
+    Lists which are not annotated are kept as lists, all other objects are
+    encoded as a JSON object with their type. Raises TypeError if the tree
+    contains an object which can not be encoded.
+    """
+    value_type = type(value)
+    if value is None or value_type is bool or value_type is str:
+        return value
+    if value_type is int:
+        if not _MIN_INT <= value <= _MAX_INT:
+            raise TypeError(f"Integer {value} is too large")
+        return value
+    if value_type is float:
+        if math.isfinite(value):
+            return value
+        return {"type": "float", "value": repr(value)}
+    if value_type is list:
+        return [_encode(item) for item in value]
+    if value_type is NodeStrClass:
+        return _encode_reference(value, {"type": "str", "value": str(value)})
+    if value_type is NodeListClass:
+        return _encode_reference(
+            value, {"type": "list", "items": [_encode(item) for item in value]}
+        )
+    if value_type is NodeDictClass or value_type is dict:
+        encoded: dict[str, Any] = {
+            "type": "dict",
+            "items": [[_encode(key), _encode(item)] for key, item in value.items()],
+        }
+        if value_type is dict:
+            encoded["plain"] = True
+            return encoded
+        return _encode_reference(value, encoded)
+    if value_type is Input:
+        return {"type": "input", "value": value.name}
+    if value_type is datetime:
+        return {"type": "datetime", "value": value.isoformat()}
+    if value_type is date:
+        return {"type": "date", "value": value.isoformat()}
+    if value_type is bytes:
+        return {"type": "bytes", "value": base64.b64encode(value).decode("ascii")}
+    if value_type is set:
+        return {"type": "set", "items": [_encode(item) for item in value]}
+    raise TypeError(f"Objects of type {value_type.__name__} can not be cached")
+
+
+def _decode_reference(
+    value: NodeDictClass | NodeListClass | NodeStrClass, encoded: dict[str, Any]
+) -> Any:
+    """Restore the file reference of a decoded value."""
+    if "file" in encoded:
+        setattr(value, "__config_file__", encoded["file"])
+        setattr(value, "__line__", encoded["line"])
+    return value
+
+
+def _decode(encoded: Any) -> Any:
+    """Decode a parsed YAML tree encoded by _encode.
+
+    Returns new objects on each call, so the tree can be changed by the caller.
+    """
+    if isinstance(encoded, list):
+        return [_decode(item) for item in encoded]
+    if not isinstance(encoded, dict):
+        return encoded
+    value_type = encoded["type"]
+    if value_type == "dict":
+        items = {_decode(key): _decode(item) for key, item in encoded["items"]}
+        if encoded.get("plain"):
+            return items
+        return _decode_reference(NodeDictClass(items), encoded)
+    if value_type == "list":
+        return _decode_reference(
+            NodeListClass(_decode(item) for item in encoded["items"]), encoded
+        )
+    if value_type == "str":
+        return _decode_reference(NodeStrClass(encoded["value"]), encoded)
+    if value_type == "float":
+        return float(encoded["value"])
+    if value_type == "input":
+        return Input(encoded["value"])
+    if value_type == "datetime":
+        return datetime.fromisoformat(encoded["value"])
+    if value_type == "date":
+        return date.fromisoformat(encoded["value"])
+    if value_type == "bytes":
+        return base64.b64decode(encoded["value"])
+    if value_type == "set":
+        return {_decode(item) for item in encoded["items"]}
+    raise ValueError(f"Unknown type {value_type}")
+
+
+@dataclass(slots=True)
+class _CacheEntry:
+    """A parsed YAML file."""
+
+    dependencies: YamlDependencies
+    # The encoded tree, including the trees of included files
+    data: Any
+    # Time it took to parse the file and the files it includes
+    parse_seconds: float
+
+
+class YamlCache:
+    """Persistent cache of parsed YAML files.
+
+    While the cache is active, load_yaml returns the parsed tree of a file
+    from the cache if neither the file nor any of the files, directories
+    and environment variables it depends on have changed. Since included
+    files are cached on their own, only files which changed, and the files
+    including them, are parsed again.
+
+    The tree is returned without parsing, so warnings about the content
+    of a file are only logged when the file is parsed.
+
+    The cache can be used by several threads at once, for example when all
+    integrations are reloaded.
+    """
+
+    def __init__(self, path: str) -> None:
+        """Initialize the cache."""
+        self.path = path
+        self.hits = 0
+        self.misses = 0
+        self.seconds_saved = 0.0
+        self._entries: dict[str, _CacheEntry] | None = None
+        self._dirty = False
+        # Protects the entries and the statistics
+        self._lock = threading.Lock()
+        # Dependencies of the files which are being loaded in the current context
+        self._loading: ContextVar[tuple[YamlDependencies, ...]] = ContextVar(
+            "yaml_cache_loading", default=()
+        )
+
+    @contextmanager
+    def active(self) -> Generator[None, None, None]:
+        """Use the cache for all YAML files loaded in the context.
+
+        Loads the cache from disk on first use and saves it if it changed.
+        """
+        with self._lock:
+            if self._entries is None:
+                self._entries = self._load()
+        token = loader.ACTIVE_YAML_CACHE.set(self)
+        try:
+            yield
+        finally:
+            loader.ACTIVE_YAML_CACHE.reset(token)
+        with self._lock:
+            if self._dirty:
+                self._save()
+
+    def load_yaml(
+        self, fname: str | os.PathLike[str], secrets: Secrets | None = None
+    ) -> JSON_TYPE | None:
+        """Load a YAML file from the cache or parse it."""
+        assert self._entries is not None
+        path = os.fspath(fname)
+        start = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(path)
+        # Entries are not changed once they are stored, so they can be
+        # checked without holding the lock
+        if entry is not None:
+            try:
+                if entry.dependencies.is_current():
+                    cached: JSON_TYPE | None = _decode(entry.data)
+                    self._record(entry.dependencies)
+                    with self._lock:
+                        self.hits += 1
+                        self.seconds_saved += max(
+                            entry.parse_seconds - (time.monotonic() - start), 0
+                        )
+                    return cached
+            except (OSError, KeyError, TypeError, ValueError) as err:
+                _LOGGER.debug("Ignoring cached %s: %s", path, err)
+            with self._lock:
+                if self._entries.get(path) is entry:
+                    del self._entries[path]
+                    self._dirty = True
+
+        with self._lock:
+            self.misses += 1
+        dependencies = YamlDependencies()
+        token = self._loading.set((*self._loading.get(), dependencies))
+        try:
+            # Record the file before reading it, so changes while it is
+            # parsed are noticed the next time
+            self.record_file(path)
+            result = loader.load_yaml_uncached(fname, secrets)
+        finally:
+            self._loading.reset(token)
+        self._record(dependencies)
+        try:
+            data = _encode(result)
+        except TypeError as err:
+            # Objects created by custom constructors may not be encodable
+            _LOGGER.debug("Not caching %s: %s", path, err)
+            return result
+        with self._lock:
+            self._entries[path] = _CacheEntry(
+                dependencies, data, time.monotonic() - start
+            )
+            self._dirty = True
+        return result
+
+    def _record(self, dependencies: YamlDependencies) -> None:
+        """Add dependencies to the file which is being loaded."""
+        if loading := self._loading.get():
+            loading[-1].update(dependencies)
+
+    def record_file(self, path: str) -> None:
+        """Record the file being loaded depends on a file."""
+        if loading := self._loading.get():
+            loading[-1].record_file(path)
+
+    def record_directory(self, directory: str, pattern: str, files: list[str]) -> None:
+        """Record the file being loaded depends on the files in a directory."""
+        if loading := self._loading.get():
+            loading[-1].directories[(directory, pattern)] = files
+
+    def record_env_var(self, name: str) -> None:
+        """Record the file being loaded depends on an environment variable."""
+        if loading := self._loading.get():
+            loading[-1].env_vars[name] = os.environ.get(name)
+
+    def _load(self) -> dict[str, _CacheEntry]:
+        """Load the cache from disk, called with the lock held."""
+        try:
+            with open(self.path, "rb") as cache_file:
+                cache: dict[str, Any] = json_loads_object(cache_file.read())
+            if cache.get("version") != CACHE_VERSION:
+                return {}
+            return {
+                path: _CacheEntry(
+                    YamlDependencies(
+                        entry["files"],
+                        {
+                            (directory, pattern): files
+                            for directory, pattern, files in entry["directories"]
+                        },
+                        entry["env_vars"],
+                    ),
+                    entry["data"],
+                    entry["parse_seconds"],
+                )
+                for path, entry in cache["entries"].items()
+            }
+        except FileNotFoundError:
+            return {}
+        except (
+            OSError,
+            *JSON_DECODE_EXCEPTIONS,
+            AttributeError,
+            KeyError,
+            TypeError,
+            ValueError,
+        ) as err:
+            _LOGGER.warning("Ignoring invalid YAML cache %s: %s", self.path, err)
+            return {}
+
+    def _save(self) -> None:
+        """Save the cache to disk, called with the lock held."""
+        assert self._entries is not None
+        entries = {
+            path: {
+                "files": entry.dependencies.files,
+                "directories": [
+                    [directory, pattern, files]
+                    for (
+                        directory,
+                        pattern,
+                    ), files in entry.dependencies.directories.items()
+                ],
+                "env_vars": entry.dependencies.env_vars,
+                "data": entry.data,
+                "parse_seconds": entry.parse_seconds,
+            }
+            for path, entry in self._entries.items()
+        }
+        try:
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            # The cache contains the values of secrets
+            write_utf8_file(
+                self.path,
+                orjson.dumps({"version": CACHE_VERSION, "entries": entries}),
+                private=True,
+                mode="wb",
+            )
+        except (OSError, TypeError, HomeAssistantError) as err:
+            _LOGGER.warning("Unable to save the YAML cache %s: %s", self.path, err)
+            return
+        self._dirty = False
@@ -3,7 +3,10 @@
 from __future__ import annotations
 
 from collections.abc import Callable, Iterator
+from contextvars import ContextVar
+from dataclasses import dataclass, field
 import fnmatch
+import hashlib
 from io import StringIO, TextIOWrapper
 import logging
 import os
@@ -30,6 +33,8 @@ from .objects import Input, NodeDictClass, NodeListClass, NodeStrClass
 
 if TYPE_CHECKING:
     from functools import cached_property
+
+    from .cache import YamlCache
 else:
     from homeassistant.backports.functools import cached_property
 
@@ -41,6 +46,11 @@ _DictT = TypeVar("_DictT", bound=dict)
 
 _LOGGER = logging.getLogger(__name__)
 
+# The cache which is used by load_yaml in the current context, see YamlCache
+ACTIVE_YAML_CACHE: ContextVar[YamlCache | None] = ContextVar(
+    "active_yaml_cache", default=None
+)
+
 
 class YamlTypeError(HomeAssistantError):
     """Raised by load_yaml_dict if top level data is not a dict."""
@@ -82,7 +92,11 @@ class Secrets:
 
     def _load_secret_yaml(self, secret_dir: Path) -> dict[str, str]:
         """Load the secrets yaml from path."""
-        if (secret_path := secret_dir / SECRET_YAML) in self._cache:
+        secret_path = secret_dir / SECRET_YAML
+        if (yaml_cache := ACTIVE_YAML_CACHE.get()) is not None:
+            # The secret depends on the secrets files even if they don't exist
+            yaml_cache.record_file(str(secret_path))
+        if secret_path in self._cache:
             return self._cache[secret_path]
 
         _LOGGER.debug("Loading %s", secret_path)
@@ -227,6 +241,15 @@ def load_yaml(
     fname: str | os.PathLike[str], secrets: Secrets | None = None
 ) -> JSON_TYPE | None:
     """Load a YAML file."""
+    if (yaml_cache := ACTIVE_YAML_CACHE.get()) is not None:
+        return yaml_cache.load_yaml(fname, secrets)
+    return load_yaml_uncached(fname, secrets)
+
+
+def load_yaml_uncached(
+    fname: str | os.PathLike[str], secrets: Secrets | None = None
+) -> JSON_TYPE | None:
+    """Load a YAML file without using the active YAML cache."""
     try:
         with open(fname, encoding="utf-8") as conf_file:
             return parse_yaml(conf_file, secrets)
@@ -361,11 +384,63 @@ def _find_files(directory: str, pattern: str) -> Iterator[str]:
                 yield filename
 
 
+def _find_included_files(directory: str, pattern: str) -> Iterator[str]:
+    """Find the files included from a directory."""
+    if (yaml_cache := ACTIVE_YAML_CACHE.get()) is None:
+        return _find_files(directory, pattern)
+    files = list(_find_files(directory, pattern))
+    yaml_cache.record_directory(directory, pattern, files)
+    return iter(files)
+
+
+def _file_digest(path: str) -> str | None:
+    """Return the digest of the content of a file, None if it does not exist."""
+    try:
+        with open(path, encoding="utf-8", errors="surrogateescape") as file:
+            content = file.read()
+    except FileNotFoundError:
+        return None
+    return hashlib.blake2b(content.encode("utf-8", "surrogateescape")).hexdigest()
+
+
+@dataclass(slots=True)
+class YamlDependencies:
+    """Everything a parsed YAML file depends on."""
+
+    # Path and digest of the content of the file, None if it does not exist
+    files: dict[str, str | None] = field(default_factory=dict)
+    # Directory and pattern of included directories and the included files
+    directories: dict[tuple[str, str], list[str]] = field(default_factory=dict)
+    # Value of environment variables, None if it is not set
+    env_vars: dict[str, str | None] = field(default_factory=dict)
+
+    def record_file(self, path: str) -> None:
+        """Record the content of a file."""
+        self.files[path] = _file_digest(path)
+
+    def update(self, other: YamlDependencies) -> None:
+        """Add the dependencies of another file."""
+        self.files.update(other.files)
+        self.directories.update(other.directories)
+        self.env_vars.update(other.env_vars)
+
+    def is_current(self) -> bool:
+        """Return if none of the dependencies changed."""
+        return (
+            all(os.environ.get(name) == value for name, value in self.env_vars.items())
+            and all(
+                list(_find_files(directory, pattern)) == files
+                for (directory, pattern), files in self.directories.items()
+            )
+            and all(_file_digest(path) == digest for path, digest in self.files.items())
+        )
+
+
 def _include_dir_named_yaml(loader: LoaderType, node: yaml.nodes.Node) -> NodeDictClass:
     """Load multiple files from directory as a dictionary."""
     mapping = NodeDictClass()
     loc = os.path.join(os.path.dirname(loader.get_name), node.value)
-    for fname in _find_files(loc, "*.yaml"):
+    for fname in _find_included_files(loc, "*.yaml"):
         filename = os.path.splitext(os.path.basename(fname))[0]
         if os.path.basename(fname) == SECRET_YAML:
             continue
@@ -384,7 +459,7 @@ def _include_dir_merge_named_yaml(
     """Load multiple files from directory as a merged dictionary."""
     mapping = NodeDictClass()
     loc = os.path.join(os.path.dirname(loader.get_name), node.value)
-    for fname in _find_files(loc, "*.yaml"):
+    for fname in _find_included_files(loc, "*.yaml"):
         if os.path.basename(fname) == SECRET_YAML:
             continue
         loaded_yaml = load_yaml(fname, loader.secrets)
@@ -400,7 +475,7 @@ def _include_dir_list_yaml(
     loc = os.path.join(os.path.dirname(loader.get_name), node.value)
     return [
         loaded_yaml
-        for f in _find_files(loc, "*.yaml")
+        for f in _find_included_files(loc, "*.yaml")
         if os.path.basename(f) != SECRET_YAML
         and (loaded_yaml := load_yaml(f, loader.secrets)) is not None
     ]
@@ -412,7 +487,7 @@ def _include_dir_merge_list_yaml(
     """Load multiple files from directory as a merged list."""
     loc: str = os.path.join(os.path.dirname(loader.get_name), node.value)
     merged_list: list[JSON_TYPE] = []
-    for fname in _find_files(loc, "*.yaml"):
+    for fname in _find_included_files(loc, "*.yaml"):
         if os.path.basename(fname) == SECRET_YAML:
             continue
         loaded_yaml = load_yaml(fname, loader.secrets)
@@ -481,6 +556,8 @@ def _handle_scalar_tag(
 def _env_var_yaml(loader: LoaderType, node: yaml.nodes.Node) -> str:
     """Load environment variables and embed it into the configuration YAML."""
     args = node.value.split()
+    if (yaml_cache := ACTIVE_YAML_CACHE.get()) is not None:
+        yaml_cache.record_env_var(args[0])
 
     # Check for a default value
     if len(args) > 1:
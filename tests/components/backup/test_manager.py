@@ -2,7 +2,9 @@
 
 from __future__ import annotations
 
+import json
 from pathlib import Path
+import tarfile
 from unittest.mock import AsyncMock, MagicMock, Mock, patch
 
 import pytest
@@ -52,7 +54,10 @@ async def _mock_backup_generation(manager: BackupManager):
     ) as mocked_json_bytes, patch(
         "homeassistant.components.backup.manager.HAVERSION",
         "2025.1.0",
-    ):
+    ), patch(
+        "homeassistant.components.backup.manager.add_config_archive",
+        return_value={},
+    ) as mocked_add_config_archive:
         await manager.generate_backup()
 
         assert mocked_json_bytes.call_count == 1
@@ -62,6 +67,7 @@ async def _mock_backup_generation(manager: BackupManager):
         assert manager.backup_dir.as_posix() in str(
             mocked_tarfile.call_args_list[0][0][0]
         )
+        assert mocked_add_config_archive.call_args[0][1] == "./homeassistant.tar.gz"
 
 
 async def _setup_mock_domain(
@@ -182,6 +188,92 @@ async def test_generate_backup(
     assert "Loaded 0 platforms" in caplog.text
 
 
+def _read_config_archive(backup_path: Path) -> dict[str, bytes]:
+    """Return the files in the configuration archive of a backup."""
+    with tarfile.open(backup_path, "r:") as outer_tar:
+        inner_file = outer_tar.extractfile("./homeassistant.tar.gz")
+        assert inner_file is not None
+        with tarfile.open(fileobj=inner_file, mode="r:gz") as inner_tar:
+            return {
+                member.name: inner_tar.extractfile(member).read()
+                for member in inner_tar.getmembers()
+                if member.isfile()
+            }
+
+
+async def test_generate_incremental_backup(hass: HomeAssistant, tmp_path: Path) -> None:
+    """Test an incremental backup only contains the changed files."""
+    hass.config.config_dir = str(tmp_path)
+    (tmp_path / "configuration.yaml").write_text("homeassistant:\n")
+    (tmp_path / "large.bin").write_bytes(bytes(range(256)) * 64)
+    (tmp_path / ".storage").mkdir()
+    (tmp_path / ".storage" / "core.config").write_text("{}")
+    (tmp_path / "home-assistant.log").write_text("excluded")
+    manager = BackupManager(hass)
+    manager.loaded_backups = True
+
+    # Compress the archive in several gzip members
+    with patch("homeassistant.components.backup.archive.GZIP_CHUNK_SIZE", 1024):
+        full = await manager.generate_backup()
+    assert _read_config_archive(full.path) == {
+        "data/configuration.yaml": b"homeassistant:\n",
+        "data/large.bin": bytes(range(256)) * 64,
+        "data/.storage/core.config": b"{}",
+    }
+
+    (tmp_path / "configuration.yaml").write_text("homeassistant:\n  name: Home\n")
+    (tmp_path / "large.bin").unlink()
+    incremental = await manager.generate_backup(incremental=True)
+    assert incremental.name.endswith("(incremental)")
+    assert _read_config_archive(incremental.path) == {
+        "data/configuration.yaml": b"homeassistant:\n  name: Home\n",
+    }
+    with tarfile.open(incremental.path, "r:") as backup_file:
+        backup_json = json.loads(backup_file.extractfile("./backup.json").read())
+    assert backup_json["type"] == "incremental"
+    assert backup_json["base_backup"] == full.slug
+    manifest = json.loads(
+        (manager.backup_dir / f"{incremental.slug}.manifest.json").read_text()
+    )
+    assert manifest["base"] == full.slug
+    assert {path: entry[3] for path, entry in manifest["files"].items()} == {
+        "data/configuration.yaml": incremental.slug,
+        "data/.storage/core.config": full.slug,
+    }
+    assert manifest["removed"] == ["data/large.bin"]
+
+    # The base of an incremental backup can not be removed before it
+    with pytest.raises(HomeAssistantError, match=incremental.slug):
+        await manager.remove_backup(full.slug)
+    assert full.path.exists()
+
+    # A backup without its base is a full backup again
+    await manager.remove_backup(incremental.slug)
+    await manager.remove_backup(full.slug)
+    backup = await manager.generate_backup(incremental=True)
+    assert not backup.name.endswith("(incremental)")
+    assert len(_read_config_archive(backup.path)) == 2
+
+
+async def test_load_backups_from_index(hass: HomeAssistant, tmp_path: Path) -> None:
+    """Test loading backups only opens backups which are not in the index."""
+    hass.config.config_dir = str(tmp_path)
+    (tmp_path / "configuration.yaml").write_text("homeassistant:\n")
+    manager = BackupManager(hass)
+    manager.loaded_backups = True
+    backup = await manager.generate_backup()
+
+    manager = BackupManager(hass)
+    await manager.load_backups()
+    assert await manager.get_backups() == {backup.slug: backup}
+    assert (manager.backup_dir / "index.json").exists()
+
+    manager = BackupManager(hass)
+    with patch("tarfile.open", side_effect=OSError):
+        await manager.load_backups()
+    assert await manager.get_backups() == {backup.slug: backup}
+
+
 async def test_loading_platforms(
     hass: HomeAssistant,
     caplog: pytest.LogCaptureFixture,
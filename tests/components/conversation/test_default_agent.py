@@ -290,6 +290,112 @@ async def test_trigger_sentences(hass: HomeAssistant, init_components) -> None:
     assert len(callback.mock_calls) == 0
 
 
+async def test_trigger_sentences_unregister_other(
+    hass: HomeAssistant, init_components
+) -> None:
+    """Test unregistering a trigger keeps the other triggers matching."""
+    agent = await conversation._get_agent_manager(hass).async_get_agent(
+        conversation.HOME_ASSISTANT_AGENT
+    )
+    assert isinstance(agent, conversation.DefaultAgent)
+
+    callback_1 = AsyncMock(return_value="first")
+    callback_2 = AsyncMock(return_value="second")
+    unregister_1 = agent.register_trigger(["first trigger"], callback_1)
+    agent.register_trigger(["second trigger {name}"], callback_2)
+
+    result = await conversation.async_converse(
+        hass, "second trigger test", None, Context()
+    )
+    assert result.response.speech["plain"]["speech"] == "second"
+
+    unregister_1()
+    # Registered after the intents of the triggers were built
+    callback_3 = AsyncMock(return_value="third")
+    agent.register_trigger(["third trigger"], callback_3)
+
+    result = await conversation.async_converse(hass, "first trigger", None, Context())
+    assert result.response.response_type == intent.IntentResponseType.ERROR
+    result = await conversation.async_converse(
+        hass, "second trigger test", None, Context()
+    )
+    assert result.response.speech["plain"]["speech"] == "second"
+    assert callback_2.call_args[0][1].entities["name"].value == "test"
+    result = await conversation.async_converse(hass, "third trigger", None, Context())
+    assert result.response.speech["plain"]["speech"] == "third"
+
+    callback_1.assert_not_called()
+    assert callback_2.call_count == 2
+    assert callback_3.call_count == 1
+
+
+async def test_trigger_wildcards_removed_with_last_trigger(
+    hass: HomeAssistant, init_components
+) -> None:
+    """Test the wildcard slot list of triggers is removed with its last trigger."""
+    agent = await conversation._get_agent_manager(hass).async_get_agent(
+        conversation.HOME_ASSISTANT_AGENT
+    )
+    assert isinstance(agent, conversation.DefaultAgent)
+
+    unregister_1 = agent.register_trigger(["play {album}"], AsyncMock())
+    result = await conversation.async_converse(hass, "play test", None, Context())
+    assert result.response.response_type == intent.IntentResponseType.ACTION_DONE
+
+    # Registered after the intents of the triggers were built
+    unregister_2 = agent.register_trigger(["queue {album} next"], AsyncMock())
+    unregister_3 = agent.register_trigger(["open {app}"], AsyncMock())
+    assert agent._trigger_intents is not None
+    assert agent._trigger_intents.slot_lists.keys() == {"album", "app"}
+
+    unregister_1()
+    assert agent._trigger_intents.slot_lists.keys() == {"album", "app"}
+    unregister_3()
+    assert agent._trigger_intents.slot_lists.keys() == {"album"}
+    unregister_2()
+    assert not agent._trigger_intents.slot_lists
+
+
+async def test_slot_lists_updated_incrementally(
+    hass: HomeAssistant, init_components
+) -> None:
+    """Test the name slot list is updated without checking all entities again."""
+    hass.states.async_set("light.kitchen", "off")
+    hass.states.async_set("light.bedroom", "off")
+    expose_entity(hass, "light.kitchen", True)
+    expose_entity(hass, "light.bedroom", True)
+
+    agent = await conversation._get_agent_manager(hass).async_get_agent(
+        conversation.HOME_ASSISTANT_AGENT
+    )
+    assert isinstance(agent, conversation.DefaultAgent)
+
+    def names() -> list[str]:
+        return [value.value_out for value in agent._make_slot_lists()["name"].values]
+
+    assert names() == ["kitchen", "bedroom"]
+
+    with patch(
+        "homeassistant.components.conversation.default_agent.async_should_expose",
+        return_value=True,
+    ) as mock_should_expose:
+        hass.states.async_set("light.hallway", "off")
+        hass.states.async_set(
+            "light.kitchen", "on", {ATTR_FRIENDLY_NAME: "Kitchen ceiling"}
+        )
+        # Changes of the state do not affect the names
+        hass.states.async_set(
+            "light.kitchen", "off", {ATTR_FRIENDLY_NAME: "Kitchen ceiling"}
+        )
+        hass.states.async_remove("light.bedroom")
+        assert names() == ["Kitchen ceiling", "hallway"]
+
+    assert [call.args[2] for call in mock_should_expose.call_args_list] == [
+        "light.hallway",
+        "light.kitchen",
+    ]
+
+
 async def test_shopping_list_add_item(
     hass: HomeAssistant, init_components, sl_setup
 ) -> None:
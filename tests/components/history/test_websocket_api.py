@@ -172,6 +172,68 @@ async def test_history_during_period(
     assert sensor_test_history[2]["a"] == {"any": "attr"}
 
 
+async def test_history_during_period_max_points(
+    recorder_mock: Recorder, hass: HomeAssistant, hass_ws_client: WebSocketGenerator
+) -> None:
+    """Test history_during_period downsamples numeric states with max_points."""
+    start = dt_util.utcnow()
+    end = start + timedelta(seconds=20)
+
+    await async_setup_component(hass, "history", {})
+    await async_recorder_block_till_done(hass)
+    values = [5, 1, 9, 3, 4, 2, 8, 7, 6, 0, 3, 3, 5, 9, 1, 2, 4, 6, 8, 7]
+    for offset, value in enumerate(values):
+        with freeze_time(start + timedelta(seconds=offset, milliseconds=500)):
+            hass.states.async_set("sensor.power", str(value))
+            if offset == 12:
+                hass.states.async_set("sensor.power", "unavailable")
+            await async_recorder_block_till_done(hass)
+    await async_wait_recording_done(hass)
+
+    client = await hass_ws_client()
+    await client.send_json(
+        {
+            "id": 1,
+            "type": "history/history_during_period",
+            "start_time": start.isoformat(),
+            "end_time": end.isoformat(),
+            "entity_ids": ["sensor.power"],
+            "minimal_response": True,
+            "no_attributes": True,
+            "max_points": 8,
+        }
+    )
+    response = await client.receive_json()
+    assert response["success"]
+    # Two buckets of 10 seconds with the first, minimum, maximum and last
+    # state, the unavailable state ends the second bucket and starts a third
+    assert [state["s"] for state in response["result"]["sensor.power"]] == [
+        "5",
+        "9",
+        "0",
+        "3",
+        "5",
+        "unavailable",
+        "9",
+        "1",
+        "7",
+    ]
+
+    await client.send_json(
+        {
+            "id": 2,
+            "type": "history/history_during_period",
+            "start_time": start.isoformat(),
+            "end_time": end.isoformat(),
+            "entity_ids": ["sensor.power"],
+            "max_points": 2,
+        }
+    )
+    response = await client.receive_json()
+    assert not response["success"]
+    assert response["error"]["code"] == "invalid_format"
+
+
 async def test_history_during_period_impossible_conditions(
     recorder_mock: Recorder, hass: HomeAssistant, hass_ws_client: WebSocketGenerator
 ) -> None:
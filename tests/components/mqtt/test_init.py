@@ -1255,6 +1255,51 @@ async def test_subscribe_topic_level_wildcard_and_wildcard_no_match(
     assert len(calls) == 0
 
 
+async def test_subscribe_overlapping_wildcard_topics_and_unsubscribe(
+    hass: HomeAssistant,
+    mqtt_mock_entry: MqttMockHAClientGenerator,
+    calls: list[ReceiveMessage],
+    record_calls: MessageCallbackType,
+) -> None:
+    """Test overlapping wildcard subscriptions keep matching after unsubscribe."""
+    await mqtt_mock_entry()
+    unsub_level = await mqtt.async_subscribe(hass, "home/+/state", record_calls)
+    unsub_subtree = await mqtt.async_subscribe(hass, "home/#", record_calls)
+    await mqtt.async_subscribe(hass, "home/+/+", record_calls)
+    await mqtt.async_subscribe(hass, "home/kitchen/state", record_calls)
+
+    async_fire_mqtt_message(hass, "home/kitchen/state", "test-payload")
+    await hass.async_block_till_done()
+    assert sorted(call.subscribed_topic for call in calls) == [
+        "home/#",
+        "home/+/+",
+        "home/+/state",
+        "home/kitchen/state",
+    ]
+
+    calls.clear()
+    unsub_subtree()
+    async_fire_mqtt_message(hass, "home/kitchen/state", "test-payload")
+    async_fire_mqtt_message(hass, "home", "test-payload")
+    await hass.async_block_till_done()
+    assert sorted(call.subscribed_topic for call in calls) == [
+        "home/+/+",
+        "home/+/state",
+        "home/kitchen/state",
+    ]
+
+    calls.clear()
+    unsub_level()
+    with pytest.raises(HomeAssistantError):
+        unsub_level()
+    async_fire_mqtt_message(hass, "home/kitchen/state", "test-payload")
+    await hass.async_block_till_done()
+    assert sorted(call.subscribed_topic for call in calls) == [
+        "home/+/+",
+        "home/kitchen/state",
+    ]
+
+
 async def test_subscribe_topic_sys_root(
     hass: HomeAssistant,
     mqtt_mock_entry: MqttMockHAClientGenerator,
@@ -1,5 +1,6 @@
 """Test the Profiler config flow."""
 
+import asyncio
 from datetime import timedelta
 from functools import lru_cache
 import logging
@@ -18,6 +19,7 @@ from homeassistant.components.profiler import (
     CONF_ENABLED,
     CONF_SECONDS,
     SERVICE_DUMP_LOG_OBJECTS,
+    SERVICE_LOG_EVENT_BUS_STATS,
     SERVICE_LOG_EVENT_LOOP_SCHEDULED,
     SERVICE_LOG_THREAD_FRAMES,
     SERVICE_LRU_STATS,
@@ -247,6 +249,36 @@ async def test_log_scheduled(
     await hass.async_block_till_done()
 
 
+async def test_log_event_bus_stats(
+    hass: HomeAssistant, caplog: pytest.LogCaptureFixture
+) -> None:
+    """Test we can log event bus statistics."""
+
+    entry = MockConfigEntry(domain=DOMAIN)
+    entry.add_to_hass(hass)
+
+    assert await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+
+    assert hass.services.has_service(DOMAIN, SERVICE_LOG_EVENT_BUS_STATS)
+
+    call_task = hass.async_create_task(
+        hass.services.async_call(
+            DOMAIN, SERVICE_LOG_EVENT_BUS_STATS, {CONF_SECONDS: 0.1}, blocking=True
+        )
+    )
+    await asyncio.sleep(0)
+    hass.bus.async_fire("profiler_test_event")
+    hass.bus.async_fire("profiler_test_event")
+    await call_task
+
+    assert "Event bus stats for profiler_test_event" in caplog.text
+    assert "fired 2 times" in caplog.text
+
+    assert await hass.config_entries.async_unload(entry.entry_id)
+    await hass.async_block_till_done()
+
+
 async def test_lru_stats(hass: HomeAssistant, caplog: pytest.LogCaptureFixture) -> None:
     """Test logging lru stats."""
 
@@ -195,6 +195,71 @@ async def test_view_default_namespace(
     )
 
 
+@pytest.mark.parametrize("namespace", [""])
+async def test_view_openmetrics_gzip(
+    client: ClientSessionGenerator, sensor_entities: dict[str, er.RegistryEntry]
+) -> None:
+    """Test the metrics in the OpenMetrics format with gzip compression."""
+    resp = await client.get(
+        prometheus.API_ENDPOINT,
+        headers={
+            "Accept": "application/openmetrics-text; version=1.0.0",
+            "Accept-Encoding": "gzip",
+        },
+    )
+    assert resp.status == HTTPStatus.OK
+    assert resp.headers["content-type"].startswith("application/openmetrics-text")
+    assert resp.headers["content-encoding"] == "gzip"
+    body = await resp.text()
+    assert body.endswith("\n# EOF\n")
+    assert body.count("# EOF") == 1
+    assert "# HELP python_info Python platform information" in body
+    assert (
+        'sensor_power_kwh{domain="sensor",'
+        'entity="sensor.radio_energy",'
+        'friendly_name="Radio Energy"} 14.0' in body
+    )
+
+
+@pytest.mark.parametrize("namespace", [""])
+async def test_view_renders_changed_families(
+    hass: HomeAssistant,
+    client: ClientSessionGenerator,
+    sensor_entities: dict[str, er.RegistryEntry],
+) -> None:
+    """Test only the metric families which changed are rendered again."""
+    render = prometheus.exposition._render
+    with mock.patch(
+        f"{PROMETHEUS_PATH}.exposition._render", side_effect=render
+    ) as mock_render:
+        await generate_latest_metrics(client)
+        family_count = mock_render.call_count
+        mock_render.reset_mock()
+
+        set_state_with_entry(hass, sensor_entities["sensor_3"], 15)
+        await hass.async_block_till_done()
+        body = await generate_latest_metrics(client)
+        # The global registry, the sensor and the state metrics
+        assert mock_render.call_count == 5
+        assert mock_render.call_count < family_count
+
+        gzip_resp = await client.get(
+            prometheus.API_ENDPOINT, headers={"Accept-Encoding": "gzip"}
+        )
+        assert gzip_resp.headers["content-encoding"] == "gzip"
+        gzip_body = (await gzip_resp.text()).split("\n")
+
+    assert (
+        'sensor_power_kwh{domain="sensor",'
+        'entity="sensor.radio_energy",'
+        'friendly_name="Radio Energy"} 15.0' in body
+    )
+    # The compressed metrics are the same, apart from the process metrics
+    assert [line for line in gzip_body if line.startswith("sensor_")] == [
+        line for line in body if line.startswith("sensor_")
+    ]
+
+
 @pytest.mark.parametrize("namespace", [""])
 async def test_sensor_unit(
     client: ClientSessionGenerator, sensor_entities: dict[str, er.RegistryEntry]
@@ -0,0 +1,221 @@
+"""Test spilling the recorder backlog to disk."""
+
+from dataclasses import dataclass
+from pathlib import Path
+import threading
+from unittest.mock import patch
+
+import pytest
+
+from homeassistant.components.recorder import Recorder, get_instance, history
+from homeassistant.components.recorder.backlog import EventBacklogJournal
+from homeassistant.components.recorder.const import BACKLOG_JOURNAL_FILE
+from homeassistant.components.recorder.tasks import RecorderTask
+from homeassistant.components.recorder.util import session_scope
+from homeassistant.const import EVENT_STATE_CHANGED
+from homeassistant.core import Context, Event, EventOrigin, HomeAssistant, State
+from homeassistant.util import dt as dt_util
+
+from .common import async_wait_recording_done
+
+from tests.typing import RecorderInstanceGenerator
+
+
+def _state_changed_event(entity_id: str, state: str) -> Event:
+    """Return a state_changed event."""
+    return Event(
+        EVENT_STATE_CHANGED,
+        {
+            "entity_id": entity_id,
+            "old_state": None,
+            "new_state": State(entity_id, state, {"unit_of_measurement": "W"}),
+        },
+        context=Context(user_id="abc", parent_id="01HZ4Z6CRNC5W8ZV3GBRDZ3XYW"),
+    )
+
+
+async def test_journal_replays_events_in_order(
+    hass: HomeAssistant, tmp_path: Path
+) -> None:
+    """Test events are replayed in order from disk and from memory."""
+    journal = EventBacklogJournal(hass, str(tmp_path / "backlog"))
+    assert not journal.active
+
+    state_event = _state_changed_event("sensor.power", "5")
+    journal.async_append(state_event)
+    journal.async_append(
+        Event("custom", {"value": 1}, EventOrigin.remote, time_fired_timestamp=10)
+    )
+    await hass.async_add_executor_job(journal.flush)
+    journal.async_append(Event("custom", {"value": 2}))
+    assert journal.active
+    assert len(journal) == 3
+    assert journal.spilled == 3
+
+    events = await hass.async_add_executor_job(journal.read_batch, 2)
+    assert [event.event_type for event in events] == [EVENT_STATE_CHANGED, "custom"]
+    replayed_state = events[0].data["new_state"]
+    original_state = state_event.data["new_state"]
+    assert replayed_state.state == original_state.state
+    assert replayed_state.attributes == original_state.attributes
+    assert replayed_state.last_updated == original_state.last_updated
+    assert replayed_state.last_changed == original_state.last_changed
+    assert events[0].data["old_state"] is None
+    assert events[0].context.user_id == "abc"
+    assert events[0].context.parent_id == "01HZ4Z6CRNC5W8ZV3GBRDZ3XYW"
+    assert events[0].context.id == state_event.context.id
+    assert events[0].time_fired_timestamp == state_event.time_fired_timestamp
+    assert events[1].origin is EventOrigin.remote
+    assert events[1].time_fired_timestamp == 10
+    assert journal.active
+
+    events = await hass.async_add_executor_job(journal.read_batch, 2)
+    assert [event.data for event in events] == [{"value": 2}]
+    assert not journal.active
+    assert len(journal) == 0
+    assert not (tmp_path / "backlog").exists()
+
+
+async def test_journal_resumes_after_restart(
+    hass: HomeAssistant, tmp_path: Path
+) -> None:
+    """Test events which were not replayed are kept across restarts."""
+    path = str(tmp_path / "backlog")
+    journal = EventBacklogJournal(hass, path)
+    for value in range(5):
+        journal.async_append(Event("custom", {"value": value}))
+    await hass.async_add_executor_job(journal.flush)
+    events = await hass.async_add_executor_job(journal.read_batch, 2)
+    assert [event.data["value"] for event in events] == [0, 1]
+    journal.async_append(Event("custom", {"value": 5}))
+    await hass.async_add_executor_job(journal.close)
+
+    journal = EventBacklogJournal(hass, path)
+    await hass.async_add_executor_job(journal.load)
+    assert journal.active
+    assert len(journal) == 4
+    events = await hass.async_add_executor_job(journal.read_batch, 10)
+    assert [event.data["value"] for event in events] == [2, 3, 4, 5]
+    assert not journal.active
+
+    await hass.async_add_executor_job(journal.close)
+    journal = EventBacklogJournal(hass, path)
+    await hass.async_add_executor_job(journal.load)
+    assert not journal.active
+
+
+async def test_recorder_spills_backlog_to_disk(
+    recorder_mock: Recorder, hass: HomeAssistant
+) -> None:
+    """Test the recorder records events which were spilled to disk."""
+    instance = get_instance(hass)
+    start = dt_util.utcnow()
+    with patch("homeassistant.components.recorder.core.BACKLOG_SPILL_THRESHOLD", 0):
+        for value in range(10):
+            hass.states.async_set("sensor.power", str(value))
+        await hass.async_block_till_done()
+    assert instance.backlog_journal.spilled == 10
+
+    while instance.backlog_journal.active:
+        await async_wait_recording_done(hass)
+    await async_wait_recording_done(hass)
+
+    assert instance.backlog_journal.replayed == 10
+    assert instance.backlog_journal.replay_rate
+    with session_scope(hass=hass, read_only=True) as session:
+        states = history.get_significant_states_with_session(
+            hass, session, start, entity_ids=["sensor.power"]
+        )
+    assert [state.state for state in states["sensor.power"]] == [
+        str(value) for value in range(10)
+    ]
+
+
+@dataclass(slots=True)
+class _BlockingTask(RecorderTask):
+    """Block the recorder thread until released."""
+
+    release: threading.Event
+    commit_before = False
+
+    def run(self, instance: Recorder) -> None:
+        """Handle the task."""
+        self.release.wait(5)
+
+
+async def test_tasks_run_after_spilled_events(
+    recorder_mock: Recorder, hass: HomeAssistant
+) -> None:
+    """Test tasks queued while events are spilled run after those events."""
+    instance = get_instance(hass)
+    start = dt_util.utcnow()
+    release = threading.Event()
+    instance.queue_task(_BlockingTask(release))
+    with patch("homeassistant.components.recorder.core.BACKLOG_SPILL_THRESHOLD", 0):
+        for value in range(5):
+            hass.states.async_set("sensor.power", str(value))
+        await hass.async_block_till_done()
+        assert instance.backlog_journal.active
+        # The entity is renamed after the spilled states were recorded
+        instance.async_update_states_metadata("sensor.power", "sensor.energy")
+    release.set()
+
+    # Waiting also waits for the spilled events to be recorded
+    await instance.async_block_till_done()
+    assert not instance.backlog_journal.active
+    with session_scope(hass=hass, read_only=True) as session:
+        states = history.get_significant_states_with_session(
+            hass, session, start, entity_ids=["sensor.energy", "sensor.power"]
+        )
+    assert [state.state for state in states["sensor.energy"]] == [
+        str(value) for value in range(5)
+    ]
+    assert "sensor.power" not in states
+
+
+async def test_recorder_resumes_journal_before_queueing(
+    async_setup_recorder_instance: RecorderInstanceGenerator,
+    hass: HomeAssistant,
+    tmp_path: Path,
+) -> None:
+    """Test events of the last run are recorded before new events."""
+    hass.config.config_dir = str(tmp_path)
+    journal = EventBacklogJournal(hass, hass.config.path(BACKLOG_JOURNAL_FILE))
+    journal.async_append(_state_changed_event("sensor.power", "old"))
+    await hass.async_add_executor_job(journal.close)
+
+    journal_active = []
+    async_initialize = Recorder.async_initialize
+
+    def _async_initialize(instance: Recorder) -> None:
+        journal_active.append(instance.backlog_journal.active)
+        async_initialize(instance)
+
+    with patch.object(Recorder, "async_initialize", _async_initialize):
+        instance = await async_setup_recorder_instance(hass)
+
+    # New events are spilled behind the events of the last run
+    assert journal_active == [True]
+    while instance.backlog_journal.active:
+        await async_wait_recording_done(hass)
+    await async_wait_recording_done(hass)
+    # The event of the last run and the events since the start
+    assert instance.backlog_journal.replayed == instance.backlog_journal.spilled + 1
+
+
+async def test_recorder_stops_when_journal_is_full(
+    recorder_mock: Recorder, hass: HomeAssistant, caplog: pytest.LogCaptureFixture
+) -> None:
+    """Test the recorder stops recording once too many events were spilled."""
+    instance = get_instance(hass)
+    queue_size = instance.backlog
+    with patch.object(EventBacklogJournal, "__len__", return_value=10), patch(
+        "homeassistant.components.recorder.core.BACKLOG_JOURNAL_MAX_EVENTS", 10
+    ):
+        # Spilled events are part of the backlog
+        assert instance.backlog >= 10
+        instance._async_check_queue()
+
+    assert "to avoid running out of disk space" in caplog.text
+    assert not instance.recording
+    assert queue_size < 10
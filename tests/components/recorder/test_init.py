@@ -374,6 +374,8 @@ def test_saving_state_with_exception(
 ) -> None:
     """Test saving and restoring a state."""
     hass = hass_recorder()
+    # States only go through the session when bulk inserts are disabled
+    get_instance(hass).bulk_insert_writer = None
 
     entity_id = "test.recorder"
     state = "restoring_from_db"
@@ -416,6 +418,8 @@ def test_saving_state_with_sqlalchemy_exception(
 ) -> None:
     """Test saving state when there is an SQLAlchemyError."""
     hass = hass_recorder()
+    # States only go through the session when bulk inserts are disabled
+    get_instance(hass).bulk_insert_writer = None
 
     entity_id = "test.recorder"
     state = "restoring_from_db"
@@ -451,6 +455,88 @@ def test_saving_state_with_sqlalchemy_exception(
     assert "SQLAlchemyError error processing task" not in caplog.text
 
 
+def test_saving_state_with_exception_bulk_insert(
+    hass_recorder: Callable[..., HomeAssistant],
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    """Test saving a state when the bulk insert fails."""
+    hass = hass_recorder()
+    instance = get_instance(hass)
+    assert instance.bulk_insert_writer is not None
+
+    entity_id = "test.recorder"
+    attributes = {"test_attr": 5, "test_attr_10": "nice"}
+
+    with patch("time.sleep"), patch.object(
+        instance.bulk_insert_writer,
+        "write",
+        side_effect=OperationalError(
+            "insert the state", "fake params", "forced to fail"
+        ),
+    ):
+        hass.states.set(entity_id, "fail", attributes)
+        wait_recording_done(hass)
+
+    assert "Error executing query" in caplog.text
+
+    caplog.clear()
+    hass.states.set(entity_id, "restoring_from_db", attributes)
+    wait_recording_done(hass)
+
+    with session_scope(hass=hass, read_only=True) as session:
+        db_states = list(session.query(States))
+        assert len(db_states) == 1
+        assert db_states[0].state == "restoring_from_db"
+        assert db_states[0].old_state_id is None
+
+    assert "Error executing query" not in caplog.text
+
+
+def test_bulk_insert_retry_does_not_insert_rows_again(
+    hass_recorder: Callable[..., HomeAssistant],
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    """Test retrying a failed bulk insert does not write the inserted rows twice."""
+    hass = hass_recorder()
+    instance = get_instance(hass)
+    assert instance.bulk_insert_writer is not None
+    session = instance.event_session
+    commit = session.commit
+    failed = False
+
+    def _commit() -> None:
+        nonlocal failed
+        if not failed:
+            # The rows were already inserted in the transaction
+            failed = True
+            raise OperationalError("commit", "fake params", "forced to fail")
+        commit()
+
+    with patch("time.sleep"), patch.object(session, "commit", _commit):
+        hass.bus.fire("test_event", {"some": "data"})
+        hass.states.set("test.recorder", "on", {"test_attr": 5})
+        wait_recording_done(hass)
+
+    assert failed
+    assert "Error executing query" in caplog.text
+    with session_scope(hass=hass, read_only=True) as read_session:
+        assert read_session.query(States).count() == 1
+        assert read_session.query(StateAttributes).count() == 1
+        assert (
+            read_session.query(EventData)
+            .filter(EventData.shared_data == '{"some":"data"}')
+            .count()
+            == 1
+        )
+        assert (
+            read_session.query(Events)
+            .join(EventTypes)
+            .filter(EventTypes.event_type == "test_event")
+            .count()
+            == 1
+        )
+
+
 async def test_force_shutdown_with_queue_of_writes_that_generate_exceptions(
     async_setup_recorder_instance: RecorderInstanceGenerator,
     hass: HomeAssistant,
@@ -1393,6 +1479,56 @@ def test_saving_sets_old_state(hass_recorder: Callable[..., HomeAssistant]) -> N
         assert states_by_state["s4"].old_state_id == states_by_state["s2"].state_id
 
 
+@pytest.mark.parametrize("bulk_insert", [True, False])
+def test_saving_sets_old_state_inside_commit_interval(
+    hass_recorder: Callable[..., HomeAssistant], bulk_insert: bool
+) -> None:
+    """Test saving sets old state for states written in the same commit."""
+    hass = hass_recorder()
+    if not bulk_insert:
+        get_instance(hass).bulk_insert_writer = None
+
+    attributes = {"test_attr": 5}
+    hass.states.set("test.one", "s1", attributes)
+    hass.states.set("test.two", "s2", attributes)
+    hass.states.set("test.one", "s3", attributes)
+    hass.states.set("test.one", "s4", {"test_attr": 6})
+    hass.states.set("test.two", "s5", attributes)
+    wait_recording_done(hass)
+    hass.states.set("test.one", "s6", attributes)
+    hass.states.remove("test.two")
+    wait_recording_done(hass)
+
+    with session_scope(hass=hass, read_only=True) as session:
+        states = list(
+            session.query(
+                StatesMeta.entity_id,
+                States.state_id,
+                States.old_state_id,
+                States.state,
+                States.attributes_id,
+            ).outerjoin(StatesMeta, States.metadata_id == StatesMeta.metadata_id)
+        )
+        assert len(states) == 7
+        states_by_state = {state.state: state for state in states}
+
+        assert states_by_state["s1"].old_state_id is None
+        assert states_by_state["s2"].old_state_id is None
+        assert states_by_state["s3"].old_state_id == states_by_state["s1"].state_id
+        assert states_by_state["s4"].old_state_id == states_by_state["s3"].state_id
+        assert states_by_state["s5"].old_state_id == states_by_state["s2"].state_id
+        assert states_by_state["s6"].old_state_id == states_by_state["s4"].state_id
+        assert states_by_state[None].entity_id == "test.two"
+        assert states_by_state[None].old_state_id == states_by_state["s5"].state_id
+
+        assert (
+            states_by_state["s4"].attributes_id != states_by_state["s1"].attributes_id
+        )
+        assert {
+            states_by_state[state].attributes_id for state in ("s1", "s2", "s3", "s5")
+        } == {states_by_state["s6"].attributes_id}
+
+
 def test_saving_state_with_serializable_data(
     hass_recorder: Callable[..., HomeAssistant], caplog: pytest.LogCaptureFixture
 ) -> None:
@@ -3,7 +3,7 @@
 from datetime import datetime, timedelta
 import json
 import sqlite3
-from unittest.mock import patch
+from unittest.mock import ANY, patch
 
 from freezegun import freeze_time
 import pytest
@@ -23,7 +23,7 @@ from homeassistant.components.recorder.db_schema import (
     StatisticsShortTerm,
 )
 from homeassistant.components.recorder.history import get_significant_states
-from homeassistant.components.recorder.purge import purge_old_data
+from homeassistant.components.recorder.purge import PurgeScheduler, purge_old_data
 from homeassistant.components.recorder.queries import select_event_type_ids
 from homeassistant.components.recorder.services import (
     SERVICE_PURGE,
@@ -101,6 +101,80 @@ async def test_purge_big_database(
         assert state_attributes.count() == 1
 
 
+async def test_purge_runs_sized_by_scheduler(
+    async_setup_recorder_instance: RecorderInstanceGenerator, hass: HomeAssistant
+) -> None:
+    """Test purge runs stop once their time budget is used up."""
+    instance = await async_setup_recorder_instance(hass)
+    scheduler = instance.purge_scheduler
+
+    for _ in range(12):
+        await _add_test_states(hass, wait_recording_done=False)
+    await async_wait_recording_done(hass)
+
+    with (
+        patch.object(instance, "max_bind_vars", 8),
+        patch.object(instance.database_engine, "max_bind_vars", 8),
+        patch("homeassistant.components.recorder.purge.PURGE_RUN_TIME_BUDGET", 0),
+        session_scope(hass=hass) as session,
+    ):
+        states = session.query(States)
+        assert states.count() == 72
+
+        purge_before = dt_util.utcnow() - timedelta(days=4)
+        assert not purge_old_data(instance, purge_before, repack=False)
+        assert states.count() == 64
+        assert scheduler.running
+        assert scheduler.runs == 1
+        assert scheduler.states_purged == 8
+        assert scheduler.batch_seconds > 0
+
+        while not purge_old_data(instance, purge_before, repack=False):
+            pass
+        assert states.count() == 24
+        assert scheduler.as_dict() | {"batch_seconds": None} == {
+            "running": False,
+            "purge_before": purge_before,
+            "runs": 7,
+            "states_purged": 48,
+            "events_purged": 0,
+            "estimated_remaining": 0,
+            "batch_seconds": None,
+        }
+
+
+def test_purge_scheduler_batches_and_estimate() -> None:
+    """Test the batches of a run and the estimate of the rows left to purge."""
+    scheduler = PurgeScheduler()
+    assert scheduler.batches(20, 0) == 20
+    scheduler.batch_done(0.5)
+    assert scheduler.batches(20, 0) == 2
+    scheduler.batch_done(1.5)
+    assert scheduler.batch_seconds == pytest.approx(0.8)
+    assert scheduler.batches(20, 0) == 1
+    scheduler.batch_seconds = 0.001
+    assert scheduler.batches(20, 0) == 20
+    # Only a single batch is purged while the recorder is behind
+    assert scheduler.batches(20, 5000) == 1
+
+    purge_before = datetime(2024, 1, 11, tzinfo=dt_util.UTC)
+    start_ts = purge_before.timestamp() - 10 * 86400
+    with patch(
+        "homeassistant.components.recorder.purge._oldest_ts",
+        return_value=(start_ts, start_ts),
+    ):
+        scheduler.start_run(None, purge_before, True)
+    scheduler.states_purged = 100
+    scheduler.events_purged = 10
+    with patch(
+        "homeassistant.components.recorder.purge._oldest_ts",
+        return_value=(start_ts + 86400, start_ts + 2 * 86400),
+    ):
+        scheduler.finish_run(None, False)
+    # 100 states per day for 9 days and 5 events per day for 8 days
+    assert scheduler.estimated_remaining == 940
+
+
 async def test_purge_old_states(
     async_setup_recorder_instance: RecorderInstanceGenerator, hass: HomeAssistant
 ) -> None:
@@ -261,7 +335,7 @@ async def test_purge_old_states_encounters_operational_error(
     caplog: pytest.LogCaptureFixture,
 ) -> None:
     """Test error on operational errors that are not mysql does not retry."""
-    await async_setup_recorder_instance(hass)
+    instance = await async_setup_recorder_instance(hass)
 
     await _add_test_states(hass)
     await async_wait_recording_done(hass)
@@ -279,6 +353,16 @@ async def test_purge_old_states_encounters_operational_error(
 
     assert "retrying" not in caplog.text
     assert "Error executing purge" in caplog.text
+    # The failed run is not reported as running
+    assert instance.purge_scheduler.as_dict() == {
+        "running": False,
+        "purge_before": None,
+        "runs": 0,
+        "states_purged": 0,
+        "events_purged": 0,
+        "estimated_remaining": None,
+        "batch_seconds": ANY,
+    }
 
 
 async def test_purge_old_events(
@@ -36,6 +36,24 @@ async def test_recorder_system_health(
     }
 
 
+async def test_recorder_system_health_spilled_events(
+    recorder_mock: Recorder, hass: HomeAssistant, recorder_db_url: str
+) -> None:
+    """Test recorder system health reports events spilled to disk."""
+    if recorder_db_url.startswith(("mysql://", "postgresql://")):
+        # This test is specific for SQLite
+        return
+
+    assert await async_setup_component(hass, "system_health", {})
+    await async_wait_recording_done(hass)
+    backlog_journal = get_instance(hass).backlog_journal
+    backlog_journal.spilled = 20
+    backlog_journal.record_replay(20, 0.5)
+    info = await get_system_health_info(hass, "recorder")
+    assert info["spilled_events"] == 0
+    assert info["spilled_events_replay_rate"] == "40 events/s"
+
+
 @pytest.mark.parametrize(
     "dialect_name", [SupportedDialect.MYSQL, SupportedDialect.POSTGRESQL]
 )
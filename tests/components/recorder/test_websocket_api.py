@@ -31,6 +31,7 @@ from homeassistant.util.unit_system import METRIC_SYSTEM, US_CUSTOMARY_SYSTEM
 
 from .common import (
     async_recorder_block_till_done,
+    async_wait_purge_done,
     async_wait_recording_done,
     create_engine_test,
     do_adhoc_statistics,
@@ -2095,6 +2096,46 @@ async def test_recorder_info(
     }
 
 
+async def test_recorder_purge_progress(
+    recorder_mock: Recorder, hass: HomeAssistant, hass_ws_client: WebSocketGenerator
+) -> None:
+    """Test getting the progress of the purge."""
+    client = await hass_ws_client()
+
+    await client.send_json_auto_id({"type": "recorder/purge_progress"})
+    response = await client.receive_json()
+    assert response["success"]
+    assert response["result"] == {
+        "running": False,
+        "purge_before": None,
+        "runs": 0,
+        "states_purged": 0,
+        "events_purged": 0,
+        "estimated_remaining": None,
+        "batch_seconds": None,
+    }
+
+    hass.states.async_set("sensor.test", "1")
+    await async_wait_recording_done(hass)
+    await hass.services.async_call(
+        recorder.DOMAIN, "purge", {"keep_days": 0}, blocking=True
+    )
+    await async_wait_purge_done(hass)
+
+    await client.send_json_auto_id({"type": "recorder/purge_progress"})
+    response = await client.receive_json()
+    assert response["success"]
+    assert response["result"] == {
+        "running": False,
+        "purge_before": ANY,
+        "runs": 1,
+        "states_purged": 1,
+        "events_purged": ANY,
+        "estimated_remaining": 0,
+        "batch_seconds": ANY,
+    }
+
+
 async def test_recorder_info_no_recorder(
     hass: HomeAssistant, hass_ws_client: WebSocketGenerator
 ) -> None:
@@ -588,3 +588,46 @@ async def test_ws_api(hass: HomeAssistant, hass_ws_client: WebSocketGenerator) -
         "config_entry": [hue_config_entry.entry_id],
         "area": [kitchen_area.id],
     }
+
+
+async def test_reference_graph_updates(hass: HomeAssistant) -> None:
+    """Test the reference graph follows changes of referencing entities."""
+    assert await async_setup_component(hass, "search", {})
+    assert await async_setup_component(
+        hass,
+        "group",
+        {"group": {"kitchen": {"entities": ["light.ceiling"]}}},
+    )
+    await hass.async_block_till_done()
+
+    device_reg = dr.async_get(hass)
+    entity_reg = er.async_get(hass)
+    graph = hass.data[search.DOMAIN]
+
+    def search_light() -> dict[str, set[str]]:
+        searcher = search.Searcher(
+            hass, device_reg, entity_reg, MOCK_ENTITY_SOURCES, graph
+        )
+        return searcher.async_search("entity", "light.ceiling")
+
+    assert search_light() == {"group": {"group.kitchen"}}
+
+    await hass.services.async_call(
+        "group",
+        "set",
+        {"object_id": "living_room", "entities": ["light.ceiling"]},
+        blocking=True,
+    )
+    assert search_light() == {"group": {"group.kitchen", "group.living_room"}}
+
+    await hass.services.async_call(
+        "group",
+        "set",
+        {"object_id": "kitchen", "entities": ["light.counter"]},
+        blocking=True,
+    )
+    await hass.services.async_call(
+        "group", "remove", {"object_id": "living_room"}, blocking=True
+    )
+    assert search_light() == {}
+    assert graph.async_referenced_by("entity", "light.counter") == {"group.kitchen"}
@@ -34,6 +34,7 @@ from homeassistant.components.recorder.statistics import (
 )
 from homeassistant.components.recorder.util import get_instance, session_scope
 from homeassistant.components.sensor import ATTR_OPTIONS, SensorDeviceClass
+from homeassistant.components.sensor.recorder import compile_statistics
 from homeassistant.const import ATTR_FRIENDLY_NAME, STATE_UNAVAILABLE
 from homeassistant.core import HomeAssistant, State
 from homeassistant.setup import async_setup_component, setup_component
@@ -196,6 +197,75 @@ def test_compile_hourly_statistics(
     assert "Error while processing event StatisticsTask" not in caplog.text
 
 
+def test_compile_statistics_from_state_rows(
+    hass_recorder: Callable[..., HomeAssistant], caplog: pytest.LogCaptureFixture
+) -> None:
+    """Test compiling from state rows matches compiling from states."""
+    zero = dt_util.utcnow()
+    attributes = {"state_class": "measurement", "unit_of_measurement": "W"}
+    with freeze_time(zero - timedelta(minutes=1)) as freezer:
+        hass = hass_recorder()
+        setup_component(hass, "sensor", {})
+        wait_recording_done(hass)  # Wait for the sensor recorder platform
+        # A state before the period, which counts from the start of the period
+        freezer.move_to(zero - timedelta(seconds=30))
+        hass.states.set("sensor.before", "12", attributes)
+        hass.states.set("sensor.unit_change", "1.5", attributes)
+        record_states(hass, freezer, zero, "sensor.test1", attributes)
+        record_states(
+            hass, freezer, zero, "sensor.unavailable", attributes, [5, "-", 17]
+        )
+        record_states(hass, freezer, zero, "sensor.before", attributes, [1, 2, 3])
+        record_states(
+            hass,
+            freezer,
+            zero,
+            "sensor.unit_change",
+            {**attributes, "unit_of_measurement": "kW"},
+        )
+        freezer.move_to(zero + timedelta(minutes=2))
+        hass.states.set("sensor.not_numeric", "on", attributes)
+        wait_recording_done(hass)
+
+    def _compile(vectorized: bool) -> dict[str, dict]:
+        with (
+            patch(
+                "homeassistant.components.sensor.recorder.VECTORIZED_STATISTICS",
+                vectorized,
+            ),
+            session_scope(hass=hass, read_only=True) as session,
+        ):
+            compiled = compile_statistics(
+                hass, session, zero, zero + timedelta(minutes=5)
+            )
+        return {
+            result["meta"]["statistic_id"]: {
+                **result["stat"],
+                "unit": result["meta"]["unit_of_measurement"],
+            }
+            for result in compiled.platform_stats
+        }
+
+    from_states = _compile(vectorized=False)
+    assert _compile(vectorized=False) == from_states
+    # Falling back to compiling from states is only logged once
+    assert caplog.text.count("NumPy is not installed") == 1
+    from_rows = _compile(vectorized=True)
+    assert set(from_states) == {
+        "sensor.before",
+        "sensor.test1",
+        "sensor.unavailable",
+        "sensor.unit_change",
+    }
+    assert from_rows == {
+        statistic_id: {
+            key: pytest.approx(value) if isinstance(value, float) else value
+            for key, value in stat.items()
+        }
+        for statistic_id, stat in from_states.items()
+    }
+
+
 @pytest.mark.parametrize(
     (
         "device_class",
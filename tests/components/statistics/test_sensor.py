@@ -30,7 +30,7 @@ from homeassistant.const import (
     UnitOfEnergy,
     UnitOfTemperature,
 )
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, State
 from homeassistant.helpers import entity_registry as er
 from homeassistant.setup import async_setup_component
 from homeassistant.util import dt as dt_util
@@ -1432,6 +1432,67 @@ async def test_state_characteristic_mean_circular(hass: HomeAssistant) -> None:
     )
 
 
+@pytest.mark.parametrize(
+    ("characteristic", "expected_fn"),
+    [
+        ("mean", statistics.mean),
+        ("median", statistics.median),
+        ("standard_deviation", statistics.stdev),
+        ("variance", statistics.variance),
+        ("value_max", max),
+        ("value_min", min),
+        ("sum", sum),
+        (
+            "percentile",
+            lambda values: statistics.quantiles(values, n=100, method="exclusive")[89],
+        ),
+        (
+            "sum_differences",
+            lambda values: sum(abs(j - i) for i, j in zip(values, values[1:])),
+        ),
+        (
+            "sum_differences_nonnegative",
+            lambda values: sum(
+                (j - i if j >= i else j) for i, j in zip(values, values[1:])
+            ),
+        ),
+    ],
+)
+async def test_state_characteristics_after_buffer_overflow(
+    characteristic: str, expected_fn: Any
+) -> None:
+    """Test the incremental characteristics match a recalculation over the window."""
+    sensor = StatisticsSensor(
+        "sensor.test_monitored",
+        "test",
+        None,
+        characteristic,
+        7,
+        None,
+        False,
+        6,
+        90,
+    )
+    start = dt_util.utcnow()
+    for i in range(50):
+        value = (i * 37 % 23) - 4.5 + (i % 3) * 0.125
+        sensor._add_state_to_queue(
+            State(
+                "sensor.test_monitored",
+                str(value),
+                last_updated=start + timedelta(seconds=i * (i % 4 + 1)),
+            )
+        )
+        sensor._update_value()
+        if i == 0:
+            continue
+        expected = round(expected_fn(list(sensor.states)), 6)
+        assert sensor._value == pytest.approx(expected), (
+            f"value mismatch for characteristic '{characteristic}' "
+            f"after {i + 1} samples - assert {sensor._value} == {expected}"
+        )
+
+
 async def test_invalid_state_characteristic(hass: HomeAssistant) -> None:
     """Test the detection of wrong state_characteristics selected."""
     assert await async_setup_component(
@@ -10,8 +10,11 @@ import pytest
 from pytest_unordered import unordered
 
 from homeassistant.bootstrap import async_setup_component
-from homeassistant.components.trace.const import DEFAULT_STORED_TRACES
-from homeassistant.const import EVENT_HOMEASSISTANT_STOP
+from homeassistant.components.trace.const import (
+    DATA_TRACE_RUN_COUNTS,
+    DEFAULT_STORED_TRACES,
+)
+from homeassistant.const import EVENT_HOMEASSISTANT_STOP, SERVICE_RELOAD
 from homeassistant.core import Context, CoreState, HomeAssistant, callback
 from homeassistant.helpers.typing import UNDEFINED
 from homeassistant.util.uuid import random_uuid_hex
@@ -774,6 +777,110 @@ async def test_trace_no_traces(
     assert len(_find_traces(response["result"], domain, "sun")) == 0
 
 
+@pytest.mark.parametrize("domain", ["automation", "script"])
+@pytest.mark.parametrize(
+    ("trace_config", "script_execution"),
+    [
+        ({"mode": "full"}, ["finished", "aborted", "finished", "aborted", "finished"]),
+        ({"mode": "off"}, []),
+        ({"mode": "sampled", "sample_every": 3}, ["finished", "aborted"]),
+        ({"mode": "errors"}, ["aborted", "aborted"]),
+    ],
+)
+async def test_trace_mode(
+    hass: HomeAssistant,
+    hass_ws_client: WebSocketGenerator,
+    domain,
+    trace_config,
+    script_execution,
+) -> None:
+    """Test which runs of a script or automation are traced in each trace mode."""
+    id = 1
+
+    def next_id():
+        nonlocal id
+        id += 1
+        return id
+
+    sun_config = {
+        "id": "sun",
+        "trigger": {"platform": "event", "event_type": "test_event"},
+        "action": [
+            {"event": "some_event"},
+            {
+                "if": {
+                    "condition": "template",
+                    "value_template": "{{ is_state('input_boolean.fail', 'on') }}",
+                },
+                "then": {"stop": "Failed", "error": True},
+            },
+        ],
+        "trace": trace_config,
+    }
+    if domain == "script":
+        configs = {"sun": {"sequence": sun_config["action"], "trace": trace_config}}
+    else:
+        configs = [sun_config]
+    assert await async_setup_component(hass, domain, {domain: configs})
+
+    client = await hass_ws_client()
+
+    for run in range(5):
+        hass.states.async_set("input_boolean.fail", "on" if run % 2 else "off")
+        await _run_automation_or_script(hass, domain, sun_config, "test_event")
+        await hass.async_block_till_done()
+
+    await client.send_json({"id": next_id(), "type": "trace/list", "domain": domain})
+    response = await client.receive_json()
+    assert response["success"]
+    traces = _find_traces(response["result"], domain, "sun")
+    assert [trace["script_execution"] for trace in traces] == script_execution
+
+    # Stored traces have their trace elements recorded
+    for trace in traces:
+        await client.send_json(
+            {
+                "id": next_id(),
+                "type": "trace/get",
+                "domain": domain,
+                "item_id": "sun",
+                "run_id": trace["run_id"],
+            }
+        )
+        response = await client.receive_json()
+        assert response["success"]
+        assert response["result"]["trace"]
+
+
+@pytest.mark.parametrize("domain", ["automation", "script"])
+async def test_trace_run_count_removed(hass: HomeAssistant, domain) -> None:
+    """Test the run count of a sampled script or automation is removed with it."""
+    trace_config = {"mode": "sampled", "sample_every": 3}
+    sun_config = {
+        "id": "sun",
+        "trigger": {"platform": "event", "event_type": "test_event"},
+        "action": {"event": "some_event"},
+        "trace": trace_config,
+    }
+    if domain == "script":
+        configs = {"sun": {"sequence": sun_config["action"], "trace": trace_config}}
+    else:
+        configs = [sun_config]
+    assert await async_setup_component(hass, domain, {domain: configs})
+
+    await _run_automation_or_script(hass, domain, sun_config, "test_event")
+    await hass.async_block_till_done()
+    assert hass.data[DATA_TRACE_RUN_COUNTS] == {f"{domain}.sun": 1}
+
+    with patch(
+        "homeassistant.config.load_yaml_config_file",
+        autospec=True,
+        return_value={domain: {} if domain == "script" else []},
+    ):
+        await hass.services.async_call(domain, SERVICE_RELOAD, blocking=True)
+    assert hass.data[DATA_TRACE_RUN_COUNTS] == {}
+
+
 @pytest.mark.parametrize(
     ("domain", "prefix", "trigger", "last_step", "script_execution"),
     [
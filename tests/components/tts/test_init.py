@@ -37,7 +37,7 @@ from .common import (
     retrieve_media,
 )
 
-from tests.common import async_mock_service, mock_restore_cache
+from tests.common import async_fire_time_changed, async_mock_service, mock_restore_cache
 from tests.typing import ClientSessionGenerator, WebSocketGenerator
 
 ORIG_WRITE_TAGS = tts.SpeechManager.write_tags
@@ -1234,6 +1234,143 @@ async def test_load_cache_retrieve_without_mem_cache(
     assert await req.read() == tts_data
 
 
+async def test_load_cache_retrieve_range(
+    hass: HomeAssistant,
+    mock_tts_entity: MockTTSEntity,
+    mock_tts_cache_dir,
+    hass_client: ClientSessionGenerator,
+) -> None:
+    """Set up component and stream a range of a file from the cache."""
+    cache_file = mock_tts_cache_dir / (
+        "42f18378fd4393d18c8dd11d03fa9563c1e54491_en-us_-_tts.test.mp3"
+    )
+    cache_file.write_bytes(b"0123456789")
+
+    await mock_config_entry_setup(hass, mock_tts_entity)
+
+    client = await hass_client()
+
+    url = "/api/tts_proxy/42f18378fd4393d18c8dd11d03fa9563c1e54491_en-us_-_tts.test.mp3"
+
+    req = await client.get(url, headers={"Range": "bytes=2-5"})
+    assert req.status == HTTPStatus.PARTIAL_CONTENT
+    assert await req.read() == b"2345"
+    # Voices in the file cache are streamed and not loaded into memory
+    assert hass.data[tts.DATA_TTS_MANAGER].mem_cache == {}
+
+    cache_file.unlink()
+    req = await client.get(url)
+    assert req.status == HTTPStatus.NOT_FOUND
+
+
+async def test_load_cache_from_index(
+    hass: HomeAssistant,
+    hass_storage: dict[str, Any],
+    mock_tts_entity: MockTTSEntity,
+    mock_tts_cache_dir,
+    mock_tts_get_cache_files: MagicMock,
+    hass_client: ClientSessionGenerator,
+) -> None:
+    """Set up component with the index of the file cache."""
+    filename = "42f18378fd4393d18c8dd11d03fa9563c1e54491_en-us_-_tts.test.mp3"
+    (mock_tts_cache_dir / filename).write_bytes(b"voice")
+    hass_storage[tts.CACHE_INDEX_STORAGE_KEY] = {
+        "version": tts.CACHE_INDEX_STORAGE_VERSION,
+        "data": {
+            "cache_dir": str(mock_tts_cache_dir),
+            "mtime": mock_tts_cache_dir.stat().st_mtime_ns,
+            "files": [[filename.removesuffix(".mp3"), filename, 5]],
+        },
+    }
+
+    await mock_config_entry_setup(hass, mock_tts_entity)
+
+    # The cache directory is not listed
+    mock_tts_get_cache_files.assert_not_called()
+
+    client = await hass_client()
+    req = await client.get(f"/api/tts_proxy/{filename}")
+    assert req.status == HTTPStatus.OK
+    assert await req.read() == b"voice"
+
+
+async def test_load_cache_with_outdated_index(
+    hass: HomeAssistant,
+    hass_storage: dict[str, Any],
+    mock_tts_entity: MockTTSEntity,
+    mock_tts_cache_dir,
+    mock_tts_get_cache_files: MagicMock,
+) -> None:
+    """Test the cache directory is listed if it changed after saving the index."""
+    filename = "42f18378fd4393d18c8dd11d03fa9563c1e54491_en-us_-_tts.test.mp3"
+    (mock_tts_cache_dir / filename).write_bytes(b"voice")
+    hass_storage[tts.CACHE_INDEX_STORAGE_KEY] = {
+        "version": tts.CACHE_INDEX_STORAGE_VERSION,
+        "data": {
+            "cache_dir": str(mock_tts_cache_dir),
+            "mtime": mock_tts_cache_dir.stat().st_mtime_ns - 1,
+            "files": [],
+        },
+    }
+
+    await mock_config_entry_setup(hass, mock_tts_entity)
+
+    mock_tts_get_cache_files.assert_called_once()
+    assert hass.data[tts.DATA_TTS_MANAGER].file_cache == {
+        filename.removesuffix(".mp3"): filename
+    }
+
+
+async def test_mem_cache_evicts_least_recently_used(
+    hass: HomeAssistant, mock_tts_entity: MockTTSEntity
+) -> None:
+    """Test the least recently used voices are removed from memory."""
+    await mock_config_entry_setup(hass, mock_tts_entity)
+    manager = hass.data[tts.DATA_TTS_MANAGER]
+
+    with patch("homeassistant.components.tts.MEM_CACHE_MAX_SIZE", 10):
+        manager._async_store_to_memcache("key_1", "key_1.mp3", b"1234")
+        manager._async_store_to_memcache("key_2", "key_2.mp3", b"1234")
+        manager._async_use_mem_cache("key_1")
+        manager._async_store_to_memcache("key_3", "key_3.mp3", b"1234")
+
+    assert list(manager.mem_cache) == ["key_1", "key_3"]
+    assert manager.mem_cache_size == 8
+
+
+async def test_file_cache_evicts_least_recently_used(
+    hass: HomeAssistant,
+    hass_storage: dict[str, Any],
+    mock_tts_entity: MockTTSEntity,
+    mock_tts_cache_dir,
+    freezer: FrozenDateTimeFactory,
+) -> None:
+    """Test the least recently used files are removed from the cache."""
+    await mock_config_entry_setup(hass, mock_tts_entity)
+    manager = hass.data[tts.DATA_TTS_MANAGER]
+
+    with patch("homeassistant.components.tts.FILE_CACHE_MAX_SIZE", 10):
+        await manager._async_save_tts_audio("key_1", "key_1.mp3", b"1234")
+        await manager._async_save_tts_audio("key_2", "key_2.mp3", b"1234")
+        manager._async_use_file_cache("key_1")
+        await manager._async_save_tts_audio("key_3", "key_3.mp3", b"1234")
+
+    assert manager.file_cache == {"key_1": "key_1.mp3", "key_3": "key_3.mp3"}
+    assert sorted(path.name for path in mock_tts_cache_dir.iterdir()) == [
+        "key_1.mp3",
+        "key_3.mp3",
+    ]
+
+    freezer.tick(tts.CACHE_INDEX_SAVE_DELAY)
+    async_fire_time_changed(hass)
+    await hass.async_block_till_done()
+    assert hass_storage[tts.CACHE_INDEX_STORAGE_KEY]["data"] == {
+        "cache_dir": str(mock_tts_cache_dir),
+        "mtime": mock_tts_cache_dir.stat().st_mtime_ns,
+        "files": [["key_1", "key_1.mp3", 4], ["key_3", "key_3.mp3", 4]],
+    }
+
+
 @pytest.mark.parametrize(
     ("setup", "data", "expected_url_suffix"),
     [
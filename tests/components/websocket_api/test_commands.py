@@ -20,7 +20,7 @@ from homeassistant.components.websocket_api.const import FEATURE_COALESCE_MESSAG
 from homeassistant.const import SIGNAL_BOOTSTRAP_INTEGRATIONS
 from homeassistant.core import Context, HomeAssistant, State, SupportsResponse, callback
 from homeassistant.exceptions import HomeAssistantError, ServiceValidationError
-from homeassistant.helpers import device_registry as dr
+from homeassistant.helpers import device_registry as dr, polling
 from homeassistant.helpers.dispatcher import async_dispatcher_send
 from homeassistant.loader import async_get_integration
 from homeassistant.setup import async_setup_component
@@ -1308,6 +1308,81 @@ async def test_render_template_renders_template(
     }
 
 
+async def test_render_template_cache_stats(
+    hass: HomeAssistant, websocket_client
+) -> None:
+    """Test render_template subscriptions of the same template share renders."""
+    hass.states.async_set("light.test", "on")
+
+    for msg_id in (5, 6):
+        await websocket_client.send_json(
+            {
+                "id": msg_id,
+                "type": "render_template",
+                "template": "State is: {{ states('light.test') }}",
+            }
+        )
+        msg = await websocket_client.receive_json()
+        assert msg["success"]
+        msg = await websocket_client.receive_json()
+        assert msg["event"]["result"] == "State is: on"
+
+    await websocket_client.send_json({"id": 7, "type": "render_template/cache_stats"})
+    msg = await websocket_client.receive_json()
+    assert msg["id"] == 7
+    assert msg["success"]
+    # Each subscription renders when set up and refreshes once, only
+    # the very first render has to render the template
+    assert msg["result"]["hits"] == 3
+    assert msg["result"]["misses"] == 1
+    assert msg["result"]["size"] == 1
+
+
+async def test_render_template_cache_stats_requires_admin(
+    hass: HomeAssistant, websocket_client, hass_admin_user: MockUser
+) -> None:
+    """Test render_template/cache_stats requires an admin."""
+    hass_admin_user.groups = []
+    await websocket_client.send_json({"id": 5, "type": "render_template/cache_stats"})
+    msg = await websocket_client.receive_json()
+    assert not msg["success"]
+    assert msg["error"]["code"] == const.ERR_UNAUTHORIZED
+
+
+async def test_poll_latencies(hass: HomeAssistant, websocket_client) -> None:
+    """Test entity/poll_latencies returns the poll latency of each platform."""
+    latency = polling.async_get_poll_scheduler(hass).latencies.setdefault(
+        "light.demo", polling.PollLatencyHistogram()
+    )
+    latency.record(0.02)
+    latency.record(0.3)
+
+    await websocket_client.send_json({"id": 5, "type": "entity/poll_latencies"})
+    msg = await websocket_client.receive_json()
+    assert msg["id"] == 5
+    assert msg["success"]
+    assert msg["result"] == {
+        "light.demo": {
+            "buckets": [*polling.POLL_LATENCY_BUCKETS, None],
+            "counts": [0, 1, 0, 0, 1, 0, 0, 0, 0, 0, 0, 0],
+            "count": 2,
+            "total": pytest.approx(0.32),
+            "overruns": 0,
+        }
+    }
+
+
+async def test_poll_latencies_requires_admin(
+    hass: HomeAssistant, websocket_client, hass_admin_user: MockUser
+) -> None:
+    """Test entity/poll_latencies requires an admin."""
+    hass_admin_user.groups = []
+    await websocket_client.send_json({"id": 5, "type": "entity/poll_latencies"})
+    msg = await websocket_client.receive_json()
+    assert not msg["success"]
+    assert msg["error"]["code"] == const.ERR_UNAUTHORIZED
+
+
 async def test_render_template_with_timeout_and_variables(
     hass: HomeAssistant, websocket_client
 ) -> None:
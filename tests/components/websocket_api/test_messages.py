@@ -4,12 +4,15 @@ import pytest
 
 from homeassistant.components.websocket_api.messages import (
     _partial_cached_event_message as lru_event_cache,
+    _partial_cached_state_diff_message as lru_state_diff_cache,
     _state_diff_event,
     cached_event_message,
+    cached_state_diff_message,
     message_to_json_bytes,
 )
 from homeassistant.const import EVENT_STATE_CHANGED
 from homeassistant.core import Context, Event, HomeAssistant, State, callback
+from homeassistant.util.json import json_loads
 
 from tests.common import async_capture_events
 
@@ -83,6 +86,30 @@ async def test_cached_event_message_with_different_idens(hass: HomeAssistant) ->
     assert cache_info.currsize == 1
 
 
+async def test_cached_state_diff_message_with_different_idens(
+    hass: HomeAssistant,
+) -> None:
+    """Test the state diff is serialized once for all subscriptions."""
+    events = async_capture_events(hass, EVENT_STATE_CHANGED)
+    hass.states.async_set("light.window", "on")
+    hass.states.async_set("light.window", "off")
+    await hass.async_block_till_done()
+
+    lru_state_diff_cache.cache_clear()
+
+    messages = [cached_state_diff_message(iden, events[1]) for iden in (2, 3, 10)]
+
+    cache_info = lru_state_diff_cache.cache_info()
+    assert cache_info.hits == 2
+    assert cache_info.misses == 1
+    for iden, message in zip((2, 3, 10), messages, strict=True):
+        assert json_loads(message) == {
+            "id": iden,
+            "type": "event",
+            "event": _state_diff_event(events[1]),
+        }
+
+
 async def test_state_diff_event(hass: HomeAssistant) -> None:
     """Test building state_diff_message."""
     state_change_events = async_capture_events(hass, EVENT_STATE_CHANGED)
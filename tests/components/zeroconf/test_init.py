@@ -1,5 +1,6 @@
 """Test Zeroconf component setup process."""
 
+from time import monotonic
 from typing import Any
 from unittest.mock import call, patch
 
@@ -12,6 +13,7 @@ from zeroconf import (
 )
 from zeroconf.asyncio import AsyncServiceInfo
 
+from homeassistant import config_entries
 from homeassistant.components import zeroconf
 from homeassistant.const import (
     EVENT_COMPONENT_LOADED,
@@ -21,7 +23,9 @@ from homeassistant.const import (
     EVENT_HOMEASSISTANT_STOP,
 )
 from homeassistant.core import HomeAssistant
+from homeassistant.exceptions import HomeAssistantError
 from homeassistant.generated import zeroconf as zc_gen
+from homeassistant.helpers.dispatcher import async_dispatcher_send
 from homeassistant.setup import ATTR_COMPONENT, async_setup_component
 
 NON_UTF8_VALUE = b"ABCDEF\x8a"
@@ -1294,3 +1298,139 @@ async def test_zeroconf_removed(hass: HomeAssistant, mock_async_zeroconf: None)
     assert len(mock_service_browser.mock_calls) == 1
     assert len(mock_async_progress_by_init_data_type.mock_calls) == 1
     assert mock_async_abort.mock_calls[0][1][0] == "mock_flow_id"
+
+
+async def test_unchanged_announcements_skipped(
+    hass: HomeAssistant, mock_async_zeroconf: None
+) -> None:
+    """Test unchanged announcements of a service are not matched again."""
+    service_handlers = []
+    browser_zeroconf = []
+
+    def _capture_handlers(zeroconf, services, handlers):
+        """Capture the service update handler."""
+        browser_zeroconf.append(zeroconf)
+        service_handlers.extend(handlers)
+
+    zc_name = "shelly108._http._tcp.local."
+
+    def _announce(state_change=ServiceStateChange.Added):
+        service_handlers[0](
+            browser_zeroconf[0], "_http._tcp.local.", zc_name, state_change
+        )
+
+    with patch.dict(
+        zc_gen.ZEROCONF,
+        {
+            "_http._tcp.local.": [
+                {
+                    "domain": "shelly",
+                    "name": "shelly*",
+                    "properties": {"macaddress": "ffaadd*"},
+                }
+            ]
+        },
+        clear=True,
+    ), patch.object(
+        hass.config_entries.flow, "async_init"
+    ) as mock_config_flow, patch.object(
+        zeroconf, "AsyncServiceBrowser", side_effect=_capture_handlers
+    ), patch(
+        "homeassistant.components.zeroconf.AsyncServiceInfo",
+        side_effect=get_zeroconf_info_mock("FFAADDCC11DD"),
+    ) as mock_service_info:
+        assert await async_setup_component(hass, zeroconf.DOMAIN, {zeroconf.DOMAIN: {}})
+        hass.bus.async_fire(EVENT_HOMEASSISTANT_STARTED)
+        await hass.async_block_till_done()
+        discovery = service_handlers[0].__self__
+
+        _announce()
+        _announce()
+        await hass.async_block_till_done()
+        assert len(mock_config_flow.mock_calls) == 1
+        assert discovery.processed_updates == 1
+        assert discovery.skipped_updates == 1
+
+        # A changed announcement is matched again
+        mock_service_info.side_effect = get_zeroconf_info_mock("FFAADDCC11DE")
+        _announce()
+        await hass.async_block_till_done()
+        assert len(mock_config_flow.mock_calls) == 2
+
+        # After the service was removed it is discovered again
+        _announce(ServiceStateChange.Removed)
+        _announce()
+        await hass.async_block_till_done()
+        assert len(mock_config_flow.mock_calls) == 3
+
+        # After a config entry was removed services are discovered again
+        async_dispatcher_send(
+            hass,
+            config_entries.SIGNAL_CONFIG_ENTRY_CHANGED,
+            config_entries.ConfigEntryChange.REMOVED,
+            None,
+        )
+        _announce()
+        await hass.async_block_till_done()
+        assert len(mock_config_flow.mock_calls) == 4
+
+        # Unchanged announcements are matched again once the fingerprint expired
+        with patch(
+            "homeassistant.components.zeroconf.monotonic",
+            return_value=monotonic() + zeroconf.FINGERPRINT_TTL,
+        ):
+            _announce()
+        await hass.async_block_till_done()
+        assert len(mock_config_flow.mock_calls) == 5
+
+    assert discovery.processed_updates == 5
+    assert discovery.skipped_updates == 1
+
+
+async def test_announcement_matched_again_after_failed_flow_creation(
+    hass: HomeAssistant, mock_async_zeroconf: None
+) -> None:
+    """Test an unchanged announcement is matched again if creating its flows failed."""
+    service_handlers = []
+    browser_zeroconf = []
+
+    def _capture_handlers(zeroconf, services, handlers):
+        """Capture the service update handler."""
+        browser_zeroconf.append(zeroconf)
+        service_handlers.extend(handlers)
+
+    def _announce():
+        service_handlers[0](
+            browser_zeroconf[0],
+            "_http._tcp.local.",
+            "shelly108._http._tcp.local.",
+            ServiceStateChange.Added,
+        )
+
+    with patch.dict(
+        zc_gen.ZEROCONF,
+        {"_http._tcp.local.": [{"domain": "shelly", "name": "shelly*"}]},
+        clear=True,
+    ), patch.object(
+        zeroconf, "AsyncServiceBrowser", side_effect=_capture_handlers
+    ), patch(
+        "homeassistant.components.zeroconf.AsyncServiceInfo",
+        side_effect=get_zeroconf_info_mock("FFAADDCC11DD"),
+    ), patch(
+        "homeassistant.components.zeroconf.discovery_flow.async_create_flow",
+        side_effect=[HomeAssistantError("boom"), None],
+    ) as mock_create_flow:
+        assert await async_setup_component(hass, zeroconf.DOMAIN, {zeroconf.DOMAIN: {}})
+        hass.bus.async_fire(EVENT_HOMEASSISTANT_STARTED)
+        await hass.async_block_till_done()
+        discovery = service_handlers[0].__self__
+
+        with pytest.raises(HomeAssistantError):
+            _announce()
+        _announce()
+        _announce()
+        await hass.async_block_till_done()
+
+    assert len(mock_create_flow.mock_calls) == 2
+    assert discovery.processed_updates == 2
+    assert discovery.skipped_updates == 1
@@ -10,6 +10,7 @@ import gc
 import itertools
 import logging
 import os
+from pathlib import Path
 import reprlib
 import sqlite3
 import ssl
@@ -36,7 +37,7 @@ from syrupy.assertion import SnapshotAssertion
 # Setup patching if dt_util time functions before any other Home Assistant imports
 from . import patch_time  # noqa: F401, isort:skip
 
-from homeassistant import core as ha, loader, runner
+from homeassistant import bootstrap, config as config_util, core as ha, loader, runner
 from homeassistant.auth.const import GROUP_ID_ADMIN, GROUP_ID_READ_ONLY
 from homeassistant.auth.models import Credentials
 from homeassistant.auth.providers import homeassistant, legacy_api_password
@@ -307,6 +308,31 @@ def skip_stop_scripts(
         yield
 
 
+@pytest.fixture(autouse=True)
+def persisted_files_in_tmp_path(tmp_path: Path) -> Generator[None, None, None]:
+    """Keep the files core persists across restarts in the tmp dir of the test.
+
+    The YAML cache, the integration index and the startup trace are loaded
+    and saved as usual, but are not shared through the config dir of the
+    tests. hass.config.path returns the absolute paths unchanged.
+    """
+    with (
+        patch(
+            "homeassistant.config.YAML_CACHE_FILE",
+            str(tmp_path / config_util.YAML_CACHE_FILE),
+        ),
+        patch(
+            "homeassistant.loader.INTEGRATION_INDEX_FILE",
+            str(tmp_path / loader.INTEGRATION_INDEX_FILE),
+        ),
+        patch(
+            "homeassistant.bootstrap.STARTUP_TRACE_FILENAME",
+            str(tmp_path / bootstrap.STARTUP_TRACE_FILENAME),
+        ),
+    ):
+        yield
+
+
 @contextmanager
 def long_repr_strings() -> Generator[None, None, None]:
     """Increase reprlib maxstring and maxother to 300."""
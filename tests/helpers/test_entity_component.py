@@ -115,10 +115,7 @@ async def test_setup_does_discovery(
     assert ("platform_test", {}, {"msg": "discovery_info"}) == mock_setup.call_args[0]
 
 
-@patch("homeassistant.helpers.entity_platform.async_track_time_interval")
-async def test_set_scan_interval_via_config(
-    mock_track: Mock, hass: HomeAssistant
-) -> None:
+async def test_set_scan_interval_via_config(hass: HomeAssistant) -> None:
     """Test the setting of the scan interval via configuration."""
 
     def platform_setup(
@@ -139,8 +136,9 @@ async def test_set_scan_interval_via_config(
     )
 
     await hass.async_block_till_done()
-    assert mock_track.called
-    assert timedelta(seconds=30) == mock_track.call_args[0][2]
+    handle = list(component._platforms.values())[-1]
+    assert handle.scan_interval == timedelta(seconds=30)
+    assert handle._poller is not None
 
 
 async def test_set_entity_namespace_via_config(hass: HomeAssistant) -> None:
@@ -4,6 +4,8 @@ import asyncio
 from collections.abc import Iterable
 from datetime import timedelta
 import logging
+import threading
+import time
 from typing import Any
 from unittest.mock import ANY, Mock, patch
 
@@ -86,7 +88,7 @@ async def test_polling_disabled_by_config_entry(hass: HomeAssistant) -> None:
     poll_ent = MockEntity(should_poll=True)
 
     await entity_platform.async_add_entities([poll_ent])
-    assert entity_platform._async_unsub_polling is None
+    assert entity_platform._poller is None
 
 
 async def test_polling_updates_entities_with_exception(hass: HomeAssistant) -> None:
@@ -179,10 +181,7 @@ async def test_update_state_adds_entities_with_update_before_add_false(
     assert not ent.update.called
 
 
-@patch("homeassistant.helpers.entity_platform.async_track_time_interval")
-async def test_set_scan_interval_via_platform(
-    mock_track: Mock, hass: HomeAssistant
-) -> None:
+async def test_set_scan_interval_via_platform(hass: HomeAssistant) -> None:
     """Test the setting of the scan interval via platform."""
 
     def platform_setup(
@@ -204,8 +203,9 @@ async def test_set_scan_interval_via_platform(
     await component.async_setup({DOMAIN: {"platform": "platform"}})
 
     await hass.async_block_till_done()
-    assert mock_track.called
-    assert timedelta(seconds=30) == mock_track.call_args[0][2]
+    handle = list(component._platforms.values())[-1]
+    assert handle.scan_interval == timedelta(seconds=30)
+    assert handle._poller is not None
 
 
 async def test_adding_entities_with_generator_and_thread_callback(
@@ -320,7 +320,6 @@ async def test_parallel_updates_async_platform(hass: HomeAssistant) -> None:
     entity = AsyncEntity()
     await handle.async_add_entities([entity])
     assert entity.parallel_updates is None
-    assert handle._update_in_sequence is False
 
 
 async def test_parallel_updates_async_platform_with_constant(
@@ -350,7 +349,6 @@ async def test_parallel_updates_async_platform_with_constant(
     await handle.async_add_entities([entity])
     assert entity.parallel_updates is not None
     assert entity.parallel_updates._value == 2
-    assert handle._update_in_sequence is False
 
 
 async def test_parallel_updates_sync_platform(hass: HomeAssistant) -> None:
@@ -469,9 +467,8 @@ async def test_parallel_updates_async_platform_updates_in_parallel(
     assert entity2.parallel_updates is None
     assert entity3.parallel_updates is None
 
-    assert handle._update_in_sequence is False
-
-    await handle._update_entity_states(dt_util.utcnow())
+    async_fire_time_changed(hass, dt_util.utcnow() + DEFAULT_SCAN_INTERVAL)
+    await hass.async_block_till_done(wait_background_tasks=True)
     assert peak_update_count > 1
 
 
@@ -490,6 +487,7 @@ async def test_parallel_updates_sync_platform_updates_in_sequence(
     await hass.async_block_till_done()
 
     handle = list(component._platforms.values())[-1]
+    lock = threading.Lock()
     updating = []
     peak_update_count = 0
 
@@ -497,15 +495,13 @@ async def test_parallel_updates_sync_platform_updates_in_sequence(
         """Mock entity that has update."""
 
         def update(self):
-            pass
-
-        async def async_update_ha_state(self, *args: Any, **kwargs: Any) -> None:
             nonlocal peak_update_count
-            updating.append(self.entity_id)
-            await asyncio.sleep(0)
-            peak_update_count = max(len(updating), peak_update_count)
-            await asyncio.sleep(0)
-            updating.remove(self.entity_id)
+            with lock:
+                updating.append(self.entity_id)
+                peak_update_count = max(len(updating), peak_update_count)
+            time.sleep(0.01)
+            with lock:
+                updating.remove(self.entity_id)
 
     entity1 = SyncEntity()
     entity2 = SyncEntity()
@@ -519,9 +515,8 @@ async def test_parallel_updates_sync_platform_updates_in_sequence(
     assert entity3.parallel_updates is not None
     assert entity3.parallel_updates._value == 1
 
-    assert handle._update_in_sequence is True
-
-    await handle._update_entity_states(dt_util.utcnow())
+    async_fire_time_changed(hass, dt_util.utcnow() + DEFAULT_SCAN_INTERVAL)
+    await hass.async_block_till_done(wait_background_tasks=True)
     assert peak_update_count == 1
 
 
@@ -983,7 +978,7 @@ async def test_stop_shutdown_cancels_retry_setup_and_interval_listener(
     ent_platform.async_shutdown()
 
     assert len(mock_call_later.return_value.mock_calls) == 1
-    assert ent_platform._async_unsub_polling is None
+    assert ent_platform._poller is None
     assert ent_platform._async_cancel_retry_setup is None
 
 
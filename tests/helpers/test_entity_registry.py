@@ -281,7 +281,7 @@ async def test_loading_saving_data(
     )
     entity_registry.async_update_entity(
         orig_entry2.entity_id,
-        categories={"scope", "id"},
+        categories={"scope": "id"},
         labels={"label1", "label2"},
     )
     orig_entry2 = entity_registry.async_get(orig_entry2.entity_id)
@@ -312,7 +312,7 @@ async def test_loading_saving_data(
     assert orig_entry4 == new_entry4
 
     assert new_entry2.area_id == "mock-area-id"
-    assert new_entry2.categories == {"scope", "id"}
+    assert new_entry2.categories == {"scope": "id"}
     assert new_entry2.capabilities == {"max": 100}
     assert new_entry2.config_entry_id == mock_config.entry_id
     assert new_entry2.device_class == "user-class"
@@ -1493,6 +1493,19 @@ def test_entity_registry_items() -> None:
     assert entities.get_entity_id(("test", "hue", "2345")) is entry2.entity_id
     assert entities.get_entry(entry2.id) is entry2
 
+    labeled_entry = attr.evolve(
+        entry1, labels={"label1", "label2"}, categories={"automation": "cat1"}
+    )
+    entities["test.entity1"] = labeled_entry
+    entities["test.entity2"] = attr.evolve(entry2, labels={"label2"})
+    assert entities.get_entries_for_label("label1") == [labeled_entry]
+    assert entities.get_entries_for_label("label2") == [
+        labeled_entry,
+        entities["test.entity2"],
+    ]
+    assert entities.get_entries_for_category("automation", "cat1") == [labeled_entry]
+    assert entities.get_entries_for_category("script", "cat1") == []
+
     entities.pop("test.entity1")
     del entities["test.entity2"]
 
@@ -1500,6 +1513,8 @@ def test_entity_registry_items() -> None:
     assert entities.get_entry(entry1.id) is None
     assert entities.get_entity_id(("test", "hue", "2345")) is None
     assert entities.get_entry(entry2.id) is None
+    assert entities.get_entries_for_label("label2") == []
+    assert entities.get_entries_for_category("automation", "cat1") == []
 
 
 async def test_disabled_by_str_not_allowed(
@@ -0,0 +1,222 @@
+"""Tests for the poll scheduler helper."""
+
+import asyncio
+from datetime import timedelta
+import logging
+import threading
+import time
+
+import pytest
+
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers import polling
+from homeassistant.helpers.entity_component import (
+    DEFAULT_SCAN_INTERVAL,
+    EntityComponent,
+)
+import homeassistant.util.dt as dt_util
+
+from tests.common import (
+    MockEntity,
+    MockPlatform,
+    async_fire_time_changed,
+    mock_platform,
+)
+
+_LOGGER = logging.getLogger(__name__)
+DOMAIN = "test_domain"
+
+
+async def test_polls_are_spread_over_interval(hass: HomeAssistant) -> None:
+    """Test entities are polled at their own offset within the interval."""
+    component = EntityComponent(_LOGGER, DOMAIN, hass, timedelta(seconds=20))
+    await component.async_setup({})
+
+    polls: dict[str, float] = {}
+
+    class PollEntity(MockEntity):
+        """Entity which records when it was polled."""
+
+        async def async_update(self) -> None:
+            polls[self.entity_id] = hass.loop.time()
+
+    entities = [PollEntity(name=f"test_{index}") for index in range(10)]
+    start = hass.loop.time()
+    await component.async_add_entities(entities)
+
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=20))
+    await hass.async_block_till_done(wait_background_tasks=True)
+
+    # Each entity was polled once in the interval
+    assert set(polls) == {entity.entity_id for entity in entities}
+    # and they were not all scheduled at the same time
+    handles = component._platforms[DOMAIN]._poller._handles
+    assert len({handle.when() for handle in handles.values()}) == 10
+    for entity in entities:
+        when = handles[entity.entity_id].when()
+        assert start < when <= hass.loop.time() + 20
+        offset = (when - polling._entity_phase(entity.entity_id, 20)) % 20
+        assert min(offset, 20 - offset) < 1e-6
+
+    latency = polling.async_get_poll_scheduler(hass).latencies[f"{DOMAIN}.{DOMAIN}"]
+    assert latency.count == 10
+    assert sum(latency.counts) == 10
+
+
+async def test_next_poll_time() -> None:
+    """Test the next poll time is on the grid of the phase."""
+    assert polling._next_poll_time(100.0, 30.0, 5.0) == 125.0
+    assert polling._next_poll_time(125.0, 30.0, 5.0) == 155.0
+    assert polling._next_poll_time(126.0, 30.0, 5.0) == 155.0
+    assert 0 <= polling._entity_phase("sensor.test", 30.0) < 30.0
+    assert polling._entity_phase("sensor.test", 30.0) == polling._entity_phase(
+        "sensor.test", 30.0
+    )
+
+
+async def test_removed_entity_is_not_polled(hass: HomeAssistant) -> None:
+    """Test an entity is not polled after it was removed."""
+    component = EntityComponent(_LOGGER, DOMAIN, hass)
+    await component.async_setup({})
+
+    updates = []
+
+    class PollEntity(MockEntity):
+        """Entity which records its polls."""
+
+        async def async_update(self) -> None:
+            updates.append(self.entity_id)
+
+    entity1 = PollEntity(name="test_1")
+    entity2 = PollEntity(name="test_2")
+    await component.async_add_entities([entity1, entity2])
+    platform = component._platforms[DOMAIN]
+
+    await platform.async_remove_entity(entity1.entity_id)
+    assert entity1.entity_id not in platform._poller._handles
+
+    async_fire_time_changed(hass, dt_util.utcnow() + DEFAULT_SCAN_INTERVAL)
+    await hass.async_block_till_done(wait_background_tasks=True)
+    assert updates == [entity2.entity_id]
+
+    await platform.async_remove_entity(entity2.entity_id)
+    assert platform._poller is None
+
+
+async def test_slow_poll_is_rescheduled(
+    hass: HomeAssistant, caplog: pytest.LogCaptureFixture
+) -> None:
+    """Test an entity whose poll takes longer than the interval is not overlapped."""
+    component = EntityComponent(_LOGGER, DOMAIN, hass, timedelta(seconds=20))
+    await component.async_setup({})
+
+    entity = MockEntity(name="test")
+    await component.async_add_entities([entity])
+    poller = component._platforms[DOMAIN]._poller
+
+    poller._async_poll_done(entity, 90)
+    poller._async_poll_done(entity, 90)
+    assert caplog.text.count("took longer than the scheduled update interval") == 1
+    poller._async_poll_done(entity, 1)
+    poller._async_poll_done(entity, 90)
+    assert caplog.text.count("took longer than the scheduled update interval") == 2
+
+    latency = polling.async_get_poll_scheduler(hass).latencies[f"{DOMAIN}.{DOMAIN}"]
+    assert latency.overruns == 3
+    assert latency.as_dict()["counts"][-1] == 3
+
+    # The next poll is at the next offset after the poll was done
+    now = hass.loop.time()
+    poller._async_schedule(entity, now + 45)
+    assert now + 45 < poller._handles[entity.entity_id].when() <= now + 65
+
+
+async def test_executor_polls_are_bounded(hass: HomeAssistant) -> None:
+    """Test the number of polls running in the executor is bounded."""
+    platform = MockPlatform()
+    platform.PARALLEL_UPDATES = 0
+    mock_platform(hass, "platform.test_domain", platform)
+
+    component = EntityComponent(_LOGGER, DOMAIN, hass)
+    await component.async_setup({DOMAIN: {"platform": "platform"}})
+    await hass.async_block_till_done()
+
+    polling.async_get_poll_scheduler(hass).executor_polls = asyncio.Semaphore(2)
+
+    lock = threading.Lock()
+    updating = []
+    peak_update_count = 0
+
+    class SyncEntity(MockEntity):
+        """Mock entity that has update."""
+
+        def update(self) -> None:
+            nonlocal peak_update_count
+            with lock:
+                updating.append(self.entity_id)
+                peak_update_count = max(len(updating), peak_update_count)
+            time.sleep(0.01)
+            with lock:
+                updating.remove(self.entity_id)
+
+    handle = list(component._platforms.values())[-1]
+    await handle.async_add_entities([SyncEntity() for _ in range(5)])
+    assert handle.parallel_updates is None
+
+    async_fire_time_changed(hass, dt_util.utcnow() + DEFAULT_SCAN_INTERVAL)
+    await hass.async_block_till_done(wait_background_tasks=True)
+    assert peak_update_count == 2
+
+
+async def test_waiting_platform_does_not_hold_executor_polls(
+    hass: HomeAssistant,
+) -> None:
+    """Test polls waiting for the parallel updates of a platform hold no executor slot."""
+    slow_platform = MockPlatform()
+    slow_platform.PARALLEL_UPDATES = 1
+    mock_platform(hass, "slow.test_domain", slow_platform)
+    mock_platform(hass, "fast.test_domain", MockPlatform())
+
+    component = EntityComponent(_LOGGER, DOMAIN, hass)
+    await component.async_setup({DOMAIN: [{"platform": "slow"}, {"platform": "fast"}]})
+    await hass.async_block_till_done()
+
+    scheduler = polling.async_get_poll_scheduler(hass)
+    scheduler.executor_polls = asyncio.Semaphore(2)
+
+    release = threading.Event()
+    fast_updated = asyncio.Event()
+
+    class SlowEntity(MockEntity):
+        """Mock entity whose update blocks."""
+
+        def update(self) -> None:
+            release.wait(5)
+
+    class FastEntity(MockEntity):
+        """Mock entity whose update returns right away."""
+
+        def update(self) -> None:
+            hass.loop.call_soon_threadsafe(fast_updated.set)
+
+    slow_handle, fast_handle = list(component._platforms.values())[-2:]
+    slow_entities = [SlowEntity() for _ in range(3)]
+    fast_entity = FastEntity()
+    await slow_handle.async_add_entities(slow_entities)
+    await fast_handle.async_add_entities([fast_entity])
+
+    polls = [
+        hass.async_create_task(slow_handle._poller._async_poll(entity))
+        for entity in slow_entities
+    ]
+    polls.append(hass.async_create_task(fast_handle._poller._async_poll(fast_entity)))
+
+    try:
+        async with asyncio.timeout(5):
+            await fast_updated.wait()
+    finally:
+        release.set()
+    await asyncio.gather(*polls)
+
+    assert scheduler.latencies[f"{DOMAIN}.slow"].count == 3
+    assert scheduler.latencies[f"{DOMAIN}.fast"].count == 1
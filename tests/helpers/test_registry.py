@@ -7,7 +7,12 @@ import pytest
 
 from homeassistant.core import CoreState, HomeAssistant
 from homeassistant.helpers import storage
-from homeassistant.helpers.registry import SAVE_DELAY, SAVE_DELAY_LONG, BaseRegistry
+from homeassistant.helpers.registry import (
+    SAVE_DELAY,
+    SAVE_DELAY_LONG,
+    BaseRegistry,
+    BaseRegistryItems,
+)
 
 from tests.common import async_fire_time_changed
 
@@ -69,3 +74,25 @@ async def test_async_schedule_save(
     async_fire_time_changed(hass)
     await hass.async_block_till_done()
     assert registry.save_calls == 2
+
+
+def test_registry_items_indexes() -> None:
+    """Test indexes of registry items are kept up to date."""
+    items: BaseRegistryItems[dict[str, Any]] = BaseRegistryItems()
+    items["a"] = {"tags": {"x", "y"}}
+    items.add_index("tags", lambda entry: entry["tags"])
+    items["b"] = {"tags": {"y"}}
+
+    assert items.get_entries_for_index("tags", "x") == [items["a"]]
+    assert items.get_entries_for_index("tags", "y") == [items["a"], items["b"]]
+    assert items.get_entries_for_index("tags", "z") == []
+
+    items["a"] = {"tags": {"z"}}
+    assert items.get_entries_for_index("tags", "x") == []
+    assert items.get_entries_for_index("tags", "y") == [items["b"]]
+    assert items.get_entries_for_index("tags", "z") == [items["a"]]
+
+    del items["a"]
+    items.pop("b")
+    assert items.get_entries_for_index("tags", "y") == []
+    assert items.get_entries_for_index("tags", "z") == []
@@ -353,6 +353,87 @@ async def test_dump_data(hass: HomeAssistant) -> None:
     assert state1["state"]["state"] == "off"
 
 
+async def test_stored_states_decoded_on_demand(
+    hass: HomeAssistant, hass_storage: dict[str, Any]
+) -> None:
+    """Test stored states are only decoded when they are restored."""
+    now = dt_util.utcnow()
+    hass_storage[STORAGE_KEY] = {
+        "version": 1,
+        "key": STORAGE_KEY,
+        "data": [
+            json_round_trip(
+                StoredState(State(f"input_boolean.b{idx}", "on"), None, now).as_dict()
+            )
+            for idx in range(3)
+        ],
+    }
+    hass.data.pop(DATA_RESTORE_STATE)
+    await async_load(hass)
+    data = async_get(hass)
+    assert data.last_states == {}
+
+    platform = MockEntityPlatform(hass, domain="input_boolean")
+    entity = RestoreEntity()
+    entity.hass = hass
+    entity.entity_id = "input_boolean.b1"
+    await platform.async_add_entities([entity])
+
+    state = await entity.async_get_last_state()
+    assert state is not None
+    assert state.state == "on"
+    assert list(data.last_states) == ["input_boolean.b1"]
+
+    with patch(
+        "homeassistant.helpers.restore_state.Store.async_save"
+    ) as mock_write_data:
+        await data.async_dump_states()
+
+    written_states = mock_write_data.mock_calls[0][1][0]
+    # States which were not restored are written as they were loaded
+    assert written_states[1:] == hass_storage[STORAGE_KEY]["data"][::2]
+    assert [item["state"]["entity_id"] for item in json_round_trip(written_states)] == [
+        "input_boolean.b1",
+        "input_boolean.b0",
+        "input_boolean.b2",
+    ]
+    assert list(data.last_states) == ["input_boolean.b1"]
+
+
+async def test_dump_keeps_last_seen_of_unchanged_states(hass: HomeAssistant) -> None:
+    """Test the last seen time of unchanged states is only updated once a day."""
+    platform = MockEntityPlatform(hass, domain="input_boolean")
+    entities = []
+    for idx in range(2):
+        entity = RestoreEntity()
+        entity.hass = hass
+        entity.entity_id = f"input_boolean.b{idx}"
+        entities.append(entity)
+    await platform.async_add_entities(entities)
+    data = async_get(hass)
+
+    async def _dump() -> list[dict[str, Any]]:
+        with patch(
+            "homeassistant.helpers.restore_state.Store.async_save"
+        ) as mock_write_data:
+            await data.async_dump_states()
+        return json_round_trip(mock_write_data.mock_calls[0][1][0])
+
+    first = await _dump()
+    hass.states.async_set("input_boolean.b1", "on")
+    second = await _dump()
+    assert second[0] == first[0]
+    assert second[1]["state"]["state"] == "on"
+    assert second[1]["last_seen"] != first[1]["last_seen"]
+
+    with patch(
+        "homeassistant.helpers.restore_state.dt_util.utcnow",
+        return_value=dt_util.utcnow() + timedelta(days=1, seconds=1),
+    ):
+        third = await _dump()
+    assert third[0]["last_seen"] != first[0]["last_seen"]
+
+
 async def test_dump_error(hass: HomeAssistant) -> None:
     """Test that we cache data."""
     states = [
@@ -851,3 +851,143 @@ async def test_read_only_store(
     hass.bus.async_fire(EVENT_HOMEASSISTANT_FINAL_WRITE)
     await hass.async_block_till_done()
     assert read_only_store.key not in hass_storage
+
+
+async def test_journal(tmpdir: py.path.local) -> None:
+    """Test changes are appended to the journal and replayed when loading."""
+    async with async_test_home_assistant() as hass:
+        hass.config.config_dir = await hass.async_add_executor_job(
+            tmpdir.mkdir, "temp_storage"
+        )
+        store = storage.Store(hass, MOCK_VERSION, MOCK_KEY, journal=True)
+        journal_path = f"{store.path}{storage.JOURNAL_SUFFIX}"
+        items = [{"id": str(idx), "name": f"item {idx}"} for idx in range(100)]
+        await store.async_save({"items": items, "name": "items"})
+        with open(store.path, "rb") as snapshot_file:
+            snapshot = snapshot_file.read()
+        assert not os.path.exists(journal_path)
+
+        items[5] = {"id": "5", "name": "renamed"}
+        await store.async_save({"items": items, "name": "items"})
+        del items[10]
+        await store.async_save({"items": items, "name": "items"})
+        items.append({"id": "100", "name": "item 100"})
+        await store.async_save({"items": items, "name": "renamed"})
+        # Saving unchanged data does not write anything
+        await store.async_save({"items": items, "name": "renamed"})
+
+        with open(store.path, "rb") as snapshot_file:
+            assert snapshot_file.read() == snapshot
+        with open(journal_path, "rb") as journal_file:
+            lines = journal_file.read().splitlines()
+        assert len(lines) == 3
+        assert all(len(line) < 150 for line in lines)
+
+        expected = {"items": items, "name": "renamed"}
+        store = storage.Store(hass, MOCK_VERSION, MOCK_KEY, journal=True)
+        assert await store.async_load() == expected
+
+        # A line which was not written completely is ignored
+        with open(journal_path, "ab") as journal_file:
+            journal_file.write(b'{"j": "')
+        store = storage.Store(hass, MOCK_VERSION, MOCK_KEY, journal=True)
+        assert await store.async_load() == expected
+
+        # The next write is a snapshot
+        items[0] = {"id": "0", "name": "renamed"}
+        await store.async_save({"items": items, "name": "renamed"})
+        assert not os.path.exists(journal_path)
+        store = storage.Store(hass, MOCK_VERSION, MOCK_KEY, journal=True)
+        assert await store.async_load() == {"items": items, "name": "renamed"}
+
+        await hass.async_stop(force=True)
+
+
+async def test_journal_compacted_on_final_write(tmpdir: py.path.local) -> None:
+    """Test the journal is compacted into the file when stopping."""
+    async with async_test_home_assistant() as hass:
+        hass.config.config_dir = await hass.async_add_executor_job(
+            tmpdir.mkdir, "temp_storage"
+        )
+        store = storage.Store(hass, MOCK_VERSION, MOCK_KEY, journal=True)
+        journal_path = f"{store.path}{storage.JOURNAL_SUFFIX}"
+        items = [{"id": str(idx), "name": f"item {idx}"} for idx in range(100)]
+        await store.async_save({"items": items, "name": "items"})
+        items[5] = {"id": "5", "name": "renamed"}
+        await store.async_save({"items": items, "name": "items"})
+        assert os.path.exists(journal_path)
+
+        await hass.async_stop(force=True)
+
+        assert not os.path.exists(journal_path)
+        with open(store.path, "rb") as snapshot_file:
+            assert json.loads(snapshot_file.read()) == {
+                "version": MOCK_VERSION,
+                "minor_version": 1,
+                "key": MOCK_KEY,
+                "data": {"items": items, "name": "items"},
+            }
+
+
+async def test_journal_list_data(tmpdir: py.path.local) -> None:
+    """Test only the changed items of a stored list are appended to the journal."""
+    async with async_test_home_assistant() as hass:
+        hass.config.config_dir = await hass.async_add_executor_job(
+            tmpdir.mkdir, "temp_storage"
+        )
+        store = storage.Store(hass, MOCK_VERSION, MOCK_KEY, journal=True)
+        journal_path = f"{store.path}{storage.JOURNAL_SUFFIX}"
+        items = [{"id": str(idx), "name": f"item {idx}"} for idx in range(100)]
+        await store.async_save(items)
+
+        for idx in (3, 4, 50, 97):
+            items[idx] = {"id": str(idx), "name": "renamed"}
+        await store.async_save(items)
+        with open(journal_path, "rb") as journal_file:
+            lines = journal_file.read().splitlines()
+        assert len(lines) == 1
+        assert len(lines[0]) < 300
+
+        store = storage.Store(hass, MOCK_VERSION, MOCK_KEY, journal=True)
+        assert await store.async_load() == items
+
+        items.insert(10, {"id": "100", "name": "item 100"})
+        items[20] = {"id": "20", "name": "renamed"}
+        await store.async_save(items)
+        store = storage.Store(hass, MOCK_VERSION, MOCK_KEY, journal=True)
+        assert await store.async_load() == items
+
+        await hass.async_stop(force=True)
+
+
+async def test_journal_compaction(tmpdir: py.path.local) -> None:
+    """Test a snapshot is written when the journal grew too large."""
+    async with async_test_home_assistant() as hass:
+        hass.config.config_dir = await hass.async_add_executor_job(
+            tmpdir.mkdir, "temp_storage"
+        )
+        store = storage.Store(hass, MOCK_VERSION, MOCK_KEY, journal=True)
+        journal_path = f"{store.path}{storage.JOURNAL_SUFFIX}"
+        items = [{"id": str(idx), "name": f"item {idx}"} for idx in range(20)]
+        await store.async_save({"items": items})
+
+        journal_sizes = []
+        for idx in range(20):
+            items[idx] = {"id": str(idx), "name": f"renamed {idx}"}
+            await store.async_save({"items": items})
+            journal_sizes.append(
+                os.path.getsize(journal_path) if os.path.exists(journal_path) else 0
+            )
+        # The journal was compacted into a snapshot and then started again
+        assert 0 in journal_sizes[1:]
+        assert journal_sizes[0] > 0
+
+        store = storage.Store(hass, MOCK_VERSION, MOCK_KEY, journal=True)
+        assert await store.async_load() == {"items": items}
+
+        # A store which was not loaded writes a snapshot
+        store = storage.Store(hass, MOCK_VERSION, MOCK_KEY, journal=True)
+        await store.async_save({"items": items})
+        assert not os.path.exists(journal_path)
+
+        await hass.async_stop(force=True)
@@ -5127,6 +5127,82 @@ async def test_render_to_info_with_exception(hass: HomeAssistant) -> None:
     assert info.entities == {"test_domain.object"}
 
 
+async def test_render_to_info_cache(hass: HomeAssistant) -> None:
+    """Test renders of the same template are shared until an entity changes."""
+    hass.states.async_set("light.kitchen", "on")
+    render_cache = template.async_get_render_cache(hass)
+    first = template.Template("{{ states('light.kitchen') }} {{ name }}", hass)
+    second = template.Template("{{ states('light.kitchen') }} {{ name }}", hass)
+
+    info = first.async_render_to_info({"name": "a", "unused": []}, use_cache=True)
+    assert info.result() == "on a"
+    assert render_cache.async_get_stats()["misses"] == 1
+
+    with patch.object(template, "_render_with_context") as mock_render:
+        info = second.async_render_to_info({"name": "a", "unused": {}}, use_cache=True)
+    mock_render.assert_not_called()
+    assert info.result() == "on a"
+    assert info.template is second
+    assert info.entities == {"light.kitchen"}
+    assert info.filter("light.kitchen") is True
+    assert render_cache.async_get_stats()["hits"] == 1
+
+    assert second.async_render_to_info({"name": "b"}, use_cache=True).result() == (
+        "on b"
+    )
+
+    hass.states.async_set("light.kitchen", "off")
+    info = second.async_render_to_info({"name": "a"}, use_cache=True)
+    assert info.result() == "off a"
+    assert render_cache.async_get_stats() == {
+        "hits": 1,
+        "misses": 3,
+        "size": 2,
+        "max_size": template.RENDER_CACHE_SIZE,
+    }
+
+    hass.bus.async_fire(ar.EVENT_AREA_REGISTRY_UPDATED)
+    assert render_cache.async_get_stats()["size"] == 0
+
+
+@pytest.mark.parametrize(
+    "template_str",
+    [
+        "{{ now() }}",
+        "{{ [1, 2, 3] | random }}",
+        "{{ states.light | count }}",
+        "{{ states | count }}",
+        "{{ states('light.kitchen') | float }}",
+        "{{ issues() | count }}",
+        "{{ issue('test', 'issue') }}",
+        "{{ integration_entities('light') }}",
+    ],
+)
+async def test_render_to_info_cache_skipped(
+    hass: HomeAssistant, template_str: str
+) -> None:
+    """Test renders which don't only depend on entities are not cached."""
+    hass.states.async_set("light.kitchen", "on")
+    template.Template(template_str, hass).async_render_to_info(use_cache=True)
+    template.Template(template_str, hass).async_render_to_info(use_cache=True)
+
+    assert template.async_get_render_cache(hass).async_get_stats()["hits"] == 0
+
+
+async def test_render_to_info_cache_variable_types(hass: HomeAssistant) -> None:
+    """Test renders with equal variables of different types are not shared."""
+    render = template.Template("x={{ x }}", hass).async_render_to_info
+
+    assert render({"x": 1}, use_cache=True).result() == "x=1"
+    assert render({"x": True}, use_cache=True).result() == "x=True"
+    assert render({"x": 1.0}, use_cache=True).result() == "x=1.0"
+    assert render({"x": -0.0}, use_cache=True).result() == "x=-0.0"
+    assert render({"x": 0.0}, use_cache=True).result() == "x=0.0"
+    assert render({"x": (1,)}, use_cache=True).result() == "x=(1,)"
+    assert render({"x": (True,)}, use_cache=True).result() == "x=(True,)"
+    assert template.async_get_render_cache(hass).async_get_stats()["hits"] == 0
+
+
 async def test_lru_increases_with_many_entities(hass: HomeAssistant) -> None:
     """Test that the template internal LRU cache increases with many entities."""
     # We do not actually want to record 4096 entities so we mock the entity count
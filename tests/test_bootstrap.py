@@ -3,7 +3,10 @@
 import asyncio
 from collections.abc import Generator, Iterable
 import glob
+import json
+import logging
 import os
+from pathlib import Path
 import sys
 from typing import Any
 from unittest.mock import AsyncMock, Mock, patch
@@ -19,6 +22,7 @@ from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers.dispatcher import async_dispatcher_connect
 from homeassistant.helpers.typing import ConfigType
 from homeassistant.loader import Integration
+from homeassistant.util.yaml.cache import YamlCache
 
 from .common import (
     MockConfigEntry,
@@ -30,6 +34,8 @@ from .common import (
 )
 
 VERSION_PATH = os.path.join(get_test_config_dir(), config_util.VERSION_FILE)
+# The startup trace is not written in tests, except where it is tested
+_write_startup_trace = bootstrap._write_startup_trace
 
 
 @pytest.fixture(autouse=True)
@@ -175,6 +181,126 @@ async def test_setup_after_deps_all_present(hass: HomeAssistant) -> None:
     assert order == ["logger", "root", "first_dep", "second_dep"]
 
 
+@pytest.mark.parametrize("load_registries", [False])
+async def test_setup_does_not_wait_for_unrelated_domains(
+    hass: HomeAssistant, caplog: pytest.LogCaptureFixture, tmp_path: Path
+) -> None:
+    """Test domains are set up as soon as their dependencies are set up."""
+    slow_setup_started = asyncio.Event()
+    release_slow_setup = asyncio.Event()
+    started: list[str] = []
+
+    async def async_setup_slow(hass: HomeAssistant, config: ConfigType) -> bool:
+        slow_setup_started.set()
+        await release_slow_setup.wait()
+        return True
+
+    def gen_domain_setup(domain):
+        async def async_setup(hass, config):
+            started.append(domain)
+            return True
+
+        return async_setup
+
+    mock_integration(hass, MockModule(domain="slow", async_setup=async_setup_slow))
+    mock_integration(
+        hass, MockModule(domain="fast", async_setup=gen_domain_setup("fast"))
+    )
+    mock_integration(
+        hass,
+        MockModule(
+            domain="fast_dependent",
+            async_setup=gen_domain_setup("fast_dependent"),
+            dependencies=["fast"],
+        ),
+    )
+    mock_integration(
+        hass,
+        MockModule(
+            domain="slow_dependent",
+            async_setup=gen_domain_setup("slow_dependent"),
+            partial_manifest={"after_dependencies": ["slow"]},
+        ),
+    )
+
+    hass.config.config_dir = str(tmp_path)
+    yaml_cache = hass.data[config_util.DATA_YAML_CACHE] = YamlCache(
+        str(tmp_path / config_util.YAML_CACHE_FILE)
+    )
+    yaml_cache.hits, yaml_cache.misses, yaml_cache.seconds_saved = 3, 1, 0.25
+    caplog.set_level(logging.DEBUG, logger="homeassistant.bootstrap")
+    with patch("homeassistant.bootstrap._write_startup_trace", _write_startup_trace):
+        setup_task = hass.async_create_task(
+            bootstrap._async_set_up_integrations(
+                hass,
+                {"slow": {}, "fast": {}, "fast_dependent": {}, "slow_dependent": {}},
+            )
+        )
+        await slow_setup_started.wait()
+        while "fast_dependent" not in hass.config.components:
+            await asyncio.sleep(0)
+        assert started == ["fast", "fast_dependent"]
+
+        release_slow_setup.set()
+        await setup_task
+    assert started == ["fast", "fast_dependent", "slow_dependent"]
+    assert "Critical path: " in caplog.text
+
+    trace = json.loads(
+        (tmp_path / bootstrap.STARTUP_TRACE_FILENAME).read_text(encoding="utf-8")
+    )
+    event_names = {event["name"] for event in trace["traceEvents"]}
+    assert {
+        "slow import",
+        "slow setup",
+        "slow_dependent wait",
+        "slow_dependent setup",
+        "fast_dependent dependencies",
+    } <= event_names
+    assert trace["otherData"] == {
+        "yaml_cache": {"hits": 3, "misses": 1, "seconds_saved": 0.25}
+    }
+
+
+@pytest.mark.parametrize("load_registries", [False])
+async def test_setup_circular_after_dependencies(hass: HomeAssistant) -> None:
+    """Test circular after dependencies do not wait for an unrelated domain."""
+    integrations = {
+        "first": Mock(all_dependencies=set(), after_dependencies=["second"]),
+        "second": Mock(all_dependencies=set(), after_dependencies=["first"]),
+        "unrelated": Mock(all_dependencies=set(), after_dependencies=[]),
+    }
+    order: list[str] = []
+
+    async def mock_async_setup_component(hass, domain, config):
+        order.append(domain)
+        return True
+
+    with patch(
+        "homeassistant.bootstrap.async_setup_component", mock_async_setup_component
+    ):
+        async with asyncio.timeout(1):
+            await bootstrap._async_setup_in_dependency_order(
+                hass, set(integrations), {}, integrations
+            )
+
+    assert order[0] == "unrelated"
+    assert sorted(order[1:]) == ["first", "second"]
+
+
+def test_critical_path() -> None:
+    """Test the critical path follows the prerequisites which finished last."""
+    integrations = {
+        "a": Mock(all_dependencies=set(), after_dependencies=[]),
+        "b": Mock(all_dependencies=set(), after_dependencies=[]),
+        "c": Mock(all_dependencies={"a"}, after_dependencies=["b"]),
+        "d": Mock(all_dependencies={"a"}, after_dependencies=[]),
+    }
+    started = {"a": 0, "b": 0, "c": 5, "d": 2}
+    finished = {"a": 2, "b": 5, "c": 6, "d": 3}
+    assert bootstrap._critical_path(integrations, started, finished) == ["b", "c"]
+
+
 @pytest.mark.parametrize("load_registries", [False])
 async def test_setup_after_deps_in_stage_1_ignored(hass: HomeAssistant) -> None:
     """Test after_dependencies are ignored in stage 1."""
@@ -932,11 +1058,12 @@ async def test_warning_logged_on_wrap_up_timeout(
     hass: HomeAssistant, caplog: pytest.LogCaptureFixture
 ) -> None:
     """Test we log a warning on bootstrap timeout."""
+    task_done = asyncio.Event()
 
     def gen_domain_setup(domain):
         async def async_setup(hass, config):
             async def _not_marked_background_task():
-                await asyncio.sleep(0.2)
+                await task_done.wait()
 
             hass.async_create_task(_not_marked_background_task())
             return True
@@ -954,6 +1081,7 @@ async def test_warning_logged_on_wrap_up_timeout(
 
     with patch.object(bootstrap, "WRAP_UP_TIMEOUT", 0):
         await bootstrap._async_set_up_integrations(hass, {"normal_integration": {}})
+        task_done.set()
         await hass.async_block_till_done()
 
     assert "Setup timed out for bootstrap" in caplog.text
@@ -1142,6 +1142,105 @@ async def test_eventbus_filtered_listener(hass: HomeAssistant) -> None:
     unsub()
 
 
+async def test_eventbus_entity_id_listener(hass: HomeAssistant) -> None:
+    """Test listening for state changes of specific entity_ids."""
+    old_count = hass.bus.async_listeners().get(EVENT_STATE_CHANGED, 0)
+    calls = []
+
+    @ha.callback
+    def listener(event):
+        """Mock listener."""
+        calls.append(event)
+
+    unsub = hass.bus.async_listen(
+        EVENT_STATE_CHANGED, listener, entity_ids=["light.kitchen", "light.bed"]
+    )
+    assert hass.bus.async_listeners()[EVENT_STATE_CHANGED] == old_count + 2
+
+    hass.states.async_set("light.kitchen", "on")
+    hass.states.async_set("light.other", "on")
+    hass.states.async_set("light.bed", "on")
+    await hass.async_block_till_done()
+
+    assert [event.data["entity_id"] for event in calls] == [
+        "light.kitchen",
+        "light.bed",
+    ]
+
+    unsub()
+    assert hass.bus.async_listeners().get(EVENT_STATE_CHANGED, 0) == old_count
+
+    hass.states.async_set("light.kitchen", "off")
+    await hass.async_block_till_done()
+    assert len(calls) == 2
+
+
+async def test_eventbus_entity_id_listener_state_reported(
+    hass: HomeAssistant,
+) -> None:
+    """Test state_reported listeners for entity_ids also get state changes."""
+    calls = []
+
+    @ha.callback
+    def listener(event):
+        """Mock listener."""
+        calls.append(event)
+
+    unsub = hass.bus.async_listen(
+        EVENT_STATE_REPORTED, listener, entity_ids=["light.kitchen"]
+    )
+
+    hass.states.async_set("light.kitchen", "on")
+    hass.states.async_set("light.kitchen", "on")
+    hass.states.async_set("light.other", "on")
+    hass.states.async_set("light.other", "on")
+    await hass.async_block_till_done()
+
+    assert [event.event_type for event in calls] == [
+        EVENT_STATE_CHANGED,
+        EVENT_STATE_REPORTED,
+    ]
+    unsub()
+
+
+async def test_eventbus_entity_id_listener_unsupported_event(
+    hass: HomeAssistant,
+) -> None:
+    """Test listening for entity_ids is only supported for state events."""
+    with pytest.raises(HomeAssistantError, match="Listening for specific entity_ids"):
+        hass.bus.async_listen("test", lambda event: None, entity_ids=["light.x"])
+
+
+async def test_eventbus_collect_stats(hass: HomeAssistant) -> None:
+    """Test collecting statistics about firing events."""
+
+    @ha.callback
+    def filter(event_data):
+        """Mock filter."""
+        return False
+
+    unsub = hass.bus.async_listen("test", lambda event: None, event_filter=filter)
+
+    hass.bus.async_fire("test")
+    assert hass.bus.async_stop_collecting_stats() == {}
+
+    hass.bus.async_start_collecting_stats()
+    hass.bus.async_fire("test", {})
+    hass.bus.async_fire("test", {})
+    hass.bus.async_fire("no_listeners")
+    stats = hass.bus.async_stop_collecting_stats()
+
+    assert stats["test"].fired == 2
+    assert stats["test"].filter_calls == 2
+    assert stats["test"].dispatch_time > 0
+    assert stats["no_listeners"].fired == 1
+    assert stats["no_listeners"].filter_calls == 0
+
+    hass.bus.async_fire("test", {})
+    assert hass.bus.async_stop_collecting_stats() == {}
+    unsub()
+
+
 async def test_eventbus_run_immediately_callback(hass: HomeAssistant) -> None:
     """Test we can call events immediately with a callback."""
     calls = []
@@ -1443,6 +1542,42 @@ async def test_statemachine_entity_ids(hass: HomeAssistant) -> None:
     assert states == ["light.bowl", "switch.ac"]
 
 
+async def test_statemachine_all_snapshot(hass: HomeAssistant) -> None:
+    """Test snapshots are shared until a state changes."""
+    hass.states.async_set("light.bowl", "on")
+    hass.states.async_set("switch.ac", "off")
+    version = hass.states.async_version()
+
+    snapshot = hass.states.async_all_snapshot()
+    light_snapshot = hass.states.async_all_snapshot("LIGHT")
+    switch_snapshot = hass.states.async_all_snapshot("switch")
+    assert [state.entity_id for state in snapshot] == ["light.bowl", "switch.ac"]
+    assert [state.entity_id for state in light_snapshot] == ["light.bowl"]
+    assert hass.states.async_all_snapshot("unknown") == ()
+    assert hass.states.async_all_snapshot() is snapshot
+    assert hass.states.async_all_snapshot("light") is light_snapshot
+
+    # Reporting the same state only updates last_reported
+    hass.states.async_set("light.bowl", "on")
+    assert hass.states.async_version() == version
+    assert hass.states.async_all_snapshot() is snapshot
+
+    hass.states.async_set("light.bowl", "off")
+    assert hass.states.async_version() != version
+    new_snapshot = hass.states.async_all_snapshot()
+    assert new_snapshot is not snapshot
+    assert snapshot[0].state == "on"
+    assert new_snapshot[0].state == "off"
+    assert hass.states.async_all_snapshot("light") is not light_snapshot
+    assert hass.states.async_all_snapshot("switch") is switch_snapshot
+
+    hass.states.async_remove("switch.ac")
+    assert [state.entity_id for state in hass.states.async_all_snapshot()] == [
+        "light.bowl"
+    ]
+    assert hass.states.async_all_snapshot("switch") == ()
+
+
 async def test_statemachine_remove(hass: HomeAssistant) -> None:
     """Test remove method."""
     hass.states.async_set("light.bowl", "on", {})
@@ -2,8 +2,10 @@
 
 import asyncio
 import os
+from pathlib import Path
 import sys
 import threading
+from types import ModuleType
 from typing import Any
 from unittest.mock import MagicMock, Mock, patch
 
@@ -703,6 +705,61 @@ async def test_get_custom_components(
         mock_get.assert_called_once_with(hass)
 
 
+async def test_integration_index(hass: HomeAssistant, tmp_path: Path) -> None:
+    """Test manifests are taken from the index until they change."""
+    root = ModuleType("homeassistant.components")
+    root.__path__ = [str(tmp_path / "components")]
+    integration_dir = tmp_path / "components" / "indexed"
+    integration_dir.mkdir(parents=True)
+    (integration_dir / "manifest.json").write_text(
+        '{"domain": "indexed", "name": "Indexed"}'
+    )
+    (integration_dir / "light.py").touch()
+    index_path = str(tmp_path / ".storage" / loader.INTEGRATION_INDEX_FILE)
+
+    def resolve(index: loader.IntegrationIndex) -> loader.Integration | None:
+        return loader.Integration.resolve_from_root(hass, root, "indexed", index)
+
+    index = loader.IntegrationIndex(index_path)
+    integration = await hass.async_add_executor_job(resolve, index)
+    assert integration.name == "Indexed"
+    assert integration.platforms_exists(["light"]) == ["light"]
+    assert (index.hits, index.misses) == (0, 1)
+    await hass.async_add_executor_job(index.save)
+
+    index = loader.IntegrationIndex(index_path)
+    await hass.async_add_executor_job(index.load)
+    integration = await hass.async_add_executor_job(resolve, index)
+    assert integration.name == "Indexed"
+    assert integration.platforms_exists(["light"]) == ["light"]
+    assert (index.hits, index.misses) == (1, 0)
+    assert not index.dirty
+
+    # A platform was added
+    (integration_dir / "switch.py").touch()
+    os.utime(integration_dir, ns=(0, 0))
+    integration = await hass.async_add_executor_job(resolve, index)
+    assert integration.platforms_exists(["switch"]) == ["switch"]
+    assert (index.hits, index.misses) == (1, 1)
+
+    # The manifest changed
+    (integration_dir / "manifest.json").write_text(
+        '{"domain": "indexed", "name": "Renamed"}'
+    )
+    integration = await hass.async_add_executor_job(resolve, index)
+    assert integration.name == "Renamed"
+    assert (index.hits, index.misses) == (1, 2)
+
+    # The integration was removed
+    (integration_dir / "manifest.json").unlink()
+    assert await hass.async_add_executor_job(resolve, index) is None
+    await hass.async_add_executor_job(index.save)
+    index = loader.IntegrationIndex(index_path)
+    await hass.async_add_executor_job(index.load)
+    assert await hass.async_add_executor_job(resolve, index) is None
+    assert (index.hits, index.misses) == (0, 0)
+
+
 async def test_get_config_flows(hass: HomeAssistant) -> None:
     """Verify that custom components with config_flow are available."""
     test_1_integration = _get_test_integration(hass, "test_1", False)
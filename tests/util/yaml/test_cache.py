@@ -0,0 +1,196 @@
+"""Test the persistent YAML cache."""
+
+from datetime import date, datetime, timedelta, timezone
+import json
+import math
+import os
+from pathlib import Path
+import threading
+from unittest.mock import patch
+
+import pytest
+
+from homeassistant.util.yaml import Input, Secrets, load_yaml_dict, loader
+from homeassistant.util.yaml.cache import CACHE_VERSION, YamlCache
+
+
+def _load(cache: YamlCache, path: Path) -> dict:
+    """Load a YAML file with the cache active."""
+    with cache.active():
+        return load_yaml_dict(path, Secrets(path.parent))
+
+
+def test_only_changed_files_are_parsed(tmp_path: Path) -> None:
+    """Test only changed files and the files including them are parsed."""
+    config = tmp_path / "configuration.yaml"
+    config.write_text(
+        "sensor: !include sensor.yaml\n"
+        "light: !include light.yaml\n"
+        "automation: !include_dir_list automations\n"
+        "password: !secret password\n"
+    )
+    (tmp_path / "sensor.yaml").write_text("- platform: template\n")
+    (tmp_path / "light.yaml").write_text("- platform: group\n")
+    (tmp_path / "automations").mkdir()
+    (tmp_path / "automations" / "a.yaml").write_text("alias: a\n")
+    (tmp_path / "secrets.yaml").write_text("password: pwd\n")
+    cache_path = str(tmp_path / ".storage" / "core.yaml_cache")
+
+    cache = YamlCache(cache_path)
+    expected = {
+        "sensor": [{"platform": "template"}],
+        "light": [{"platform": "group"}],
+        "automation": [{"alias": "a"}],
+        "password": "pwd",
+    }
+    assert _load(cache, config) == expected
+    assert (cache.hits, cache.misses) == (0, 5)
+    assert os.path.exists(cache_path)
+
+    cache = YamlCache(cache_path)
+    loaded = _load(cache, config)
+    assert loaded == expected
+    assert (cache.hits, cache.misses) == (1, 0)
+    # The file references used for error messages are kept
+    assert loaded["sensor"].__config_file__ == str(config)
+    assert loaded["sensor"].__line__ == 1
+    assert loaded["sensor"][0].__config_file__ == str(tmp_path / "sensor.yaml")
+
+    (tmp_path / "light.yaml").write_text("- platform: switch_as_x\n")
+    cache = YamlCache(cache_path)
+    expected["light"] = [{"platform": "switch_as_x"}]
+    assert _load(cache, config) == expected
+    # The configuration and the light file are parsed again
+    assert (cache.hits, cache.misses) == (3, 2)
+
+    (tmp_path / "automations" / "b.yaml").write_text("alias: b\n")
+    expected["automation"].append({"alias": "b"})
+    assert _load(cache, config) == expected
+
+    (tmp_path / "secrets.yaml").write_text("password: changed\n")
+    expected["password"] = "changed"
+    assert _load(cache, config) == expected
+
+
+def test_env_var_changes(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test files are parsed again if an environment variable changes."""
+    config = tmp_path / "configuration.yaml"
+    config.write_text("password: !env_var TEST_YAML_CACHE default\n")
+    cache = YamlCache(str(tmp_path / "core.yaml_cache"))
+    monkeypatch.delenv("TEST_YAML_CACHE", raising=False)
+    assert _load(cache, config) == {"password": "default"}
+    assert _load(cache, config) == {"password": "default"}
+    assert cache.hits == 1
+
+    monkeypatch.setenv("TEST_YAML_CACHE", "set")
+    assert _load(cache, config) == {"password": "set"}
+    assert cache.hits == 1
+
+
+def test_invalid_cache_is_ignored(
+    tmp_path: Path, caplog: pytest.LogCaptureFixture
+) -> None:
+    """Test a cache with unexpected content is ignored."""
+    config = tmp_path / "configuration.yaml"
+    config.write_text("homeassistant:\n")
+    cache_path = tmp_path / "core.yaml_cache"
+    cache_path.write_text(
+        json.dumps({"version": CACHE_VERSION, "entries": {str(config): "invalid"}})
+    )
+
+    cache = YamlCache(str(cache_path))
+    assert _load(cache, config) == {"homeassistant": None}
+    assert cache.misses == 1
+    assert "Ignoring invalid YAML cache" in caplog.text
+
+    cache = YamlCache(str(cache_path))
+    assert _load(cache, config) == {"homeassistant": None}
+    assert cache.hits == 1
+
+
+def test_cached_types(tmp_path: Path) -> None:
+    """Test the values of a parsed YAML file are returned from the cache."""
+    config = tmp_path / "configuration.yaml"
+    config.write_text(
+        "date: 2024-01-02\n"
+        "datetime: 2024-01-02 03:04:05+01:00\n"
+        "binary: !!binary aGVsbG8=\n"
+        "set: !!set {a, b}\n"
+        "float: 1.5\n"
+        "infinity: .inf\n"
+        "input: !input name\n"
+        "nested:\n"
+        "  1: [true, null, text]\n"
+    )
+    expected = {
+        "date": date(2024, 1, 2),
+        "datetime": datetime(2024, 1, 2, 3, 4, 5, tzinfo=timezone(timedelta(hours=1))),
+        "binary": b"hello",
+        "set": {"a", "b"},
+        "float": 1.5,
+        "infinity": math.inf,
+        "input": Input("name"),
+        "nested": {1: [True, None, "text"]},
+    }
+    cache_path = str(tmp_path / "core.yaml_cache")
+    assert _load(YamlCache(cache_path), config) == expected
+
+    cache = YamlCache(cache_path)
+    loaded = _load(cache, config)
+    assert cache.hits == 1
+    assert loaded == expected
+    assert loaded["nested"][1].__line__ == 9
+
+    # Changing the returned tree does not change the cache
+    loaded["nested"][1].append("changed")
+    assert _load(cache, config) == expected
+
+
+def test_concurrent_loads(tmp_path: Path) -> None:
+    """Test files loaded by several threads at once record their own includes."""
+    for name in ("a", "b"):
+        (tmp_path / f"{name}.yaml").write_text(
+            f"{name}: !include {name}_include.yaml\n"
+        )
+        (tmp_path / f"{name}_include.yaml").write_text("1\n")
+    cache = YamlCache(str(tmp_path / "core.yaml_cache"))
+    load_yaml_uncached = loader.load_yaml_uncached
+    a_loading = threading.Event()
+    b_loading = threading.Event()
+    a_loaded = threading.Event()
+
+    def _load_yaml_uncached(fname, secrets=None):
+        # b.yaml starts loading after a.yaml, but a.yaml and its include are
+        # parsed while b.yaml is loading
+        if os.fspath(fname).endswith("a.yaml"):
+            a_loading.set()
+            assert b_loading.wait(5)
+            try:
+                return load_yaml_uncached(fname, secrets)
+            finally:
+                a_loaded.set()
+        if os.fspath(fname).endswith("b.yaml"):
+            b_loading.set()
+            assert a_loaded.wait(5)
+        return load_yaml_uncached(fname, secrets)
+
+    results = {}
+
+    def _load_file(name: str) -> None:
+        results[name] = _load(cache, tmp_path / f"{name}.yaml")
+
+    with patch.object(loader, "load_yaml_uncached", _load_yaml_uncached):
+        thread_a = threading.Thread(target=_load_file, args=("a",))
+        thread_a.start()
+        assert a_loading.wait(5)
+        thread_b = threading.Thread(target=_load_file, args=("b",))
+        thread_b.start()
+        thread_a.join()
+        thread_b.join()
+    assert results == {"a": {"a": 1}, "b": {"b": 1}}
+    assert cache.misses == 4
+
+    (tmp_path / "a_include.yaml").write_text("2\n")
+    assert _load(cache, tmp_path / "a.yaml") == {"a": 2}
+    assert _load(cache, tmp_path / "b.yaml") == {"b": 1}
+    assert cache.hits == 1